@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for per-snapshot register decoding.
+
+Times ``from_modbus_registers()`` on each transport data class with a full,
+synthetic register snapshot, both as a dict and as a ``RegisterSnapshot``.
+Run it before and after a change to the decode path to compare
+per-snapshot cost.
+
+Usage:
+    python scripts/bench_decode_plans.py [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from collections.abc import Callable
+
+from pylxpweb.registers.battery import BATTERY_BASE_ADDRESS, BATTERY_REGISTER_COUNT
+from pylxpweb.transports.data import (
+    BatteryBankData,
+    InverterEnergyData,
+    InverterRuntimeData,
+    MidboxRuntimeData,
+)
+from pylxpweb.transports.snapshot import RegisterSnapshot
+
+
+def input_snapshot() -> dict[int, int]:
+    """Inverter input registers 0-259 with plausible non-zero values."""
+    registers = {address: (address * 37) % 4000 + 1 for address in range(260)}
+    registers[4] = 530  # battery voltage 53.0 V
+    registers[5] = (100 << 8) | 87  # SOH 100 %, SOC 87 %
+    return registers
+
+
+def battery_snapshot(count: int) -> dict[int, int]:
+    """Individual battery registers for ``count`` modules from 5002."""
+    registers: dict[int, int] = {}
+    for index in range(count):
+        base = BATTERY_BASE_ADDRESS + index * BATTERY_REGISTER_COUNT
+        for offset in range(BATTERY_REGISTER_COUNT):
+            registers[base + offset] = (offset * 7) % 90 + 1
+    return registers
+
+
+def main() -> None:
+    """Run the benchmark and print per-snapshot timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=5000, help="iterations per case")
+    args = parser.parse_args()
+    number: int = args.number
+
+    inputs = input_snapshot()
+    batteries = battery_snapshot(4)
+    input_array = RegisterSnapshot.from_registers(inputs)
+    battery_array = RegisterSnapshot.from_registers(batteries)
+    cases: list[tuple[str, Callable[[], object]]] = [
+        (
+            "InverterRuntimeData",
+            lambda: InverterRuntimeData.from_modbus_registers(inputs, "EG4_HYBRID"),
+        ),
+        (
+            "InverterEnergyData",
+            lambda: InverterEnergyData.from_modbus_registers(inputs, "EG4_HYBRID"),
+        ),
+        (
+            "BatteryBankData (4 modules)",
+            lambda: BatteryBankData.from_modbus_registers(inputs, batteries),
+        ),
+        ("MidboxRuntimeData", lambda: MidboxRuntimeData.from_modbus_registers(inputs)),
+        (
+            "InverterRuntimeData (array)",
+            lambda: InverterRuntimeData.from_modbus_registers(input_array, "EG4_HYBRID"),
+        ),
+        (
+            "BatteryBankData (array)",
+            lambda: BatteryBankData.from_modbus_registers(input_array, battery_array),
+        ),
+    ]
+
+    print(f"{'snapshot':<30} {'per decode':>12}")
+    for label, decode in cases:
+        decode()  # warm up lazy imports and memoized plans
+        elapsed = timeit.timeit(decode, number=number)
+        print(f"{label:<30} {elapsed / number * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
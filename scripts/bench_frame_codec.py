@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for the dongle frame codec.
+
+Compares the table-driven CRC and template-based request encoder in
+``pylxpweb.transports.frame_codec`` with the bit-by-bit CRC and the
+concatenation-based packet builder they replaced.
+
+Usage:
+    python scripts/bench_frame_codec.py [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import struct
+import timeit
+
+from pylxpweb.transports.frame_codec import (
+    MODBUS_READ_INPUT,
+    PACKET_PREFIX,
+    PROTOCOL_VERSION,
+    DongleFrameCodec,
+    compute_crc16,
+    frame_crc,
+)
+
+DONGLE_SERIAL = "BA12345678"
+INVERTER_SERIAL = "CE12345678"
+TCP_FUNC_TRANSLATED = 0xC2
+
+
+def bitwise_crc16(data: bytes) -> int:
+    """The previous bit-by-bit CRC-16/Modbus."""
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ 0xA001
+            else:
+                crc >>= 1
+    return crc & 0xFFFF
+
+
+def concat_read_packet(start_register: int, register_count: int) -> bytes:
+    """The previous read-request builder (serials re-encoded every call)."""
+    dongle_bytes = DONGLE_SERIAL.encode("ascii").ljust(10, b"\x00")[:10]
+    inverter_bytes = INVERTER_SERIAL.encode("ascii").ljust(10, b"\x00")[:10]
+    data_frame = bytes([0x00, MODBUS_READ_INPUT]) + inverter_bytes
+    data_frame += struct.pack("<H", start_register)
+    data_frame += struct.pack("<H", register_count)
+    crc = bitwise_crc16(data_frame)
+    data_length = len(data_frame) + 2
+    packet = PACKET_PREFIX
+    packet += struct.pack("<H", PROTOCOL_VERSION)
+    packet += struct.pack("<H", 14 + data_length)
+    packet += bytes([0x01, TCP_FUNC_TRANSLATED])
+    packet += dongle_bytes
+    packet += struct.pack("<H", data_length)
+    packet += data_frame
+    packet += struct.pack("<H", crc)
+    return packet
+
+
+def build_reply(register_count: int) -> bytes:
+    """Build a read reply carrying ``register_count`` registers."""
+    data_frame = bytes([0x01, MODBUS_READ_INPUT]) + INVERTER_SERIAL.encode("ascii")
+    data_frame += struct.pack("<HB", 0, register_count * 2)
+    data_frame += struct.pack(f"<{register_count}H", *range(register_count))
+    data_length = len(data_frame) + 2
+    return (
+        PACKET_PREFIX
+        + struct.pack("<HH", PROTOCOL_VERSION, 14 + data_length)
+        + bytes([0x01, TCP_FUNC_TRANSLATED])
+        + DONGLE_SERIAL.encode("ascii")
+        + struct.pack("<H", data_length)
+        + data_frame
+        + struct.pack("<H", compute_crc16(data_frame))
+    )
+
+
+def _report(label: str, old: float, new: float, number: int) -> None:
+    old_us = old / number * 1e6
+    new_us = new / number * 1e6
+    print(f"{label:<32} {old_us:9.2f} us {new_us:9.2f} us {old / new:7.1f}x")
+
+
+def main() -> None:
+    """Run the benchmark and print per-operation timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000, help="iterations per case")
+    args = parser.parse_args()
+    number: int = args.number
+
+    codec = DongleFrameCodec(DONGLE_SERIAL, INVERTER_SERIAL)
+    assert codec.encode_read(TCP_FUNC_TRANSLATED, MODBUS_READ_INPUT, 0, 40) == (
+        concat_read_packet(0, 40)
+    )
+
+    print(f"{'operation':<32} {'previous':>12} {'codec':>12} {'speedup':>8}")
+    _report(
+        "encode read request",
+        timeit.timeit(lambda: concat_read_packet(0, 40), number=number),
+        timeit.timeit(
+            lambda: codec.encode_read(TCP_FUNC_TRANSLATED, MODBUS_READ_INPUT, 0, 40),
+            number=number,
+        ),
+        number,
+    )
+    for register_count in (40, 125):
+        reply = build_reply(register_count)
+        data_frame = reply[20:-2]
+        _report(
+            f"verify {register_count}-register reply CRC",
+            timeit.timeit(lambda data=data_frame: bitwise_crc16(data), number=number),
+            timeit.timeit(lambda frame=reply: frame_crc(frame), number=number),
+            number,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -42,6 +42,7 @@ from __future__ import annotations
 from importlib.metadata import PackageNotFoundError, version
 
 from .client import LuxpowerClient
+from .client_pool import LuxpowerClientPool
 from .devices import (
     BaseInverter,
     Battery,
@@ -65,11 +66,13 @@ from .endpoints import (
     FirmwareEndpoints,
     ForecastingEndpoints,
     PlantEndpoints,
+    RuntimeBatchResult,
     parse_export,
 )
 from .exceptions import (
     LuxpowerAPIError,
     LuxpowerAuthError,
+    LuxpowerCircuitOpenError,
     LuxpowerConnectionError,
     LuxpowerDeviceError,
     LuxpowerDeviceOfflineError,
@@ -100,15 +103,18 @@ except PackageNotFoundError:
     __version__ = "0.0.0-dev"
 __all__ = [
     "LuxpowerClient",
+    "LuxpowerClientPool",
     "LuxpowerError",
     "LuxpowerAPIError",
     "LuxpowerAuthError",
     "LuxpowerConnectionError",
+    "LuxpowerCircuitOpenError",
     "LuxpowerDeviceError",
     "LuxpowerDeviceOfflineError",
     # Endpoint modules
     "PlantEndpoints",
     "DeviceEndpoints",
+    "RuntimeBatchResult",
     "ControlEndpoints",
     "AnalyticsEndpoints",
     "ForecastingEndpoints",
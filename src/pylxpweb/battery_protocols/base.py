@@ -69,11 +69,15 @@ class BatteryRegisterBlock:
         start: First register address in the block.
         count: Number of contiguous registers to read.
         registers: Field definitions for registers within this block.
+        static: True for device information (model, serial, firmware) that
+            does not change between polls, so a transport may re-read it on
+            a long interval instead of every poll.
     """
 
     start: int
     count: int
     registers: tuple[BatteryRegister, ...]
+    static: bool = False
 
 
 class BatteryProtocol(ABC):
@@ -56,7 +56,7 @@ _RUNTIME_REGISTERS = (
 )
 
 _RUNTIME_BLOCK = BatteryRegisterBlock(start=0, count=39, registers=_RUNTIME_REGISTERS)
-_INFO_BLOCK = BatteryRegisterBlock(start=105, count=23, registers=())
+_INFO_BLOCK = BatteryRegisterBlock(start=105, count=23, registers=(), static=True)
 
 
 class EG4SlaveProtocol(BatteryProtocol):
@@ -0,0 +1,301 @@
+"""Per-endpoint circuit breakers for Luxpower API requests.
+
+``LuxpowerClient`` tracks request failures per ``(endpoint, serial)`` pair
+instead of with one client-wide counter, so an offline inverter whose
+``getBatteryInfo`` keeps timing out does not delay ``getInverterRuntime``
+for every healthy device. This module provides that state table:
+
+- A closed breaker lets requests through; after each consecutive failure its
+  own exponential backoff delay grows, exactly like the former global
+  backoff but scoped to one endpoint and device.
+- After ``failure_threshold`` consecutive failures the breaker opens and
+  requests fail fast with ``LuxpowerCircuitOpenError`` for ``reset_timeout``
+  seconds.
+- Once the timeout elapses the breaker is half-open: a single probe request
+  is let through. Success closes the breaker; failure opens it again. A
+  probe that ends without either (cancelled, or refused by a retry) releases
+  its slot so the next request probes straight away.
+- ``snapshot()`` exports every breaker's state for diagnostics.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any
+
+from .constants import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RESET_SECONDS,
+    SERIAL_CACHE_PARAMS,
+)
+from .exceptions import LuxpowerCircuitOpenError
+
+_LOGGER = logging.getLogger(__name__)
+
+BreakerKey = tuple[str, str | None]
+"""``(endpoint path, device serial or None)`` identifying one breaker."""
+
+
+class CircuitState(StrEnum):
+    """State of one circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(slots=True)
+class CircuitBreaker:
+    """Failure tracking for one endpoint and device."""
+
+    endpoint: str
+    """API endpoint path the breaker guards."""
+
+    serial: str | None
+    """Device serial number from the request parameters, if any."""
+
+    state: CircuitState = CircuitState.CLOSED
+    """Current breaker state."""
+
+    consecutive_errors: int = 0
+    """Failures since the last success."""
+
+    backoff_delay: float = 0.0
+    """Delay in seconds applied before the next request while closed."""
+
+    opened_at: float | None = None
+    """Monotonic timestamp at which the breaker last opened."""
+
+    probe_started_at: float | None = None
+    """Monotonic timestamp of the half-open probe currently in flight."""
+
+    rejections: int = 0
+    """Requests refused while the breaker was open."""
+
+
+def breaker_key(endpoint: str, data: Mapping[str, Any] | None) -> BreakerKey:
+    """Return the breaker key for a request to ``endpoint`` with form ``data``."""
+    if data:
+        for param in SERIAL_CACHE_PARAMS:
+            value = data.get(param)
+            if value:
+                return endpoint, str(value)
+    return endpoint, None
+
+
+class CircuitBreakerTable:
+    """Circuit breakers keyed by endpoint and device serial.
+
+    Example:
+        >>> table = CircuitBreakerTable(failure_threshold=2)
+        >>> key = breaker_key("/WManage/api/battery/getBatteryInfo", {"serialNum": "123"})
+        >>> table.record_failure(key)
+        >>> table.record_failure(key)
+        >>> table.state(key)
+        <CircuitState.OPEN: 'open'>
+    """
+
+    def __init__(
+        self,
+        *,
+        backoff_config: dict[str, float],
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_BREAKER_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty table.
+
+        Args:
+            backoff_config: Backoff settings (``base_delay``, ``max_delay``,
+                ``exponential_factor``, ``jitter``); read on every use, so
+                later updates to the mapping take effect immediately
+            failure_threshold: Consecutive failures that open a breaker (>= 1)
+            reset_timeout: Seconds an open breaker rejects requests before
+                letting a half-open probe through
+            clock: Monotonic time source in seconds (injectable for tests)
+
+        Raises:
+            ValueError: If ``failure_threshold`` is less than 1
+        """
+        if failure_threshold < 1:
+            raise ValueError(f"failure_threshold must be >= 1, got {failure_threshold}")
+
+        self.backoff_config = backoff_config
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._breakers: dict[BreakerKey, CircuitBreaker] = {}
+
+    def __len__(self) -> int:
+        """Return the number of tracked breakers."""
+        return len(self._breakers)
+
+    def get(self, key: BreakerKey) -> CircuitBreaker | None:
+        """Return the breaker for ``key`` if it has recorded any failure."""
+        return self._breakers.get(key)
+
+    def state(self, key: BreakerKey) -> CircuitState:
+        """Return the state for ``key``; untracked keys are closed."""
+        breaker = self._breakers.get(key)
+        return breaker.state if breaker is not None else CircuitState.CLOSED
+
+    @property
+    def max_consecutive_errors(self) -> int:
+        """Return the highest consecutive-failure count of any breaker."""
+        return max((b.consecutive_errors for b in self._breakers.values()), default=0)
+
+    @property
+    def max_backoff_delay(self) -> float:
+        """Return the longest pending backoff delay of any breaker."""
+        return max((b.backoff_delay for b in self._breakers.values()), default=0.0)
+
+    def acquire(self, key: BreakerKey) -> float:
+        """Admit a request for ``key`` and return the backoff delay to apply first.
+
+        Raises:
+            LuxpowerCircuitOpenError: If the breaker is open, or half-open with
+                its probe still in flight
+        """
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            return 0.0
+
+        now = self._clock()
+        if breaker.state is CircuitState.OPEN:
+            assert breaker.opened_at is not None
+            if now - breaker.opened_at < self.reset_timeout:
+                self._reject(breaker, self.reset_timeout - (now - breaker.opened_at))
+            breaker.state = CircuitState.HALF_OPEN
+            breaker.probe_started_at = now
+            _LOGGER.debug("Circuit half-open for %s, sending probe", _describe(breaker))
+            return 0.0
+
+        if breaker.state is CircuitState.HALF_OPEN:
+            # A probe that never reported back is replaced once it has been
+            # out for a full reset timeout; a released one straight away
+            if (
+                breaker.probe_started_at is not None
+                and now - breaker.probe_started_at < self.reset_timeout
+            ):
+                self._reject(breaker, self.reset_timeout - (now - breaker.probe_started_at))
+            breaker.probe_started_at = now
+            return 0.0
+
+        if breaker.backoff_delay <= 0:
+            return 0.0
+        return breaker.backoff_delay + random.uniform(0, self.backoff_config["jitter"])
+
+    def current_probe(self, key: BreakerKey) -> float | None:
+        """Return the start time of the half-open probe for ``key``, if one is out."""
+        breaker = self._breakers.get(key)
+        if breaker is None or breaker.state is not CircuitState.HALF_OPEN:
+            return None
+        return breaker.probe_started_at
+
+    def release_probe(self, key: BreakerKey, started_at: float) -> None:
+        """Free the half-open probe slot taken at ``started_at`` if still held.
+
+        Called when a probe request finishes; a no-op once its outcome was
+        recorded or another probe has replaced it.
+        """
+        breaker = self._breakers.get(key)
+        if (
+            breaker is not None
+            and breaker.state is CircuitState.HALF_OPEN
+            and breaker.probe_started_at == started_at
+        ):
+            breaker.probe_started_at = None
+
+    def record_success(self, key: BreakerKey) -> None:
+        """Close the breaker for ``key`` and forget its failures."""
+        breaker = self._breakers.pop(key, None)
+        if breaker is not None and breaker.consecutive_errors > 0:
+            _LOGGER.debug(
+                "Request to %s successful, closing circuit after %d errors",
+                _describe(breaker),
+                breaker.consecutive_errors,
+            )
+
+    def record_failure(self, key: BreakerKey, error: Exception | None = None) -> None:
+        """Count a failure for ``key``, growing its backoff and opening it at the threshold."""
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker(endpoint=key[0], serial=key[1])
+
+        breaker.consecutive_errors += 1
+        base_delay = self.backoff_config["base_delay"]
+        max_delay = self.backoff_config["max_delay"]
+        factor = self.backoff_config["exponential_factor"]
+        breaker.backoff_delay = min(
+            base_delay * (factor ** (breaker.consecutive_errors - 1)), max_delay
+        )
+
+        error_msg = f": {error}" if error else ""
+        if (
+            breaker.state is CircuitState.HALF_OPEN
+            or breaker.consecutive_errors >= self.failure_threshold
+        ):
+            breaker.state = CircuitState.OPEN
+            breaker.opened_at = self._clock()
+            breaker.probe_started_at = None
+            _LOGGER.warning(
+                "API request error #%d for %s%s, circuit open for %.0f seconds",
+                breaker.consecutive_errors,
+                _describe(breaker),
+                error_msg,
+                self.reset_timeout,
+            )
+            return
+
+        _LOGGER.warning(
+            "API request error #%d for %s%s, next backoff delay: %.2f seconds",
+            breaker.consecutive_errors,
+            _describe(breaker),
+            error_msg,
+            breaker.backoff_delay,
+        )
+
+    def reset(self) -> None:
+        """Close every breaker."""
+        self._breakers.clear()
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Return the state of every tracked breaker, one dict per breaker."""
+        now = self._clock()
+        rows: list[dict[str, Any]] = []
+        for breaker in self._breakers.values():
+            retry_in = 0.0
+            if breaker.state is CircuitState.OPEN and breaker.opened_at is not None:
+                retry_in = max(0.0, self.reset_timeout - (now - breaker.opened_at))
+            rows.append(
+                {
+                    "endpoint": breaker.endpoint,
+                    "serial": breaker.serial,
+                    "state": breaker.state.value,
+                    "consecutive_errors": breaker.consecutive_errors,
+                    "backoff_delay": breaker.backoff_delay,
+                    "retry_in": retry_in,
+                    "rejections": breaker.rejections,
+                }
+            )
+        return rows
+
+    def _reject(self, breaker: CircuitBreaker, retry_in: float) -> None:
+        """Count a refused request and raise ``LuxpowerCircuitOpenError``."""
+        breaker.rejections += 1
+        raise LuxpowerCircuitOpenError(
+            f"Circuit open for {_describe(breaker)} after "
+            f"{breaker.consecutive_errors} consecutive errors; retry in {retry_in:.0f}s"
+        )
+
+
+def _describe(breaker: CircuitBreaker) -> str:
+    """Return ``endpoint`` or ``endpoint [serial]`` for log messages."""
+    if breaker.serial is None:
+        return breaker.endpoint
+    return f"{breaker.endpoint} [{breaker.serial}]"
@@ -7,7 +7,8 @@ Key Features:
 - Async/await support with aiohttp
 - Session management with auto-reauthentication
 - Request caching with configurable TTL
-- Exponential backoff for rate limiting
+- Per-endpoint circuit breakers with exponential backoff and half-open probing
+- Optional token-bucket request pacing with priority lanes
 - Automatic retry for transient errors (DATAFRAME_TIMEOUT, BUSY, etc.)
 - Support for injected aiohttp.ClientSession (Platinum tier requirement)
 - Comprehensive error handling
@@ -22,25 +23,44 @@ Retry Behavior:
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-import random
+import os
 import time
+import zoneinfo
 from collections import deque
+from collections.abc import Callable
 from contextvars import ContextVar
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Any
 from urllib.parse import urljoin
 
 import aiohttp
 from aiohttp import ClientTimeout
+from yarl import URL
 
 from .api_namespace import APINamespace
+from .circuit_breaker import BreakerKey, CircuitBreakerTable, breaker_key
 from .constants import (
     BACKOFF_BASE_DELAY_SECONDS,
     BACKOFF_MAX_DELAY_SECONDS,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RESET_SECONDS,
+    DAY_SCOPED_CACHE_CLASSES,
+    DEFAULT_MAX_STALENESS_SECONDS,
+    HTTP_DNS_CACHE_TTL_SECONDS,
+    HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+    HTTP_POOL_LIMIT,
+    HTTP_POOL_LIMIT_PER_HOST,
     HTTP_UNAUTHORIZED,
     MAX_LOGIN_RETRIES,
     MAX_TRANSIENT_ERROR_RETRIES,
+    REQUEST_SCHEDULER_BURST,
+    RESPONSE_CACHE_MAX_BYTES,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    SNAPSHOT_CACHE_CLASSES,
+    SNAPSHOT_MAX_AGE_SECONDS,
+    STALE_WHILE_REVALIDATE_CACHE_CLASSES,
     TRANSIENT_ERROR_MESSAGES,
 )
 from .endpoints import (
@@ -55,9 +75,13 @@ from .endpoints import (
 from .exceptions import (
     LuxpowerAPIError,
     LuxpowerAuthError,
+    LuxpowerCircuitOpenError,
     LuxpowerConnectionError,
 )
 from .models import LoginResponse
+from .request_scheduler import RequestScheduler, request_priority
+from .response_cache import ResponseCache
+from .snapshot import ClientSnapshot, read_snapshot, write_snapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -89,6 +113,21 @@ class LuxpowerClient:
         timeout: int = 30,
         session: aiohttp.ClientSession | None = None,
         iana_timezone: str | None = None,
+        cache_max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        cache_max_bytes: int = RESPONSE_CACHE_MAX_BYTES,
+        stale_while_revalidate: bool = False,
+        max_staleness: float = DEFAULT_MAX_STALENESS_SECONDS,
+        on_cache_refresh: Callable[[str, dict[str, Any]], None] | None = None,
+        cache_plant_discovery: bool = False,
+        pool_limit: int = HTTP_POOL_LIMIT,
+        pool_limit_per_host: int = HTTP_POOL_LIMIT_PER_HOST,
+        ttl_dns_cache: int | None = HTTP_DNS_CACHE_TTL_SECONDS,
+        keepalive_timeout: float = HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+        request_rate: float | None = None,
+        request_burst: int = REQUEST_SCHEDULER_BURST,
+        circuit_failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        circuit_reset_timeout: float = CIRCUIT_BREAKER_RESET_SECONDS,
+        connector: aiohttp.BaseConnector | None = None,
     ) -> None:
         """Initialize the Luxpower API client.
 
@@ -103,6 +142,52 @@ class LuxpowerClient:
                 for DST auto-detection. If not provided, DST auto-detection
                 will be disabled. This is required because the API doesn't
                 provide sufficient location data to reliably determine timezone.
+                Also defines the local day used to expire cached daily energy
+                totals at midnight (system local time when not provided).
+            cache_max_entries: Maximum number of cached API responses; least
+                recently used entries are evicted beyond this bound
+            cache_max_bytes: Maximum estimated size of cached API responses
+                in bytes; least recently used entries are evicted beyond this bound
+            stale_while_revalidate: When True, an expired runtime entry
+                (``STALE_WHILE_REVALIDATE_CACHE_CLASSES``) is returned immediately
+                and refreshed by one background request instead of making the
+                caller wait for the cloud round-trip
+            max_staleness: Seconds past its TTL that an entry may still be
+                served in stale-while-revalidate mode (default: 300)
+            on_cache_refresh: Optional synchronous callback invoked with the
+                cache key and fresh response when a background revalidation
+                completes successfully
+            cache_plant_discovery: When True, plant list and plant details
+                responses are cached for the ``plant_discovery`` TTL and
+                included in ``save_snapshot()``. Off by default so station
+                settings such as the DST flag are always read live.
+            pool_limit: Total connection limit of the owned session's connector
+                (0 for unlimited)
+            pool_limit_per_host: Connection limit per host of the owned
+                session's connector (0 for unlimited)
+            ttl_dns_cache: Seconds to cache DNS lookups (None caches forever)
+            keepalive_timeout: Seconds to keep idle connections open for reuse
+            request_rate: Sustained API requests per second for this account.
+                When set, HTTP calls are paced by a token bucket and queued
+                by priority (control writes and login, then runtime polls,
+                then discovery, then analytics/charts/firmware). None (the
+                default) sends requests unpaced.
+            request_burst: Requests that may be sent back to back before
+                pacing applies (only used with ``request_rate``)
+            circuit_failure_threshold: Consecutive failures of one endpoint and
+                device that open its circuit breaker (default: 5)
+            circuit_reset_timeout: Seconds an open circuit fails fast with
+                ``LuxpowerCircuitOpenError`` before a probe is let through
+                (default: 60)
+            connector: Optional connector shared with other clients (see
+                ``LuxpowerClientPool``). The owned session is created on it
+                with its own cookie jar, and the connector is never closed by
+                this client; the connector settings above are then ignored.
+                Once the connector is closed, requests raise
+                ``LuxpowerConnectionError``.
+
+        Connector settings only apply to the session this client creates; an
+        injected ``session`` keeps its own connector configuration.
         """
         self.username = username
         self.password = password
@@ -111,6 +196,22 @@ class LuxpowerClient:
         self.timeout = ClientTimeout(total=timeout)
         self.iana_timezone = iana_timezone
 
+        # Connector settings for the owned session (ignored for injected sessions
+        # and when a shared connector is supplied)
+        self._shared_connector = connector
+        self._connector_config: dict[str, Any] = {
+            "limit": pool_limit,
+            "limit_per_host": pool_limit_per_host,
+            "ttl_dns_cache": ttl_dns_cache,
+            "keepalive_timeout": keepalive_timeout,
+        }
+
+        # Connection pool statistics, collected through aiohttp tracing on the
+        # owned session: a reused connection skips the TCP and TLS handshake
+        self._connections_created: int = 0
+        self._connections_reused: int = 0
+        self._connection_queue_waits: int = 0
+
         # Session management
         self._session: aiohttp.ClientSession | None = session
         self._owns_session: bool = session is None
@@ -129,9 +230,12 @@ class LuxpowerClient:
             default=False,
         )
 
-        # Response cache with TTL configuration
-        self._response_cache: dict[str, dict[str, Any]] = {}
+        # Response cache (bounded LRU, monotonic clock) with TTL configuration
+        self._response_cache = ResponseCache(
+            max_entries=cache_max_entries, max_bytes=cache_max_bytes
+        )
         self._cache_ttl_config: dict[str, timedelta] = {
+            "plant_discovery": timedelta(minutes=15),
             "device_discovery": timedelta(minutes=15),
             "battery_info": timedelta(seconds=60),
             "parameter_read": timedelta(minutes=2),
@@ -141,6 +245,15 @@ class LuxpowerClient:
             "midbox_runtime": timedelta(seconds=20),
         }
 
+        # Stale-while-revalidate: serve an expired runtime entry at once and
+        # refresh it through the in-flight request map in the background
+        self._stale_while_revalidate = stale_while_revalidate
+        self._max_staleness = max_staleness
+        self.on_cache_refresh = on_cache_refresh
+
+        # Plant list/details are only cached (and snapshotted) on request
+        self._cache_plant_discovery = cache_plant_discovery
+
         # Backoff configuration
         self._backoff_config: dict[str, float] = {
             "base_delay": BACKOFF_BASE_DELAY_SECONDS,
@@ -148,13 +261,28 @@ class LuxpowerClient:
             "exponential_factor": 2.0,
             "jitter": 0.1,
         }
-        self._current_backoff_delay: float = 0.0
-        self._consecutive_errors: int = 0
 
-        # Hour tracking for automatic cache invalidation at boundaries
-        # Invalidates cache on first request after hour changes to ensure
-        # fresh data at date boundaries (especially midnight for daily energy values)
-        self._last_request_hour: int | None = None
+        # Circuit breakers keyed by (endpoint, serial): failures back off and
+        # eventually fail fast for that pair only, never for the whole client
+        self._circuit_breakers = CircuitBreakerTable(
+            backoff_config=self._backoff_config,
+            failure_threshold=circuit_failure_threshold,
+            reset_timeout=circuit_reset_timeout,
+        )
+
+        # Proactive pacing: a per-account token bucket with priority lanes so a
+        # burst of discovery or analytics calls cannot delay control writes
+        self._request_scheduler: RequestScheduler | None = (
+            RequestScheduler(rate=request_rate, burst=request_burst)
+            if request_rate is not None
+            else None
+        )
+
+        # Local date tracking for day-boundary cache invalidation. Daily energy
+        # totals reset at local midnight, so day-scoped cache classes are dropped
+        # on the first request of a new local day. Discovery, parameter and
+        # runtime entries are left to expire by their own TTLs.
+        self._last_request_date: date | None = None
 
         # API request rate tracking — sliding window of timestamps (monotonic)
         # for calculating requests/minute and peak rates. Only real HTTP calls
@@ -166,6 +294,12 @@ class LuxpowerClient:
         self._daily_request_count: int = 0
         self._daily_reset_ymd: tuple[int, int, int] = time.localtime()[:3]
 
+        # Single-flight request coalescing — concurrent callers asking for the
+        # same cache key share one in-flight HTTP call instead of each missing
+        # the cache and issuing their own POST.
+        self._inflight_requests: dict[str, asyncio.Task[dict[str, Any]]] = {}
+        self._coalesced_request_count: int = 0
+
         # API namespace (new v0.2.0 interface)
         self._api_namespace: APINamespace | None = None
 
@@ -197,22 +331,60 @@ class LuxpowerClient:
 
         Returns:
             aiohttp.ClientSession: The session to use for requests.
+
+        Raises:
+            LuxpowerConnectionError: If the shared ``connector`` has been
+                closed, e.g. by ``LuxpowerClientPool.close()``
         """
         if self._session is not None and not self._owns_session:
             return self._session
 
         if self._session is None or self._session.closed:
-            connector = aiohttp.TCPConnector(ssl=self.verify_ssl)
-            self._session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            if self._shared_connector is not None:
+                if self._shared_connector.closed:
+                    raise LuxpowerConnectionError(
+                        "Shared connector is closed (its LuxpowerClientPool was "
+                        "closed); this client can no longer send requests"
+                    )
+                connector: aiohttp.BaseConnector = self._shared_connector
+            else:
+                connector = aiohttp.TCPConnector(ssl=self.verify_ssl, **self._connector_config)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                connector_owner=self._shared_connector is None,
+                timeout=self.timeout,
+                trace_configs=[self._connection_trace_config()],
+            )
             self._owns_session = True
 
         return self._session
 
+    def _connection_trace_config(self) -> aiohttp.TraceConfig:
+        """Build a trace config that counts new, reused and queued connections."""
+
+        async def on_create(*_: Any) -> None:
+            self._connections_created += 1
+
+        async def on_reuse(*_: Any) -> None:
+            self._connections_reused += 1
+
+        async def on_queued(*_: Any) -> None:
+            self._connection_queue_waits += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(on_create)
+        trace_config.on_connection_reuseconn.append(on_reuse)
+        trace_config.on_connection_queued_start.append(on_queued)
+        return trace_config
+
     async def close(self) -> None:
-        """Drain authentication work and close an owned HTTP session.
+        """Drain authentication and request work and close an owned HTTP session.
 
         Authentication renewal tasks are always created and owned by this client,
-        even when the HTTP session was injected. Authentication attempts that begin
+        even when the HTTP session was injected.  Shared in-flight requests
+        (coalesced reads and stale-while-revalidate refreshes) are cancelled
+        and awaited before the session closes; callers awaiting a coalesced
+        read see ``asyncio.CancelledError``. Authentication attempts that begin
         while this method is awaiting cleanup fail with ``LuxpowerConnectionError``.
 
         Injected sessions remain open. The client remains reusable after this method
@@ -230,6 +402,16 @@ class LuxpowerClient:
                     if self._authentication_task is authentication_task:
                         self._authentication_task = None
 
+                inflight = [
+                    task
+                    for task in self._inflight_requests.values()
+                    if task is not asyncio.current_task()
+                ]
+                for task in inflight:
+                    task.cancel()
+                await asyncio.gather(*inflight, return_exceptions=True)
+                self._inflight_requests.clear()
+
                 if self._session and not self._session.closed and self._owns_session:
                     await self._session.close()
             finally:
@@ -393,77 +575,144 @@ class LuxpowerClient:
             self._daily_reset_ymd = today
         return self._daily_request_count
 
-    async def _apply_backoff(self) -> None:
-        """Apply exponential backoff delay before API requests."""
-        if self._current_backoff_delay > 0:
-            jitter = random.uniform(0, self._backoff_config["jitter"])
-            delay = self._current_backoff_delay + jitter
-            _LOGGER.debug("Applying backoff delay: %.2f seconds", delay)
+    @property
+    def api_connections_created(self) -> int:
+        """Return how many new TCP/TLS connections the owned session opened.
+
+        Only counted for the session this client creates; injected sessions
+        report 0.
+        """
+        return self._connections_created
+
+    @property
+    def api_connections_reused(self) -> int:
+        """Return how many requests reused a pooled keep-alive connection."""
+        return self._connections_reused
+
+    @property
+    def api_connection_reuse_ratio(self) -> float:
+        """Return the fraction of connection acquisitions served from the pool.
+
+        A value near 1.0 means polls are not paying a TLS handshake each time.
+        """
+        total = self._connections_created + self._connections_reused
+        if total == 0:
+            return 0.0
+        return self._connections_reused / total
+
+    @property
+    def api_connection_queue_waits(self) -> int:
+        """Return how many requests waited for a free slot in the connection pool."""
+        return self._connection_queue_waits
+
+    @property
+    def api_requests_coalesced(self) -> int:
+        """Return how many callers joined an in-flight request instead of sending one.
+
+        Each coalesced caller is an HTTP call saved: it awaited the result of an
+        identical request (same cache key) that was already on the wire.
+        """
+        return self._coalesced_request_count
+
+    @property
+    def api_requests_in_flight(self) -> int:
+        """Return the number of distinct cacheable requests currently on the wire."""
+        return len(self._inflight_requests)
+
+    @property
+    def api_request_queue_depth(self) -> int:
+        """Return how many requests are waiting for a token from the request scheduler."""
+        if self._request_scheduler is None:
+            return 0
+        return self._request_scheduler.queue_depth
+
+    @property
+    def request_scheduler_stats(self) -> dict[str, float | int | dict[str, int]] | None:
+        """Get request scheduler statistics, or None when ``request_rate`` is unset.
+
+        Returns:
+            dict with statistics:
+                - rate / burst: Configured token bucket settings
+                - tokens: Tokens currently available
+                - queue_depth: Requests waiting for a token
+                - queue_depth_by_priority: Waiting requests per lane
+                  (control, runtime, normal, background)
+                - granted: Tokens handed out
+                - queued: Requests that had to wait for a token
+                - total_wait_seconds / max_wait_seconds: Time spent queued
+        """
+        if self._request_scheduler is None:
+            return None
+        return self._request_scheduler.stats()
+
+    @property
+    def circuit_breaker_states(self) -> list[dict[str, Any]]:
+        """Get the state of every endpoint/device circuit breaker with recent failures.
+
+        Pairs that have not failed since their last success are closed and
+        not listed.
+
+        Returns:
+            list of dicts, one per breaker:
+                - endpoint / serial: API path and device serial (None if the
+                  request names no device)
+                - state: "closed", "open" or "half_open"
+                - consecutive_errors: Failures since the last success
+                - backoff_delay: Delay applied before the next request while closed
+                - retry_in: Seconds until an open breaker lets a probe through
+                - rejections: Requests refused while open
+        """
+        return self._circuit_breakers.snapshot()
+
+    def reset_circuit_breakers(self) -> None:
+        """Close every circuit breaker so the next requests go straight out."""
+        self._circuit_breakers.reset()
+
+    @property
+    def _consecutive_errors(self) -> int:
+        """Highest consecutive-failure count across all circuit breakers."""
+        return self._circuit_breakers.max_consecutive_errors
+
+    @property
+    def _current_backoff_delay(self) -> float:
+        """Longest pending backoff delay across all circuit breakers."""
+        return self._circuit_breakers.max_backoff_delay
+
+    async def _apply_backoff(self, key: BreakerKey) -> None:
+        """Admit a request through its circuit breaker, sleeping its backoff delay.
+
+        Raises:
+            LuxpowerCircuitOpenError: If the circuit for ``key`` is open
+        """
+        delay = self._circuit_breakers.acquire(key)
+        if delay > 0:
+            _LOGGER.debug("Applying backoff delay for %s: %.2f seconds", key[0], delay)
             await asyncio.sleep(delay)
 
-    def _handle_request_success(self) -> None:
-        """Reset backoff on successful request."""
-        if self._consecutive_errors > 0:
-            _LOGGER.debug(
-                "Request successful, resetting backoff after %d errors",
-                self._consecutive_errors,
-            )
-        self._consecutive_errors = 0
-        self._current_backoff_delay = 0.0
+    def _handle_request_success(self, key: BreakerKey) -> None:
+        """Close the circuit breaker for ``key`` on a successful request."""
+        self._circuit_breakers.record_success(key)
 
-    def _handle_request_error(self, error: Exception | None = None) -> None:
-        """Increase backoff delay on request error.
+    def _handle_request_error(self, key: BreakerKey, error: Exception | None = None) -> None:
+        """Record a failure against the circuit breaker for ``key``.
 
         Args:
+            key: Breaker key of the failed request
             error: The exception that caused the error (for logging)
         """
-        self._consecutive_errors += 1
-        base_delay = self._backoff_config["base_delay"]
-        max_delay = self._backoff_config["max_delay"]
-        factor = self._backoff_config["exponential_factor"]
-
-        self._current_backoff_delay = min(
-            base_delay * (factor ** (self._consecutive_errors - 1)), max_delay
-        )
-
-        error_msg = f": {error}" if error else ""
-        _LOGGER.warning(
-            "API request error #%d%s, next backoff delay: %.2f seconds",
-            self._consecutive_errors,
-            error_msg,
-            self._current_backoff_delay,
-        )
+        self._circuit_breakers.record_failure(key, error)
 
     def _get_cache_key(self, endpoint_key: str, **params: Any) -> str:
         """Generate a cache key for an endpoint and parameters."""
         param_str = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
         return f"{endpoint_key}:{param_str}"
 
-    def _is_cache_valid(self, cache_key: str, endpoint_key: str) -> bool:
-        """Check if cached response is still valid."""
-        if cache_key not in self._response_cache:
-            return False
-
-        cache_entry = self._response_cache[cache_key]
-        cache_time = cache_entry.get("timestamp")
-        if not isinstance(cache_time, datetime):
-            return False
-
+    def _cache_response(self, cache_key: str, endpoint_key: str, response: dict[str, Any]) -> None:
+        """Cache a response with the TTL configured for its endpoint class."""
         ttl = self._cache_ttl_config.get(endpoint_key, timedelta(seconds=30))
-        return datetime.now() < cache_time + ttl
-
-    def _cache_response(self, cache_key: str, response: dict[str, Any]) -> None:
-        """Cache a response with timestamp."""
-        self._response_cache[cache_key] = {
-            "timestamp": datetime.now(),
-            "response": response,
-        }
-
-    def _get_cached_response(self, cache_key: str) -> dict[str, Any] | None:
-        """Get cached response if valid."""
-        if cache_key in self._response_cache:
-            return self._response_cache[cache_key].get("response")
-        return None
+        self._response_cache.put(
+            cache_key, response, ttl=ttl.total_seconds(), cache_class=endpoint_key
+        )
 
     # ============================================================================
     # Public Cache Management Methods
@@ -479,8 +728,8 @@ class LuxpowerClient:
             >>> client.clear_cache()
             >>> # Next API calls will fetch fresh data
         """
-        self._response_cache.clear()
-        _LOGGER.debug("Cache cleared (%d entries removed)", len(self._response_cache))
+        removed = self._response_cache.clear()
+        _LOGGER.debug("Cache cleared (%d entries removed)", removed)
 
     def invalidate_cache_for_device(self, serial_num: str) -> None:
         """Invalidate all cached responses for a specific device.
@@ -493,15 +742,12 @@ class LuxpowerClient:
             >>> client.invalidate_cache_for_device("1234567890")
             >>> # Next calls for this device will fetch fresh data
         """
-        keys_to_remove = [key for key in self._response_cache if serial_num in key]
-
-        for key in keys_to_remove:
-            del self._response_cache[key]
+        removed = self._response_cache.invalidate_serial(serial_num)
 
         _LOGGER.debug(
             "Cache invalidated for device %s (%d entries removed)",
             serial_num,
-            len(keys_to_remove),
+            removed,
         )
 
     @property
@@ -512,6 +758,12 @@ class LuxpowerClient:
             dict with statistics:
                 - total_entries: Number of cached responses
                 - endpoints: Dict of endpoint types to entry counts
+                - total_bytes: Estimated size of all cached responses
+                - max_entries / max_bytes: Configured cache bounds
+                - hits / misses: Lookups served from / missing the cache
+                - stale_hits: Expired entries served in stale-while-revalidate mode
+                - expirations: Lookups that found an expired entry
+                - evictions: Entries dropped to stay within the bounds
 
         Example:
             >>> stats = client.cache_stats
@@ -529,8 +781,153 @@ class LuxpowerClient:
         return {
             "total_entries": len(self._response_cache),
             "endpoints": endpoints,
+            **self._response_cache.stats(),
         }
 
+    # ============================================================================
+    # Snapshot Persistence
+    # ============================================================================
+
+    async def save_snapshot(self, path: str | os.PathLike[str]) -> None:
+        """Save the session and slow-changing cache entries to disk.
+
+        Persists the session cookies, user/account details and the fresh
+        discovery and parameter-read cache entries (``SNAPSHOT_CACHE_CLASSES``)
+        so that ``load_snapshot()`` after a restart can skip the login and
+        discovery round-trips. Plant list/details responses are only included
+        when the client caches them (``cache_plant_discovery=True``). The
+        password is never written. The file is
+        replaced atomically and created readable by its owner only.
+
+        Args:
+            path: Destination file
+
+        Raises:
+            OSError: If the file cannot be written
+
+        Example:
+            >>> await client.save_snapshot(hass.config.path(".pylxpweb_snapshot"))
+        """
+        cookies: dict[str, str] = {}
+        if self._session is not None and not self._session.closed:
+            cookies = {
+                name: morsel.value
+                for name, morsel in self._session.cookie_jar.filter_cookies(
+                    URL(self.base_url)
+                ).items()
+            }
+
+        now = self._response_cache.now()
+        cache = []
+        for key in self._response_cache:
+            entry = self._response_cache.peek(key)
+            if (
+                entry is not None
+                and entry.cache_class in SNAPSHOT_CACHE_CLASSES
+                and entry.is_fresh(now)
+            ):
+                cache.append((key, entry.cache_class, entry.response))
+
+        snapshot = ClientSnapshot(
+            base_url=self.base_url,
+            username=self.username,
+            saved_at=time.time(),
+            cookies=cookies,
+            session_expires=(self._session_expires.timestamp() if self._session_expires else None),
+            user_id=self._user_id,
+            user_role=self._user_role,
+            account_level=self._account_level,
+            cache=cache,
+        )
+        await asyncio.to_thread(write_snapshot, path, snapshot)
+        _LOGGER.debug("Saved snapshot with %d cache entries to %s", len(cache), path)
+
+    async def load_snapshot(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_age: float = SNAPSHOT_MAX_AGE_SECONDS,
+    ) -> bool:
+        """Restore a snapshot written by ``save_snapshot()``.
+
+        Cache entries are restored with their full class TTL counted from
+        now, so they refresh lazily on their normal schedule. The session is
+        restored only while its estimated expiry lies in the future; if the
+        server has invalidated it anyway, the next request re-authenticates
+        transparently.
+
+        A missing, unreadable or invalid file, a snapshot for another
+        ``base_url`` or username, or one older than ``max_age`` is ignored.
+
+        Args:
+            path: Snapshot file
+            max_age: Maximum snapshot age in seconds
+
+        Returns:
+            True if a valid snapshot was loaded, False if it was ignored
+            (the client then starts cold)
+
+        Example:
+            >>> if not await client.load_snapshot(path):
+            >>>     await client.login()
+        """
+        try:
+            snapshot = await asyncio.to_thread(read_snapshot, path)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Ignoring unreadable snapshot %s: %s", path, err)
+            return False
+
+        if snapshot.base_url != self.base_url or snapshot.username != self.username:
+            _LOGGER.debug("Ignoring snapshot %s taken for another account", path)
+            return False
+        age = time.time() - snapshot.saved_at
+        if not 0 <= age <= max_age:
+            _LOGGER.debug("Ignoring snapshot %s (age %.0f s)", path, age)
+            return False
+
+        now = datetime.now()
+        expires = (
+            datetime.fromtimestamp(snapshot.session_expires)
+            if snapshot.session_expires is not None
+            else None
+        )
+        session_restored = expires is not None and expires > now and bool(snapshot.cookies)
+        if session_restored:
+            session = await self._get_session()
+            session.cookie_jar.update_cookies(snapshot.cookies, response_url=URL(self.base_url))
+            self._session_expires = expires
+            self._user_id = snapshot.user_id
+            self._user_role = snapshot.user_role
+            self._account_level = snapshot.account_level
+
+        restored = 0
+        for key, cache_class, response in snapshot.cache:
+            if cache_class in SNAPSHOT_CACHE_CLASSES:
+                self._cache_response(key, cache_class, response)
+                restored += 1
+
+        _LOGGER.debug(
+            "Loaded snapshot %s (age %.0f s, session %s, %d cache entries)",
+            path,
+            age,
+            "restored" if session_restored else "not restored",
+            restored,
+        )
+        return True
+
+    def _local_date(self) -> date:
+        """Return today's date in ``iana_timezone`` (system local time if unset)."""
+        if self.iana_timezone:
+            try:
+                return datetime.now(zoneinfo.ZoneInfo(self.iana_timezone)).date()
+            except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+                _LOGGER.debug(
+                    "Invalid IANA timezone '%s', using system local date", self.iana_timezone
+                )
+        return datetime.now().date()
+
     def _is_transient_error(self, error_msg: str) -> bool:
         """Check if an error message indicates a transient error.
 
@@ -554,9 +951,16 @@ class LuxpowerClient:
     ) -> dict[str, Any]:
         """Make an HTTP request to the API.
 
-        Automatically invalidates cache on first request after hour boundary
-        to ensure fresh data at date rollovers (especially midnight for daily
-        energy values).
+        Automatically invalidates day-scoped cache entries (daily energy
+        totals) on the first request after the local date changes, using
+        ``iana_timezone`` when configured. Other cache classes expire only by
+        their own TTL.
+
+        Concurrent callers for the same cacheable request (same ``cache_key``)
+        share a single in-flight HTTP call and receive the same result; see
+        ``api_requests_coalesced``. With ``stale_while_revalidate`` enabled, an
+        expired runtime entry within ``max_staleness`` is returned at once and
+        refreshed by a single background request.
 
         Automatically retries transient errors (e.g., DATAFRAME_TIMEOUT, BUSY)
         with exponential backoff up to MAX_TRANSIENT_ERROR_RETRIES attempts.
@@ -577,28 +981,167 @@ class LuxpowerClient:
             LuxpowerConnectionError: If connection fails
             LuxpowerAPIError: If API returns an error (non-transient or max retries exceeded)
         """
-        # Auto-invalidate cache on first request after hour change
-        # This ensures fresh data after boundaries, especially midnight
-        current_hour = datetime.now().hour
-        if self._last_request_hour is not None and current_hour != self._last_request_hour:
+        # Drop day-scoped entries on the first request of a new local day so
+        # daily energy totals never carry over midnight
+        today = self._local_date()
+        if self._last_request_date is not None and today != self._last_request_date:
+            removed = sum(
+                self._response_cache.invalidate_class(cache_class)
+                for cache_class in DAY_SCOPED_CACHE_CLASSES
+            )
             _LOGGER.debug(
-                "Hour boundary crossed (hour %d → %d), invalidating all caches",
-                self._last_request_hour,
-                current_hour,
+                "Local day boundary crossed (%s → %s), invalidated %d day-scoped cache entries",
+                self._last_request_date,
+                today,
+                removed,
             )
-            self.clear_cache()
 
-        self._last_request_hour = current_hour
+        self._last_request_date = today
 
         # Check cache if enabled
-        if cache_key and cache_endpoint and self._is_cache_valid(cache_key, cache_endpoint):
-            cached = self._get_cached_response(cache_key)
+        if cache_key and cache_endpoint:
+            if (
+                self._stale_while_revalidate
+                and cache_endpoint in STALE_WHILE_REVALIDATE_CACHE_CLASSES
+            ):
+                stale = self._response_cache.get_stale(cache_key, self._max_staleness)
+                if stale is not None:
+                    _LOGGER.debug("Serving stale response for %s, revalidating", cache_key)
+                    if cache_key not in self._inflight_requests:
+                        task = self._start_inflight_request(
+                            method, endpoint, data, cache_key, cache_endpoint
+                        )
+                        task.add_done_callback(
+                            functools.partial(self._revalidation_done, cache_key)
+                        )
+                    return stale
+
+            cached = self._response_cache.get(cache_key)
             if cached:
                 _LOGGER.debug("Using cached response for %s", cache_key)
                 return cached
 
-        # Apply backoff if needed
-        await self._apply_backoff()
+        # Coalesce concurrent identical reads onto one in-flight HTTP call.
+        # Requests issued by the login task itself stay inline so a rejected
+        # session surfaces instead of waiting on the login it is part of.
+        if cache_key and cache_endpoint and asyncio.current_task() is not self._authentication_task:
+            inflight = self._inflight_requests.get(cache_key)
+            if inflight is not None:
+                self._coalesced_request_count += 1
+                _LOGGER.debug("Joining in-flight request for %s", cache_key)
+                return await asyncio.shield(inflight)
+
+            task = self._start_inflight_request(
+                method, endpoint, data, cache_key, cache_endpoint, _retry_count
+            )
+            return await asyncio.shield(task)
+
+        return await self._send_request(
+            method,
+            endpoint,
+            data=data,
+            cache_key=cache_key,
+            cache_endpoint=cache_endpoint,
+            retry_count=_retry_count,
+        )
+
+    def _start_inflight_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None,
+        cache_key: str,
+        cache_endpoint: str,
+        retry_count: int = 0,
+    ) -> asyncio.Task[dict[str, Any]]:
+        """Start a shared request task and register it under ``cache_key``."""
+        task = asyncio.create_task(
+            self._send_request(
+                method,
+                endpoint,
+                data=data,
+                cache_key=cache_key,
+                cache_endpoint=cache_endpoint,
+                retry_count=retry_count,
+            )
+        )
+        self._inflight_requests[cache_key] = task
+        task.add_done_callback(functools.partial(self._inflight_request_done, cache_key))
+        return task
+
+    def _revalidation_done(self, cache_key: str, task: asyncio.Task[dict[str, Any]]) -> None:
+        """Report a finished background revalidation to ``on_cache_refresh``."""
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            _LOGGER.debug("Background revalidation of %s failed: %s", cache_key, error)
+            return
+        callback = self.on_cache_refresh
+        if callback is None:
+            return
+        try:
+            callback(cache_key, task.result())
+        except Exception:
+            _LOGGER.exception("on_cache_refresh callback failed for %s", cache_key)
+
+    def _inflight_request_done(self, cache_key: str, task: asyncio.Task[dict[str, Any]]) -> None:
+        """Drop a finished in-flight request and consume an unobserved failure."""
+        if self._inflight_requests.get(cache_key) is task:
+            del self._inflight_requests[cache_key]
+        if not task.cancelled():
+            task.exception()
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        data: dict[str, Any] | None,
+        cache_key: str | None,
+        cache_endpoint: str | None,
+        retry_count: int,
+    ) -> dict[str, Any]:
+        """Perform one HTTP request with retry and re-authentication handling.
+
+        Transient-error retries and re-authentication replays call back into
+        this method directly so they never join their own in-flight entry.
+        """
+        # Fail fast if this endpoint/device circuit is open, else apply its backoff
+        key = breaker_key(endpoint, data)
+        await self._apply_backoff(key)
+        probe = self._circuit_breakers.current_probe(key)
+        try:
+            return await self._send_admitted_request(
+                key,
+                method,
+                endpoint,
+                data=data,
+                cache_key=cache_key,
+                cache_endpoint=cache_endpoint,
+                retry_count=retry_count,
+            )
+        finally:
+            # A half-open probe that ended without recording an outcome
+            # (cancelled, or its retry refused) must not hold the slot
+            if probe is not None:
+                self._circuit_breakers.release_probe(key, probe)
+
+    async def _send_admitted_request(
+        self,
+        key: BreakerKey,
+        method: str,
+        endpoint: str,
+        *,
+        data: dict[str, Any] | None,
+        cache_key: str | None,
+        cache_endpoint: str | None,
+        retry_count: int,
+    ) -> dict[str, Any]:
+        """Send one request already admitted by the circuit breaker for ``key``."""
+        # Wait for a token in this endpoint's priority lane when pacing is on
+        if self._request_scheduler is not None:
+            await self._request_scheduler.acquire(request_priority(endpoint))
 
         session = await self._get_session()
         url = urljoin(self.base_url, endpoint)
@@ -632,38 +1175,42 @@ class LuxpowerClient:
 
                     # Check if this is a transient error that should be retried
                     is_transient = self._is_transient_error(error_msg)
-                    can_retry = _retry_count < MAX_TRANSIENT_ERROR_RETRIES
+                    can_retry = retry_count < MAX_TRANSIENT_ERROR_RETRIES
                     if is_transient and can_retry:
-                        self._handle_request_error()
+                        self._handle_request_error(key)
                         _LOGGER.warning(
                             "Transient API error '%s' (attempt %d/%d), retrying with backoff...",
                             error_msg,
-                            _retry_count + 1,
+                            retry_count + 1,
                             MAX_TRANSIENT_ERROR_RETRIES,
                         )
                         # Retry with incremented counter
-                        return await self._request(
+                        return await self._send_request(
                             method,
                             endpoint,
                             data=data,
                             cache_key=cache_key,
                             cache_endpoint=cache_endpoint,
-                            _retry_count=_retry_count + 1,
+                            retry_count=retry_count + 1,
                         )
 
-                    # Non-transient error or max retries exceeded
+                    # Non-transient error or max retries exceeded.  A
+                    # non-transient error is the server answering, so it
+                    # counts as success for the breaker (closing a probe).
+                    if not is_transient:
+                        self._handle_request_success(key)
                     raise LuxpowerAPIError(f"API error (HTTP {response.status}): {error_msg}")
 
                 # Cache successful response
                 if cache_key and cache_endpoint:
-                    self._cache_response(cache_key, json_data)
+                    self._cache_response(cache_key, cache_endpoint, json_data)
 
-                self._handle_request_success()
+                self._handle_request_success(key)
                 return json_data
 
         except aiohttp.ContentTypeError as err:
             # Session expired and API returned HTML login page instead of JSON
-            self._handle_request_error(err)
+            self._handle_request_error(key, err)
             _LOGGER.warning(
                 "Got HTML response instead of JSON (session expired), attempting to re-authenticate"
             )
@@ -675,7 +1222,7 @@ class LuxpowerClient:
                     data=data,
                     cache_key=cache_key,
                     cache_endpoint=cache_endpoint,
-                    retry_count=_retry_count,
+                    retry_count=retry_count,
                 )
             except LuxpowerAuthError:
                 # True authentication failure (wrong credentials, account locked)
@@ -696,7 +1243,7 @@ class LuxpowerClient:
                 ) from login_err
 
         except aiohttp.ClientResponseError as err:
-            self._handle_request_error(err)
+            self._handle_request_error(key, err)
             if err.status == HTTP_UNAUTHORIZED:
                 # Session expired - try to re-authenticate once
                 _LOGGER.warning("Got 401 Unauthorized, attempting to re-authenticate")
@@ -708,7 +1255,7 @@ class LuxpowerClient:
                         data=data,
                         cache_key=cache_key,
                         cache_endpoint=cache_endpoint,
-                        retry_count=_retry_count,
+                        retry_count=retry_count,
                     )
                 except LuxpowerAuthError:
                     # True authentication failure (wrong credentials, account locked)
@@ -731,16 +1278,17 @@ class LuxpowerClient:
                     ) from login_err
             raise LuxpowerAPIError(f"HTTP {err.status}: {err.message}") from err
 
-        except LuxpowerAPIError:
-            # Re-raise our own exceptions (from transient error handling, etc)
+        except (LuxpowerAPIError, LuxpowerCircuitOpenError):
+            # Re-raise our own exceptions (from transient error handling, or a
+            # retry refused because the circuit opened, etc)
             raise
 
         except aiohttp.ClientError as err:
-            self._handle_request_error(err)
+            self._handle_request_error(key, err)
             raise LuxpowerConnectionError(f"Connection error: {err}") from err
 
         except Exception as err:
-            self._handle_request_error(err)
+            self._handle_request_error(key, err)
             raise LuxpowerAPIError(f"Unexpected error: {err}") from err
 
     async def _retry_request_after_authentication(
@@ -762,13 +1310,13 @@ class LuxpowerClient:
         _LOGGER.debug("Re-authentication successful, retrying request")
         replay_token = self._reactive_authentication_replay.set(True)
         try:
-            return await self._request(
+            return await self._send_request(
                 method,
                 endpoint,
                 data=data,
                 cache_key=cache_key,
                 cache_endpoint=cache_endpoint,
-                _retry_count=retry_count,
+                retry_count=retry_count,
             )
         finally:
             self._reactive_authentication_replay.reset(replay_token)
@@ -0,0 +1,256 @@
+"""Pool of Luxpower API clients for many accounts in one process.
+
+A service monitoring many customer accounts would otherwise create one
+``LuxpowerClient`` per account, each with its own connection pool and DNS
+cache. ``LuxpowerClientPool`` shares a single ``aiohttp.TCPConnector``
+between accounts while keeping everything that belongs to an account
+separate:
+
+- Shared: TCP/TLS connections, the DNS cache, and the global cap on
+  concurrent connections, which is the connector's ``limit``
+  (``max_connections``); requests beyond it wait for a free connection.
+- Per account: the HTTP session and its cookie jar (so logins never leak
+  between accounts), authentication state, response cache, request
+  coalescing, circuit breakers and the token-bucket rate budget.
+
+All accounts must be used from the event loop the pool was first used on.
+Closing the pool closes the shared connector: clients obtained from it
+before then raise ``LuxpowerConnectionError`` on their next request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterator
+from typing import Any
+
+import aiohttp
+
+from .circuit_breaker import CircuitState
+from .client import LuxpowerClient
+from .constants import (
+    HTTP_DNS_CACHE_TTL_SECONDS,
+    HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+    HTTP_POOL_LIMIT,
+    REQUEST_SCHEDULER_BURST,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LuxpowerClientPool:
+    """Many account clients sharing one connector.
+
+    Example:
+        ```python
+        async with LuxpowerClientPool(max_connections=50, request_rate=1.0) as pool:
+            for username, password in accounts:
+                pool.add_account(username, password)
+            for client in pool.clients():
+                await client.login()
+            print(pool.stats()["alice@example.com"]["requests_per_minute"])
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str = "https://monitor.eg4electronics.com",
+        verify_ssl: bool = True,
+        timeout: int = 30,
+        max_connections: int = HTTP_POOL_LIMIT,
+        ttl_dns_cache: int | None = HTTP_DNS_CACHE_TTL_SECONDS,
+        keepalive_timeout: float = HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+        request_rate: float | None = None,
+        request_burst: int = REQUEST_SCHEDULER_BURST,
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            base_url: Base URL for every account's API requests
+            verify_ssl: Whether to verify SSL certificates
+            timeout: Request timeout in seconds (default: 30)
+            max_connections: Global cap on concurrent connections across all
+                accounts, applied as the shared connector's ``limit`` (0 for
+                unlimited)
+            ttl_dns_cache: Seconds to cache DNS lookups (None caches forever)
+            keepalive_timeout: Seconds to keep idle connections open for reuse
+            request_rate: Default per-account rate budget in requests per
+                second (None for unpaced); see ``LuxpowerClient``
+            request_burst: Default per-account burst size for ``request_rate``
+        """
+        self.base_url = base_url
+        self.verify_ssl = verify_ssl
+        self.timeout = timeout
+        self.request_rate = request_rate
+        self.request_burst = request_burst
+
+        # One host serves every account, so the global limit is the only cap
+        self._connector_config: dict[str, Any] = {
+            "limit": max_connections,
+            "limit_per_host": 0,
+            "ttl_dns_cache": ttl_dns_cache,
+            "keepalive_timeout": keepalive_timeout,
+        }
+        self._connector: aiohttp.TCPConnector | None = None
+        self._clients: dict[str, LuxpowerClient] = {}
+
+    async def __aenter__(self) -> LuxpowerClientPool:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: Any,
+    ) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+    def __len__(self) -> int:
+        """Return the number of accounts in the pool."""
+        return len(self._clients)
+
+    def __contains__(self, account: object) -> bool:
+        """Return True if ``account`` has a client in the pool."""
+        return account in self._clients
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over account keys in insertion order."""
+        return iter(list(self._clients))
+
+    def __getitem__(self, account: str) -> LuxpowerClient:
+        """Return the client for ``account``.
+
+        Raises:
+            KeyError: If the account is not in the pool
+        """
+        return self._clients[account]
+
+    def clients(self) -> list[LuxpowerClient]:
+        """Return every account client in insertion order."""
+        return list(self._clients.values())
+
+    def _get_connector(self) -> aiohttp.TCPConnector:
+        """Get or create the connector shared by every account."""
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(ssl=self.verify_ssl, **self._connector_config)
+        return self._connector
+
+    def add_account(
+        self,
+        username: str,
+        password: str,
+        *,
+        account: str | None = None,
+        **client_kwargs: Any,
+    ) -> LuxpowerClient:
+        """Create a client for one account on the shared connector.
+
+        Must be called from the pool's running event loop.
+
+        Args:
+            username: API username for authentication
+            password: API password for authentication
+            account: Key for the account in the pool (default: ``username``)
+            **client_kwargs: Further ``LuxpowerClient`` keyword arguments for
+                this account, e.g. ``iana_timezone`` or a different
+                ``request_rate``
+
+        Returns:
+            LuxpowerClient: The new account client (not yet logged in)
+
+        Raises:
+            ValueError: If the account key is already in the pool, or
+                ``client_kwargs`` tries to replace the session or connector
+        """
+        key = account or username
+        if key in self._clients:
+            raise ValueError(f"Account {key!r} is already in the pool")
+        if "session" in client_kwargs or "connector" in client_kwargs:
+            raise ValueError("Pool accounts always use the pool's shared connector")
+
+        client_kwargs.setdefault("request_rate", self.request_rate)
+        client_kwargs.setdefault("request_burst", self.request_burst)
+        client = LuxpowerClient(
+            username,
+            password,
+            base_url=self.base_url,
+            verify_ssl=self.verify_ssl,
+            timeout=self.timeout,
+            connector=self._get_connector(),
+            **client_kwargs,
+        )
+        self._clients[key] = client
+        _LOGGER.debug("Added account %s to client pool (%d accounts)", key, len(self._clients))
+        return client
+
+    async def remove_account(self, account: str) -> None:
+        """Close one account's client and drop it from the pool.
+
+        Raises:
+            KeyError: If the account is not in the pool
+        """
+        client = self._clients.pop(account)
+        await client.close()
+
+    async def close(self) -> None:
+        """Close every account client, then the shared connector.
+
+        The pool is empty afterwards and may be reused; a later
+        ``add_account`` creates a new connector.  Clients created before
+        the close stay bound to the closed connector and raise
+        ``LuxpowerConnectionError`` if used again.
+        """
+        clients = list(self._clients.values())
+        self._clients.clear()
+        results = await asyncio.gather(
+            *(client.close() for client in clients), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.warning("Error closing pooled client: %s", result)
+
+        if self._connector is not None and not self._connector.closed:
+            await self._connector.close()
+        self._connector = None
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return per-account request statistics.
+
+        Returns:
+            dict mapping account key to:
+                - requests_per_minute / requests_last_hour / requests_today:
+                  Real HTTP calls (cache hits excluded)
+                - requests_coalesced: Calls saved by joining in-flight requests
+                - requests_in_flight: Distinct cacheable requests on the wire
+                - request_queue_depth: Requests waiting on the rate budget
+                - connections_created / connections_reused: Connection
+                  acquisitions from the shared pool
+                - cache_entries / cache_hits / cache_misses: Response cache usage
+                - open_circuits: Endpoint/device circuit breakers currently open
+        """
+        stats: dict[str, dict[str, Any]] = {}
+        for key, client in self._clients.items():
+            cache = client.cache_stats
+            stats[key] = {
+                "requests_per_minute": client.api_requests_per_minute,
+                "requests_last_hour": client.api_requests_last_hour,
+                "requests_today": client.api_requests_today,
+                "requests_coalesced": client.api_requests_coalesced,
+                "requests_in_flight": client.api_requests_in_flight,
+                "request_queue_depth": client.api_request_queue_depth,
+                "connections_created": client.api_connections_created,
+                "connections_reused": client.api_connections_reused,
+                "cache_entries": cache["total_entries"],
+                "cache_hits": cache["hits"],
+                "cache_misses": cache["misses"],
+                "open_circuits": sum(
+                    1
+                    for breaker in client.circuit_breaker_states
+                    if breaker["state"] == CircuitState.OPEN
+                ),
+            }
+        return stats
@@ -28,15 +28,33 @@ from .api import (
     # Backoff and retry
     BACKOFF_BASE_DELAY_SECONDS,
     BACKOFF_MAX_DELAY_SECONDS,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RESET_SECONDS,
+    DAY_SCOPED_CACHE_CLASSES,
+    DEFAULT_MAX_STALENESS_SECONDS,
     DEVICE_TYPE_GRIDBOSS,
     # Device type constants
     DEVICE_TYPE_INVERTER,
+    HTTP_DNS_CACHE_TTL_SECONDS,
     HTTP_FORBIDDEN,
+    HTTP_KEEPALIVE_TIMEOUT_SECONDS,
     # HTTP status codes
     HTTP_OK,
+    HTTP_POOL_LIMIT,
+    HTTP_POOL_LIMIT_PER_HOST,
     HTTP_UNAUTHORIZED,
     MAX_LOGIN_RETRIES,
     MAX_TRANSIENT_ERROR_RETRIES,
+    REQUEST_PRIORITY_ENDPOINT_PREFIXES,
+    REQUEST_SCHEDULER_BURST,
+    RESPONSE_CACHE_MAX_BYTES,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RUNTIME_BATCH_MAX_CONCURRENCY,
+    SERIAL_CACHE_PARAMS,
+    SNAPSHOT_CACHE_CLASSES,
+    SNAPSHOT_FORMAT_VERSION,
+    SNAPSHOT_MAX_AGE_SECONDS,
+    STALE_WHILE_REVALIDATE_CACHE_CLASSES,
     TRANSIENT_ERROR_MESSAGES,
 )
 
@@ -649,10 +667,28 @@ __all__ = [
     "HTTP_OK",
     "HTTP_UNAUTHORIZED",
     "HTTP_FORBIDDEN",
+    "HTTP_POOL_LIMIT",
+    "HTTP_POOL_LIMIT_PER_HOST",
+    "HTTP_DNS_CACHE_TTL_SECONDS",
+    "HTTP_KEEPALIVE_TIMEOUT_SECONDS",
+    "REQUEST_SCHEDULER_BURST",
+    "REQUEST_PRIORITY_ENDPOINT_PREFIXES",
+    "RUNTIME_BATCH_MAX_CONCURRENCY",
     "BACKOFF_BASE_DELAY_SECONDS",
     "BACKOFF_MAX_DELAY_SECONDS",
+    "CIRCUIT_BREAKER_FAILURE_THRESHOLD",
+    "CIRCUIT_BREAKER_RESET_SECONDS",
+    "DAY_SCOPED_CACHE_CLASSES",
+    "DEFAULT_MAX_STALENESS_SECONDS",
     "MAX_LOGIN_RETRIES",
     "MAX_TRANSIENT_ERROR_RETRIES",
+    "RESPONSE_CACHE_MAX_BYTES",
+    "RESPONSE_CACHE_MAX_ENTRIES",
+    "SERIAL_CACHE_PARAMS",
+    "SNAPSHOT_CACHE_CLASSES",
+    "SNAPSHOT_FORMAT_VERSION",
+    "SNAPSHOT_MAX_AGE_SECONDS",
+    "STALE_WHILE_REVALIDATE_CACHE_CLASSES",
     "TRANSIENT_ERROR_MESSAGES",
     # Devices
     "DEVICE_TYPE_INVERTER",
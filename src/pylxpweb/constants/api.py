@@ -29,6 +29,107 @@ BACKOFF_BASE_DELAY_SECONDS = 1.0
 # Maximum delay (in seconds) for exponential backoff
 BACKOFF_MAX_DELAY_SECONDS = 60.0
 
+# Consecutive failures of one endpoint/device pair that open its circuit
+# breaker. Higher than the attempts a single call makes through transient
+# retries, so one unlucky call never opens the circuit on its own.
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+
+# Seconds an open circuit fails fast before a half-open probe is let through
+CIRCUIT_BREAKER_RESET_SECONDS = 60.0
+
+# ==============================================================================
+# HTTP Connection Pool Constants
+# ==============================================================================
+# Defaults for the aiohttp TCPConnector the client creates when it owns its
+# session. Every plant on an account is polled through the same portal host,
+# so the per-host limit is the effective request concurrency.
+HTTP_POOL_LIMIT = 100
+HTTP_POOL_LIMIT_PER_HOST = 10
+
+# Seconds a resolved portal address is reused before DNS is queried again
+HTTP_DNS_CACHE_TTL_SECONDS = 300
+
+# Seconds an idle keep-alive connection is held open. Longer than the common
+# 20-30 s poll interval so each poll reuses a warm TLS connection.
+HTTP_KEEPALIVE_TIMEOUT_SECONDS = 75.0
+
+# ==============================================================================
+# Request Scheduler Constants
+# ==============================================================================
+# Default bucket capacity when a request rate is configured on the client:
+# requests that may go out back to back before pacing kicks in
+REQUEST_SCHEDULER_BURST = 10
+
+# Scheduling lane per API path prefix, checked in order (first match wins).
+# Lanes are served control → runtime → normal → background; unmatched paths
+# use the normal lane.
+REQUEST_PRIORITY_ENDPOINT_PREFIXES: tuple[tuple[str, str], ...] = (
+    ("/WManage/api/login", "control"),
+    ("/WManage/web/maintain/remoteSet/", "control"),
+    ("/WManage/web/config/quickCharge/start", "control"),
+    ("/WManage/web/config/quickCharge/stop", "control"),
+    ("/WManage/web/config/quickDischarge/", "control"),
+    ("/WManage/web/maintain/standardUpdate/run", "control"),
+    ("/WManage/api/inverter/getInverterRuntime", "runtime"),
+    ("/WManage/api/inverter/getInverterEnergyInfo", "runtime"),
+    ("/WManage/api/battery/getBatteryInfo", "runtime"),
+    ("/WManage/api/midbox/getMidboxRuntime", "runtime"),
+    ("/WManage/api/analyze/", "background"),
+    ("/WManage/api/inverterChart/", "background"),
+    ("/WManage/api/predict/", "background"),
+    ("/WManage/api/weather/", "background"),
+    ("/WManage/web/analyze/", "background"),
+    ("/WManage/web/maintain/standardUpdate/checkUpdates", "background"),
+    ("/WManage/web/maintain/remoteUpdate/info", "background"),
+)
+
+# Default number of concurrent requests in a batched multi-inverter runtime
+# fetch; kept below HTTP_POOL_LIMIT_PER_HOST so a batch never queues on the
+# connection pool
+RUNTIME_BATCH_MAX_CONCURRENCY = 8
+
+# ==============================================================================
+# Response Cache Constants
+# ==============================================================================
+# Upper bound on cached API responses held by one client. Least-recently-used
+# entries are evicted first once either bound is exceeded.
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+
+# Upper bound on the estimated size (serialized JSON bytes) of cached responses
+RESPONSE_CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# Request parameters whose values identify a device; cache entries are indexed
+# by these values so device invalidation does not scan every key
+SERIAL_CACHE_PARAMS = frozenset({"serialNum", "sn", "inverterSn"})
+
+# Cache classes whose responses hold "today" totals that reset at local
+# midnight. These are dropped on the first request of a new local day (in the
+# client's IANA timezone); every other class expires only by its own TTL.
+DAY_SCOPED_CACHE_CLASSES = frozenset({"inverter_energy"})
+
+# Cache classes eligible for stale-while-revalidate serving when enabled on
+# the client: fast-changing runtime snapshots where a slightly old value is
+# better than blocking an entity update on a cloud round-trip
+STALE_WHILE_REVALIDATE_CACHE_CLASSES = frozenset({"inverter_runtime", "midbox_runtime"})
+
+# Default seconds past its TTL that a stale entry may still be served
+DEFAULT_MAX_STALENESS_SECONDS = 300.0
+
+# ==============================================================================
+# Client Snapshot Constants
+# ==============================================================================
+# On-disk snapshot format version; snapshots with any other version are ignored
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Cache classes persisted in a snapshot: the slow-changing discovery data and
+# parameter reads a cold start spends most of its requests on. Runtime data is
+# never persisted since it is stale long before the next start. Plant entries
+# only exist when the client was created with cache_plant_discovery=True.
+SNAPSHOT_CACHE_CLASSES = frozenset({"plant_discovery", "device_discovery", "parameter_read"})
+
+# Default maximum age (seconds) of a snapshot that is still loaded
+SNAPSHOT_MAX_AGE_SECONDS = 24 * 3600.0
+
 # Maximum number of retry attempts for transient errors
 MAX_TRANSIENT_ERROR_RETRIES = 3
 
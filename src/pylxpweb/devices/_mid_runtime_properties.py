@@ -15,18 +15,29 @@ Helper methods:
 - ``_raw_float(transport_attr, http_attr)`` — read a pre-scaled float.
 - ``_raw_int(transport_attr, http_attr)`` — read an int (smart port status).
 
+``snapshot()`` resolves every public property below in one pass and caches
+the result until the next refresh, for consumers that read them all.
+
 Aggregate properties (e.g. ``grid_power``, ``e_ups_today``) delegate to
 per-phase properties so the access logic is handled in one place.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
+
+from ._sensor_snapshot import sensor_snapshot
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from pylxpweb.models import MidboxRuntime
     from pylxpweb.transports.data import MidboxRuntimeData
 
+# Public properties that describe the device rather than measure anything;
+# left out of snapshot().
+_NON_SENSOR_PROPERTIES = frozenset({"firmware_version", "has_data"})
+
 
 def _safe_sum(*values: int | float | None) -> float | None:
     """Sum values, returning None if all are None, treating individual Nones as 0.
@@ -95,6 +106,19 @@ class MIDRuntimePropertiesMixin:
             return None
         return cast("float | None", getattr(tr, attr, None))
 
+    def snapshot(self) -> Mapping[str, Any]:
+        """Get every GridBOSS sensor value, resolved in one pass.
+
+        Keys are the sensor property names of this mixin
+        (``grid_l1_voltage``, ``smart_load1_power``, ...); ``firmware_version``
+        and ``has_data`` are left out.  The mapping is read-only and reused
+        until the device refreshes.
+
+        Returns:
+            Read-only mapping of sensor name to value.
+        """
+        return sensor_snapshot(self, MIDRuntimePropertiesMixin, _NON_SENSOR_PROPERTIES)
+
     # ===========================================
     # Smart Port Power Helper
     # ===========================================
@@ -0,0 +1,81 @@
+"""Cached sensor snapshots for the runtime property mixins.
+
+``sensor_snapshot()`` calls the getter of every sensor property a runtime
+mixin declares and caches the resulting mapping on the device until the
+device refreshes or its runtime data object is replaced, so consumers that
+read every sensor each poll pay for the getters once per refresh instead of
+once per read.
+
+The getter list is looked up once per concrete class, so subclass overrides
+(e.g. off-grid families) are honoured.  Keys are property names, not the
+register tables' ``ha_sensor_key`` names, which only partly coincide.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from functools import cache
+from types import MappingProxyType
+from typing import Any
+
+# (refresh generation, cloud runtime object, transport runtime object)
+type _SnapshotKey = tuple[object, object, object]
+
+
+@cache
+def _sensor_getters(
+    device_cls: type, mixin: type, exclude: frozenset[str]
+) -> tuple[tuple[str, Callable[[Any], Any]], ...]:
+    """Return ``(name, getter)`` for each public property ``mixin`` declares.
+
+    Getters are taken from ``device_cls`` so that overrides win.  Names keep
+    the mixin's declaration order; names in ``exclude`` are skipped.
+    """
+    getters: list[tuple[str, Callable[[Any], Any]]] = []
+    for name, attr in vars(mixin).items():
+        if name.startswith("_") or name in exclude or not isinstance(attr, property):
+            continue
+        resolved = getattr(device_cls, name, None)
+        if isinstance(resolved, property) and resolved.fget is not None:
+            getters.append((name, resolved.fget))
+    return tuple(getters)
+
+
+def sensor_snapshot(
+    device: Any, mixin: type, exclude: frozenset[str] = frozenset()
+) -> Mapping[str, Any]:
+    """Resolve every sensor property of ``mixin`` on ``device`` in one pass.
+
+    Args:
+        device: Inverter or MID device using ``mixin``.
+        mixin: Runtime properties mixin whose public properties are sensors.
+        exclude: Public properties of ``mixin`` that are not sensors
+            (firmware version, connection flags, ...).
+
+    Returns:
+        Read-only mapping of property name to value, reused until the
+        device's refresh generation or runtime data objects change.
+    """
+    key: _SnapshotKey = (
+        getattr(device, "refresh_generation", None),
+        getattr(device, "_runtime", None),
+        getattr(device, "_transport_runtime", None),
+    )
+    cached: tuple[_SnapshotKey, Mapping[str, Any]] | None = getattr(
+        device, "_sensor_snapshot_cache", None
+    )
+    # Runtime objects compare by identity: they are replaced on refresh, never
+    # mutated, and comparing pydantic models field by field costs a full pass.
+    if (
+        cached is not None
+        and cached[0][0] == key[0]
+        and cached[0][1] is key[1]
+        and cached[0][2] is key[2]
+    ):
+        return cached[1]
+
+    device_cls: type = type(device)
+    values = {name: getter(device) for name, getter in _sensor_getters(device_cls, mixin, exclude)}
+    snapshot = MappingProxyType(values)
+    device._sensor_snapshot_cache = (key, snapshot)
+    return snapshot
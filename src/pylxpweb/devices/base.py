@@ -144,7 +144,9 @@ class BaseDevice(ABC):
         self._client = client
         self.serial_number = serial_number
         self._model = model
-        self._last_refresh: datetime | None = None
+        # Bumped on every _last_refresh assignment; see refresh_generation.
+        self._refresh_generation = 0
+        self._last_refresh_at: datetime | None = None
         self._refresh_interval = timedelta(seconds=30)
 
         # Local transport (Modbus/Dongle) - None means HTTP-only mode
@@ -230,6 +232,42 @@ class BaseDevice(ABC):
         """
         return self._model if self._model else "Unknown"
 
+    @property
+    def _last_refresh(self) -> datetime | None:
+        """Time of the last completed refresh, or None if never refreshed."""
+        return self._last_refresh_at
+
+    @_last_refresh.setter
+    def _last_refresh(self, value: datetime | None) -> None:
+        self._last_refresh_at = value
+        self._refresh_generation = getattr(self, "_refresh_generation", 0) + 1
+
+    @property
+    def refresh_generation(self) -> int:
+        """Counter incremented each time this device's data changes.
+
+        It moves on every completed refresh and whenever cached data is
+        dropped outside one (transport link down or detached).
+
+        Aggregates over several devices (``ParallelGroup``, ``BatteryBank``)
+        memoize their values per member generation, so they are recomputed
+        only after a member's data changes.
+
+        Returns:
+            Number of data changes recorded since the device was created.
+        """
+        return self._refresh_generation
+
+    def _bump_refresh_generation(self) -> None:
+        """Mark member data as changed outside a completed refresh.
+
+        Called when cached data is cleared or replaced without assigning
+        ``_last_refresh`` (link down, local transport detached), so
+        aggregates memoized on ``refresh_generation`` do not keep serving
+        the dropped values.
+        """
+        self._refresh_generation += 1
+
     @property
     def needs_refresh(self) -> bool:
         """Check if device data needs refreshing based on TTL.
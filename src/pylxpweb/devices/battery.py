@@ -176,6 +176,9 @@ class Battery(BaseDevice):
             value: New BatteryModule data
         """
         self._data = value
+        # New module data is this battery's refresh; lets BatteryBank
+        # aggregates see the change.
+        self._refresh_generation += 1
 
     # ========== Identification Properties ==========
 
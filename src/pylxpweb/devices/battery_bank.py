@@ -7,6 +7,7 @@ for all batteries connected to an inverter.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from pylxpweb.constants import ScaleFactor, apply_scale
@@ -22,6 +23,20 @@ if TYPE_CHECKING:
     from .inverters.base import BaseInverter
 
 
+@dataclass(frozen=True, slots=True)
+class _BankAggregates:
+    """Cross-battery diagnostics for one refresh generation of a bank."""
+
+    soc_delta: int | None
+    min_soh: int | None
+    soh_delta: int | None
+    voltage_delta: float | None
+    cell_voltage_delta_max: float | None
+    cycle_count_delta: int | None
+    max_cell_temp: float | None
+    temp_delta: float | None
+
+
 class BatteryBank(BaseDevice):
     """Represents the aggregate battery bank for an inverter.
 
@@ -87,6 +102,47 @@ class BatteryBank(BaseDevice):
         # Individual battery modules in this bank
         self.batteries: list[Battery] = []  # Will be Battery objects
 
+        # Diagnostics memoized per battery refresh generation
+        self._aggregates_cache: tuple[tuple[object, ...], _BankAggregates] | None = None
+
+    def _aggregates(self) -> _BankAggregates:
+        """Return cross-battery diagnostics, rebuilt only after a battery refreshes.
+
+        The cache key pairs each battery object with its refresh generation,
+        so replacing the list, a battery, or a battery's data all invalidate it.
+        """
+        batteries = self.batteries
+        key = tuple((battery, battery.refresh_generation) for battery in batteries)
+        cached = self._aggregates_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        if not batteries:
+            aggregates = _BankAggregates(None, None, None, None, None, None, None, None)
+        else:
+            socs = [b.soc for b in batteries]
+            sohs = [b.soh for b in batteries]
+            counts = [b.cycle_count for b in batteries]
+            # Zero is the transport's absent-voltage sentinel, not a real sample.
+            voltages = [v for v in (b.voltage for b in batteries) if v > 0]
+            highest = max(b.max_cell_temp for b in batteries)
+            lowest = min(b.min_cell_temp for b in batteries)
+            several = len(batteries) >= 2
+            aggregates = _BankAggregates(
+                soc_delta=max(socs) - min(socs) if several else None,
+                min_soh=min(sohs),
+                soh_delta=max(sohs) - min(sohs) if several else None,
+                voltage_delta=(
+                    round(max(voltages) - min(voltages), 2) if len(voltages) >= 2 else None
+                ),
+                cell_voltage_delta_max=max(b.cell_voltage_delta for b in batteries),
+                cycle_count_delta=max(counts) - min(counts) if several else None,
+                max_cell_temp=highest,
+                temp_delta=round(highest - lowest, 1),
+            )
+        self._aggregates_cache = (key, aggregates)
+        return aggregates
+
     def _get_transport_runtime(self) -> Any | None:
         """Get transport runtime data from parent inverter if available.
 
@@ -205,10 +261,7 @@ class BatteryBank(BaseDevice):
             SOC difference in percentage points, or None if fewer than
             2 batteries are present (delta not meaningful).
         """
-        if len(self.batteries) < 2:
-            return None
-        soc_values = [b.soc for b in self.batteries]
-        return max(soc_values) - min(soc_values)
+        return self._aggregates().soc_delta
 
     # ========== State of Health ==========
 
@@ -221,9 +274,7 @@ class BatteryBank(BaseDevice):
         Returns:
             Lowest SOH percentage, or None if no batteries present.
         """
-        if not self.batteries:
-            return None
-        return min(b.soh for b in self.batteries)
+        return self._aggregates().min_soh
 
     @property
     def soh_delta(self) -> int | None:
@@ -236,10 +287,7 @@ class BatteryBank(BaseDevice):
             SOH difference in percentage points, or None if fewer than
             2 batteries are present.
         """
-        if len(self.batteries) < 2:
-            return None
-        soh_values = [b.soh for b in self.batteries]
-        return max(soh_values) - min(soh_values)
+        return self._aggregates().soh_delta
 
     # ========== Cross-Battery Diagnostics ==========
 
@@ -254,11 +302,7 @@ class BatteryBank(BaseDevice):
             Voltage difference in volts, or None if fewer than
             2 batteries are present.
         """
-        # Zero is the transport's absent-voltage sentinel, not a real sample.
-        voltages = [b.voltage for b in self.batteries if b.voltage > 0]
-        if len(voltages) < 2:
-            return None
-        return round(max(voltages) - min(voltages), 2)
+        return self._aggregates().voltage_delta
 
     @property
     def cell_voltage_delta_max(self) -> float | None:
@@ -272,9 +316,7 @@ class BatteryBank(BaseDevice):
             Maximum cell voltage delta in volts, or None if no
             batteries present.
         """
-        if not self.batteries:
-            return None
-        return max(b.cell_voltage_delta for b in self.batteries)
+        return self._aggregates().cell_voltage_delta_max
 
     @property
     def cycle_count(self) -> int | None:
@@ -305,10 +347,7 @@ class BatteryBank(BaseDevice):
             Cycle count difference, or None if fewer than
             2 batteries are present.
         """
-        if len(self.batteries) < 2:
-            return None
-        counts = [b.cycle_count for b in self.batteries]
-        return max(counts) - min(counts)
+        return self._aggregates().cycle_count_delta
 
     @property
     def max_cell_temp(self) -> float | None:
@@ -320,9 +359,7 @@ class BatteryBank(BaseDevice):
             Maximum cell temperature in Celsius, or None if no
             batteries present.
         """
-        if not self.batteries:
-            return None
-        return max(b.max_cell_temp for b in self.batteries)
+        return self._aggregates().max_cell_temp
 
     @property
     def temp_delta(self) -> float | None:
@@ -335,11 +372,7 @@ class BatteryBank(BaseDevice):
             Temperature difference in Celsius, or None if no
             batteries present.
         """
-        if not self.batteries:
-            return None
-        highest = max(b.max_cell_temp for b in self.batteries)
-        lowest = min(b.min_cell_temp for b in self.batteries)
-        return round(highest - lowest, 1)
+        return self._aggregates().temp_delta
 
     # ========== Voltage Properties ==========
 
@@ -18,6 +18,9 @@ Helper methods:
 - ``_scaled_float(transport_attr, http_field)`` — read a float that
   needs ``scale_runtime_value()`` applied to the HTTP path.
 
+``snapshot()`` resolves every public property below in one pass and caches
+the result until the next refresh, for consumers that read them all.
+
 Both factory methods on InverterRuntimeData (``from_modbus_registers()``)
 and InverterRuntime (HTTP cloud API) are supported. Transport data is
 already scaled; HTTP data uses ``scale_runtime_value()`` for fields that
@@ -39,17 +42,26 @@ Properties are organized by category:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pylxpweb.constants import derive_pv_current, scale_runtime_value
 from pylxpweb.transports.data import BATTERY_TEMPERATURE_SENTINEL_C
 
+from .._sensor_snapshot import sensor_snapshot
 from ._features import InverterFamily
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from pylxpweb.models import InverterRuntime
     from pylxpweb.transports.data import InverterRuntimeData
 
+# Public properties that describe the device or its connection rather than
+# measure anything; left out of snapshot().
+_NON_SENSOR_PROPERTIES = frozenset(
+    {"firmware_version", "is_lost", "power_rating", "power_rating_text", "has_runtime_data"}
+)
+
 
 class InverterRuntimePropertiesMixin:
     """Mixin providing runtime property accessors for inverters."""
@@ -106,6 +118,19 @@ class InverterRuntimePropertiesMixin:
             return None
         return scale_runtime_value(http_field, raw)
 
+    def snapshot(self) -> Mapping[str, Any]:
+        """Get every runtime sensor value, resolved in one pass.
+
+        Keys are the sensor property names of this mixin (``pv1_voltage``,
+        ``battery_power``, ...); device info and connection flags such as
+        ``firmware_version`` and ``is_lost`` are left out.  The mapping is
+        read-only and reused until the inverter refreshes.
+
+        Returns:
+            Read-only mapping of sensor name to value.
+        """
+        return sensor_snapshot(self, InverterRuntimePropertiesMixin, _NON_SENSOR_PROPERTIES)
+
     # ===========================================
     # PV (Solar Panel) Properties
     # ===========================================
@@ -322,6 +322,7 @@ class BaseInverter(FirmwareUpdateMixin, InverterRuntimePropertiesMixin, BaseDevi
         self._transport_runtime = None
         self._transport_energy = None
         self._transport_battery = None
+        self._bump_refresh_generation()
 
     def _on_local_transport_attached(self) -> None:
         """Apply transport-specific cache TTLs after public attachment."""
@@ -219,6 +219,7 @@ class MIDDevice(FirmwareUpdateMixin, MIDRuntimePropertiesMixin, BaseDevice):
         """Drop transport-derived MID data after detachment."""
         self._transport_runtime = None
         self._runtime_cache_time = None
+        self._bump_refresh_generation()
 
     async def refresh(self) -> None:
         """Refresh MID device runtime data from API or transport.
@@ -343,6 +344,7 @@ class MIDDevice(FirmwareUpdateMixin, MIDRuntimePropertiesMixin, BaseDevice):
         marks the device unavailable (eg4-57g / integration #226).
         """
         self._transport_runtime = None
+        self._bump_refresh_generation()
 
     # All properties are provided by MIDRuntimePropertiesMixin
 
@@ -6,6 +6,7 @@ inverters operating in parallel, optionally with a MID (GridBOSS) device.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -17,6 +18,30 @@ if TYPE_CHECKING:
     from .station import Station
 
 
+@dataclass(frozen=True, slots=True)
+class _PowerAggregates:
+    """Inverter power sums for one refresh generation of a group."""
+
+    pv_total_power: int
+    inverter_power: int
+    eps_power: int
+    grid_import_power: int
+    grid_export_power: int
+
+
+@dataclass(frozen=True, slots=True)
+class _BatteryAggregates:
+    """Battery bank sums for one refresh generation of a group."""
+
+    charge_power: int
+    discharge_power: int
+    battery_power: int
+    max_capacity: int
+    current_capacity: float
+    voltage: float | None
+    battery_count: int
+
+
 class ParallelGroup:
     """Represents a group of inverters operating in parallel.
 
@@ -69,6 +94,10 @@ class ParallelGroup:
         # Energy data (private - use properties for access)
         self._energy: EnergyInfo | None = None
 
+        # Aggregates memoized per member refresh generation (see _members_key)
+        self._power_cache: tuple[tuple[object, ...], _PowerAggregates] | None = None
+        self._battery_cache: tuple[tuple[object, ...], _BatteryAggregates] | None = None
+
     async def refresh(self) -> None:
         """Refresh runtime data for all devices in group.
 
@@ -417,6 +446,90 @@ class ParallelGroup:
     # ===========================================
     # These properties aggregate power values from all inverters in the group.
     # Computed from each inverter's runtime data, not from a single API call.
+    # The sums are built in one pass and reused until a member inverter
+    # refreshes, so reading every property costs one walk per refresh.
+
+    def _members_key(self) -> tuple[object, ...]:
+        """Member inverters paired with their refresh generations.
+
+        Holds the inverter objects themselves (not ids) so a replaced
+        member can never alias a cached one.
+        """
+        return tuple(
+            (inverter, getattr(inverter, "refresh_generation", None)) for inverter in self.inverters
+        )
+
+    def _power(self) -> _PowerAggregates:
+        """Return the power sums for the current member generations."""
+        key = self._members_key()
+        cached = self._power_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        pv = inverter_power = eps = grid_import = grid_export = 0
+        for inverter in self.inverters:
+            value = inverter.pv_total_power
+            if value is not None:
+                pv += value
+            value = inverter.inverter_power
+            if value is not None:
+                inverter_power += value
+            value = inverter.eps_power
+            if value is not None:
+                eps += value
+            value = inverter.power_to_user
+            if value is not None:
+                grid_import += value
+            value = inverter.power_to_grid
+            if value is not None:
+                grid_export += value
+
+        aggregates = _PowerAggregates(
+            pv_total_power=pv,
+            inverter_power=inverter_power,
+            eps_power=eps,
+            grid_import_power=grid_import,
+            grid_export_power=grid_export,
+        )
+        self._power_cache = (key, aggregates)
+        return aggregates
+
+    def _battery(self) -> _BatteryAggregates:
+        """Return the battery bank sums for the current member generations."""
+        key = self._members_key()
+        cached = self._battery_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        charge = discharge = battery_power = max_capacity = battery_count = 0
+        current_capacity = 0.0
+        voltages: list[float] = []
+        for inverter in self.inverters:
+            bank = inverter.battery_bank
+            if not bank:
+                continue
+            charge += bank.charge_power or 0
+            discharge += bank.discharge_power or 0
+            if bank.battery_power is not None:
+                battery_power += bank.battery_power
+            max_capacity += bank.max_capacity or 0
+            current_capacity += bank.current_capacity or 0
+            voltage = bank.voltage
+            if voltage is not None and voltage > 0:
+                voltages.append(voltage)
+            battery_count += bank.battery_count or 0
+
+        aggregates = _BatteryAggregates(
+            charge_power=charge,
+            discharge_power=discharge,
+            battery_power=battery_power,
+            max_capacity=max_capacity,
+            current_capacity=current_capacity,
+            voltage=round(sum(voltages) / len(voltages), 1) if voltages else None,
+            battery_count=battery_count,
+        )
+        self._battery_cache = (key, aggregates)
+        return aggregates
 
     @property
     def pv_total_power(self) -> int:
@@ -427,12 +540,7 @@ class ParallelGroup:
         Returns:
             Total PV power in watts, or 0 if no data.
         """
-        total = 0
-        for inverter in self.inverters:
-            pv = inverter.pv_total_power
-            if pv is not None:
-                total += pv
-        return total
+        return self._power().pv_total_power
 
     @property
     def inverter_power(self) -> int:
@@ -443,12 +551,7 @@ class ParallelGroup:
         Returns:
             Total inverter output power in watts, or 0 if no data.
         """
-        total = 0
-        for inverter in self.inverters:
-            power = inverter.inverter_power
-            if power is not None:
-                total += power
-        return total
+        return self._power().inverter_power
 
     @property
     def grid_power(self) -> int:
@@ -461,12 +564,8 @@ class ParallelGroup:
         Returns:
             Net grid power in watts, or 0 if no data.
         """
-        total = 0
-        for inverter in self.inverters:
-            import_power = inverter.power_to_user or 0
-            export_power = inverter.power_to_grid or 0
-            total += import_power - export_power
-        return total
+        power = self._power()
+        return power.grid_import_power - power.grid_export_power
 
     @property
     def load_power(self) -> int:
@@ -478,15 +577,15 @@ class ParallelGroup:
         Returns:
             Total load consumption in watts, or 0 if no data.
         """
-        pv = self.pv_total_power
-        discharge = self.battery_discharge_power
-        charge = self.battery_charge_power
-        grid_import = 0
-        grid_export = 0
-        for inverter in self.inverters:
-            grid_import += inverter.power_to_user or 0
-            grid_export += inverter.power_to_grid or 0
-        return pv + discharge - charge + grid_import - grid_export
+        power = self._power()
+        battery = self._battery()
+        return (
+            power.pv_total_power
+            + battery.discharge_power
+            - battery.charge_power
+            + power.grid_import_power
+            - power.grid_export_power
+        )
 
     @property
     def eps_power(self) -> int:
@@ -497,12 +596,7 @@ class ParallelGroup:
         Returns:
             Total EPS power in watts, or 0 if no data.
         """
-        total = 0
-        for inverter in self.inverters:
-            eps = inverter.eps_power
-            if eps is not None:
-                total += eps
-        return total
+        return self._power().eps_power
 
     @property
     def grid_import_power(self) -> int:
@@ -513,12 +607,7 @@ class ParallelGroup:
         Returns:
             Total grid import power in watts, or 0 if no data.
         """
-        total = 0
-        for inverter in self.inverters:
-            import_power = inverter.power_to_user
-            if import_power is not None:
-                total += import_power
-        return total
+        return self._power().grid_import_power
 
     @property
     def grid_export_power(self) -> int:
@@ -529,12 +618,7 @@ class ParallelGroup:
         Returns:
             Total grid export power in watts, or 0 if no data.
         """
-        total = 0
-        for inverter in self.inverters:
-            export_power = inverter.power_to_grid
-            if export_power is not None:
-                total += export_power
-        return total
+        return self._power().grid_export_power
 
     @property
     def consumption_power(self) -> int:
@@ -549,12 +633,17 @@ class ParallelGroup:
         Returns:
             Total consumption power in watts (>= 0).
         """
-        pv = self.pv_total_power
-        grid_import = self.grid_import_power
-        grid_export = self.grid_export_power
+        power = self._power()
+        battery = self._battery()
         # Battery power: discharge adds to available power, charge subtracts
-        battery_power = self.battery_discharge_power - self.battery_charge_power
-        return max(0, pv + battery_power + grid_import - grid_export)
+        battery_power = battery.discharge_power - battery.charge_power
+        return max(
+            0,
+            power.pv_total_power
+            + battery_power
+            + power.grid_import_power
+            - power.grid_export_power,
+        )
 
     # ===========================================
     # Aggregate Battery Properties
@@ -572,11 +661,7 @@ class ParallelGroup:
         Returns:
             Total charging power in watts, or 0 if no battery data.
         """
-        total = 0
-        for inverter in self.inverters:
-            if inverter.battery_bank:
-                total += inverter.battery_bank.charge_power or 0
-        return total
+        return self._battery().charge_power
 
     @property
     def battery_discharge_power(self) -> int:
@@ -587,11 +672,7 @@ class ParallelGroup:
         Returns:
             Total discharging power in watts, or 0 if no battery data.
         """
-        total = 0
-        for inverter in self.inverters:
-            if inverter.battery_bank:
-                total += inverter.battery_bank.discharge_power or 0
-        return total
+        return self._battery().discharge_power
 
     @property
     def battery_power(self) -> int:
@@ -603,11 +684,7 @@ class ParallelGroup:
         Returns:
             Net battery power in watts, or 0 if no battery data.
         """
-        total = 0
-        for inverter in self.inverters:
-            if inverter.battery_bank and inverter.battery_bank.battery_power is not None:
-                total += inverter.battery_bank.battery_power
-        return total
+        return self._battery().battery_power
 
     @property
     def battery_soc(self) -> float:
@@ -620,18 +697,9 @@ class ParallelGroup:
         Returns:
             Weighted average SOC percentage (0-100), or 0.0 if no battery data.
         """
-        total_current = 0.0
-        total_max = 0.0
-
-        for inverter in self.inverters:
-            if inverter.battery_bank:
-                current = inverter.battery_bank.current_capacity or 0
-                max_cap = inverter.battery_bank.max_capacity or 0
-                total_current += current
-                total_max += max_cap
-
-        if total_max > 0:
-            return round((total_current / total_max) * 100, 1)
+        battery = self._battery()
+        if battery.max_capacity > 0:
+            return round((battery.current_capacity / battery.max_capacity) * 100, 1)
         return 0.0
 
     @property
@@ -643,11 +711,7 @@ class ParallelGroup:
         Returns:
             Total maximum capacity in Ah, or 0 if no battery data.
         """
-        total = 0
-        for inverter in self.inverters:
-            if inverter.battery_bank:
-                total += inverter.battery_bank.max_capacity or 0
-        return total
+        return self._battery().max_capacity
 
     @property
     def battery_current_capacity(self) -> float:
@@ -658,11 +722,7 @@ class ParallelGroup:
         Returns:
             Total current capacity in Ah, or 0.0 if no battery data.
         """
-        total = 0.0
-        for inverter in self.inverters:
-            if inverter.battery_bank:
-                total += inverter.battery_bank.current_capacity or 0
-        return round(total, 1)
+        return round(self._battery().current_capacity, 1)
 
     @property
     def battery_voltage(self) -> float | None:
@@ -674,16 +734,7 @@ class ParallelGroup:
         Returns:
             Average battery voltage in volts, or None if no battery data.
         """
-        voltages: list[float] = []
-        for inverter in self.inverters:
-            if inverter.battery_bank:
-                voltage = inverter.battery_bank.voltage
-                if voltage is not None and voltage > 0:
-                    voltages.append(voltage)
-
-        if voltages:
-            return round(sum(voltages) / len(voltages), 1)
-        return None
+        return self._battery().voltage
 
     @property
     def battery_count(self) -> int:
@@ -694,11 +745,7 @@ class ParallelGroup:
         Returns:
             Total number of battery modules, or 0 if no battery data.
         """
-        total = 0
-        for inverter in self.inverters:
-            if inverter.battery_bank:
-                total += inverter.battery_bank.battery_count or 0
-        return total
+        return self._battery().battery_count
 
     @classmethod
     async def from_api_data(
@@ -29,6 +29,7 @@ _LOGGER = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from pylxpweb import LuxpowerClient
     from pylxpweb.transports.config import AttachResult, TransportConfig, TransportFactory
+    from pylxpweb.transports.modbus_gateway import ModbusGatewayPool
     from pylxpweb.transports.protocol import InverterTransport
 
     from .battery import Battery
@@ -640,6 +641,7 @@ class Station(BaseDevice):
         station_name: str = "Local Station",
         plant_id: int = 0,
         timezone_str: str = "UTC",
+        share_modbus_gateways: bool = False,
     ) -> Station:
         """Create a Station from local transport discovery.
 
@@ -656,6 +658,10 @@ class Station(BaseDevice):
             station_name: Name for the created station (default: "Local Station").
             plant_id: Unique identifier for the station (default: 0).
             timezone_str: Timezone string for the station (default: "UTC").
+            share_modbus_gateways: If True, Modbus TCP devices behind the same
+                gateway (same host and port, different unit IDs) share one
+                connection from a ``ModbusGatewayPool`` (default: False, one
+                connection per device).
 
         Returns:
             Station instance with devices organized by parallel groups.
@@ -713,7 +719,9 @@ class Station(BaseDevice):
         )
 
         # Discover devices from all transports
-        discovered, failed_serials = await cls._discover_devices_from_configs(configs)
+        discovered, failed_serials = await cls._discover_devices_from_configs(
+            configs, share_modbus_gateways=share_modbus_gateways
+        )
 
         if not discovered:
             raise TransportConnectionError("All transports failed to connect")
@@ -748,22 +756,28 @@ class Station(BaseDevice):
     async def _discover_devices_from_configs(
         cls,
         configs: list[TransportConfig],
+        *,
+        share_modbus_gateways: bool = False,
     ) -> tuple[list[tuple[Any, Any]], list[str]]:
         """Connect to transports and discover device information.
 
         Args:
             configs: List of transport configurations.
+            share_modbus_gateways: If True, Modbus TCP devices behind the
+                same gateway (same host and port, different unit IDs) share
+                one connection from a gateway pool.
 
         Returns:
             Tuple of (discovered devices, failed serials).
         """
-        from pylxpweb.transports import discover_device_info
+        from pylxpweb.transports import ModbusGatewayPool, discover_device_info
 
         discovered: list[tuple[Any, Any]] = []
         failed_serials: list[str] = []
+        gateways = ModbusGatewayPool() if share_modbus_gateways else None
 
         for config in configs:
-            transport = cls._create_transport_from_config(config)
+            transport = cls._create_transport_from_config(config, gateways=gateways)
             if transport is None:
                 failed_serials.append(config.serial)
                 continue
@@ -787,11 +801,19 @@ class Station(BaseDevice):
         return discovered, failed_serials
 
     @classmethod
-    def _create_transport_from_config(cls, config: TransportConfig) -> Any | None:
+    def _create_transport_from_config(
+        cls,
+        config: TransportConfig,
+        *,
+        gateways: ModbusGatewayPool | None = None,
+    ) -> Any | None:
         """Create a transport from configuration.
 
         Args:
             config: Transport configuration.
+            gateways: Optional pool of shared Modbus TCP connections; Modbus
+                TCP transports then attach to the pool's gateway for their
+                host and port instead of opening their own connection.
 
         Returns:
             Transport instance or None if creation failed.
@@ -808,6 +830,11 @@ class Station(BaseDevice):
                 inverter_family=config.inverter_family,
                 timeout=config.timeout,
                 max_input_block_size=config.max_input_block_size,
+                gateway=(
+                    gateways.get(config.host, config.port, timeout=config.timeout)
+                    if gateways is not None
+                    else None
+                ),
             )
 
         if config.transport_type == TransportType.WIFI_DONGLE:
@@ -9,7 +9,7 @@ from __future__ import annotations
 from pylxpweb.endpoints.analytics import AnalyticsEndpoints
 from pylxpweb.endpoints.base import BaseEndpoint
 from pylxpweb.endpoints.control import ControlEndpoints
-from pylxpweb.endpoints.devices import DeviceEndpoints
+from pylxpweb.endpoints.devices import DeviceEndpoints, RuntimeBatchResult
 from pylxpweb.endpoints.export import ExportDaySheet, ExportEndpoints, parse_export
 from pylxpweb.endpoints.firmware import FirmwareEndpoints
 from pylxpweb.endpoints.forecasting import ForecastingEndpoints
@@ -19,6 +19,7 @@ __all__ = [
     "BaseEndpoint",
     "PlantEndpoints",
     "DeviceEndpoints",
+    "RuntimeBatchResult",
     "ControlEndpoints",
     "AnalyticsEndpoints",
     "ExportEndpoints",
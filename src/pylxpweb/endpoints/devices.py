@@ -6,12 +6,17 @@ This module provides device functionality including:
 - Energy statistics
 - Battery information
 - GridBOSS/MID device data
+- Batched runtime fetches for many inverters
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal, get_args
 
+from pylxpweb.constants import RUNTIME_BATCH_MAX_CONCURRENCY
 from pylxpweb.endpoints.base import BaseEndpoint
 from pylxpweb.models import (
     BatteryInfo,
@@ -29,6 +34,37 @@ from pylxpweb.models import (
 if TYPE_CHECKING:
     from pylxpweb.client import LuxpowerClient
 
+RuntimeBatchPart = Literal["runtime", "energy", "battery"]
+"""Per-inverter data a runtime batch can fetch."""
+
+
+@dataclass
+class RuntimeBatchResult:
+    """Data fetched for one inverter by :meth:`DeviceEndpoints.get_runtime_batch`.
+
+    Parts that were not requested, or whose request failed, are ``None``; a
+    failure is recorded in ``errors`` under the part name instead of being
+    raised, so one offline inverter never fails the whole batch.
+
+    Attributes:
+        serial_num: Inverter serial number.
+        runtime: Real-time metrics (``"runtime"`` part).
+        energy: Energy statistics (``"energy"`` part).
+        battery: Battery status and modules (``"battery"`` part).
+        errors: Part name -> exception raised while fetching it.
+    """
+
+    serial_num: str
+    runtime: InverterRuntime | None = None
+    energy: EnergyInfo | None = None
+    battery: BatteryInfo | None = None
+    errors: dict[str, BaseException] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Return True if every requested part was fetched."""
+        return not self.errors
+
 
 class DeviceEndpoints(BaseEndpoint):
     """Device endpoints for discovery, runtime data, and device information."""
@@ -467,6 +503,77 @@ class DeviceEndpoints(BaseEndpoint):
     # Convenience Methods
     # ============================================================================
 
+    async def get_runtime_batch(
+        self,
+        serials: Iterable[str],
+        include: Iterable[RuntimeBatchPart] = ("runtime", "battery"),
+        *,
+        max_concurrency: int = RUNTIME_BATCH_MAX_CONCURRENCY,
+    ) -> dict[str, RuntimeBatchResult]:
+        """Fetch runtime data for many inverters concurrently.
+
+        Every (serial, part) request is planned up front and run at the same
+        time, at most ``max_concurrency`` at once, so a whole plant refreshes
+        in roughly one round-trip of wall time. Requests go through the regular
+        endpoint methods and therefore reuse the client's response cache and
+        in-flight request coalescing.
+
+        Args:
+            serials: Inverter serial numbers (duplicates are fetched once)
+            include: Parts to fetch per inverter: "runtime", "energy" and/or
+                "battery" (default: runtime and battery)
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            dict: serial_num -> RuntimeBatchResult, in input order. Failed parts
+                are reported in ``RuntimeBatchResult.errors`` rather than raised.
+
+        Raises:
+            ValueError: If ``include`` names an unknown part or
+                ``max_concurrency`` is less than 1
+
+        Example:
+            >>> batch = await client.devices.get_runtime_batch(
+            >>>     ["1234567890", "0987654321"], include=("runtime", "energy")
+            >>> )
+            >>> for serial, result in batch.items():
+            >>>     if result.runtime:
+            >>>         print(f"{serial}: {result.runtime.ppv}W")
+            >>>     for part, error in result.errors.items():
+            >>>         print(f"{serial} {part} failed: {error}")
+        """
+        parts = tuple(dict.fromkeys(include))
+        unknown = set(parts) - set(get_args(RuntimeBatchPart))
+        if unknown:
+            raise ValueError(f"Unknown runtime batch parts: {sorted(unknown)}")
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
+        results = {sn: RuntimeBatchResult(serial_num=sn) for sn in dict.fromkeys(serials)}
+        if not results or not parts:
+            return results
+
+        fetchers: dict[RuntimeBatchPart, Callable[[str], Awaitable[object]]] = {
+            "runtime": self.get_inverter_runtime,
+            "energy": self.get_inverter_energy,
+            "battery": self.get_battery_info,
+        }
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(result: RuntimeBatchResult, part: RuntimeBatchPart) -> None:
+            async with semaphore:
+                try:
+                    value = await fetchers[part](result.serial_num)
+                except Exception as err:
+                    result.errors[part] = err
+                    return
+            setattr(result, part, value)
+
+        await asyncio.gather(
+            *(fetch(result, part) for result in results.values() for part in parts)
+        )
+        return results
+
     async def get_all_device_data(
         self, plant_id: int
     ) -> dict[str, InverterOverviewResponse | dict[str, InverterRuntime] | dict[str, BatteryInfo]]:
@@ -496,8 +603,6 @@ class DeviceEndpoints(BaseEndpoint):
             >>>     if runtime:
             >>>         print(f"Inverter {inverter['serialNum']}: {runtime.pac}W")
         """
-        import asyncio
-
         # Get device list first
         devices = await self.get_devices(plant_id)
 
@@ -508,24 +613,18 @@ class DeviceEndpoints(BaseEndpoint):
             if "Grid Boss" not in device.deviceTypeText:
                 inverter_serials.append(device.serialNum)
 
-        # Fetch runtime and battery data concurrently for all inverters
-        runtime_tasks = [self.get_inverter_runtime(sn) for sn in inverter_serials]
-        battery_tasks = [self.get_battery_info(sn) for sn in inverter_serials]
-
-        runtime_results = await asyncio.gather(*runtime_tasks, return_exceptions=True)
-        battery_results = await asyncio.gather(*battery_tasks, return_exceptions=True)
+        # Fetch runtime and battery data for all inverters in one batch
+        batch = await self.get_runtime_batch(inverter_serials, include=("runtime", "battery"))
 
         # Build result dictionaries
         runtime_data: dict[str, InverterRuntime] = {}
         battery_data: dict[str, BatteryInfo] = {}
 
-        for sn, runtime in zip(inverter_serials, runtime_results, strict=True):
-            if not isinstance(runtime, BaseException):
-                runtime_data[sn] = runtime
-
-        for sn, battery in zip(inverter_serials, battery_results, strict=True):
-            if not isinstance(battery, BaseException):
-                battery_data[sn] = battery
+        for sn, result in batch.items():
+            if result.runtime is not None:
+                runtime_data[sn] = result.runtime
+            if result.battery is not None:
+                battery_data[sn] = result.battery
 
         return {
             "devices": devices,
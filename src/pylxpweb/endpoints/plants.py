@@ -87,7 +87,16 @@ class PlantEndpoints(BaseEndpoint):
             "rows": rows,
         }
 
-        response = await self.client._request("POST", self._plant_list_endpoint, data=data)
+        # Cached (and snapshotted) only with cache_plant_discovery=True
+        caching = self.client._cache_plant_discovery
+        cache_key = self._get_cache_key("plants", path=self._plant_list_endpoint, **data)
+        response = await self.client._request(
+            "POST",
+            self._plant_list_endpoint,
+            data=data,
+            cache_key=cache_key if caching else None,
+            cache_endpoint="plant_discovery" if caching else None,
+        )
         return PlantListResponse.model_validate(response)
 
     async def get_plant_details(self, plant_id: int | str) -> dict[str, Any]:
@@ -130,7 +139,17 @@ class PlantEndpoints(BaseEndpoint):
             "order": "desc",
         }
 
-        response = await self.client._request("POST", self._plant_list_endpoint, data=data)
+        caching = self.client._cache_plant_discovery
+        cache_key = self._get_cache_key(
+            "plant_details", path=self._plant_list_endpoint, plantId=plant_id
+        )
+        response = await self.client._request(
+            "POST",
+            self._plant_list_endpoint,
+            data=data,
+            cache_key=cache_key if caching else None,
+            cache_endpoint="plant_discovery" if caching else None,
+        )
 
         if isinstance(response, dict) and response.get("rows"):
             from logging import getLogger
@@ -345,6 +364,9 @@ class PlantEndpoints(BaseEndpoint):
         _LOGGER = getLogger(__name__)
         await self.client._ensure_authenticated()
 
+        # The edit posts back every field, so never build it from cached details
+        self.client._response_cache.invalidate_class("plant_discovery")
+
         # Get current configuration from API (human-readable values)
         _LOGGER.debug("Fetching plant details for plant %s", plant_id)
         plant_details = await self.get_plant_details(plant_id)
@@ -359,6 +381,7 @@ class PlantEndpoints(BaseEndpoint):
         )
 
         response = await self.client._request("POST", "/WManage/web/config/plant/edit", data=data)
+        self.client._response_cache.invalidate_class("plant_discovery")
 
         _LOGGER.debug("Plant %s configuration updated successfully", plant_id)
         return response
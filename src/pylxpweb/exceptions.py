@@ -15,6 +15,10 @@ class LuxpowerConnectionError(LuxpowerError):
     """Raised when connection to the API fails."""
 
 
+class LuxpowerCircuitOpenError(LuxpowerConnectionError):
+    """Raised when a request is refused because its endpoint's circuit is open."""
+
+
 class LuxpowerAPIError(LuxpowerError):
     """Raised when the API returns an error response."""
 
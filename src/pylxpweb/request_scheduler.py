@@ -0,0 +1,215 @@
+"""Token-bucket request scheduler for Luxpower API calls.
+
+``LuxpowerClient`` can pace its HTTP calls ahead of time instead of only
+reacting to portal throttling after the fact. This module provides the
+scheduler behind that pacing:
+
+- One token bucket per client (one account): ``rate`` tokens per second
+  refill a bucket that holds at most ``burst`` tokens, and every HTTP
+  attempt spends one token.
+- Callers that find the bucket empty wait in a priority queue. Control
+  writes and login run first, runtime polls next, and analytics, charts,
+  forecasts and firmware checks last; within a priority, callers are
+  served in arrival order.
+- Queue depth and wait-time counters are kept for ``scheduler_stats``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import Callable
+from enum import IntEnum
+
+from .constants import REQUEST_PRIORITY_ENDPOINT_PREFIXES
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """Scheduling lane of an API request; lower values are served first."""
+
+    CONTROL = 0
+    """Parameter writes, quick charge/discharge commands and login."""
+
+    RUNTIME = 1
+    """Runtime, energy and battery polls that feed live entities."""
+
+    NORMAL = 2
+    """Discovery, parameter reads and anything not classified otherwise."""
+
+    BACKGROUND = 3
+    """Analytics, chart data, forecasts, exports and firmware checks."""
+
+
+def request_priority(endpoint: str) -> RequestPriority:
+    """Return the scheduling lane for an API endpoint path.
+
+    Paths are matched against ``REQUEST_PRIORITY_ENDPOINT_PREFIXES``;
+    unmatched paths use ``RequestPriority.NORMAL``.
+    """
+    for prefix, lane in REQUEST_PRIORITY_ENDPOINT_PREFIXES:
+        if endpoint.startswith(prefix):
+            return RequestPriority[lane.upper()]
+    return RequestPriority.NORMAL
+
+
+class RequestScheduler:
+    """Token bucket with priority lanes for one account's API requests.
+
+    Example:
+        >>> scheduler = RequestScheduler(rate=2.0, burst=5)
+        >>> await scheduler.acquire(RequestPriority.CONTROL)
+        0.0
+        >>> scheduler.stats()["granted"]
+        1
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the scheduler with a full bucket.
+
+        Args:
+            rate: Tokens added per second (sustained requests per second, > 0)
+            burst: Bucket capacity (requests that may be sent back to back, >= 1)
+            clock: Monotonic time source in seconds (injectable for tests)
+
+        Raises:
+            ValueError: If ``rate`` is not positive or ``burst`` is less than 1
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be > 0, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be >= 1, got {burst}")
+
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+
+        # Min-heap of (priority, arrival sequence, waiter); cancelled waiters
+        # stay in the heap until they reach the top and are skipped
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._wakeup: asyncio.TimerHandle | None = None
+
+        self.granted = 0
+        self.queued = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def tokens(self) -> float:
+        """Return the number of tokens currently in the bucket."""
+        self._refill()
+        return self._tokens
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of callers waiting for a token."""
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    def queue_depth_by_priority(self) -> dict[str, int]:
+        """Return the number of waiting callers per priority lane name."""
+        depths = {priority.name.lower(): 0 for priority in RequestPriority}
+        for priority, _, waiter in self._waiters:
+            if not waiter.done():
+                depths[RequestPriority(priority).name.lower()] += 1
+        return depths
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.NORMAL) -> float:
+        """Wait for a token in ``priority``'s lane and spend it.
+
+        A caller is granted a token immediately only when nobody is queued, so
+        a steady stream of new requests cannot starve waiting ones.
+
+        Returns:
+            Seconds spent waiting for the token.
+        """
+        self._refill()
+        if not self._waiters and self._tokens >= 1.0:
+            self._tokens -= 1.0
+            self.granted += 1
+            return 0.0
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), waiter))
+        self.queued += 1
+        started = self._clock()
+        self._schedule_wakeup()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just before cancellation: hand the token back and
+                # let the next waiter have it now rather than at the next refill
+                self._tokens = min(self._tokens + 1.0, float(self.burst))
+                self.granted -= 1
+                if self._wakeup is not None:
+                    self._wakeup.cancel()
+                    self._wakeup = None
+            self._schedule_wakeup()
+            raise
+
+        waited = self._clock() - started
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        _LOGGER.debug("Request in %s lane waited %.3f seconds", priority.name, waited)
+        return waited
+
+    def stats(self) -> dict[str, float | int | dict[str, int]]:
+        """Return bucket settings, queue depths and wait-time counters."""
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": self.tokens,
+            "queue_depth": self.queue_depth,
+            "queue_depth_by_priority": self.queue_depth_by_priority(),
+            "granted": self.granted,
+            "queued": self.queued,
+            "total_wait_seconds": self.total_wait,
+            "max_wait_seconds": self.max_wait,
+        }
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill, up to ``burst``."""
+        now = self._clock()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self._tokens + elapsed * self.rate, float(self.burst))
+        self._updated = now
+
+    def _dispatch(self) -> None:
+        """Grant tokens to waiters in priority order while the bucket allows."""
+        self._wakeup = None
+        self._refill()
+        while self._waiters:
+            _, _, waiter = self._waiters[0]
+            if waiter.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._tokens < 1.0:
+                break
+            heapq.heappop(self._waiters)
+            self._tokens -= 1.0
+            self.granted += 1
+            waiter.set_result(None)
+        self._schedule_wakeup()
+
+    def _schedule_wakeup(self) -> None:
+        """Arrange a dispatch for when the next token is available."""
+        if self._wakeup is not None or not self._waiters:
+            return
+        loop = asyncio.get_running_loop()
+        self._refill()
+        delay = max(0.0, (1.0 - self._tokens) / self.rate)
+        self._wakeup = loop.call_later(delay, self._dispatch)
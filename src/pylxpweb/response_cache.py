@@ -0,0 +1,302 @@
+"""Bounded LRU cache for Luxpower API responses.
+
+``LuxpowerClient`` keeps recent JSON responses keyed by the strings produced
+by ``LuxpowerClient._get_cache_key()`` (``"endpoint:param=value&..."``). This
+module provides the store behind that cache:
+
+- Entries carry their own TTL and a monotonic timestamp, so wall-clock jumps
+  (NTP corrections, DST) never extend or shorten a lifetime.
+- The cache is bounded by entry count and by estimated payload size; the
+  least recently used entries are evicted first.
+- A secondary index maps device serial numbers to the keys that mention them,
+  so per-device invalidation is a dictionary lookup instead of a key scan.
+- Expired entries can be served for a bounded time past their TTL
+  (stale-while-revalidate) while the caller refreshes them.
+- Hit, miss, stale-hit, expiry, and eviction counters are kept for
+  ``cache_stats``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from .constants import (
+    RESPONSE_CACHE_MAX_BYTES,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    SERIAL_CACHE_PARAMS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """One cached API response."""
+
+    response: dict[str, Any]
+    """Decoded JSON response as returned by the API."""
+
+    stored_at: float
+    """Monotonic timestamp at which the response was stored."""
+
+    ttl: float
+    """Lifetime in seconds, measured from ``stored_at``."""
+
+    size: int
+    """Estimated payload size in bytes (compact JSON encoding)."""
+
+    cache_class: str | None = None
+    """TTL class the entry was stored under (e.g. ``"inverter_runtime"``)."""
+
+    def age(self, now: float) -> float:
+        """Return the entry age in seconds at monotonic time ``now``."""
+        return now - self.stored_at
+
+    def is_fresh(self, now: float) -> bool:
+        """Return True while the entry is within its TTL."""
+        return now - self.stored_at < self.ttl
+
+
+def _estimate_size(response: dict[str, Any]) -> int:
+    """Estimate the memory cost of a response by its compact JSON length."""
+    try:
+        return len(json.dumps(response, separators=(",", ":"), default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _serials_in_key(key: str) -> tuple[str, ...]:
+    """Extract device serial numbers from a ``"endpoint:k=v&k=v"`` cache key."""
+    _, sep, params = key.partition(":")
+    if not sep or not params:
+        return ()
+    serials: list[str] = []
+    for pair in params.split("&"):
+        name, eq, value = pair.partition("=")
+        if eq and value and name in SERIAL_CACHE_PARAMS:
+            serials.append(value)
+    return tuple(serials)
+
+
+class ResponseCache:
+    """Size-bounded LRU store of API responses with per-entry TTL.
+
+    Example:
+        >>> cache = ResponseCache(max_entries=2)
+        >>> cache.put("runtime:serialNum=123", {"soc": 80}, ttl=20.0)
+        >>> cache.get("runtime:serialNum=123")
+        {'soc': 80}
+        >>> cache.invalidate_serial("123")
+        1
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        max_bytes: int = RESPONSE_CACHE_MAX_BYTES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses (must be >= 1)
+            max_bytes: Maximum total estimated payload size in bytes (must be >= 1)
+            clock: Monotonic time source in seconds (injectable for tests)
+
+        Raises:
+            ValueError: If either bound is less than 1
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._serial_index: dict[str, set[str]] = {}
+        self._total_bytes = 0
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries (fresh or expired)."""
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if ``key`` has an entry, regardless of freshness."""
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over cached keys from least to most recently used."""
+        return iter(list(self._entries))
+
+    @property
+    def total_bytes(self) -> int:
+        """Return the total estimated payload size of all entries."""
+        return self._total_bytes
+
+    def now(self) -> float:
+        """Return the current time on the cache's monotonic clock."""
+        return self._clock()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return a fresh cached response and mark it most recently used.
+
+        Expired entries are dropped and reported as a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if not entry.is_fresh(self._clock()):
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.response
+
+    def get_stale(self, key: str, max_staleness: float) -> dict[str, Any] | None:
+        """Return an expired response that is at most ``max_staleness`` past its TTL.
+
+        Fresh entries, missing keys, and entries older than the staleness
+        bound return None; the caller then falls back to ``get()``.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        now = self._clock()
+        if entry.is_fresh(now) or entry.age(now) - entry.ttl > max_staleness:
+            return None
+        self._entries.move_to_end(key)
+        self.stale_hits += 1
+        return entry.response
+
+    def peek(self, key: str) -> CacheEntry | None:
+        """Return the entry for ``key`` without freshness checks or LRU updates."""
+        return self._entries.get(key)
+
+    def put(
+        self,
+        key: str,
+        response: dict[str, Any],
+        *,
+        ttl: float,
+        cache_class: str | None = None,
+    ) -> None:
+        """Store a response, evicting least recently used entries if over bounds.
+
+        Args:
+            key: Cache key (``"endpoint:param=value&..."``)
+            response: Decoded JSON response
+            ttl: Lifetime in seconds
+            cache_class: TTL class name the entry belongs to
+        """
+        if key in self._entries:
+            self._remove(key)
+
+        entry = CacheEntry(
+            response=response,
+            stored_at=self._clock(),
+            ttl=ttl,
+            size=_estimate_size(response),
+            cache_class=cache_class,
+        )
+        self._entries[key] = entry
+        self._total_bytes += entry.size
+        for serial in _serials_in_key(key):
+            self._serial_index.setdefault(serial, set()).add(key)
+
+        self._evict()
+
+    def invalidate(self, key: str) -> bool:
+        """Remove one entry. Returns True if it existed."""
+        if key not in self._entries:
+            return False
+        self._remove(key)
+        return True
+
+    def invalidate_serial(self, serial_num: str) -> int:
+        """Remove every entry whose request parameters name ``serial_num``.
+
+        Returns:
+            Number of entries removed.
+        """
+        keys = self._serial_index.pop(serial_num, None)
+        if not keys:
+            return 0
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def invalidate_class(self, cache_class: str) -> int:
+        """Remove every entry stored under ``cache_class``.
+
+        Returns:
+            Number of entries removed.
+        """
+        keys = [key for key, entry in self._entries.items() if entry.cache_class == cache_class]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> int:
+        """Remove every entry. Returns the number of entries removed."""
+        count = len(self._entries)
+        self._entries.clear()
+        self._serial_index.clear()
+        self._total_bytes = 0
+        return count
+
+    def stats(self) -> dict[str, int]:
+        """Return size bounds and hit/stale-hit/miss/expiry/eviction counters."""
+        return {
+            "total_bytes": self._total_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "expirations": self.expirations,
+            "evictions": self.evictions,
+        }
+
+    def _remove(self, key: str) -> None:
+        """Drop ``key`` from the entry map and the serial index."""
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.size
+        for serial in _serials_in_key(key):
+            keys = self._serial_index.get(serial)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._serial_index[serial]
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until both bounds hold.
+
+        The most recently stored entry is always kept, even if it alone
+        exceeds ``max_bytes``.
+        """
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+        ):
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.evictions += 1
+            _LOGGER.debug("Evicted cached response %s", key)
@@ -0,0 +1,168 @@
+"""On-disk client snapshots for fast restarts.
+
+A cold start logs in, detects the account level, discovers every plant and
+device, and reads three parameter ranges per inverter. ``LuxpowerClient``
+can save the results of that work with ``save_snapshot()`` and restore them
+with ``load_snapshot()`` after a restart, so the next start needs almost no
+cloud calls.
+
+A snapshot holds:
+
+- The session cookies, estimated session expiry, user id/role and detected
+  account level. It never holds the password.
+- Fresh response-cache entries of the ``SNAPSHOT_CACHE_CLASSES``: the plant
+  and device hierarchy and the parameter reads.
+
+The file is compact JSON tagged with ``SNAPSHOT_FORMAT_VERSION``. It is
+written atomically and readable only by its owner, because the cookies
+grant access to the account. Decoding validates the version and every
+field; a file that fails validation is rejected as a whole.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .constants import SNAPSHOT_FORMAT_VERSION
+
+
+@dataclass(slots=True)
+class ClientSnapshot:
+    """Restorable state of one ``LuxpowerClient``."""
+
+    base_url: str
+    """API base URL the snapshot was taken against."""
+
+    username: str
+    """Account the snapshot belongs to."""
+
+    saved_at: float
+    """Unix timestamp at which the snapshot was taken."""
+
+    cookies: dict[str, str] = field(default_factory=dict)
+    """Session cookies for ``base_url`` (name -> value)."""
+
+    session_expires: float | None = None
+    """Unix timestamp of the estimated session expiry, if logged in."""
+
+    user_id: int | None = None
+    """Logged-in user id."""
+
+    user_role: str | None = None
+    """Logged-in user role (e.g. ``"VIEWER"``, ``"INSTALLER"``)."""
+
+    account_level: str | None = None
+    """Detected account permission level."""
+
+    cache: list[tuple[str, str, dict[str, Any]]] = field(default_factory=list)
+    """Cached responses as ``(cache key, cache class, response)``."""
+
+    def to_bytes(self) -> bytes:
+        """Encode the snapshot as compact, versioned JSON."""
+        payload = {
+            "version": SNAPSHOT_FORMAT_VERSION,
+            "base_url": self.base_url,
+            "username": self.username,
+            "saved_at": self.saved_at,
+            "session": {
+                "cookies": self.cookies,
+                "expires": self.session_expires,
+                "user_id": self.user_id,
+                "user_role": self.user_role,
+                "account_level": self.account_level,
+            },
+            "cache": [list(item) for item in self.cache],
+        }
+        return json.dumps(payload, separators=(",", ":"), default=str).encode()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> ClientSnapshot:
+        """Decode and validate a snapshot produced by ``to_bytes()``.
+
+        Raises:
+            ValueError: If the data is not valid JSON, has another format
+                version, or any field has the wrong type
+        """
+        try:
+            payload = json.loads(data)
+        except (UnicodeDecodeError, json.JSONDecodeError) as err:
+            raise ValueError(f"Snapshot is not valid JSON: {err}") from err
+        if not isinstance(payload, dict):
+            raise ValueError("Snapshot must be a JSON object")
+        version = payload.get("version")
+        if version != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot version {version!r} (expected {SNAPSHOT_FORMAT_VERSION})"
+            )
+
+        session = _require(payload, "session", dict)
+        cookies = _require(session, "cookies", dict)
+        if not all(isinstance(k, str) and isinstance(v, str) for k, v in cookies.items()):
+            raise ValueError("Snapshot cookies must map names to string values")
+
+        cache: list[tuple[str, str, dict[str, Any]]] = []
+        for item in _require(payload, "cache", list):
+            if (
+                not isinstance(item, list)
+                or len(item) != 3
+                or not isinstance(item[0], str)
+                or not isinstance(item[1], str)
+                or not isinstance(item[2], dict)
+            ):
+                raise ValueError("Snapshot cache entries must be [key, class, response]")
+            cache.append((item[0], item[1], item[2]))
+
+        return cls(
+            base_url=_require(payload, "base_url", str),
+            username=_require(payload, "username", str),
+            saved_at=float(_require(payload, "saved_at", (int, float))),
+            cookies=cookies,
+            session_expires=_optional(session, "expires", (int, float)),
+            user_id=_optional(session, "user_id", int),
+            user_role=_optional(session, "user_role", str),
+            account_level=_optional(session, "account_level", str),
+            cache=cache,
+        )
+
+
+def write_snapshot(path: str | os.PathLike[str], snapshot: ClientSnapshot) -> None:
+    """Atomically write ``snapshot`` to ``path`` with owner-only permissions."""
+    target = Path(path)
+    temp = target.with_name(f"{target.name}.tmp")
+    fd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(snapshot.to_bytes())
+        os.replace(temp, target)
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+
+
+def read_snapshot(path: str | os.PathLike[str]) -> ClientSnapshot:
+    """Read and validate the snapshot at ``path``.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the contents fail validation
+    """
+    return ClientSnapshot.from_bytes(Path(path).read_bytes())
+
+
+def _require(payload: dict[str, Any], name: str, kind: type | tuple[type, ...]) -> Any:
+    """Return ``payload[name]``, raising ValueError unless it is a ``kind``."""
+    value = payload.get(name)
+    if not isinstance(value, kind) or isinstance(value, bool):
+        raise ValueError(f"Snapshot field {name!r} is missing or invalid")
+    return value
+
+
+def _optional(payload: dict[str, Any], name: str, kind: type | tuple[type, ...]) -> Any:
+    """Return ``payload[name]`` or None, raising ValueError on a wrong type."""
+    if payload.get(name) is None:
+        return None
+    return _require(payload, name, kind)
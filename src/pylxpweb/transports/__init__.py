@@ -38,6 +38,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from .bus_arbiter import (
+    BUS_PRIORITY_BATTERY,
+    BUS_PRIORITY_INVERTER,
+    BusClientStats,
+    RS485BusArbiter,
+)
 from .capabilities import (
     DONGLE_CAPABILITIES,
     HTTP_CAPABILITIES,
@@ -87,11 +93,16 @@ from .factory import (
     create_transport,
     create_transport_from_config,
 )
+from .frame_codec import DongleFrameCodec
+from .gap_map import GapSafetyMap, gap_model_key
+from .hedge import HedgePolicy
 from .http import HTTPTransport
 from .hybrid import HybridTransport
 from .modbus import ModbusTransport
+from .modbus_gateway import GatewayUnitStats, ModbusGateway, ModbusGatewayPool
 from .modbus_serial import ModbusSerialTransport
 from .observation import RegisterObservation, RegisterObserver, RegisterSegment, RegisterSpace
+from .passive_cache import PassiveRegisterCache
 from .protocol import (
     BaseTransport,
     InverterTransport,
@@ -99,13 +110,14 @@ from .protocol import (
     TerminalInverterTransport,
     TerminalTransport,
 )
+from .snapshot import RegisterSnapshot
 
 if TYPE_CHECKING:
-    from .battery_modbus import BatteryModbusTransport
+    from .battery_modbus import BatteryModbusTransport, BatteryTopologyCache
 
 
-def __getattr__(name: str) -> type[BatteryModbusTransport]:
-    """Lazy import for BatteryModbusTransport to avoid circular dependency.
+def __getattr__(name: str) -> type[BatteryModbusTransport] | type[BatteryTopologyCache]:
+    """Lazy import for battery_modbus names to avoid circular dependency.
 
     The battery_modbus module imports from battery_protocols, which imports
     from transports.data, creating a circular dependency at import time.
@@ -114,6 +126,10 @@ def __getattr__(name: str) -> type[BatteryModbusTransport]:
         from .battery_modbus import BatteryModbusTransport
 
         return BatteryModbusTransport
+    if name == "BatteryTopologyCache":
+        from .battery_modbus import BatteryTopologyCache
+
+        return BatteryTopologyCache
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
@@ -143,6 +159,26 @@ __all__ = [
     "RegisterObserver",
     "RegisterSegment",
     "RegisterSpace",
+    # Array-backed register snapshots
+    "RegisterSnapshot",
+    # Passive register harvesting (dongle)
+    "PassiveRegisterCache",
+    # Dongle protocol frame codec
+    "DongleFrameCodec",
+    # Learned gap bridging for coalesced input reads
+    "GapSafetyMap",
+    "gap_model_key",
+    # Hedged local/cloud reads for HybridTransport
+    "HedgePolicy",
+    # Shared Modbus TCP gateway connections
+    "ModbusGateway",
+    "ModbusGatewayPool",
+    "GatewayUnitStats",
+    # Shared RS485 bus arbitration
+    "RS485BusArbiter",
+    "BusClientStats",
+    "BUS_PRIORITY_INVERTER",
+    "BUS_PRIORITY_BATTERY",
     # Transport implementations
     "HTTPTransport",
     "ModbusTransport",
@@ -150,6 +186,7 @@ __all__ = [
     "DongleTransport",
     "HybridTransport",
     "BatteryModbusTransport",
+    "BatteryTopologyCache",
     # Discovery utilities
     "DeviceDiscoveryInfo",
     "HOLD_DEVICE_TYPE_CODE",
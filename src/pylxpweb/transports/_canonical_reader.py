@@ -11,6 +11,7 @@ so the same reader works for inverter, battery, and GridBOSS registers.
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -32,7 +33,7 @@ def _resolve_address(reg: _RegDef, base_address: int) -> int:
 
 
 def read_raw(
-    registers: dict[int, int],
+    registers: Mapping[int, int],
     reg: _RegDef,
     *,
     base_address: int = 0,
@@ -87,7 +88,7 @@ def read_raw(
 
 
 def read_battery_firmware(
-    registers: dict[int, int],
+    registers: Mapping[int, int],
     reg: _RegDef,
     *,
     base_address: int,
@@ -107,7 +108,7 @@ def read_battery_firmware(
 
 
 def read_battery_serial(
-    registers: dict[int, int],
+    registers: Mapping[int, int],
     *,
     base_address: int,
     start_offset: int = 17,
@@ -128,7 +129,7 @@ def read_battery_serial(
 
 
 def read_scaled(
-    registers: dict[int, int],
+    registers: Mapping[int, int],
     reg: _RegDef,
     *,
     base_address: int = 0,
@@ -149,7 +150,7 @@ def read_scaled(
 
 
 def unpack_low_high_bytes(
-    registers: dict[int, int],
+    registers: Mapping[int, int],
     reg: _RegDef,
     *,
     base_address: int = 0,
@@ -169,7 +170,7 @@ def unpack_low_high_bytes(
 
 
 def unpack_parallel_config(
-    registers: dict[int, int],
+    registers: Mapping[int, int],
     reg: _RegDef,
 ) -> tuple[int | None, int | None, int | None]:
     """Unpack parallel configuration register (reg 113).
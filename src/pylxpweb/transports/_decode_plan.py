@@ -0,0 +1,364 @@
+"""Precompiled register decode plans for the transport data classes.
+
+``from_modbus_registers()`` used to walk the canonical register definitions
+on every snapshot: filter the model's registers by category, look up each
+field mapping, compare canonical names for the special cases and resolve
+``bit_width``/``packed``/``signed``/``scale`` through ``getattr`` in
+``read_raw()``.  None of that depends on the snapshot, only on the model
+family and PV string count.
+
+A decode plan does that work once.  Each register becomes a flat op tuple
+``(address, wide, signed, divisor, packed, key)`` and the plan builders are
+memoized per argument set, so decoding a snapshot is a single loop of
+lookups and integer arithmetic.  :func:`decode_into` gives exactly the
+values ``read_raw()`` (``divisor == 0``) or ``read_scaled()`` would, and
+indexes a :class:`~pylxpweb.transports.snapshot.RegisterSnapshot`'s word
+array directly.
+
+Registers that need more than a scaled value (packed SOC/SOH, parallel
+config, fault and warning codes, the BMS permission bitmap) are compiled
+into a separate ``specials`` op list keyed by canonical name, and the data
+class applies its own handling to the decoded raw values.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from pylxpweb.registers.battery import BATTERY_REGISTERS
+from pylxpweb.registers.gridboss import GRIDBOSS_REGISTERS
+from pylxpweb.registers.inverter_input import (
+    BY_NAME,
+    PV4_6_EXTENDED_NAMES,
+    registers_for_model,
+)
+
+from ._field_mappings import (
+    BATTERY_FIELD,
+    ENERGY_CATEGORIES,
+    ENERGY_FIELD,
+    GRIDBOSS_FIELD,
+    RUNTIME_CATEGORIES,
+    RUNTIME_FIELD,
+)
+from .snapshot import RegisterSnapshot
+
+# (address or offset, 32-bit, signed, divisor (0 = raw int), packed, key)
+# packed: 0 = whole register, 1 = low byte, 2 = high byte
+DecodeOp = tuple[int, bool, bool, int, int, str]
+
+_PACKED_NONE = 0
+_PACKED_LOW = 1
+_PACKED_HIGH = 2
+
+# Fields on InverterRuntimeData that store raw int values (no ÷10/÷100 scaling).
+RUNTIME_INT_FIELDS: frozenset[str] = frozenset(
+    {
+        "device_status",
+        "eps_apparent_power",
+        "bms_cycle_count",
+        "battery_parallel_num",
+        "inverter_on_time",
+        "ac_input_type",
+        # EPS per-leg power (regs 129-132)
+        "eps_l1_power",
+        "eps_l2_power",
+        "eps_l1_apparent_power",
+        "eps_l2_apparent_power",
+        # Split-phase per-leg grid power (regs 197-204)
+        "inverter_power_l1",
+        "inverter_power_l2",
+        "rectifier_power_l1",
+        "rectifier_power_l2",
+        "grid_export_power_l1",
+        "grid_export_power_l2",
+        "grid_import_power_l1",
+        "grid_import_power_l2",
+    }
+)
+
+# Runtime registers without a RUNTIME_FIELD mapping that the runtime data
+# class post-processes from their raw value.
+RUNTIME_SPECIAL_NAMES: frozenset[str] = frozenset(
+    {
+        "soc_soh_packed",
+        "parallel_config",
+        "fault_code",
+        "bms_fault_code",
+        "warning_code",
+        "bms_warning_code",
+        "battery_status_inv",
+    }
+)
+
+# Battery-module registers decoded raw (packed bytes and counters)
+_BATTERY_RAW_NAMES = frozenset(
+    {
+        "battery_soc",
+        "battery_soh",
+        "battery_max_cell_num_voltage",
+        "battery_min_cell_num_voltage",
+        "battery_max_cell_num_temp",
+        "battery_min_cell_num_temp",
+        "battery_cycle_count",
+    }
+)
+
+# Decoded by dedicated multi-register readers, or checked before the plan runs
+_BATTERY_SKIPPED_NAMES = frozenset(
+    {"battery_status_header", "battery_firmware_version", "battery_serial_number"}
+)
+
+# Aggregate battery registers read by BatteryBankData, by decode kind
+_BANK_RAW_NAMES = (
+    "soc_soh_packed",
+    "bms_fault_code",
+    "bms_warning_code",
+    "battery_parallel_count",
+    "bms_battery_type",
+    "bms_cycle_count",
+    "battery_status_inv",
+)
+_BANK_SCALED_NAMES = (
+    "battery_voltage",
+    "charge_power",
+    "discharge_power",
+    "battery_current_bms",
+    "battery_temperature",
+    "bms_charge_current_limit",
+    "bms_discharge_current_limit",
+    "bms_charge_voltage_ref",
+    "bms_discharge_cutoff",
+    "bms_max_cell_voltage",
+    "bms_min_cell_voltage",
+    "bms_max_cell_temperature",
+    "bms_min_cell_temperature",
+    "battery_voltage_inv_sample",
+    "battery_capacity_ah",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DecodePlan:
+    """Compiled decode for one data class and argument set.
+
+    Attributes:
+        ops: Ops writing data class fields, in definition order (a later op
+            for the same field wins, as in the definition loop).
+        specials: Raw ops keyed by canonical name for registers the data
+            class post-processes.
+    """
+
+    ops: tuple[DecodeOp, ...]
+    specials: tuple[DecodeOp, ...] = ()
+
+
+def compile_op(reg: Any, key: str, *, raw: bool, offset: bool = False) -> DecodeOp:
+    """Compile one register definition into a decode op.
+
+    Args:
+        reg: Canonical register definition (inverter, battery or GridBOSS).
+        key: Output key the decoded value is stored under.
+        raw: Decode like ``read_raw()`` (True) or ``read_scaled()`` (False).
+        offset: Address by the definition's ``offset`` (battery modules,
+            relative to a per-module base) instead of its ``address``.
+    """
+    address: int = getattr(reg, "offset", 0) if offset else reg.address
+    packed_attr: str | None = getattr(reg, "packed", None)
+    packed = (
+        _PACKED_LOW
+        if packed_attr == "low_byte"
+        else _PACKED_HIGH
+        if packed_attr == "high_byte"
+        else _PACKED_NONE
+    )
+    divisor = 0 if raw else int(reg.scale.value)
+    return (
+        address,
+        getattr(reg, "bit_width", 16) == 32,
+        bool(reg.signed),
+        divisor,
+        packed,
+        key,
+    )
+
+
+def decode_into(
+    ops: tuple[DecodeOp, ...],
+    registers: Mapping[int, int],
+    out: dict[str, Any],
+    *,
+    base: int = 0,
+    missing: Any = None,
+) -> dict[str, Any]:
+    """Run ``ops`` over ``registers``, storing each value in ``out``.
+
+    Args:
+        ops: Compiled ops.
+        registers: Mapping of register address to raw value.
+        out: Dict receiving one entry per op.
+        base: Added to every op address (battery module base address).
+        missing: Value stored when a required register is absent.
+
+    Returns:
+        ``out``, for chaining.
+    """
+    if isinstance(registers, RegisterSnapshot):
+        return _decode_snapshot(ops, registers, out, base, missing)
+    get = registers.get
+    for address, wide, signed, divisor, packed, key in ops:
+        addr = base + address
+        value = get(addr)
+        if value is None:
+            out[key] = missing
+            continue
+        if wide:
+            high = get(addr + 1)
+            if high is None:
+                out[key] = missing
+                continue
+            # All LuxPower/EG4 32-bit are little-endian (low word first)
+            value |= high << 16
+            if signed and value > 0x7FFFFFFF:
+                value -= 0x100000000
+        elif packed:
+            value = value & 0xFF if packed == _PACKED_LOW else (value >> 8) & 0xFF
+        elif signed and value > 0x7FFF:
+            value -= 0x10000
+        if divisor == 0:
+            out[key] = value
+        elif divisor == 1:
+            out[key] = float(value)
+        else:
+            out[key] = float(value) / divisor
+    return out
+
+
+def _decode_snapshot(
+    ops: tuple[DecodeOp, ...],
+    snapshot: RegisterSnapshot,
+    out: dict[str, Any],
+    base: int,
+    missing: Any,
+) -> dict[str, Any]:
+    """:func:`decode_into` indexing the snapshot's buffers directly."""
+    first, words, present = snapshot.layout()
+    span = len(present)
+    shift = base - first
+    for address, wide, signed, divisor, packed, key in ops:
+        index = shift + address
+        if not (0 <= index < span and present[index]):
+            out[key] = missing
+            continue
+        value = words[index]
+        if wide:
+            if index + 1 >= span or not present[index + 1]:
+                out[key] = missing
+                continue
+            value |= words[index + 1] << 16
+            if signed and value > 0x7FFFFFFF:
+                value -= 0x100000000
+        elif packed:
+            value = value & 0xFF if packed == _PACKED_LOW else (value >> 8) & 0xFF
+        elif signed and value > 0x7FFF:
+            value -= 0x10000
+        if divisor == 0:
+            out[key] = value
+        elif divisor == 1:
+            out[key] = float(value)
+        else:
+            out[key] = float(value) / divisor
+    return out
+
+
+@cache
+def runtime_plan(model_family: str, pv_string_count: int) -> DecodePlan:
+    """Plan for ``InverterRuntimeData.from_modbus_registers``.
+
+    Split-phase handling only combines already-decoded per-leg values, so
+    it is not part of the plan.
+    """
+    ops: list[DecodeOp] = []
+    specials: list[DecodeOp] = []
+    for reg in registers_for_model(model_family):
+        if reg.category.value not in RUNTIME_CATEGORIES:
+            continue
+        name = reg.canonical_name
+        # V23-extended pv4-6 (``pvN_voltage``/``pvN_power``): only when the
+        # MODEL exposes that string index.
+        if name in PV4_6_EXTENDED_NAMES and int(name[2]) > pv_string_count:
+            continue
+        field_name = RUNTIME_FIELD.get(name)
+        if field_name is None:
+            if name in RUNTIME_SPECIAL_NAMES:
+                specials.append(compile_op(reg, name, raw=True))
+            continue
+        ops.append(compile_op(reg, field_name, raw=field_name in RUNTIME_INT_FIELDS))
+    load_power_reg = BY_NAME.get("power_to_user")
+    if load_power_reg is not None:
+        specials.append(compile_op(load_power_reg, "power_to_user", raw=False))
+    return DecodePlan(tuple(ops), tuple(specials))
+
+
+@cache
+def energy_plan(model_family: str, pv_string_count: int) -> DecodePlan:
+    """Plan for ``InverterEnergyData.from_modbus_registers``."""
+    ops: list[DecodeOp] = []
+    for reg in registers_for_model(model_family):
+        if reg.category.value not in ENERGY_CATEGORIES:
+            continue
+        name = reg.canonical_name
+        # V23-extended pv4-6 energy (``epvN_day``/``epvN_all``)
+        if name in PV4_6_EXTENDED_NAMES and int(name[3]) > pv_string_count:
+            continue
+        field_name = ENERGY_FIELD.get(name)
+        if field_name is not None:
+            ops.append(compile_op(reg, field_name, raw=False))
+    return DecodePlan(tuple(ops))
+
+
+@cache
+def battery_bank_plan() -> DecodePlan:
+    """Plan for the aggregate registers of ``BatteryBankData``, by canonical name."""
+    return DecodePlan(
+        tuple(compile_op(BY_NAME[name], name, raw=True) for name in _BANK_RAW_NAMES)
+        + tuple(compile_op(BY_NAME[name], name, raw=False) for name in _BANK_SCALED_NAMES)
+    )
+
+
+@cache
+def battery_module_plan() -> DecodePlan:
+    """Plan for ``BatteryData.from_modbus_registers``, relative to a module base.
+
+    Packed SOC/SOH decode to the ``soc``/``soh`` keys.
+    """
+    ops: list[DecodeOp] = []
+    for reg in BATTERY_REGISTERS:
+        name = reg.canonical_name
+        if name in _BATTERY_SKIPPED_NAMES:
+            continue
+        if name == "battery_soc":
+            ops.append(compile_op(reg, "soc", raw=True, offset=True))
+            continue
+        if name == "battery_soh":
+            ops.append(compile_op(reg, "soh", raw=True, offset=True))
+            continue
+        field_name = BATTERY_FIELD.get(name)
+        if field_name is not None:
+            ops.append(compile_op(reg, field_name, raw=name in _BATTERY_RAW_NAMES, offset=True))
+    return DecodePlan(tuple(ops))
+
+
+@cache
+def gridboss_plan() -> DecodePlan:
+    """Plan for ``MidboxRuntimeData.from_modbus_registers``."""
+    return DecodePlan(
+        tuple(
+            compile_op(reg, field_name, raw=False)
+            for reg in GRIDBOSS_REGISTERS
+            if (field_name := GRIDBOSS_FIELD.get(reg.canonical_name)) is not None
+        )
+    )
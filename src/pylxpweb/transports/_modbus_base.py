@@ -18,7 +18,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Mapping
 from typing import TYPE_CHECKING, Any
 
 from pymodbus.exceptions import ModbusException
@@ -46,6 +46,8 @@ if TYPE_CHECKING:
         MidboxRuntimeData,
     )
 
+    from .gap_map import GapSafetyMap
+
 _LOGGER = logging.getLogger(__name__)
 
 __all__ = ["BaseModbusTransport", "INPUT_REGISTER_GROUPS"]
@@ -77,6 +79,8 @@ class BaseModbusTransport(RegisterDataMixin, BaseTransport):
         max_input_block_size: int = DEFAULT_INPUT_BLOCK_SIZE,
         register_observer: RegisterObserver | None = None,
         session_max_age: float | None = None,
+        input_refresh_intervals: Mapping[str, float] | None = None,
+        gap_map: GapSafetyMap | None = None,
     ) -> None:
         """Initialize base Modbus transport.
 
@@ -103,6 +107,14 @@ class BaseModbusTransport(RegisterDataMixin, BaseTransport):
             session_max_age: Maximum connection age in seconds, or None to
                 disable proactive recycling. The base default keeps serial
                 transports from reopening their ports periodically.
+            input_refresh_intervals: Optional minimum seconds between reads
+                per input register group (see
+                :func:`~pylxpweb.transports._register_data.validate_input_refresh_intervals`).
+            gap_map: Optional learned map of register gaps that are safe to
+                bridge, shared across transports (see
+                :class:`~pylxpweb.transports.gap_map.GapSafetyMap`).  With
+                coalescing enabled, input reads then bridge known-safe gaps
+                and probe unknown ones to use fewer transactions.
         """
         super().__init__(serial, register_observer=register_observer)
         self._unit_id = unit_id
@@ -116,6 +128,8 @@ class BaseModbusTransport(RegisterDataMixin, BaseTransport):
         self._pymodbus_retries = pymodbus_retries
         self._session_max_age = session_max_age
         self._init_input_coalescing(max_input_block_size)
+        self._init_input_refresh(input_refresh_intervals)
+        self._gap_map = gap_map
         self._client: Any = None
         self._lock = asyncio.Lock()
         self._consecutive_errors: int = 0
@@ -180,6 +194,16 @@ class BaseModbusTransport(RegisterDataMixin, BaseTransport):
             raise TransportConnectionError(f"Transport not connected for {self._serial}")
         return self._client
 
+    @contextlib.asynccontextmanager
+    async def _bus_slot(self) -> AsyncIterator[None]:
+        """Hold the physical bus for one request/response transaction.
+
+        A transport owns its connection outright by default, so this is a
+        no-op; transports sharing a gateway or an RS485 bus with other
+        clients override it to take their turn.
+        """
+        yield
+
     async def _read_registers(
         self,
         address: int,
@@ -208,7 +232,7 @@ class BaseModbusTransport(RegisterDataMixin, BaseTransport):
         self._last_read_retried = False
 
         for attempt in range(self._retries + 1):
-            async with self._lock:
+            async with self._lock, self._bus_slot():
                 try:
                     client = self._require_active_client()
                     read_fn = (
@@ -348,7 +372,7 @@ class BaseModbusTransport(RegisterDataMixin, BaseTransport):
         """
         self._ensure_connected()
 
-        async with self._lock:
+        async with self._lock, self._bus_slot():
             try:
                 client = self._require_active_client()
                 if len(values) == 1:
@@ -0,0 +1,207 @@
+"""Pipelined Modbus TCP reads matched by MBAP transaction ID.
+
+pymodbus runs one request at a time per connection: ``execute()`` holds a
+lock and a single response future until the reply arrives.  Many
+RS485-to-Ethernet gateways buffer requests, though, so several reads can
+be in flight at once and the responses told apart by the MBAP transaction
+ID (TID) each one echoes.
+
+:class:`ModbusTcpPipeline` borrows the already-open pymodbus connection for
+one batch: it writes up to ``window`` read requests back to back, routes
+each response to its request by TID, and hands the connection back.  It
+reports the gateway as misbehaving when a response carries a TID it never
+sent (gateways that substitute their own counter, see
+``ModbusTransport._patch_tid_validation``), so the transport can fall back
+to serial reads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+from collections.abc import Callable
+from typing import Any
+
+from .exceptions import TransportReadError, TransportTimeoutError
+
+# Pipelined mode is off unless a window above 1 is configured
+DEFAULT_PIPELINE_WINDOW = 1
+
+# Upper bound on outstanding requests; gateway request buffers are small
+MAX_PIPELINE_WINDOW = 16
+
+_MBAP_HEADER = struct.Struct(">HHHB")  # tid, protocol id, length, unit id
+_READ_PDU = struct.Struct(">BHH")  # function, address, count
+
+# (function code, start address, register count)
+PipelineRead = tuple[int, int, int]
+
+
+def validate_pipeline_window(value: int) -> int:
+    """Validate a pipeline window size.
+
+    Args:
+        value: Requested maximum outstanding requests per connection.
+
+    Returns:
+        The validated window.
+
+    Raises:
+        ValueError: If outside ``1..MAX_PIPELINE_WINDOW``.
+    """
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise ValueError(f"pipeline_window must be an int, got {type(value).__name__}")
+    if not DEFAULT_PIPELINE_WINDOW <= value <= MAX_PIPELINE_WINDOW:
+        raise ValueError(
+            f"pipeline_window must be between {DEFAULT_PIPELINE_WINDOW} and "
+            f"{MAX_PIPELINE_WINDOW}, got {value}"
+        )
+    return value
+
+
+class PipelineMisbehaviorError(TransportReadError):
+    """The gateway answered with a transaction ID no request used."""
+
+
+class ModbusTcpPipeline:
+    """One batch of windowed, TID-matched reads over a pymodbus connection.
+
+    The caller must hold the transport's request lock for the whole batch
+    so no pymodbus request runs on the connection at the same time.
+    """
+
+    def __init__(
+        self,
+        ctx: Any,
+        *,
+        window: int,
+        unit_id: int,
+        timeout: float,
+    ) -> None:
+        """Bind the pipeline to a connected pymodbus transaction manager.
+
+        Args:
+            ctx: The pymodbus client's ``ctx`` (transaction manager), which
+                owns the asyncio transport and the MBAP framer.
+            window: Maximum requests in flight at once.
+            unit_id: Modbus unit/device ID for every request.
+            timeout: Seconds to wait for each response once it is sent.
+        """
+        self._ctx = ctx
+        self._window = window
+        self._unit_id = unit_id
+        self._timeout = timeout
+        # tid -> (requested function code, future for its registers)
+        self._pending: dict[int, tuple[int, asyncio.Future[list[int]]]] = {}
+        self._buffer = bytearray()
+        self.misbehaved = False
+
+    async def read_many(self, reads: list[PipelineRead]) -> list[list[int] | Exception]:
+        """Issue ``reads`` with up to ``window`` in flight.
+
+        Args:
+            reads: Read requests as (function code, address, count).
+
+        Returns:
+            One entry per read, in order: the register values, or the
+            exception that read failed with (``TransportTimeoutError``,
+            ``TransportReadError`` for an exception response, or
+            ``PipelineMisbehaviorError``).
+        """
+        # Bytes are taken at data_received: pymodbus discards its whole
+        # receive buffer once it exceeds one frame's maximum size, which a
+        # burst of pipelined replies easily does.
+        original_receiver: Callable[[bytes], None] = self._ctx.data_received
+        self._ctx.data_received = self._on_data
+        window = asyncio.Semaphore(self._window)
+        try:
+            results = await asyncio.gather(
+                *(self._read(window, read) for read in reads),
+                return_exceptions=True,
+            )
+        finally:
+            self._ctx.data_received = original_receiver
+            self._pending.clear()
+            self._buffer.clear()
+        out: list[list[int] | Exception] = []
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+            out.append(result)
+        return out
+
+    async def _read(self, window: asyncio.Semaphore, read: PipelineRead) -> list[int]:
+        """Send one request once a window slot is free and await its reply."""
+        function, address, count = read
+        async with window:
+            if self.misbehaved:
+                raise PipelineMisbehaviorError("Gateway does not echo transaction IDs")
+            tid = self._ctx.getNextTID()
+            future: asyncio.Future[list[int]] = asyncio.get_running_loop().create_future()
+            self._pending[tid] = (function, future)
+            # Written straight to the socket: pymodbus's own send path
+            # discards its receive buffer, which may hold earlier replies.
+            self._ctx.transport.write(
+                _MBAP_HEADER.pack(tid, 0, 1 + _READ_PDU.size, self._unit_id)
+                + _READ_PDU.pack(function, address, count)
+            )
+            try:
+                return await asyncio.wait_for(future, self._timeout)
+            except TimeoutError as err:
+                raise TransportTimeoutError(
+                    f"Timeout on pipelined read of {count} registers at {address}"
+                ) from err
+            finally:
+                self._pending.pop(tid, None)
+
+    def _on_data(self, data: bytes) -> None:
+        """Buffer ``data`` and route every complete response in it."""
+        self._buffer += data
+        used = 0
+        while used < len(self._buffer):
+            frame_len, unit_id, tid, pdu = self._ctx.framer.decode(bytes(self._buffer[used:]))
+            if not frame_len or not pdu:
+                break
+            used += frame_len
+            pending = self._pending.get(tid)
+            if pending is None:
+                self._misbehave(tid)
+                continue
+            function, future = pending
+            if not future.done():
+                self._resolve(future, function, unit_id, pdu)
+        del self._buffer[:used]
+
+    def _misbehave(self, tid: int) -> None:
+        """Fail every outstanding request after an unknown TID."""
+        self.misbehaved = True
+        err = PipelineMisbehaviorError(f"Response with unknown transaction ID {tid}")
+        for _function, future in self._pending.values():
+            if not future.done():
+                future.set_exception(err)
+
+    def _resolve(
+        self,
+        future: asyncio.Future[list[int]],
+        expected_function: int,
+        unit_id: int,
+        pdu: bytes,
+    ) -> None:
+        """Decode a read response PDU into ``future``."""
+        function = pdu[0]
+        if unit_id != self._unit_id or function & 0x7F != expected_function:
+            future.set_exception(
+                TransportReadError(
+                    f"Response for unit {unit_id} function 0x{function:02x}, expected "
+                    f"unit {self._unit_id} function 0x{expected_function:02x}"
+                )
+            )
+        elif function & 0x80:
+            code = pdu[1] if len(pdu) > 1 else 0
+            future.set_exception(
+                TransportReadError(f"Modbus exception: function=0x{function:02x}, code={code}")
+            )
+        else:
+            byte_count = pdu[1] if len(pdu) > 1 else 0
+            count = min(byte_count, len(pdu) - 2) // 2
+            future.set_result(list(struct.unpack_from(f">{count}H", pdu, 2)))
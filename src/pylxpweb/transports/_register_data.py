@@ -18,9 +18,10 @@ unchanged.  Under ``TYPE_CHECKING`` it supplies typed stubs for mypy.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import time
-from collections.abc import Callable, Coroutine, Sequence
+from collections.abc import AsyncIterator, Callable, Coroutine, Mapping, Sequence, Set
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
@@ -52,6 +53,7 @@ from .exceptions import (
     TransportResponseMismatchError,
     TransportTimeoutError,
 )
+from .gap_map import GapSafetyMap, gap_model_key
 from .observation import (
     RegisterObservation,
     RegisterObserver,
@@ -59,6 +61,7 @@ from .observation import (
     RegisterSpace,
     _RegisterCapture,
 )
+from .snapshot import RegisterSnapshot
 
 if TYPE_CHECKING:
     from pylxpweb.devices.inverters._features import InverterFamily
@@ -115,6 +118,11 @@ INPUT_REGISTER_GROUPS: dict[str, tuple[int, int]] = {
     "split_phase_grid": (193, 12),  # Registers 193-204: Split-phase grid voltages + per-leg power
 }
 
+# Groups read on every poll whatever the ``input_refresh_intervals`` policy:
+# besides power they carry the device status (reg 0), bus voltages (38-39)
+# and the fault/warning codes (60-63), which must never be served stale.
+_ALWAYS_READ_INPUT_GROUPS = frozenset({"power_energy", "status_energy"})
+
 # GridBOSS/MID register groups for ``read_midbox_runtime``
 MIDBOX_REGISTER_GROUPS: list[tuple[int, int]] = [
     (0, 40),  # Voltages, currents, power, smart loads 1-3
@@ -161,6 +169,16 @@ mismatch fallback the transport reverts to plain reads for this window, then
 re-probes coalescing once — bounding the retry cost without a permanent latch.
 """
 
+GAP_UNSAFE_STRIKES = 3
+"""Consecutive failed reads before a bridged gap is marked unsafe regardless.
+
+A Modbus exception response or short read on an untried gap marks it unsafe
+at once.  Timeouts and socket errors say nothing about the gap, and a gap
+already known safe is not flipped by one failure, so those only count a
+strike; this many in a row without a successful bridged read in between
+still marks the gap unsafe.
+"""
+
 
 def validate_input_block_size(value: int) -> int:
     """Validate a ``max_input_block_size`` setting.
@@ -192,6 +210,9 @@ class _ReadBlock:
     start: int
     count: int
 
+    gaps: tuple[tuple[int, int], ...] = ()
+    """Bridged ``(start, end)`` address ranges no member group covers."""
+
     @property
     def label(self) -> str:
         """Human-readable name for logs ('power_energy+status_energy+...')."""
@@ -202,11 +223,43 @@ class _ReadBlock:
         """Whether this block merges multiple groups (fallback-eligible)."""
         return len(self.members) > 1
 
+    def spans(self, values: Sequence[int]) -> list[tuple[int, Sequence[int]]]:
+        """Split a read of this block into its group-covered runs.
+
+        Registers read only because a gap was bridged are dropped, so a
+        bridged read yields exactly the registers the unbridged plan would.
+        """
+        if not self.gaps:
+            return [(self.start, values)]
+        runs: list[tuple[int, Sequence[int]]] = []
+        position = self.start
+        for gap_start, gap_end in (*self.gaps, (self.start + len(values), 0)):
+            if gap_start > position:
+                runs.append((position, values[position - self.start : gap_start - self.start]))
+            position = gap_end
+        return runs
+
 
 class _CoalescedReadFallback(Exception):
     """Internal: a coalesced block read failed; retry with plain group reads."""
 
 
+def _is_gap_attributable(reason: object) -> bool:
+    """Whether a failed bridged read can be blamed on the bridged gaps.
+
+    Only a response from the device itself counts: a Modbus exception
+    response or malformed frame (a :class:`TransportReadError` raised
+    without an underlying I/O error), or a short read (recorded as a
+    message, not an exception).  Timeouts, socket errors and misrouted
+    frames say nothing about the addresses that were read.
+    """
+    if not isinstance(reason, BaseException):
+        return True
+    if isinstance(reason, TransportResponseMismatchError):
+        return False
+    return isinstance(reason, TransportReadError) and reason.__cause__ is None
+
+
 def _append_observed_segment(
     segments: list[RegisterSegment],
     start: int,
@@ -263,6 +316,7 @@ def _capture_register_reads(
 def coalesce_register_groups(
     groups: Sequence[tuple[str, tuple[int, int]]],
     max_block_size: int,
+    can_bridge: Callable[[int, int], bool] | None = None,
 ) -> list[_ReadBlock]:
     """Merge contiguous/overlapping register groups into larger read blocks.
 
@@ -276,26 +330,106 @@ def coalesce_register_groups(
     A single group larger than ``max_block_size`` is never split; it stays
     one read, exactly as in the plain plan.
 
+    ``can_bridge`` opts into gap bridging: when it returns True for a gap
+    ``(start, end)`` between the running block and the next group, the two
+    are merged across it (the gap is recorded on the block, see
+    :meth:`_ReadBlock.spans`).  Extending each block as far as the size cap
+    allows is optimal here — blocks are runs of consecutive groups — so the
+    plan has the fewest reads the bridgeable gaps permit.
+
     Args:
         groups: ``(name, (start, count))`` pairs (e.g. INPUT_REGISTER_GROUPS
             items, or a subset).
         max_block_size: Maximum registers per merged read.
+        can_bridge: Optional predicate for bridging a gap; None never bridges.
 
     Returns:
         Ordered read plan covering the same addresses as ``groups``.
     """
-    merged: list[tuple[list[str], int, int]] = []  # (names, start, end)
+    # (names, start, end, bridged gaps)
+    merged: list[tuple[list[str], int, int, list[tuple[int, int]]]] = []
     for name, (start, count) in sorted(groups, key=lambda g: (g[1][0], g[1][0] + g[1][1])):
         end = start + count
         if merged:
-            names, run_start, run_end = merged[-1]
+            names, run_start, run_end, gaps = merged[-1]
             new_end = max(run_end, end)
-            if start <= run_end and new_end - run_start <= max_block_size:
+            if new_end - run_start <= max_block_size:
+                if start > run_end:
+                    if can_bridge is None or not can_bridge(run_end, start):
+                        merged.append(([name], start, end, []))
+                        continue
+                    gaps.append((run_end, start))
                 names.append(name)
-                merged[-1] = (names, run_start, new_end)
+                merged[-1] = (names, run_start, new_end, gaps)
                 continue
-        merged.append(([name], start, end))
-    return [_ReadBlock(tuple(names), start, end - start) for names, start, end in merged]
+        merged.append(([name], start, end, []))
+    return [
+        _ReadBlock(tuple(names), start, end - start, tuple(gaps))
+        for names, start, end, gaps in merged
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Multi-rate input refresh
+# ---------------------------------------------------------------------------
+# Lifetime energy counters, temperatures and BMS limits change far more slowly
+# than power and voltage.  ``input_refresh_intervals`` maps a group name to the
+# minimum seconds between reads of that group; read_all_input_data() then only
+# reads the groups that are due and serves the others from the last read.
+# Groups without an entry are read every poll, so the default (no policy) is
+# the plain full read.
+
+
+def validate_input_refresh_intervals(
+    intervals: Mapping[str, float] | None,
+) -> dict[str, float]:
+    """Validate an ``input_refresh_intervals`` policy.
+
+    The policy maps input register group names to the minimum seconds
+    between reads of that group, e.g. ``{"temperatures": 60, "bms_data":
+    30}``.  ``read_all_input_data()`` then reads only the groups that are
+    due and reuses the last read of the others; unlisted groups are read
+    every poll.  ``power_energy`` and ``status_energy`` hold the status,
+    fault and warning codes and cannot be throttled.
+
+    Args:
+        intervals: Group name from ``INPUT_REGISTER_GROUPS`` to minimum
+            seconds between reads, or None for no policy.
+
+    Returns:
+        The policy without its zero entries (read every poll).
+
+    Raises:
+        ValueError: If a group name is unknown or always read, or an
+            interval is negative.
+    """
+    if not intervals:
+        return {}
+    unknown = sorted(set(intervals) - set(INPUT_REGISTER_GROUPS))
+    if unknown:
+        raise ValueError(
+            f"Unknown input register groups {unknown}; expected names from "
+            f"{sorted(INPUT_REGISTER_GROUPS)}"
+        )
+    for name, seconds in intervals.items():
+        if seconds < 0:
+            raise ValueError(f"Refresh interval for {name!r} must be >= 0 (got {seconds})")
+        if seconds > 0 and name in _ALWAYS_READ_INPUT_GROUPS:
+            raise ValueError(
+                f"Input register group {name!r} holds the status, fault and warning "
+                "codes and is read every poll; it cannot have a refresh interval"
+            )
+    return {name: float(seconds) for name, seconds in intervals.items() if seconds > 0}
+
+
+def select_due_blocks(plan: list[_ReadBlock], due: Set[str]) -> list[_ReadBlock]:
+    """Keep the blocks of ``plan`` that cover at least one due group.
+
+    A coalesced block is read whole when any member is due: its other
+    members are refreshed at no extra transaction, and dropping them could
+    split the block into several reads.
+    """
+    return [block for block in plan if not due.isdisjoint(block.members)]
 
 
 # ---------------------------------------------------------------------------
@@ -314,6 +448,8 @@ if TYPE_CHECKING:
         _pv_string_count: int
         _max_input_block_size: int
         _input_coalescing_latched_off: bool
+        _input_refresh_intervals: dict[str, float]
+        _input_group_cache: dict[str, tuple[float, int, Sequence[int]]]
         _register_observer: RegisterObserver | None
 
         def _new_register_capture(self) -> _RegisterCapture: ...
@@ -356,6 +492,14 @@ class RegisterDataMixin(_DataMixinBase):
     # the #282/#258 red herring).
     _last_hold_110: int | None = None
 
+    # Last-seen device type code and firmware version, stashed the same way
+    # by read_device_type()/read_firmware_version().  Together they key the
+    # model in the learned gap map (``gap_map``); until both are known the
+    # planner never bridges gaps.
+    _last_device_type_code: int | None = None
+    _last_firmware_version: str | None = None
+    _gap_map: GapSafetyMap | None = None
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -368,6 +512,17 @@ class RegisterDataMixin(_DataMixinBase):
         """
         self._max_input_block_size = validate_input_block_size(max_input_block_size)
         self._input_coalescing_latched_off = False
+        self._gap_strikes: dict[tuple[int, int], int] = {}
+
+    def _init_input_refresh(self, intervals: Mapping[str, float] | None) -> None:
+        """Validate and store the multi-rate input refresh policy.
+
+        Shared by the Modbus and dongle transport constructors, like
+        :meth:`_init_input_coalescing`.
+        """
+        self._input_refresh_intervals = validate_input_refresh_intervals(intervals)
+        # group name -> (monotonic read time, start address, words)
+        self._input_group_cache: dict[str, tuple[float, int, Sequence[int]]] = {}
 
     @staticmethod
     def _registers_from_values(start: int, values: list[int]) -> dict[int, int]:
@@ -961,7 +1116,133 @@ class RegisterDataMixin(_DataMixinBase):
                 "[%s] coalescing cooldown expired — re-probing large input reads",
                 self._serial,
             )
-        return coalesce_register_groups(groups, max_size)
+        return coalesce_register_groups(groups, max_size, self._gap_bridge_predicate())
+
+    def _gap_model_key(self) -> str | None:
+        """Model key for the learned gap map, once type and firmware are known."""
+        if self._last_device_type_code is None or not self._last_firmware_version:
+            return None
+        return gap_model_key(self._last_device_type_code, self._last_firmware_version)
+
+    def _gap_bridge_predicate(self) -> Callable[[int, int], bool] | None:
+        """Gap-bridging predicate for one plan, or None to never bridge.
+
+        Known-safe gaps are bridged and known-unsafe ones never are.  One
+        unknown gap per plan is probed, and only once a coalesced read has
+        succeeded: large reads are then proven, so a failed probe can be
+        blamed on the gap rather than on the old ~40-register cap.
+        """
+        gap_map = self._gap_map
+        model = self._gap_model_key()
+        if gap_map is None or model is None:
+            return None
+        probe_allowed = [getattr(self, "_input_coalescing_proven", False)]
+
+        def can_bridge(start: int, end: int) -> bool:
+            status = gap_map.status(model, start, end)
+            if status is not None:
+                return status
+            if probe_allowed[0]:
+                probe_allowed[0] = False
+                return True
+            return False
+
+        return can_bridge
+
+    def _record_bridged_read(self, block: _ReadBlock, ok: bool, reason: object = None) -> None:
+        """Teach the gap map the outcome of a read bridging ``block.gaps``.
+
+        A failure marks a gap unsafe only when it is attributable to the gap
+        (a Modbus exception response or short read, see
+        :func:`_is_gap_attributable`) and the gap has not been read safely
+        before.  Anything else counts a strike; :data:`GAP_UNSAFE_STRIKES`
+        consecutive strikes mark the gap unsafe even if it was known safe.
+        """
+        gap_map = self._gap_map
+        model = self._gap_model_key()
+        if gap_map is None or model is None:
+            return
+        strikes = self._gap_strikes
+        if ok:
+            gap_map.mark_safe(model, block.gaps)
+            for gap in block.gaps:
+                strikes.pop(gap, None)
+            return
+        attributable = _is_gap_attributable(reason)
+        unsafe: list[tuple[int, int]] = []
+        for gap in block.gaps:
+            strikes[gap] = strikes.get(gap, 0) + 1
+            known_safe = gap_map.status(model, *gap) is True
+            if strikes[gap] >= GAP_UNSAFE_STRIKES or (attributable and not known_safe):
+                unsafe.append(gap)
+                del strikes[gap]
+        if not unsafe:
+            _LOGGER.debug(
+                "[%s] Input read %d-%d bridging register gaps %s failed (%s); "
+                "not blamed on the gaps yet",
+                self._serial,
+                block.start,
+                block.start + block.count - 1,
+                ", ".join(f"{start}-{end - 1}" for start, end in block.gaps),
+                reason,
+            )
+            return
+        gap_map.mark_unsafe(model, unsafe, overwrite_safe=True)
+        _LOGGER.info(
+            "[%s] Input read %d-%d bridging register gaps %s failed (%s); "
+            "those gaps will not be bridged again for model %s",
+            self._serial,
+            block.start,
+            block.start + block.count - 1,
+            ", ".join(f"{start}-{end - 1}" for start, end in unsafe),
+            reason,
+            model,
+        )
+
+    def _due_input_groups(
+        self,
+        groups: list[tuple[str, tuple[int, int]]],
+        now: float,
+    ) -> frozenset[str] | None:
+        """Names of ``groups`` due for a read under the refresh policy.
+
+        Returns None when no policy is configured (every group, every poll).
+        A group is due when it has no entry in the policy, has never been
+        read successfully, or its interval has elapsed since the last read.
+        """
+        intervals: dict[str, float] = getattr(self, "_input_refresh_intervals", {})
+        if not intervals:
+            return None
+        cache = self._input_group_cache
+        return frozenset(
+            name
+            for name, _ in groups
+            if name not in intervals or name not in cache or now - cache[name][0] >= intervals[name]
+        )
+
+    def _merge_input_group_cache(
+        self,
+        fresh: RegisterSnapshot,
+        plan: list[_ReadBlock],
+        now: float,
+    ) -> RegisterSnapshot:
+        """Record this poll's group reads and merge in the cached groups.
+
+        Each group of ``plan`` that came back complete is cached with
+        ``now``; one that failed or came back short is dropped, so it stays
+        due and its registers stay absent, as with a plain full read.  When
+        groups overlap, the most recently read one wins.
+        """
+        cache = self._input_group_cache
+        for block in plan:
+            for name in block.members:
+                start, count = INPUT_REGISTER_GROUPS[name]
+                try:
+                    cache[name] = (now, start, fresh.view(start, count))
+                except KeyError:
+                    cache.pop(name, None)
+        entries = sorted(cache.values(), key=lambda entry: entry[0])
+        return RegisterSnapshot((start, words) for _, start, words in entries)
 
     @staticmethod
     def _plain_input_plan(
@@ -1088,6 +1369,10 @@ class RegisterDataMixin(_DataMixinBase):
         cooldown reads stay plain, then coalescing re-probes once.  The
         per-read dongle transport already retries 3x, so an escaping mismatch
         is rare (no strike counter needed).
+
+        A failed read that bridges register gaps never latches: the outcome
+        goes to the gap map (:meth:`_record_bridged_read`), and a timeout or
+        socket error additionally starts the cooldown.
         """
         try:
             values = await self._read_input_registers(block.start, block.count)
@@ -1097,10 +1382,28 @@ class RegisterDataMixin(_DataMixinBase):
                 raise _CoalescedReadFallback() from err
             raise
         except Exception as err:
+            if block.gaps:
+                # A failure the gaps can explain is blamed on them, not on
+                # large-read support: the next plan stops bridging them.  A
+                # timeout or socket error is transient (#320), so it only
+                # counts a strike and the plan backs off via the cooldown.
+                self._record_bridged_read(block, False, err)
+                if not _is_gap_attributable(err):
+                    self._start_coalescing_cooldown(
+                        block, err, "bridging register gaps hit a transient error"
+                    )
+                raise _CoalescedReadFallback() from err
             if block.coalesced:
                 self._degrade_coalescing(block, err)
                 raise _CoalescedReadFallback() from err
             raise
+        if block.gaps:
+            if len(values) < block.count:
+                self._record_bridged_read(
+                    block, False, f"short response ({len(values)}/{block.count} registers)"
+                )
+                raise _CoalescedReadFallback()
+            self._record_bridged_read(block, True)
         if block.coalesced and len(values) < block.count:
             # A short-but-well-formed response (matching serial/function/start
             # register, valid CRC, just fewer registers) is the classic
@@ -1127,7 +1430,7 @@ class RegisterDataMixin(_DataMixinBase):
         self,
         group_names: list[str] | None = None,
         segments: list[RegisterSegment] | None = None,
-    ) -> dict[int, int]:
+    ) -> RegisterSnapshot:
         """Read multiple register groups sequentially with inter-group delays.
 
         When a larger ``max_input_block_size`` is configured, adjacent groups
@@ -1143,7 +1446,7 @@ class RegisterDataMixin(_DataMixinBase):
                 If *None*, reads all groups.
 
         Returns:
-            Dict mapping register address to value.
+            Snapshot of the registers read.
 
         Raises:
             TransportReadError: If any group read fails.
@@ -1171,18 +1474,44 @@ class RegisterDataMixin(_DataMixinBase):
                     _append_observed_segment(segments, segment.start_address, segment.words)
         return registers
 
+    @contextlib.asynccontextmanager
+    async def _input_prefetch(
+        self,
+        plan: list[_ReadBlock],  # noqa: ARG002 - used by overriding transports
+    ) -> AsyncIterator[bool]:
+        """Fetch ``plan``'s blocks ahead of the sequential read loop.
+
+        Transports that can have several reads in flight (pipelined Modbus
+        TCP) override this to issue every block at once; the loop's own
+        ``_read_input_registers`` calls are then answered from the results,
+        so fallback, short-read and bms semantics stay in one place.  Yields
+        True when every block was fetched, letting the loop skip its
+        inter-read delays.  The default fetches nothing.
+        """
+        yield False
+
     async def _read_group_plan(
         self,
         plan: list[_ReadBlock],
         segments: list[RegisterSegment] | None = None,
-    ) -> dict[int, int]:
+    ) -> RegisterSnapshot:
         """Execute a read plan sequentially with inter-read delays.
 
         The adaptive-delay backoff only applies to transports that track
         ``_last_read_retried`` (the pymodbus-based ones); the dongle
         transport has no such attribute and keeps its fixed delay.
         """
-        registers: dict[int, int] = {}
+        async with self._input_prefetch(plan) as prefetched:
+            return await self._read_group_plan_blocks(plan, segments, prefetched)
+
+    async def _read_group_plan_blocks(
+        self,
+        plan: list[_ReadBlock],
+        segments: list[RegisterSegment] | None,
+        prefetched: bool,
+    ) -> RegisterSnapshot:
+        """Read each block of ``plan`` in order (see :meth:`_read_group_plan`)."""
+        blocks: list[tuple[int, Sequence[int]]] = []
         current_delay = self._inter_register_delay
 
         for i, block in enumerate(plan):
@@ -1205,10 +1534,10 @@ class RegisterDataMixin(_DataMixinBase):
                     f"Failed to read register group '{block.label}': {e}"
                 ) from e
 
-            for offset, value in enumerate(values):
-                registers[block.start + offset] = value
-            if segments is not None:
-                _append_observed_segment(segments, block.start, values)
+            for start, words in block.spans(values):
+                blocks.append((start, words))
+                if segments is not None:
+                    _append_observed_segment(segments, start, words)
 
             # Increase delay when retries occurred to give the device breathing room
             if getattr(self, "_last_read_retried", False):
@@ -1218,15 +1547,15 @@ class RegisterDataMixin(_DataMixinBase):
                     current_delay,
                 )
 
-            if i < len(plan) - 1:
+            if i < len(plan) - 1 and not prefetched:
                 await asyncio.sleep(current_delay)
 
-        return registers
+        return RegisterSnapshot(blocks)
 
     async def _read_pv4_6_registers(
         self,
         segments: list[RegisterSegment] | None = None,
-    ) -> dict[int, int]:
+    ) -> RegisterSnapshot:
         """Read the V23-extended PV4-6 input registers if applicable.
 
         Covers both the voltage/power group (217-222) and the daily/lifetime
@@ -1237,13 +1566,13 @@ class RegisterDataMixin(_DataMixinBase):
         resilience of the other supplementary register groups.
 
         Returns:
-            Dict mapping address to raw value (empty if not applicable or on
+            Snapshot of the registers read (empty if not applicable or on
             read failure).
         """
         if self._pv_string_count < 4:
-            return {}
+            return RegisterSnapshot()
 
-        registers: dict[int, int] = {}
+        blocks: list[tuple[int, list[int]]] = []
         for start, count in (
             PV4_6_INPUT_REGISTER_GROUP,
             PV4_6_ENERGY_INPUT_REGISTER_GROUP,
@@ -1260,10 +1589,10 @@ class RegisterDataMixin(_DataMixinBase):
                     e,
                 )
                 continue
-            registers.update(self._registers_from_values(start, values))
+            blocks.append((start, values))
             if segments is not None:
                 _append_observed_segment(segments, start, values)
-        return registers
+        return RegisterSnapshot(blocks)
 
     async def read_quick_charge_remaining_seconds(self) -> int | None:
         """Read the quick-charge remaining-time countdown (INPUT register 210).
@@ -1311,7 +1640,7 @@ class RegisterDataMixin(_DataMixinBase):
         """
         segments = self._new_observed_segments()
         input_registers = await self._read_register_groups(segments=segments)
-        input_registers.update(await self._read_pv4_6_registers(segments))
+        input_registers |= await self._read_pv4_6_registers(segments)
         family = self._inverter_family.value if self._inverter_family else "EG4_HYBRID"
         result = InverterRuntimeData.from_modbus_registers(
             input_registers,
@@ -1340,8 +1669,7 @@ class RegisterDataMixin(_DataMixinBase):
         # bms_data is supplementary — don't fail the entire energy read
         # if these registers time out
         try:
-            bms_registers = await self._read_register_groups(["bms_data"], segments)
-            input_registers.update(bms_registers)
+            input_registers |= await self._read_register_groups(["bms_data"], segments)
         except (TransportReadError, TransportTimeoutError):
             _LOGGER.debug(
                 "bms_data registers unavailable for %s, continuing without them",
@@ -1350,7 +1678,7 @@ class RegisterDataMixin(_DataMixinBase):
 
         # V23-extended PV4-6 energy registers (only read for models with >=4
         # strings); gated identically to the runtime path.
-        input_registers.update(await self._read_pv4_6_registers(segments))
+        input_registers |= await self._read_pv4_6_registers(segments)
 
         family = self._inverter_family.value if self._inverter_family else "EG4_HYBRID"
         result = InverterEnergyData.from_modbus_registers(
@@ -1378,14 +1706,14 @@ class RegisterDataMixin(_DataMixinBase):
         Raises:
             TransportReadError: If read operation fails.
         """
-        all_registers: dict[int, int] = {}
+        blocks: list[tuple[int, list[int]]] = []
         segments = self._new_observed_segments()
 
         # Read core battery registers (power + BMS).
         # Registers 0-31 contain power/voltage/SOC; 80-112 contain BMS data.
         try:
             power_regs = await self._read_input_registers(0, 32)
-            all_registers.update(self._registers_from_values(0, power_regs))
+            blocks.append((0, power_regs))
             if segments is not None:
                 _append_observed_segment(segments, 0, power_regs)
         except Exception as e:
@@ -1404,7 +1732,7 @@ class RegisterDataMixin(_DataMixinBase):
                 )
                 bms_ok = False
             else:
-                all_registers.update(self._registers_from_values(80, bms_regs))
+                blocks.append((80, bms_regs))
                 if segments is not None:
                     _append_observed_segment(segments, 80, bms_regs)
         except Exception as e:
@@ -1424,6 +1752,8 @@ class RegisterDataMixin(_DataMixinBase):
             )
             return None
 
+        all_registers = RegisterSnapshot(blocks)
+
         # Read individual battery registers (5000+) if requested
         battery_count = all_registers.get(96, 0)
         individual_registers: dict[int, int] | None = None
@@ -1481,7 +1811,7 @@ class RegisterDataMixin(_DataMixinBase):
         self,
         plan: list[_ReadBlock],
         segments: list[RegisterSegment] | None = None,
-    ) -> tuple[dict[int, int], bool]:
+    ) -> tuple[RegisterSnapshot, bool]:
         """Execute the combined-read plan, tracking bms_data availability.
 
         A plain ``bms_data`` read failing or coming back short is non-fatal
@@ -1493,9 +1823,19 @@ class RegisterDataMixin(_DataMixinBase):
         per-group semantics.
 
         Returns:
-            Tuple of (address→value map, bms_ok).
+            Tuple of (register snapshot, bms_ok).
         """
-        input_registers: dict[int, int] = {}
+        async with self._input_prefetch(plan) as prefetched:
+            return await self._read_all_input_blocks(plan, segments, prefetched)
+
+    async def _read_all_input_blocks(
+        self,
+        plan: list[_ReadBlock],
+        segments: list[RegisterSegment] | None,
+        prefetched: bool,
+    ) -> tuple[RegisterSnapshot, bool]:
+        """Read each block of ``plan`` in order (see :meth:`_read_all_input_groups`)."""
+        blocks: list[tuple[int, Sequence[int]]] = []
         bms_ok = True
 
         for i, block in enumerate(plan):
@@ -1515,10 +1855,10 @@ class RegisterDataMixin(_DataMixinBase):
                     )
                     bms_ok = False
                     continue
-                for offset, value in enumerate(values):
-                    input_registers[block.start + offset] = value
-                if segments is not None:
-                    _append_observed_segment(segments, block.start, values)
+                for start, words in block.spans(values):
+                    blocks.append((start, words))
+                    if segments is not None:
+                        _append_observed_segment(segments, start, words)
             except _CoalescedReadFallback:
                 raise
             except Exception:
@@ -1531,10 +1871,10 @@ class RegisterDataMixin(_DataMixinBase):
                     continue
                 raise
 
-            if i < len(plan) - 1:
+            if i < len(plan) - 1 and not prefetched:
                 await asyncio.sleep(self._inter_register_delay)
 
-        return input_registers, bms_ok
+        return RegisterSnapshot(blocks), bms_ok
 
     async def read_all_input_data(
         self,
@@ -1546,28 +1886,44 @@ class RegisterDataMixin(_DataMixinBase):
 
         BMS data failure is non-fatal to match ``read_energy()`` resilience.
 
+        With an ``input_refresh_intervals`` policy, only the groups that are
+        due are read; the others come from their last successful read.
+
         Returns:
             Tuple of (runtime_data, energy_data, battery_data_or_none).
         """
         groups = self._resolve_input_groups(None)
+        now = time.monotonic()
+        due = self._due_input_groups(groups, now)
+        plan = self._plan_input_reads(groups)
+        if due is not None:
+            plan = select_due_blocks(plan, due)
+            _LOGGER.debug(
+                "[%s] input refresh: %d of %d groups due, %d reads",
+                self._serial,
+                len(due),
+                len(groups),
+                len(plan),
+            )
         winning_segments = self._new_observed_segments()
         try:
-            input_registers, bms_ok = await self._read_all_input_groups(
-                self._plan_input_reads(groups), winning_segments
-            )
+            input_registers, bms_ok = await self._read_all_input_groups(plan, winning_segments)
         except _CoalescedReadFallback:
             # A coalesced block fell back — either it latched coalescing off,
             # or it was a non-latching misrouted frame (#320).  Re-read with
             # an explicit plain plan (one read/group) so the retry never
             # coalesces again, restoring the exact per-group (bms non-fatal)
             # semantics regardless of whether the latch fired.
+            plan = self._plain_input_plan(groups)
+            if due is not None:
+                plan = select_due_blocks(plan, due)
             winning_segments = self._new_observed_segments()
-            input_registers, bms_ok = await self._read_all_input_groups(
-                self._plain_input_plan(groups), winning_segments
-            )
+            input_registers, bms_ok = await self._read_all_input_groups(plan, winning_segments)
+        if due is not None:
+            input_registers = self._merge_input_group_cache(input_registers, plan, now)
 
         # V23-extended PV4-6 registers (only read for models with >=4 strings)
-        input_registers.update(await self._read_pv4_6_registers(winning_segments))
+        input_registers |= await self._read_pv4_6_registers(winning_segments)
 
         family = self._inverter_family.value if self._inverter_family else "EG4_HYBRID"
 
@@ -1647,13 +2003,13 @@ class RegisterDataMixin(_DataMixinBase):
         Raises:
             TransportReadError: If read operation fails.
         """
-        input_registers: dict[int, int] = {}
+        blocks: list[tuple[int, list[int]]] = []
         input_segments = self._new_observed_segments()
 
         try:
             for i, (start, count) in enumerate(MIDBOX_REGISTER_GROUPS):
                 values = await self._read_input_registers(start, count)
-                input_registers.update(self._registers_from_values(start, values))
+                blocks.append((start, values))
                 if input_segments is not None:
                     _append_observed_segment(input_segments, start, values)
 
@@ -1685,7 +2041,7 @@ class RegisterDataMixin(_DataMixinBase):
             _LOGGER.debug("Failed to read smart port mode register 20")
 
         result = MidboxRuntimeData.from_modbus_registers(
-            input_registers, smart_port_mode_reg=smart_port_mode_reg
+            RegisterSnapshot(blocks), smart_port_mode_reg=smart_port_mode_reg
         )
         if input_segments:
             await self._notify_observed_segments(
@@ -1799,6 +2155,8 @@ class RegisterDataMixin(_DataMixinBase):
         segments = self._new_observed_segments()
         reader = _capture_register_reads(self._read_holding_registers, segments)
         result = await read_firmware_version_async(reader)
+        if result:
+            self._last_firmware_version = result
         if segments:
             await self._notify_observed_segments((RegisterSpace.HOLDING, segments))
         return result
@@ -1808,6 +2166,7 @@ class RegisterDataMixin(_DataMixinBase):
         segments = self._new_observed_segments()
         reader = _capture_register_reads(self._read_holding_registers, segments)
         result = await read_device_type_async(reader)
+        self._last_device_type_code = result
         if segments:
             await self._notify_observed_segments((RegisterSpace.HOLDING, segments))
         return result
@@ -12,14 +12,28 @@ Data overlay (master battery only):
   BMS data (already read during the inverter's normal refresh cycle),
   it overlays the missing fields onto the master's BatteryData.
   Slave batteries have complete data from RS485 and need no overlay.
+
+Topology cache:
+  Auto-scan probes every unit ID up to ``max_units`` and waits out a full
+  timeout for each silent one. A ``BatteryTopologyCache`` keeps the
+  discovered units (and the measured bus turnaround) per bridge, so a
+  transport started with one polls the known units straight away and
+  probes one unknown ID per ``read_all()`` instead.
+
+Turnaround tuning:
+  Opt-in (``tune_to_turnaround=True``). The inter-unit delay then follows
+  the measured bus turnaround instead of the fixed 200 ms, and discovery
+  probes give up after a few turnarounds instead of the full timeout.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import time
-from typing import Self
+from collections.abc import AsyncIterator, Iterable, Mapping
+from typing import TYPE_CHECKING, Any, Self
 
 from pymodbus.client import AsyncModbusTcpClient
 
@@ -27,8 +41,12 @@ from pylxpweb.battery_protocols.base import BatteryProtocol
 from pylxpweb.battery_protocols.detection import detect_protocol
 from pylxpweb.battery_protocols.eg4_master import EG4MasterProtocol
 from pylxpweb.battery_protocols.eg4_slave import EG4SlaveProtocol
+from pylxpweb.transports.bus_arbiter import BUS_PRIORITY_BATTERY
 from pylxpweb.transports.data import BatteryData, InverterRuntimeData
 
+if TYPE_CHECKING:
+    from pylxpweb.transports.bus_arbiter import RS485BusArbiter
+
 _LOGGER = logging.getLogger(__name__)
 
 # Number of registers to read for initial runtime block (covers both protocols).
@@ -47,8 +65,21 @@ _DETECTION_REGISTER_COUNT = 19
 # Small delay between sequential register reads to avoid bus congestion (seconds)
 _INTER_READ_DELAY = 0.1
 
-# Delay between sequential unit reads during scan or read_all (seconds)
+# Delay between sequential unit reads during scan or read_all (seconds). With
+# turnaround tuning this is the ceiling: once a unit has answered, the delay
+# tracks the measured bus turnaround instead, never dropping below the floor.
 _INTER_UNIT_DELAY = 0.2
+_MIN_INTER_UNIT_DELAY = 0.05
+
+# With turnaround tuning, discovery probes of silent IDs time out after this
+# many measured turnarounds
+# rather than the full read timeout, but never sooner than the floor, so a
+# slow-but-present BMS is still found (seconds for the floor).
+_PROBE_TIMEOUT_FACTOR = 4.0
+_MIN_PROBE_TIMEOUT = 0.25
+
+# Weight of the newest sample in the turnaround moving average.
+_TURNAROUND_SMOOTHING = 0.2
 
 # A unit that stops answering must not silently shrink the remembered topology
 # and re-enable master back-calculation against a partial bank. Retention mirrors
@@ -69,6 +100,79 @@ _PROTOCOL_MAP: dict[str, type[BatteryProtocol]] = {
 }
 
 
+class BatteryTopologyCache:
+    """Discovered battery units and bus turnaround per RS485 bridge.
+
+    Pass one to ``BatteryModbusTransport(topology_cache=...)`` to skip the
+    full unit scan on startup. The transport keeps it in step with its
+    remembered topology, so units evicted after the retention window drop
+    out and units found by the background sweep are added.
+
+    The cache is plain data: :meth:`to_dict` / :meth:`from_dict` round-trip
+    through JSON for persistence between runs.
+
+    Example:
+        >>> cache = BatteryTopologyCache()
+        >>> cache.record("10.100.3.27:502", [1, 2, 3], 0.04)
+        >>> cache.units("10.100.3.27:502")
+        [1, 2, 3]
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._units: dict[str, list[int]] = {}
+        self._turnaround: dict[str, float] = {}
+
+    def units(self, bridge: str) -> list[int]:
+        """Return the known unit IDs behind ``bridge`` (``"host:port"``)."""
+        return list(self._units.get(bridge, ()))
+
+    def turnaround(self, bridge: str) -> float | None:
+        """Return the measured request turnaround for ``bridge``, in seconds."""
+        return self._turnaround.get(bridge)
+
+    def record(self, bridge: str, units: Iterable[int], turnaround: float | None = None) -> None:
+        """Store the units (and optionally the turnaround) seen behind ``bridge``."""
+        self._units[bridge] = sorted(set(units))
+        if turnaround is not None:
+            self._turnaround[bridge] = turnaround
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """Export as ``{bridge: {"units": [...], "turnaround": seconds}}``."""
+        return {
+            bridge: {
+                "units": list(units),
+                **({"turnaround": self._turnaround[bridge]} if bridge in self._turnaround else {}),
+            }
+            for bridge, units in sorted(self._units.items())
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Mapping[str, Any]]) -> BatteryTopologyCache:
+        """Rebuild a cache exported by :meth:`to_dict`.
+
+        Raises:
+            ValueError: If a unit ID or turnaround is malformed.
+        """
+        cache = cls()
+        for bridge, entry in data.items():
+            units = entry.get("units", [])
+            if not all(type(uid) is int and 1 <= uid <= 247 for uid in units):
+                raise ValueError(f"Invalid battery unit IDs {units!r} for bridge {bridge!r}")
+            turnaround = entry.get("turnaround")
+            if turnaround is not None and (
+                not isinstance(turnaround, (int, float)) or turnaround < 0
+            ):
+                raise ValueError(f"Invalid turnaround {turnaround!r} for bridge {bridge!r}")
+            cache.record(bridge, units, None if turnaround is None else float(turnaround))
+        return cache
+
+    def __repr__(self) -> str:
+        """Return the number of bridges and units recorded."""
+        units = sum(len(known) for known in self._units.values())
+        return f"{type(self).__name__}(bridges={len(self._units)}, units={units})"
+
+
 def _initial_block_requirement(protocol: BatteryProtocol) -> int:
     """Registers a protocol actually decodes out of the initial runtime read.
 
@@ -118,6 +222,24 @@ class BatteryModbusTransport:
         protocol: Protocol name or "auto" for auto-detection.
         inverter_serial: Serial number of the inverter these batteries belong to.
         timeout: Modbus connection and read timeout in seconds.
+        bus: Arbiter for an RS485 bus shared with the inverter transport.
+            Each read then waits its turn on the bus, and the arbiter's
+            inter-frame gap replaces the fixed congestion delays between
+            reads.
+        bus_priority: Queue priority on ``bus``, lower first.
+        static_block_interval: Seconds between re-reads of static blocks
+            (slave model/serial/firmware). None or 0 reads them every poll.
+        topology_cache: Units discovered earlier on this bridge. When set,
+            ``read_all()`` polls the cached units instead of scanning every
+            poll and sweeps one unknown ID per call; the first poll still
+            scans if the cache has nothing for this bridge.
+        tune_to_turnaround: Shorten the inter-unit delay and the discovery
+            probe timeout to the measured bus turnaround (default False
+            keeps the fixed 200 ms delay and full-timeout probes). A probe
+            that times out is abandoned mid-request, so enable this only on
+            bridges that tag replies with a Modbus TCP transaction ID; on a
+            raw RTU-over-TCP bridge a late reply could be taken as the answer
+            to the next request.
     """
 
     def __init__(
@@ -129,6 +251,11 @@ class BatteryModbusTransport:
         protocol: str = "auto",
         inverter_serial: str = "",
         timeout: float = 3.0,
+        bus: RS485BusArbiter | None = None,
+        bus_priority: int = BUS_PRIORITY_BATTERY,
+        topology_cache: BatteryTopologyCache | None = None,
+        static_block_interval: float | None = None,
+        tune_to_turnaround: bool = False,
     ) -> None:
         self.host = host
         self.port = port
@@ -137,6 +264,8 @@ class BatteryModbusTransport:
         self.protocol_name = protocol
         self.inverter_serial = inverter_serial
         self.timeout = timeout
+        self._bus = bus
+        self._bus_priority = bus_priority
         self._client: AsyncModbusTcpClient | None = None
         self._connected = False
         # Serializes every operation that uses the shared client across its
@@ -157,6 +286,78 @@ class BatteryModbusTransport:
         self._evicted_units: set[int] = set()
         # Cache detected protocols per unit ID
         self._detected_protocols: dict[int, BatteryProtocol] = {}
+        # Moving average of successful request round trips, which tunes the
+        # inter-unit delay and the discovery probe timeout when enabled.
+        self._turnaround: float | None = None
+        self._tune_to_turnaround = tune_to_turnaround
+        self._topology_cache = topology_cache
+        if static_block_interval is not None and static_block_interval < 0:
+            raise ValueError(
+                f"static_block_interval must be non-negative, got {static_block_interval}"
+            )
+        self._static_block_interval = static_block_interval or 0.0
+        # (unit_id, block start) -> (monotonic read time, registers)
+        self._static_blocks: dict[tuple[int, int], tuple[float, list[int]]] = {}
+        self._sweep_next = 1
+        if topology_cache is not None:
+            self._turnaround = topology_cache.turnaround(self._bridge_key)
+            # Cached units count as declared topology from the first poll,
+            # which also closes the auto-scan cold-start window (#249).
+            self._remember_polled_units(topology_cache.units(self._bridge_key))
+
+    @property
+    def _bridge_key(self) -> str:
+        """Key for this bridge in a ``BatteryTopologyCache``."""
+        return f"{self.host}:{self.port}"
+
+    @property
+    def topology_cache(self) -> BatteryTopologyCache | None:
+        """Get the topology cache shared with earlier runs, if any."""
+        return self._topology_cache
+
+    @property
+    def bus(self) -> RS485BusArbiter | None:
+        """Get the shared RS485 bus arbiter, if any."""
+        return self._bus
+
+    @contextlib.asynccontextmanager
+    async def _bus_slot(self) -> AsyncIterator[None]:
+        """Wait for this transport's turn on a shared RS485 bus."""
+        if self._bus is None:
+            yield
+            return
+        client = f"battery@{self.host}:{self.port}"
+        async with self._bus.transaction(client, self._bus_priority):
+            yield
+
+    async def _pause(self, delay: float) -> None:
+        """Leave the bus idle between reads unless an arbiter spaces frames."""
+        if self._bus is None:
+            await asyncio.sleep(delay)
+
+    def _inter_unit_delay(self) -> float:
+        """Delay between units, tuned to the measured bus turnaround if enabled."""
+        if not self._tune_to_turnaround or self._turnaround is None:
+            return _INTER_UNIT_DELAY
+        return min(_INTER_UNIT_DELAY, max(_MIN_INTER_UNIT_DELAY, self._turnaround))
+
+    def _probe_timeout(self) -> float:
+        """Timeout for a discovery probe of a possibly absent unit.
+
+        The full read timeout applies unless turnaround tuning is enabled and
+        some unit has answered; then a silent ID is given a few turnarounds
+        rather than seconds.
+        """
+        if not self._tune_to_turnaround or self._turnaround is None:
+            return self.timeout
+        return min(self.timeout, max(_MIN_PROBE_TIMEOUT, _PROBE_TIMEOUT_FACTOR * self._turnaround))
+
+    def _record_turnaround(self, elapsed: float) -> None:
+        """Fold one successful request round trip into the moving average."""
+        if self._turnaround is None:
+            self._turnaround = elapsed
+        else:
+            self._turnaround += _TURNAROUND_SMOOTHING * (elapsed - self._turnaround)
 
     @property
     def is_connected(self) -> bool:
@@ -339,6 +540,7 @@ class BatteryModbusTransport:
         unit_id: int,
         minimum: int | None = None,
         probe: bool = False,
+        timeout: float | None = None,
     ) -> list[int] | None:
         """Read holding registers from a battery unit.
 
@@ -351,6 +553,8 @@ class BatteryModbusTransport:
                 the request deliberately over-reads what will be decoded.
             probe: Whether this is an expected-miss discovery probe. Probe
                 failures do not affect degradation or reconnect state.
+            timeout: Give up after this many seconds instead of the client
+                timeout (used for discovery probes).
 
         Returns:
             List of register values, or None on error/timeout/short read.
@@ -362,9 +566,14 @@ class BatteryModbusTransport:
                 self._degrade_unit(unit_id, start, required, 0)
             return None
         try:
-            result = await self._client.read_holding_registers(
-                start, count=count, device_id=unit_id
-            )
+            async with self._bus_slot():
+                sent = time.perf_counter()
+                request = self._client.read_holding_registers(start, count=count, device_id=unit_id)
+                if timeout is not None and timeout < self.timeout:
+                    result = await asyncio.wait_for(request, timeout)
+                else:
+                    result = await request
+                elapsed = time.perf_counter() - sent
             if result.isError():
                 _LOGGER.debug(
                     "Modbus error response: unit=%d start=%d count=%d",
@@ -401,6 +610,7 @@ class BatteryModbusTransport:
                     self._consecutive_errors += 1
                     self._degrade_unit(unit_id, start, required, len(registers))
                 return None
+            self._record_turnaround(elapsed)
             if not probe:
                 self._consecutive_errors = 0
                 self._recover_reconnect_episode()
@@ -459,6 +669,8 @@ class BatteryModbusTransport:
 
         If explicit unit_ids were provided at construction, returns them
         without probing. Otherwise, probes unit IDs 1 through max_units.
+        With turnaround tuning, once a unit has answered, silent IDs are
+        probed with a short timeout derived from the measured turnaround.
 
         Returns:
             List of responding unit IDs.
@@ -472,11 +684,13 @@ class BatteryModbusTransport:
             for uid in range(1, self.max_units + 1):
                 # Individual non-responding IDs are expected discovery misses,
                 # not unit degradation or separate bus faults (#248).
-                regs = await self._read_registers(0, 1, uid, probe=True)
+                regs = await self._read_registers(
+                    0, 1, uid, probe=True, timeout=self._probe_timeout()
+                )
                 if regs is not None:
                     responding.append(uid)
                     self._observe_unit(uid)
-                await asyncio.sleep(_INTER_UNIT_DELAY)
+                await self._pause(self._inter_unit_delay())
 
             if responding:
                 self._consecutive_errors = 0
@@ -505,6 +719,7 @@ class BatteryModbusTransport:
                     )
                 if self._consecutive_errors >= self._max_consecutive_errors:
                     await self._reconnect()
+            self._sync_topology_cache()
 
         _LOGGER.info(
             "Battery bus scan: %d/%d units responding",
@@ -566,6 +781,46 @@ class BatteryModbusTransport:
             )
         return set(self._unit_last_seen)
 
+    def _sync_topology_cache(self) -> None:
+        """Store the remembered topology and turnaround in the cache."""
+        if self._topology_cache is not None and self.unit_ids is None:
+            self._topology_cache.record(
+                self._bridge_key, self._remembered_unit_ids(), self._turnaround
+            )
+
+    def _cached_units(self) -> list[int]:
+        """Unit IDs to poll from the topology cache (empty means scan)."""
+        if self._topology_cache is None or self.unit_ids is not None:
+            return []
+        return self._topology_cache.units(self._bridge_key)
+
+    async def _sweep_unknown_unit(self, known: Iterable[int]) -> None:
+        """Probe the next unit ID outside the known topology.
+
+        One short-timeout probe per poll, round-robin over 1..max_units, so
+        a battery added to the bank is found within ``max_units`` polls
+        without paying for a full scan each time. A responding ID joins the
+        remembered topology and is read from the next poll on.
+
+        Args:
+            known: Unit IDs already polled this cycle.
+        """
+        unknown = sorted(set(range(1, self.max_units + 1)).difference(known))
+        if not unknown:
+            return
+        uid = next((u for u in unknown if u >= self._sweep_next), unknown[0])
+        self._sweep_next = uid + 1
+        async with self._operation_lock:
+            regs = await self._read_registers(0, 1, uid, probe=True, timeout=self._probe_timeout())
+        if regs is not None:
+            _LOGGER.info(
+                "Battery unit %d found on RS485 bus %s:%d by background sweep",
+                uid,
+                self.host,
+                self.port,
+            )
+            self._observe_unit(uid)
+
     async def read_all(
         self,
         inverter_bms_data: InverterRuntimeData | None = None,
@@ -586,7 +841,9 @@ class BatteryModbusTransport:
         Returns:
             List of BatteryData objects for responding units, master first.
         """
-        units = self.unit_ids or await self.scan_units()
+        # With a topology cache, only an empty cache pays for a full scan
+        cached_units = self._cached_units()
+        units = self.unit_ids or cached_units or await self.scan_units()
         self._remember_polled_units(units)
 
         # Read all units, keeping track of raw registers for master re-decode
@@ -612,7 +869,10 @@ class BatteryModbusTransport:
                 slave_results.append(data)
                 decoded_slave_ids.add(uid)
 
-            await asyncio.sleep(_INTER_UNIT_DELAY)
+            await self._pause(self._inter_unit_delay())
+
+        if cached_units:
+            await self._sweep_unknown_unit(units)
 
         # Re-decode only when decoded slave IDs cover the retained topology.
         # Thus a three-unit bank scanning as [1, 2] keeps aggregate reg 21, while
@@ -630,8 +890,10 @@ class BatteryModbusTransport:
         # its silence blocks the gate like any other. Explicit unit_ids have no
         # such window because the declared list seeds memory before the first
         # read. Closing it would need a declared expected count, which is the
-        # configuration auto-scan exists to avoid.
+        # configuration auto-scan exists to avoid. A topology cache from an
+        # earlier run seeds memory like explicit unit_ids and so avoids it.
         remembered_unit_ids = self._remembered_unit_ids()
+        self._sync_topology_cache()
         required_slave_ids = (
             remembered_unit_ids - {master_uid} if master_uid is not None else remembered_unit_ids
         )
@@ -724,15 +986,27 @@ class BatteryModbusTransport:
             return {}, None
 
         unit_read_clean = True
+        now = time.monotonic()
         for block in protocol.register_blocks:
             if block.start >= _INITIAL_BLOCK_COUNT:
+                key = (unit_id, block.start)
+                cached = self._static_blocks.get(key) if block.static else None
+                if cached is not None and now - cached[0] < self._static_block_interval:
+                    for i, v in enumerate(cached[1]):
+                        raw[block.start + i] = v
+                    continue
                 extra = await self._read_registers(block.start, block.count, unit_id)
                 if extra is not None:
                     for i, v in enumerate(extra):
                         raw[block.start + i] = v
+                    if block.static and self._static_block_interval:
+                        self._static_blocks[key] = (now, extra)
                 else:
                     unit_read_clean = False
-                await asyncio.sleep(_INTER_READ_DELAY)
+                    # A failed static block stays due rather than serving an
+                    # older copy past its interval.
+                    self._static_blocks.pop(key, None)
+                await self._pause(_INTER_READ_DELAY)
 
         battery_index = unit_id - 1
         data = protocol.decode(raw, battery_index=battery_index)
@@ -0,0 +1,236 @@
+"""Arbitration for transports sharing one RS485 bus.
+
+Installers often wire the battery daisy chain and the inverter onto one
+USB-to-RS485 adapter or one network serial bridge.  ``ModbusSerialTransport``
+and ``BatteryModbusTransport`` each serialize only their own requests, so
+on a shared bus their frames interleave and collide.
+
+:class:`RS485BusArbiter` is handed to every transport on the bus.  Each
+request/response transaction takes the bus through it: one queue for the
+whole bus, served by client priority (inverter before battery) and then in
+arrival order, with the Modbus RTU inter-frame silence enforced between
+transactions.  Time spent queued never counts against a transaction's
+timeout; the arbiter's own ``transaction_timeout`` is measured from the
+moment the bus is granted.
+
+Example:
+    bus = RS485BusArbiter(baudrate=19200)
+    inverter = ModbusSerialTransport(
+        port="socket://10.0.0.5:502", serial="CE12345678", bus=bus
+    )
+    batteries = BatteryModbusTransport(host="10.0.0.5", bus=bus)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, replace
+
+_LOGGER = logging.getLogger(__name__)
+
+# Lower values are served first.  Inverter polling feeds the control loop;
+# battery reads are informational and can wait for a gap.
+BUS_PRIORITY_INVERTER = 0
+BUS_PRIORITY_BATTERY = 10
+
+# Modbus over Serial Line v1.02, 2.5.1.1: 3.5 character times of silence
+# between frames (11 bits per RTU character), fixed at 1.75 ms above 19200 baud.
+_RTU_CHAR_BITS = 11
+_RTU_FIXED_GAP_BAUDRATE = 19200
+_RTU_FIXED_GAP = 0.00175
+
+
+def rtu_inter_frame_gap(baudrate: int) -> float:
+    """Return the Modbus RTU inter-frame silence for ``baudrate`` in seconds.
+
+    Args:
+        baudrate: Serial line speed in bits per second.
+
+    Raises:
+        ValueError: If ``baudrate`` is not positive.
+    """
+    if baudrate <= 0:
+        raise ValueError(f"baudrate must be positive, got {baudrate}")
+    if baudrate > _RTU_FIXED_GAP_BAUDRATE:
+        return _RTU_FIXED_GAP
+    return 3.5 * _RTU_CHAR_BITS / baudrate
+
+
+@dataclass(slots=True)
+class BusClientStats:
+    """Bus usage for one client of an :class:`RS485BusArbiter`.
+
+    Attributes:
+        transactions: Completed transactions (successful or not).
+        timeouts: Transactions cut off by the bus transaction timeout.
+        total_wait: Seconds spent queued for the bus, summed.
+        total_hold: Seconds holding the bus, summed.
+        max_hold: Longest single transaction in seconds.
+    """
+
+    transactions: int = 0
+    timeouts: int = 0
+    total_wait: float = 0.0
+    total_hold: float = 0.0
+    max_hold: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        """Mean seconds queued for the bus per transaction."""
+        return self.total_wait / self.transactions if self.transactions else 0.0
+
+    @property
+    def mean_hold(self) -> float:
+        """Mean seconds holding the bus per transaction."""
+        return self.total_hold / self.transactions if self.transactions else 0.0
+
+
+class RS485BusArbiter:
+    """Grants one RS485 bus to one transaction at a time.
+
+    Waiters are served by priority, then first come first served.  A
+    transport has at most one request in flight, so strict priority cannot
+    starve a lower-priority client: between two inverter reads the bus goes
+    to whoever is already queued.
+    """
+
+    def __init__(
+        self,
+        *,
+        baudrate: int = 19200,
+        inter_frame_gap: float | None = None,
+        transaction_timeout: float | None = None,
+        name: str = "",
+    ) -> None:
+        """Initialize an idle bus.
+
+        Args:
+            baudrate: Serial line speed, used to derive the inter-frame gap
+                (default 19200).
+            inter_frame_gap: Silence between transactions in seconds, overriding
+                the RTU gap derived from ``baudrate``.  Network bridges that
+                re-time frames themselves can use 0.
+            transaction_timeout: Maximum seconds one transaction may hold the
+                bus, measured from the grant, or None to rely on the clients'
+                own timeouts.
+            name: Bus description for log messages (e.g. the adapter path).
+        """
+        if inter_frame_gap is None:
+            inter_frame_gap = rtu_inter_frame_gap(baudrate)
+        elif inter_frame_gap < 0:
+            raise ValueError(f"inter_frame_gap must be >= 0, got {inter_frame_gap}")
+        if transaction_timeout is not None and transaction_timeout <= 0:
+            raise ValueError(f"transaction_timeout must be positive, got {transaction_timeout}")
+        self._inter_frame_gap = inter_frame_gap
+        self._transaction_timeout = transaction_timeout
+        self._name = name
+        self._busy = False
+        self._idle_since = 0.0
+        # (priority, arrival, future) min-heap of waiting transactions
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._arrivals = itertools.count()
+        self._stats: dict[str, BusClientStats] = {}
+
+    @property
+    def inter_frame_gap(self) -> float:
+        """Silence enforced between transactions in seconds."""
+        return self._inter_frame_gap
+
+    @property
+    def transaction_timeout(self) -> float | None:
+        """Maximum seconds one transaction may hold the bus."""
+        return self._transaction_timeout
+
+    @property
+    def name(self) -> str:
+        """Bus description for log messages."""
+        return self._name
+
+    @contextlib.asynccontextmanager
+    async def transaction(
+        self,
+        client: str,
+        priority: int = BUS_PRIORITY_INVERTER,
+    ) -> AsyncIterator[None]:
+        """Hold the bus for one request/response transaction.
+
+        Args:
+            client: Name the transaction is accounted under (e.g. a serial).
+            priority: Queue priority; lower is served first.
+
+        Raises:
+            TimeoutError: If the transaction outlives ``transaction_timeout``.
+        """
+        queued_at = time.monotonic()
+        await self._acquire(priority)
+        try:
+            gap_left = self._idle_since + self._inter_frame_gap - time.monotonic()
+            if gap_left > 0:
+                await asyncio.sleep(gap_left)
+            started_at = time.monotonic()
+            timed_out = False
+            try:
+                async with asyncio.timeout(self._transaction_timeout):
+                    yield
+            except TimeoutError:
+                timed_out = True
+                _LOGGER.debug(
+                    "RS485 bus %s: transaction for %s exceeded %.2fs",
+                    self._name,
+                    client,
+                    self._transaction_timeout,
+                )
+                raise
+            finally:
+                hold = time.monotonic() - started_at
+                stats = self._stats.setdefault(client, BusClientStats())
+                stats.transactions += 1
+                stats.timeouts += timed_out
+                stats.total_wait += started_at - queued_at
+                stats.total_hold += hold
+                stats.max_hold = max(stats.max_hold, hold)
+        finally:
+            self._idle_since = time.monotonic()
+            self._release()
+
+    async def _acquire(self, priority: int) -> None:
+        """Wait until the bus is granted to the caller."""
+        if not self._busy and not self._waiters:
+            self._busy = True
+            return
+        turn: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._arrivals), turn)
+        heapq.heappush(self._waiters, entry)
+        try:
+            await turn
+        except asyncio.CancelledError:
+            if turn.done() and not turn.cancelled():
+                # Granted just as we were cancelled: pass the bus on
+                self._release()
+            else:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            raise
+
+    def _release(self) -> None:
+        """Grant the bus to the next waiter, or mark it idle."""
+        while self._waiters:
+            _priority, _arrival, turn = heapq.heappop(self._waiters)
+            if not turn.done():
+                turn.set_result(None)
+                return
+        self._busy = False
+
+    def client_stats(self) -> dict[str, BusClientStats]:
+        """Return a snapshot of per-client bus usage.
+
+        Returns:
+            Dict mapping client name to a copy of its :class:`BusClientStats`.
+        """
+        return {client: replace(stats) for client, stats in self._stats.items()}
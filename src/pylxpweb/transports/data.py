@@ -21,28 +21,38 @@ from __future__ import annotations
 
 import logging
 import warnings
+from collections.abc import Mapping
 from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+from pylxpweb.registers.battery import (
+    BATTERY_BASE_ADDRESS,
+    BATTERY_MAX_COUNT,
+    BATTERY_REGISTER_COUNT,
+)
+from pylxpweb.registers.battery import (
+    BY_NAME as BAT_BY_NAME,
+)
 from pylxpweb.transports._canonical_reader import (
     clamp_percentage as _clamp_percentage,
 )
 from pylxpweb.transports._canonical_reader import (
+    read_battery_firmware,
+    read_battery_serial,
     read_raw,
-    read_scaled,
-    unpack_parallel_config,
 )
 from pylxpweb.transports._canonical_reader import (
     sum_optional as _sum_optional,
 )
-from pylxpweb.transports._field_mappings import (
-    BATTERY_FIELD,
-    ENERGY_CATEGORIES,
-    ENERGY_FIELD,
-    GRIDBOSS_FIELD,
-    RUNTIME_CATEGORIES,
-    RUNTIME_FIELD,
+from pylxpweb.transports._decode_plan import (
+    RUNTIME_INT_FIELDS,
+    battery_bank_plan,
+    battery_module_plan,
+    decode_into,
+    energy_plan,
+    gridboss_plan,
+    runtime_plan,
 )
 from pylxpweb.validation import MAX_LIFETIME_KWH
 
@@ -70,31 +80,8 @@ _MAX_LIFETIME_ENERGY_KWH = MAX_LIFETIME_KWH
 BATTERY_TEMPERATURE_SENTINEL_C = 127.0
 
 # Fields on InverterRuntimeData that store raw int values (no ÷10/÷100 scaling).
-# Used by from_modbus_registers() to decide between read_raw() and read_scaled().
-_RUNTIME_INT_FIELDS: frozenset[str] = frozenset(
-    {
-        "device_status",
-        "eps_apparent_power",
-        "bms_cycle_count",
-        "battery_parallel_num",
-        "inverter_on_time",
-        "ac_input_type",
-        # EPS per-leg power (regs 129-132)
-        "eps_l1_power",
-        "eps_l2_power",
-        "eps_l1_apparent_power",
-        "eps_l2_apparent_power",
-        # Split-phase per-leg grid power (regs 197-204)
-        "inverter_power_l1",
-        "inverter_power_l2",
-        "rectifier_power_l1",
-        "rectifier_power_l2",
-        "grid_export_power_l1",
-        "grid_export_power_l2",
-        "grid_import_power_l1",
-        "grid_import_power_l2",
-    }
-)
+# Used by the runtime decode plan to decide between raw and scaled decoding.
+_RUNTIME_INT_FIELDS: frozenset[str] = RUNTIME_INT_FIELDS
 
 
 def _merge_status_code(inverter_code: int | None, bms_code: int | None) -> int | None:
@@ -567,7 +554,7 @@ class InverterRuntimeData:
     @classmethod
     def from_modbus_registers(
         cls,
-        input_registers: dict[int, int],
+        input_registers: Mapping[int, int],
         model_family: str = "EG4_HYBRID",
         *,
         split_phase: bool = False,
@@ -580,7 +567,7 @@ class InverterRuntimeData:
         which registers are included (e.g. ``"EG4_HYBRID"`` vs ``"LXP"``).
 
         Args:
-            input_registers: Dict mapping register address to raw value
+            input_registers: Mapping of register address to raw value
             model_family: Inverter family string (``"EG4_HYBRID"``,
                 ``"EG4_OFFGRID"``, or ``"LXP"``).
             split_phase: If True, compute combined power from per-leg values
@@ -596,74 +583,45 @@ class InverterRuntimeData:
             Transport-agnostic runtime data with scaling applied
         """
         from pylxpweb.constants.registers import decode_bms_permissions
-        from pylxpweb.registers.inverter_input import (
-            BY_NAME,
-            PV4_6_EXTENDED_NAMES,
-            registers_for_model,
-        )
-
-        # Get registers applicable to this model, filtered to runtime categories
-        model_regs = registers_for_model(model_family)
-        runtime_regs = [r for r in model_regs if r.category.value in RUNTIME_CATEGORIES]
-
-        # Build kwargs dict from canonical definitions
-        kwargs: dict[str, Any] = {}
-        # Track special values for post-processing
-        inverter_fault_code: int | None = None
-        bms_fault_code: int | None = None
-        inverter_warning_code: int | None = None
-        bms_warning_code: int | None = None
-
-        for reg in runtime_regs:
-            # V23-extended pv4-6: only parse when the MODEL exposes that string
-            # index.  A 3-string model (pv_string_count=3) leaves pv4-6 None
-            # even if regs 217-222 are present in the raw snapshot.
-            if reg.canonical_name in PV4_6_EXTENDED_NAMES:
-                # Runtime regs here are pv4_voltage/pv4_power/... -> index at [2]
-                pv_index = int(reg.canonical_name[2])
-                if pv_index > pv_string_count:
-                    continue
-
-            field_name = RUNTIME_FIELD.get(reg.canonical_name)
-            if field_name is None:
-                # Special handling: packed registers, fault/warning codes
-                if reg.canonical_name == "soc_soh_packed":
-                    raw = read_raw(input_registers, reg)
-                    if raw is not None:
-                        soc = raw & 0xFF
-                        soh = (raw >> 8) & 0xFF
-                        if soh == 0:
-                            soh = 100  # Default to 100% if not reported
-                        kwargs["battery_soc"] = soc
-                        kwargs["battery_soh"] = soh
-                elif reg.canonical_name == "parallel_config":
-                    ms, phase, number = unpack_parallel_config(input_registers, reg)
-                    kwargs["parallel_master_slave"] = ms
-                    kwargs["parallel_phase"] = phase
-                    kwargs["parallel_number"] = number
-                elif reg.canonical_name == "fault_code":
-                    inverter_fault_code = read_raw(input_registers, reg)
-                elif reg.canonical_name == "bms_fault_code":
-                    bms_fault_code = read_raw(input_registers, reg)
-                elif reg.canonical_name == "warning_code":
-                    inverter_warning_code = read_raw(input_registers, reg)
-                elif reg.canonical_name == "bms_warning_code":
-                    bms_warning_code = read_raw(input_registers, reg)
-                elif reg.canonical_name == "battery_status_inv":
-                    # Reg 95 is a BMS permission/request bitmap (issue #232),
-                    # NOT just the idle/standby/active enum.
-                    raw = read_raw(input_registers, reg)
-                    if raw is not None:
-                        allow_charge, allow_discharge, force_charge = decode_bms_permissions(raw)
-                        kwargs["bms_allow_charge"] = allow_charge
-                        kwargs["bms_allow_discharge"] = allow_discharge
-                        kwargs["bms_force_charge"] = force_charge
-                continue
 
-            if field_name in _RUNTIME_INT_FIELDS:
-                kwargs[field_name] = read_raw(input_registers, reg)
+        # Registers applicable to this model and PV string count, compiled
+        # once per (family, string count); see ``_decode_plan``.
+        plan = runtime_plan(model_family, pv_string_count)
+        kwargs: dict[str, Any] = decode_into(plan.ops, input_registers, {})
+        # Special values, by canonical name, for post-processing
+        special = decode_into(plan.specials, input_registers, {})
+
+        # Packed SOC (low byte) / SOH (high byte)
+        raw = special.get("soc_soh_packed")
+        if raw is not None:
+            soc = raw & 0xFF
+            soh = (raw >> 8) & 0xFF
+            if soh == 0:
+                soh = 100  # Default to 100% if not reported
+            kwargs["battery_soc"] = soc
+            kwargs["battery_soh"] = soh
+        if "parallel_config" in special:
+            raw = special["parallel_config"]
+            if raw is None:
+                kwargs["parallel_master_slave"] = None
+                kwargs["parallel_phase"] = None
+                kwargs["parallel_number"] = None
             else:
-                kwargs[field_name] = read_scaled(input_registers, reg)
+                kwargs["parallel_master_slave"] = raw & 0x03
+                kwargs["parallel_phase"] = (raw >> 2) & 0x03
+                kwargs["parallel_number"] = (raw >> 8) & 0xFF
+        # Reg 95 is a BMS permission/request bitmap (issue #232),
+        # NOT just the idle/standby/active enum.
+        raw = special.get("battery_status_inv")
+        if raw is not None:
+            allow_charge, allow_discharge, force_charge = decode_bms_permissions(raw)
+            kwargs["bms_allow_charge"] = allow_charge
+            kwargs["bms_allow_discharge"] = allow_discharge
+            kwargs["bms_force_charge"] = force_charge
+        inverter_fault_code: int | None = special.get("fault_code")
+        bms_fault_code: int | None = special.get("bms_fault_code")
+        inverter_warning_code: int | None = special.get("warning_code")
+        bms_warning_code: int | None = special.get("bms_warning_code")
 
         # Combine fault/warning codes (inverter + BMS).  Prefer an active
         # (non-zero) code; preserve a known-healthy 0 when only the BMS read
@@ -697,9 +655,8 @@ class InverterRuntimeData:
 
         # load_power comes from power_to_user (reg 27), power_from_grid also
         # maps to the same register in the legacy code
-        load_power_reg = BY_NAME.get("power_to_user")
-        if load_power_reg is not None:
-            load_val = read_scaled(input_registers, load_power_reg)
+        if "power_to_user" in special:
+            load_val = special["power_to_user"]
             kwargs.setdefault("load_power", load_val)
             kwargs.setdefault("power_from_grid", load_val)
 
@@ -900,7 +857,7 @@ class InverterEnergyData:
     @classmethod
     def from_modbus_registers(
         cls,
-        input_registers: dict[int, int],
+        input_registers: Mapping[int, int],
         model_family: str = "EG4_HYBRID",
         *,
         pv_string_count: int = 3,
@@ -910,7 +867,7 @@ class InverterEnergyData:
         Uses canonical register definitions from ``registers/inverter_input.py``.
 
         Args:
-            input_registers: Dict mapping register address to raw value
+            input_registers: Mapping of register address to raw value
             model_family: Inverter family string for model filtering.
             pv_string_count: Number of PV (MPPT) strings the inverter MODEL
                 exposes (0..n).  The V23-extended pv4-6 energy registers
@@ -923,29 +880,10 @@ class InverterEnergyData:
         Returns:
             Transport-agnostic energy data with scaling applied
         """
-        from pylxpweb.registers.inverter_input import (
-            PV4_6_EXTENDED_NAMES,
-            registers_for_model,
-        )
-
-        model_regs = registers_for_model(model_family)
-        energy_regs = [r for r in model_regs if r.category.value in ENERGY_CATEGORIES]
-
-        kwargs: dict[str, float | None] = {}
-        for reg in energy_regs:
-            # V23-extended pv4-6 energy: only parse when the MODEL exposes that
-            # string index.  A 3-string model (pv_string_count=3) leaves pv4-6
-            # None even if regs 223-231 are present in the raw snapshot.  The
-            # energy canonical names are ``epvN_day``/``epvN_all`` (digit at [3]).
-            if reg.canonical_name in PV4_6_EXTENDED_NAMES:
-                pv_index = int(reg.canonical_name[3])
-                if pv_index > pv_string_count:
-                    continue
-
-            field_name = ENERGY_FIELD.get(reg.canonical_name)
-            if field_name is None:
-                continue
-            kwargs[field_name] = read_scaled(input_registers, reg)
+        # V23-extended pv4-6 energy registers are only in the plan when the
+        # MODEL exposes that string index (mirrors the runtime parse).
+        plan = energy_plan(model_family, pv_string_count)
+        kwargs: dict[str, float | None] = decode_into(plan.ops, input_registers, {})
 
         # Compute PV totals from per-string values.  Sum is count-agnostic: a
         # 3-string inverter has pv4-6=None (excluded by _sum_optional), so its
@@ -1210,7 +1148,7 @@ class BatteryData:
     def from_modbus_registers(
         cls,
         battery_index: int,
-        registers: dict[int, int],
+        registers: Mapping[int, int],
     ) -> BatteryData | None:
         """Create BatteryData from Modbus registers for a single battery.
 
@@ -1221,24 +1159,11 @@ class BatteryData:
 
         Args:
             battery_index: 0-based battery index
-            registers: Dict mapping register address to raw value
+            registers: Mapping of register address to raw value
 
         Returns:
             BatteryData with all values properly scaled, or None if battery not present
         """
-        from pylxpweb.registers.battery import (
-            BATTERY_BASE_ADDRESS,
-            BATTERY_REGISTER_COUNT,
-            BATTERY_REGISTERS,
-        )
-        from pylxpweb.registers.battery import (
-            BY_NAME as BAT_BY_NAME,
-        )
-        from pylxpweb.transports._canonical_reader import (
-            read_battery_firmware,
-            read_battery_serial,
-        )
-
         base = BATTERY_BASE_ADDRESS + (battery_index * BATTERY_REGISTER_COUNT)
 
         # Check if battery is present via status header (offset 0)
@@ -1247,56 +1172,13 @@ class BatteryData:
         if not status_raw:
             return None  # Battery slot is empty
 
-        # Build kwargs from canonical definitions using BATTERY_FIELD mapping
-        kwargs: dict[str, float | int] = {}
-        soc: int = 0
-        soh: int = 100
-
-        for reg in BATTERY_REGISTERS:
-            cname = reg.canonical_name
-
-            # Handle packed SOC/SOH
-            if cname == "battery_soc":
-                raw = read_raw(registers, reg, base_address=base)
-                soc = raw if raw is not None else 0
-                continue
-            if cname == "battery_soh":
-                raw = read_raw(registers, reg, base_address=base)
-                soh = raw if raw is not None else 0
-                continue
-
-            # Handle packed cell number registers
-            if cname in (
-                "battery_max_cell_num_voltage",
-                "battery_min_cell_num_voltage",
-                "battery_max_cell_num_temp",
-                "battery_min_cell_num_temp",
-            ):
-                field_name = BATTERY_FIELD.get(cname)
-                if field_name is not None:
-                    raw = read_raw(registers, reg, base_address=base)
-                    kwargs[field_name] = raw if raw is not None else 0
-                continue
-
-            # Handle firmware and serial (special multi-register reads)
-            if cname == "battery_firmware_version":
-                continue  # handled below
-            if cname == "battery_serial_number":
-                continue  # handled below
-            if cname == "battery_status_header":
-                continue  # already checked
-
-            field_name = BATTERY_FIELD.get(cname)
-            if field_name is None:
-                continue
-
-            # Cycle count is an int field (no scaling)
-            if cname == "battery_cycle_count":
-                raw = read_raw(registers, reg, base_address=base)
-                kwargs[field_name] = raw if raw is not None else 0
-            else:
-                val = read_scaled(registers, reg, base_address=base)
-                kwargs[field_name] = val if val is not None else 0.0
+        # Build kwargs from the compiled module plan; an absent register
+        # reads as 0 (BatteryData has no nullable cell fields).
+        kwargs: dict[str, float | int] = decode_into(
+            battery_module_plan().ops, registers, {}, base=base, missing=0
+        )
+        soc: int = int(kwargs.pop("soc", 0))
+        soh: int = int(kwargs.pop("soh", 100))
 
         # Firmware version (packed: high byte = major, low byte = minor)
         fw_reg = BAT_BY_NAME["battery_firmware_version"]
@@ -1601,8 +1483,8 @@ class BatteryBankData:
     @classmethod
     def from_modbus_registers(
         cls,
-        input_registers: dict[int, int],
-        individual_battery_registers: dict[int, int] | None = None,
+        input_registers: Mapping[int, int],
+        individual_battery_registers: Mapping[int, int] | None = None,
     ) -> BatteryBankData | None:
         """Create from Modbus input register values.
 
@@ -1612,7 +1494,7 @@ class BatteryBankData:
         5000+ range.
 
         Args:
-            input_registers: Dict mapping register address to raw value (0-127)
+            input_registers: Mapping of register address to raw value (0-127)
             individual_battery_registers: Optional dict with extended register
                 range (5000+) containing individual battery data. If provided,
                 individual batteries will be populated in the batteries list.
@@ -1621,53 +1503,25 @@ class BatteryBankData:
             BatteryBankData with all values properly scaled, or None if no battery
         """
         from pylxpweb.constants.registers import decode_bms_permissions
-        from pylxpweb.registers.battery import (
-            BATTERY_BASE_ADDRESS,
-            BATTERY_MAX_COUNT,
-            BATTERY_REGISTER_COUNT,
-        )
-        from pylxpweb.registers.inverter_input import BY_NAME
 
-        # Battery voltage from canonical register def
-        bat_volt_reg = BY_NAME["battery_voltage"]
-        battery_voltage = read_scaled(input_registers, bat_volt_reg)
+        regs = decode_into(battery_bank_plan().ops, input_registers, {})
 
         # If voltage is too low or None, assume no battery present
+        battery_voltage: float | None = regs["battery_voltage"]
         if battery_voltage is None or battery_voltage < 1.0:
             return None
 
         # SOC/SOH from packed register (low byte = SOC, high byte = SOH)
-        soc_soh_reg = BY_NAME["soc_soh_packed"]
-        soc_soh_raw = read_raw(input_registers, soc_soh_reg)
+        soc_soh_raw: int | None = regs["soc_soh_packed"]
         battery_soc: int | None = None
         battery_soh: int | None = None
         if soc_soh_raw is not None:
             battery_soc = soc_soh_raw & 0xFF
             battery_soh = (soc_soh_raw >> 8) & 0xFF
 
-        # Charge/discharge power
-        charge_power = read_scaled(input_registers, BY_NAME["charge_power"])
-        discharge_power = read_scaled(input_registers, BY_NAME["discharge_power"])
-
-        # Battery current
-        battery_current = read_scaled(input_registers, BY_NAME["battery_current_bms"])
-
-        # Battery temperature
-        battery_temp = read_scaled(input_registers, BY_NAME["battery_temperature"])
-
-        # BMS data
-        bms_fault_code = read_raw(input_registers, BY_NAME["bms_fault_code"])
-        bms_warning_code = read_raw(input_registers, BY_NAME["bms_warning_code"])
-        battery_count = read_raw(input_registers, BY_NAME["battery_parallel_count"])
-
-        # BMS settings (regs 80-84)
-        bms_battery_type = read_raw(input_registers, BY_NAME["bms_battery_type"])
-        bms_charge_current_limit = read_scaled(input_registers, BY_NAME["bms_charge_current_limit"])
-        bms_discharge_current_limit = read_scaled(
-            input_registers, BY_NAME["bms_discharge_current_limit"]
-        )
-        bms_charge_voltage_ref = read_scaled(input_registers, BY_NAME["bms_charge_voltage_ref"])
-        bms_discharge_cutoff = read_scaled(input_registers, BY_NAME["bms_discharge_cutoff"])
+        charge_power: float | None = regs["charge_power"]
+        discharge_power: float | None = regs["discharge_power"]
+        battery_count: int | None = regs["battery_parallel_count"]
 
         # Derive battery status from charge/discharge power
         battery_status: str | None = None
@@ -1678,20 +1532,13 @@ class BatteryBankData:
         elif charge_power is not None or discharge_power is not None:
             battery_status = "Idle"
 
-        # Cell data
-        max_cell_voltage = read_scaled(input_registers, BY_NAME["bms_max_cell_voltage"])
-        min_cell_voltage = read_scaled(input_registers, BY_NAME["bms_min_cell_voltage"])
-        max_cell_temp = read_scaled(input_registers, BY_NAME["bms_max_cell_temperature"])
-        min_cell_temp = read_scaled(input_registers, BY_NAME["bms_min_cell_temperature"])
-        cycle_count = read_raw(input_registers, BY_NAME["bms_cycle_count"])
-        bat_volt_inv_sample = read_scaled(input_registers, BY_NAME["battery_voltage_inv_sample"])
-        max_capacity = read_scaled(input_registers, BY_NAME["battery_capacity_ah"])
+        max_capacity: float | None = regs["battery_capacity_ah"]
 
         # BMS permission/request flags (reg 95 bitmap, issue #232)
         allow_charge: bool | None = None
         allow_discharge: bool | None = None
         force_charge: bool | None = None
-        battery_status_inv_raw = read_raw(input_registers, BY_NAME["battery_status_inv"])
+        battery_status_inv_raw = regs["battery_status_inv"]
         if battery_status_inv_raw is not None:
             allow_charge, allow_discharge, force_charge = decode_bms_permissions(
                 battery_status_inv_raw
@@ -1711,12 +1558,13 @@ class BatteryBankData:
         # to None and are skipped.
         batteries: list[BatteryData] = []
         if individual_battery_registers:
-            max_slot = -1
-            for addr in individual_battery_registers:
-                if addr < BATTERY_BASE_ADDRESS:
-                    continue
-                slot = (addr - BATTERY_BASE_ADDRESS) // BATTERY_REGISTER_COUNT
-                max_slot = max(max_slot, slot)
+            # The highest populated address lies in the highest slot
+            max_addr = max(individual_battery_registers)
+            max_slot = (
+                (max_addr - BATTERY_BASE_ADDRESS) // BATTERY_REGISTER_COUNT
+                if max_addr >= BATTERY_BASE_ADDRESS
+                else -1
+            )
             count_to_use = max_slot + 1 if max_slot >= 0 else BATTERY_MAX_COUNT
             for idx in range(count_to_use):
                 battery_data = BatteryData.from_modbus_registers(
@@ -1740,29 +1588,29 @@ class BatteryBankData:
         return cls(
             timestamp=datetime.now(),
             voltage=battery_voltage,
-            current=battery_current,
+            current=regs["battery_current_bms"],
             soc=battery_soc,
             soh=actual_soh,
-            temperature=battery_temp,
+            temperature=regs["battery_temperature"],
             charge_power=charge_power,
             discharge_power=discharge_power,
             max_capacity=max_capacity,
             current_capacity=current_capacity,
             status=battery_status,
-            fault_code=bms_fault_code,
-            warning_code=bms_warning_code,
+            fault_code=regs["bms_fault_code"],
+            warning_code=regs["bms_warning_code"],
             battery_count=actual_battery_count,
-            bms_battery_type=bms_battery_type,
-            bms_charge_current_limit=bms_charge_current_limit,
-            bms_discharge_current_limit=bms_discharge_current_limit,
-            bms_charge_voltage_ref=bms_charge_voltage_ref,
-            bms_discharge_cutoff=bms_discharge_cutoff,
-            max_cell_voltage=max_cell_voltage,
-            min_cell_voltage=min_cell_voltage,
-            max_cell_temperature=max_cell_temp,
-            min_cell_temperature=min_cell_temp,
-            cycle_count=cycle_count,
-            battery_voltage_inv_sample=bat_volt_inv_sample,
+            bms_battery_type=regs["bms_battery_type"],
+            bms_charge_current_limit=regs["bms_charge_current_limit"],
+            bms_discharge_current_limit=regs["bms_discharge_current_limit"],
+            bms_charge_voltage_ref=regs["bms_charge_voltage_ref"],
+            bms_discharge_cutoff=regs["bms_discharge_cutoff"],
+            max_cell_voltage=regs["bms_max_cell_voltage"],
+            min_cell_voltage=regs["bms_min_cell_voltage"],
+            max_cell_temperature=regs["bms_max_cell_temperature"],
+            min_cell_temperature=regs["bms_min_cell_temperature"],
+            cycle_count=regs["bms_cycle_count"],
+            battery_voltage_inv_sample=regs["battery_voltage_inv_sample"],
             allow_charge=allow_charge,
             allow_discharge=allow_discharge,
             force_charge=force_charge,
@@ -2223,7 +2071,7 @@ class MidboxRuntimeData:
     @classmethod
     def from_modbus_registers(
         cls,
-        input_registers: dict[int, int],
+        input_registers: Mapping[int, int],
         *,
         smart_port_mode_reg: int | None = None,
     ) -> MidboxRuntimeData:
@@ -2233,7 +2081,7 @@ class MidboxRuntimeData:
         GridBOSS only has one register layout so no model filtering is needed.
 
         Args:
-            input_registers: Dict mapping register address to raw value
+            input_registers: Mapping of register address to raw value
             smart_port_mode_reg: Raw value of holding register 20, which
                 contains all 4 smart port modes bit-packed (2 bits each,
                 LSB-first). ``None`` if the read failed.
@@ -2241,16 +2089,7 @@ class MidboxRuntimeData:
         Returns:
             Transport-agnostic runtime data with scaling applied
         """
-        from pylxpweb.registers.gridboss import GRIDBOSS_REGISTERS
-
-        kwargs: dict[str, Any] = {}
-
-        for reg in GRIDBOSS_REGISTERS:
-            field_name = GRIDBOSS_FIELD.get(reg.canonical_name)
-            if field_name is None:
-                continue
-
-            kwargs[field_name] = read_scaled(input_registers, reg)
+        kwargs: dict[str, Any] = decode_into(gridboss_plan().ops, input_registers, {})
 
         # Decode smart port modes from holding register 20 (bit-packed).
         # Each port uses 2 bits: 0=off, 1=smart_load, 2=ac_couple.
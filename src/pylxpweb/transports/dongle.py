@@ -29,6 +29,7 @@ import asyncio
 import contextlib
 import logging
 import struct
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any, NoReturn
 
 from ._register_data import (
@@ -44,19 +45,42 @@ from .exceptions import (
     TransportTimeoutError,
     TransportWriteError,
 )
+from .frame_codec import (
+    MODBUS_READ_HOLDING,
+    MODBUS_READ_INPUT,
+    MODBUS_WRITE_MULTI,
+    MODBUS_WRITE_SINGLE,
+    PACKET_PREFIX,
+    PROTOCOL_VERSION,
+    DongleFrameCodec,
+    compute_crc16,
+    frame_crc,
+)
 from .observation import RegisterObserver
+from .passive_cache import PassiveRegisterCache
 from .protocol import BaseTransport
 
 if TYPE_CHECKING:
     from pylxpweb.devices.inverters._features import InverterFamily
 
     from .data import BatteryBankData, InverterEnergyData, InverterRuntimeData, MidboxRuntimeData
+    from .gap_map import GapSafetyMap
 
 _LOGGER = logging.getLogger(__name__)
 
+# Re-export the codec's protocol constants for backward compatibility
+__all__ = [
+    "MODBUS_READ_HOLDING",
+    "MODBUS_READ_INPUT",
+    "MODBUS_WRITE_MULTI",
+    "MODBUS_WRITE_SINGLE",
+    "PACKET_PREFIX",
+    "PROTOCOL_VERSION",
+    "DongleTransport",
+    "compute_crc16",
+]
+
 # Protocol constants
-PACKET_PREFIX = bytes([0xA1, 0x1A])  # Magic prefix for all packets
-PROTOCOL_VERSION = 1  # Protocol version (little-endian uint16)
 TCP_FUNC_HEARTBEAT = 0xC1  # Heartbeat/keepalive
 TCP_FUNC_TRANSLATED = 0xC2  # Translated Modbus data
 TCP_FUNC_READ_PARAM = 0xC3  # Read parameters
@@ -71,12 +95,6 @@ _TCP_FUNC_NAMES = {
     TCP_FUNC_WRITE_PARAM: "write_param",
 }
 
-# Modbus function codes (embedded in TCP_FUNC_TRANSLATED)
-MODBUS_READ_HOLDING = 0x03  # Read holding registers
-MODBUS_READ_INPUT = 0x04  # Read input registers
-MODBUS_WRITE_SINGLE = 0x06  # Write single holding register
-MODBUS_WRITE_MULTI = 0x10  # Write multiple holding registers
-
 # Default connection settings
 DEFAULT_PORT = 8000
 DEFAULT_TIMEOUT = 10.0
@@ -99,26 +117,6 @@ WRITE_RETRY_DELAY = 0.5  # base backoff between sequence attempts (s)
 VERIFY_MAX_REGISTERS = 3  # skip readback verification above this many registers
 
 
-def compute_crc16(data: bytes) -> int:
-    """Compute CRC-16/Modbus checksum.
-
-    Args:
-        data: Bytes to compute CRC for
-
-    Returns:
-        16-bit CRC value
-    """
-    crc = 0xFFFF
-    for byte in data:
-        crc ^= byte
-        for _ in range(8):
-            if crc & 1:
-                crc = (crc >> 1) ^ 0xA001
-            else:
-                crc >>= 1
-    return crc & 0xFFFF
-
-
 def _format_frame_fields(
     *,
     tcp_func: int | None = None,
@@ -157,6 +155,31 @@ class _DongleFrameError(TransportReadError):
     """A stream-framing failure that makes the current socket unusable."""
 
 
+# (tcp_func, base modbus_func, start register) of a request or response frame
+_RouteKey = tuple[int, int, int]
+
+# Offsets shared by request and response frames: the data frame starts at 20
+# with action(1) + modbus_func(1) + inverter serial(10) + start register(2)
+_ROUTE_FUNC_OFFSET = 21
+_ROUTE_SERIAL_SLICE = slice(22, 32)
+_ROUTE_REGISTER_OFFSET = 32
+_MIN_ROUTABLE_FRAME_SIZE = 34
+
+
+def _frame_route_key(frame: bytes) -> _RouteKey | None:
+    """Return the routing key of a complete frame, or None if too short.
+
+    Requests and responses share the leading data-frame layout, so a request
+    packet and its reply produce the same key.  Exception replies (function
+    high bit set) route by their base function so the waiting request sees
+    the Modbus exception.
+    """
+    if len(frame) < _MIN_ROUTABLE_FRAME_SIZE:
+        return None
+    register = struct.unpack_from("<H", frame, _ROUTE_REGISTER_OFFSET)[0]
+    return frame[7], frame[_ROUTE_FUNC_OFFSET] & 0x7F, register
+
+
 class DongleTransport(RegisterDataMixin, BaseTransport):
     """WiFi Dongle TCP transport for local inverter communication.
 
@@ -200,6 +223,9 @@ class DongleTransport(RegisterDataMixin, BaseTransport):
         verify_writes: bool = True,
         max_input_block_size: int = DEFAULT_INPUT_BLOCK_SIZE,
         register_observer: RegisterObserver | None = None,
+        passive_cache_max_age: float | None = None,
+        input_refresh_intervals: Mapping[str, float] | None = None,
+        gap_map: GapSafetyMap | None = None,
     ) -> None:
         """Initialize WiFi Dongle transport.
 
@@ -229,11 +255,25 @@ class DongleTransport(RegisterDataMixin, BaseTransport):
                 large reads automatically fall back to the plain grouped reads
                 (eg4_web_monitor#254).
             register_observer: Optional callback for terminal raw-register segments.
+            passive_cache_max_age: Enable passive mode: keep reading while
+                idle, harvest the register blocks the cloud polls through
+                the same dongle, and answer input-register reads seen within
+                this many seconds without a transaction.  None (default)
+                disables passive mode.
+            input_refresh_intervals: Optional minimum seconds between reads
+                per input register group (see
+                :func:`~pylxpweb.transports._register_data.validate_input_refresh_intervals`).
+            gap_map: Optional learned map of register gaps that are safe to
+                bridge, shared across transports (see
+                :class:`~pylxpweb.transports.gap_map.GapSafetyMap`).  With
+                coalescing enabled, input reads then bridge known-safe gaps
+                and probe unknown ones to use fewer transactions.
         """
         super().__init__(inverter_serial, register_observer=register_observer)
         self._host = host
         self._port = port
         self._dongle_serial = dongle_serial
+        self._codec = DongleFrameCodec(dongle_serial, inverter_serial)
         self._timeout = timeout
         self._inverter_family = inverter_family
         self._split_phase: bool = False
@@ -241,6 +281,8 @@ class DongleTransport(RegisterDataMixin, BaseTransport):
         self._connection_retries = connection_retries
         self._inter_register_delay = 0.5  # Dongle needs slower pace than Modbus
         self._init_input_coalescing(max_input_block_size)
+        self._init_input_refresh(input_refresh_intervals)
+        self._gap_map = gap_map
         self._write_retries = write_retries
         self._write_step_delay = write_step_delay
         self._verify_writes = verify_writes
@@ -257,6 +299,18 @@ class DongleTransport(RegisterDataMixin, BaseTransport):
         self._connect_lock = asyncio.Lock()
         self._transaction_id = 0
         self._shutdown_requested = False
+        # Frame demultiplexer: one reader task per connection assembles frames
+        # and hands each to the request waiting on its routing key, dropping
+        # heartbeats and cloud-bound traffic as they arrive.
+        self._frame_reader_task: asyncio.Task[None] | None = None
+        self._frame_waiters: dict[_RouteKey | None, asyncio.Future[bytes]] = {}
+        self._frame_demand = asyncio.Event()
+        self._last_unrouted_frame: bytes | None = None
+        self._passive_cache: PassiveRegisterCache | None = (
+            PassiveRegisterCache(passive_cache_max_age)
+            if passive_cache_max_age is not None
+            else None
+        )
 
     @property
     def capabilities(self) -> TransportCapabilities:
@@ -278,6 +332,11 @@ class DongleTransport(RegisterDataMixin, BaseTransport):
         """Get the dongle serial number."""
         return self._dongle_serial
 
+    @property
+    def passive_cache(self) -> PassiveRegisterCache | None:
+        """Registers harvested from cloud-polled frames (None unless passive)."""
+        return self._passive_cache
+
     @property
     def inverter_family(self) -> InverterFamily | None:
         """Get the inverter family for register mapping."""
@@ -436,6 +495,8 @@ class DongleTransport(RegisterDataMixin, BaseTransport):
                     self._raise_if_shutdown()
 
                     self._connected = True
+                    if self._passive_cache is not None:
+                        self._start_frame_reader()
                     _LOGGER.info(
                         "Dongle transport connected to %s:%s (dongle=%s, inverter=%s)%s",
                         self._host,
@@ -526,6 +587,7 @@ class DongleTransport(RegisterDataMixin, BaseTransport):
         self._shutdown_requested = True
         self._connected = False
         self._reader = None
+        self._stop_frame_reader()
         self._receive_buffer.clear()
         writer = self._writer
         self._writer = None
@@ -576,94 +638,172 @@ class DongleTransport(RegisterDataMixin, BaseTransport):
         Returns:
             Complete packet bytes
         """
-        # Encode serial numbers as bytes
-        dongle_bytes = self._dongle_serial.encode("ascii").ljust(10, b"\x00")[:10]
-        inverter_bytes = self._serial.encode("ascii").ljust(10, b"\x00")[:10]
-
-        # Build data frame (varies by operation)
         if modbus_func == MODBUS_WRITE_SINGLE:
-            # Write single: action(1) + func(1) + serial(10) + reg(2) + value(2)
-            # action=0x00 for request (client to inverter), 0x01 for response
-            value = values[0] if values else 0
-            data_frame = bytes([0x00, modbus_func]) + inverter_bytes
-            data_frame += struct.pack("<H", start_register)
-            data_frame += struct.pack("<H", value)
-        elif modbus_func == MODBUS_WRITE_MULTI:
-            # Write multi: action(1) + func(1) + serial(10) + reg(2) + count(2) + bytes(1) + data
-            # action=0x00 for request (client to inverter), 0x01 for response
-            data_count = len(values) if values else 0
-            byte_count = data_count * 2
-            data_frame = bytes([0x00, modbus_func]) + inverter_bytes
-            data_frame += struct.pack("<H", start_register)
-            data_frame += struct.pack("<H", data_count)
-            data_frame += bytes([byte_count])
-            for value in values or []:
-                data_frame += struct.pack("<H", value)
-        else:
-            # Read: action(1) + func(1) + serial(10) + reg(2) + count(2)
-            # action=0x00 for request (client to inverter), 0x01 for response
-            data_frame = bytes([0x00, modbus_func]) + inverter_bytes
-            data_frame += struct.pack("<H", start_register)
-            data_frame += struct.pack("<H", register_count)
-
-        # Calculate CRC of data frame
-        crc = compute_crc16(data_frame)
-
-        # Build complete packet
-        # data_length = data_frame bytes + CRC (2 bytes)
-        data_length = len(data_frame) + 2
-        # frame_length = bytes after the frame_length field itself
-        # = addr(1) + tcp_func(1) + dongle(10) + data_length(2) + data_frame + crc
-        # = 14 + data_length
-        frame_length = 14 + data_length
-
-        packet = PACKET_PREFIX
-        packet += struct.pack("<H", PROTOCOL_VERSION)
-        packet += struct.pack("<H", frame_length)
-        packet += bytes([0x01, tcp_func])
-        packet += dongle_bytes
-        packet += struct.pack("<H", data_length)
-        packet += data_frame
-        packet += struct.pack("<H", crc)
+            return self._codec.encode_write_single(
+                tcp_func, start_register, values[0] if values else 0
+            )
+        if modbus_func == MODBUS_WRITE_MULTI:
+            return self._codec.encode_write_multi(tcp_func, start_register, values or [])
+        return self._codec.encode_read(tcp_func, modbus_func, start_register, register_count)
 
-        return packet
+    def _expect_frame(self, packet: bytes) -> asyncio.Future[bytes]:
+        """Register a waiter for the reply to ``packet`` before it is sent.
 
-    async def _drain_buffer(self) -> None:
-        """Drain any pending data from the receive buffer.
+        Starts the connection's frame reader on first use.  Registering
+        before the write guarantees an immediate reply is never missed.  A
+        packet too short to carry a routing key waits for the next
+        non-heartbeat frame instead.
+        """
+        key = _frame_route_key(packet)
+        self._last_unrouted_frame = None
+        waiter: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+        self._frame_waiters[key] = waiter
+        self._update_frame_demand()
+        self._start_frame_reader()
+        return waiter
+
+    def _start_frame_reader(self) -> None:
+        """Start the connection's frame reader unless it is already running."""
+        self._update_frame_demand()
+        if self._frame_reader_task is None or self._frame_reader_task.done():
+            self._frame_reader_task = asyncio.create_task(
+                self._run_frame_reader(), name=f"pylxpweb-dongle-reader-{self._serial}"
+            )
 
-        The dongle may send unsolicited heartbeat packets or there may be
-        stale data from previous requests. This method clears the buffer
-        before sending a new request to ensure clean communication.
+    def _update_frame_demand(self) -> None:
+        """Let the reader pull bytes while a request waits, or always if passive."""
+        if self._frame_waiters or self._passive_cache is not None:
+            self._frame_demand.set()
+        else:
+            self._frame_demand.clear()
+
+    def _release_frame_waiter(self, packet: bytes, waiter: asyncio.Future[bytes]) -> None:
+        """Drop ``waiter`` once its request is answered, failed or abandoned."""
+        key = _frame_route_key(packet)
+        if self._frame_waiters.get(key) is waiter:
+            del self._frame_waiters[key]
+        self._update_frame_demand()
+
+    async def _run_frame_reader(self) -> None:
+        """Assemble frames and route each to the request waiting for it.
+
+        Reads only while a request is outstanding (always, in passive mode),
+        so frames the dongle sent while idle are judged against the next
+        request instead of being drained on a timer.  A framing or socket
+        error fails every waiting request and ends the task; the request
+        path tears the connection down and the next request starts a fresh
+        reader.  An error with no request waiting (passive mode) marks the
+        transport disconnected so the next request dials a new connection.
         """
-        # Any bytes retained after extracting a previous frame are stale at
-        # this request boundary (typically an unsolicited heartbeat or a
-        # coalesced late reply), just like bytes waiting in StreamReader.
-        self._receive_buffer.clear()
+        try:
+            while True:
+                await self._frame_demand.wait()
+                self._dispatch_frame(await self._receive_frame())
+                # A burst of buffered frames never starves the waiting requests
+                await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:  # noqa: BLE001 - handed to the waiting requests
+            if not self._frame_waiters:
+                _LOGGER.debug("[%s] Idle dongle connection lost: %s", self._serial, err)
+                self._connected = False
+            self._fail_frame_waiters(err)
+
+    def _dispatch_frame(self, frame: bytes) -> None:
+        """Hand ``frame`` to its waiting request, or drop it as unsolicited.
+
+        Heartbeats, replies meant for the cloud server (another serial) and
+        frames no request is waiting for are discarded without disturbing
+        the pending request, which keeps waiting for its own reply.
+        """
+        tcp_func = frame[7] if len(frame) > 7 else None
+        if tcp_func == TCP_FUNC_HEARTBEAT:
+            _LOGGER.debug("[%s] Ignoring dongle heartbeat", self._serial)
+            return
 
-        if not self._reader:
+        # Only frames carrying this inverter's serial are routable; replies
+        # for another serial are cloud-bound traffic for someone else
+        route_key = _frame_route_key(frame)
+        expected_serial = self._serial.encode("ascii").ljust(10, b"\x00")[:10]
+        if route_key is not None and frame[_ROUTE_SERIAL_SLICE] != expected_serial:
+            route_key = None
+        key = route_key
+        waiter = self._frame_waiters.get(key)
+        if waiter is None and key is not None:
+            # A request too short to route takes the next frame as-is
+            key = None
+            waiter = self._frame_waiters.get(key)
+        if waiter is None:
+            if self._frame_waiters:
+                # Kept so a request that times out can report the misrouted
+                # frame it saw instead of a bare timeout (#320)
+                self._last_unrouted_frame = frame
+            if route_key is not None and self._passive_cache is not None:
+                self._harvest_frame(frame, route_key)
+                return
+            _LOGGER.debug(
+                "[%s] Dropping unsolicited frame (%s): %s",
+                self._serial,
+                _TCP_FUNC_NAMES.get(tcp_func, "unknown") if tcp_func is not None else "short",
+                frame[:40].hex(),
+            )
             return
 
+        del self._frame_waiters[key]
+        self._update_frame_demand()
+        if not waiter.done():
+            waiter.set_result(frame)
+
+    def _harvest_frame(self, frame: bytes, key: _RouteKey) -> None:
+        """Store the registers of a read reply another client requested.
+
+        Only well-formed translated read replies for this inverter are kept;
+        write ACKs, exception replies and frames failing validation (CRC,
+        lengths) are ignored.
+        """
+        tcp_func, func, register = key
+        if tcp_func != TCP_FUNC_TRANSLATED or func not in (MODBUS_READ_HOLDING, MODBUS_READ_INPUT):
+            return
         try:
-            # Non-blocking read to drain any pending data
-            while True:
-                try:
-                    # Very short timeout - just check if data is available
-                    junk = await asyncio.wait_for(
-                        self._reader.read(512),
-                        timeout=0.05,  # 50ms - just check for immediate data
-                    )
-                    if not junk:
-                        break
-                    _LOGGER.debug(
-                        "Drained %d bytes of pending data: %s",
-                        len(junk),
-                        junk.hex()[:50],
-                    )
-                except TimeoutError:
-                    # No pending data - good!
-                    break
-        except Exception as err:
-            _LOGGER.debug("Error draining buffer: %s", err)
+            values = self._parse_response(
+                frame,
+                expected_func=func,
+                expected_register=register,
+                expected_tcp_func=TCP_FUNC_TRANSLATED,
+            )
+        except TransportReadError as err:
+            _LOGGER.debug("[%s] Not harvesting invalid frame: %s", self._serial, err)
+            return
+        if self._passive_cache is not None and values:
+            self._passive_cache.store(self._serial, func, register, values)
+            _LOGGER.debug(
+                "[%s] Harvested %d registers from 0x%02x read at %d",
+                self._serial,
+                len(values),
+                func,
+                register,
+            )
+
+    def _fail_frame_waiters(self, err: BaseException) -> None:
+        """Fail every waiting request with ``err``."""
+        waiters = list(self._frame_waiters.values())
+        self._frame_waiters.clear()
+        self._update_frame_demand()
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_exception(err)
+
+    def _stop_frame_reader(self) -> None:
+        """Cancel the connection's frame reader and fail its waiting requests.
+
+        Waiting requests see a ``ConnectionResetError`` so they follow the
+        normal socket-error path (teardown, shutdown check, reconnect).
+        """
+        task = self._frame_reader_task
+        self._frame_reader_task = None
+        if task is not None and not task.done():
+            task.cancel()
+        self._fail_frame_waiters(ConnectionResetError("Dongle connection closed"))
 
     async def _receive_frame(self) -> bytes:
         """Read one complete packet from the TCP byte stream.
@@ -672,10 +812,10 @@ class DongleTransport(RegisterDataMixin, BaseTransport):
         prefix, six-byte outer header, and body may all arrive separately.
         Locate the prefix with a bounded junk scan, validate the advertised
         packet size before reading its body, and retain any over-read bytes
-        for the next request-boundary drain.
+        as the start of the next frame.
 
-        The caller owns the single overall response timeout.  This helper
-        deliberately does not start a new timeout per fragment.
+        Called only from the frame reader task, which runs without a
+        timeout; each request bounds its own wait for the routed reply.
         """
         reader = self._reader
         if reader is None:
@@ -789,6 +929,7 @@ class DongleTransport(RegisterDataMixin, BaseTransport):
         """
         self._connected = False
         self._reader = None
+        self._stop_frame_reader()
         self._receive_buffer.clear()
         writer = self._writer
         self._writer = None
@@ -886,32 +1027,28 @@ class DongleTransport(RegisterDataMixin, BaseTransport):
                     if self._writer is None or self._reader is None:
                         raise TransportConnectionError("Socket not initialized")
 
-                    # Drain any pending data before sending (handles unsolicited packets)
-                    await self._drain_buffer()
-                    self._raise_if_shutdown()
-
-                    # Send packet
+                    # Send packet with its reply waiter already registered.
+                    # The frame reader routes the reply here by (tcp_func,
+                    # function, register) and drops heartbeats and
+                    # cloud-bound frames without disturbing this wait; the
+                    # single wait_for bounds the whole exchange.
                     writer = self._writer
                     if writer is None:
                         raise TransportConnectionError("Socket not initialized")
-                    writer.write(packet)
-                    await writer.drain()
-                    self._raise_if_shutdown()
-
-                    # Assemble one complete protocol frame.  The single
-                    # wait_for bounds the entire prefix/header/body sequence;
-                    # fragmented reads do not each restart the timeout.
-                    response = await asyncio.wait_for(
-                        self._receive_frame(),
-                        timeout=self._timeout,
-                    )
+                    waiter = self._expect_frame(packet)
+                    try:
+                        writer.write(packet)
+                        await writer.drain()
+                        self._raise_if_shutdown()
+                        response = await asyncio.wait_for(waiter, timeout=self._timeout)
+                    finally:
+                        self._release_frame_waiter(packet, waiter)
                     self._raise_if_shutdown()
 
-                    # Parse response with cross-request validation.  The
-                    # request's own TCP function (packet byte 7) is the
-                    # expected response function, so an unsolicited heartbeat
-                    # or proxied param frame is rejected as a mismatch rather
-                    # than mis-parsed as this reply (#320).
+                    # Parse response with cross-request validation.  Routing
+                    # already matched the TCP function, function, register
+                    # and serial; the parser re-checks them and validates
+                    # lengths, CRC, exceptions and the register count (#320).
                     return self._parse_response(
                         response,
                         expected_func,
@@ -959,6 +1096,18 @@ class DongleTransport(RegisterDataMixin, BaseTransport):
                         await asyncio.sleep(0.5)
                         continue
 
+                    # Only misrouted frames arrived: surface them as the
+                    # mismatch they are, which callers treat as transient
+                    unrouted = self._last_unrouted_frame
+                    if unrouted is not None:
+                        self._parse_response(
+                            unrouted,
+                            expected_func,
+                            expected_register,
+                            expected_count,
+                            expected_tcp_func=packet[7],
+                        )
+
                     _LOGGER.error("[%s] Timeout waiting for dongle response", self._serial)
                     raise TransportTimeoutError(
                         f"[{self._serial}] Timeout waiting for dongle response. "
@@ -1137,8 +1286,9 @@ class DongleTransport(RegisterDataMixin, BaseTransport):
         # --- TCP function validation (must precede the data-frame checks) ---
         # The dongle shares the 0xA1 0x1A prefix across ALL its frames — the
         # translated-Modbus reply we want (0xC2), unsolicited heartbeats
-        # (0xC1), and proxied param frames (0xC3/0xC4).  A heartbeat racing in
-        # after _drain_buffer carries a short data frame, so without this
+        # (0xC1), and proxied param frames (0xC3/0xC4).  The frame reader
+        # never routes these to a request, but a heartbeat handed to the
+        # parser directly carries a short data frame, so without this
         # check it would trip the generic "Data frame too short" path below —
         # a plain TransportReadError that latches coalescing off on a coalesced
         # read (#320).  Rejecting the wrong TCP function as a mismatch instead
@@ -1177,12 +1327,8 @@ class DongleTransport(RegisterDataMixin, BaseTransport):
                 f"got {len(response)}"
             )
 
-        # Extract data frame and CRC
-        data_frame = response[data_start:data_end]
-        received_crc = struct.unpack("<H", response[crc_start:crc_end])[0]
-
         # Verify CRC to ensure data integrity
-        computed_crc = compute_crc16(data_frame)
+        computed_crc, received_crc = frame_crc(response)
         if computed_crc != received_crc:
             _LOGGER.warning(
                 "[%s] CRC mismatch: computed 0x%04X, received 0x%04X. "
@@ -1197,6 +1343,8 @@ class DongleTransport(RegisterDataMixin, BaseTransport):
                 f"received 0x{received_crc:04X}"
             )
 
+        data_frame = response[data_start:data_end]
+
         # For read responses, data frame contains:
         # - action (1 byte)
         # - modbus_func (1 byte)
@@ -1285,13 +1433,9 @@ class DongleTransport(RegisterDataMixin, BaseTransport):
 
         # Extract register values (little-endian uint16)
         # Register data starts at offset 15
-        register_data = data_frame[15 : 15 + byte_count]
-        registers: list[int] = []
-
-        for i in range(0, len(register_data), 2):
-            if i + 1 < len(register_data):
-                value = struct.unpack("<H", register_data[i : i + 2])[0]
-                registers.append(value)
+        # (a trailing odd byte is ignored)
+        register_count = len(data_frame[15 : 15 + byte_count]) // 2
+        registers = list(struct.unpack_from(f"<{register_count}H", data_frame, 15))
 
         # Reject a short read: the frame is well-formed (matching serial /
         # function / register, valid CRC) but carries fewer registers than
@@ -1324,6 +1468,22 @@ class DongleTransport(RegisterDataMixin, BaseTransport):
             TransportReadError: If read fails
             TransportTimeoutError: If operation times out
         """
+        # Passive mode: answer from a block the cloud polled recently.  A
+        # block larger than the plain group size is only served once large
+        # reads are proven, so a hit never stands in for the coalescing probe.
+        if self._passive_cache is not None and (
+            count <= DEFAULT_INPUT_BLOCK_SIZE or getattr(self, "_input_coalescing_proven", False)
+        ):
+            cached = self._passive_cache.lookup(self._serial, MODBUS_READ_INPUT, address, count)
+            if cached is not None:
+                _LOGGER.debug(
+                    "[%s] Input registers %d-%d served from passive cache",
+                    self._serial,
+                    address,
+                    address + count - 1,
+                )
+                return cached
+
         packet = self._build_packet(
             tcp_func=TCP_FUNC_TRANSLATED,
             modbus_func=MODBUS_READ_INPUT,
@@ -36,8 +36,10 @@ Example:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any, Literal, overload
 
+from ._modbus_pipeline import DEFAULT_PIPELINE_WINDOW
 from ._register_data import DEFAULT_INPUT_BLOCK_SIZE
 from .config import TransportConfig, TransportType
 from .dongle import DongleTransport
@@ -52,6 +54,11 @@ if TYPE_CHECKING:
     from pylxpweb import LuxpowerClient
     from pylxpweb.devices.inverters._features import InverterFamily
 
+    from .bus_arbiter import RS485BusArbiter
+    from .gap_map import GapSafetyMap
+    from .hedge import HedgePolicy
+    from .modbus_gateway import ModbusGateway
+
 # Type alias for connection types
 ConnectionType = Literal["http", "modbus", "serial", "dongle", "hybrid"]
 
@@ -133,6 +140,7 @@ def create_transport(
     local_retry_interval: float = ...,
     max_input_block_size: int = ...,
     register_observer: RegisterObserver | None = ...,
+    hedge_policy: HedgePolicy | None = ...,
 ) -> HybridTransport: ...
 
 
@@ -181,6 +189,8 @@ def create_transport(
             - timeout: Operation timeout (default: 10.0)
             - inverter_family: Register map selection (optional)
             - local_retry_interval: Seconds before retrying local (default: 60.0)
+            - hedge_policy: HedgePolicy racing HTTP against slow local reads
+              (optional)
 
     Returns:
         Configured transport instance implementing InverterTransport
@@ -327,6 +337,7 @@ def create_transport(
             local_transport=local_transport,
             http_transport=http_transport,
             local_retry_interval=local_retry_interval,
+            hedge_policy=config.get("hedge_policy"),
         )
 
     raise ValueError(f"Invalid connection_type: {connection_type}")
@@ -375,6 +386,10 @@ def create_modbus_transport(
     inverter_family: InverterFamily | None = None,
     max_input_block_size: int = DEFAULT_INPUT_BLOCK_SIZE,
     register_observer: RegisterObserver | None = None,
+    pipeline_window: int = DEFAULT_PIPELINE_WINDOW,
+    gateway: ModbusGateway | None = None,
+    input_refresh_intervals: Mapping[str, float] | None = None,
+    gap_map: GapSafetyMap | None = None,
 ) -> ModbusTransport:
     """Create a Modbus TCP transport for local network communication.
 
@@ -402,6 +417,15 @@ def create_modbus_transport(
             compatibility. Use InverterFamily.LXP for Luxpower models
             (LXP-EU, LXP-LB-BR, LXP-LV) which have different register layouts.
         register_observer: Optional callback for terminal raw-register segments.
+        pipeline_window: Maximum input-register reads in flight at once
+            (default 1 = serial reads).  Raise it for gateways that buffer
+            requests; see ``ModbusTransport``.
+        gateway: Optional shared connection for several unit IDs behind the
+            same ``host:port``, from a ``ModbusGatewayPool``.
+        input_refresh_intervals: Optional minimum seconds between reads per
+            input register group (see ``validate_input_refresh_intervals``).
+        gap_map: Optional shared map of register gaps that are safe to
+            bridge when coalescing input reads (see ``GapSafetyMap``).
 
     Returns:
         ModbusTransport instance ready for use
@@ -444,6 +468,10 @@ def create_modbus_transport(
         inverter_family=inverter_family,
         max_input_block_size=max_input_block_size,
         register_observer=register_observer,
+        pipeline_window=pipeline_window,
+        gateway=gateway,
+        input_refresh_intervals=input_refresh_intervals,
+        gap_map=gap_map,
     )
 
 
@@ -457,6 +485,9 @@ def create_dongle_transport(
     inverter_family: InverterFamily | None = None,
     max_input_block_size: int = DEFAULT_INPUT_BLOCK_SIZE,
     register_observer: RegisterObserver | None = None,
+    passive_cache_max_age: float | None = None,
+    input_refresh_intervals: Mapping[str, float] | None = None,
+    gap_map: GapSafetyMap | None = None,
 ) -> DongleTransport:
     """Create a WiFi dongle transport for local network communication.
 
@@ -491,6 +522,13 @@ def create_dongle_transport(
             If None, defaults to PV_SERIES (EG4-18KPV) for backward
             compatibility.
         register_observer: Optional callback for terminal raw-register segments.
+        passive_cache_max_age: Seconds that register blocks the cloud polls
+            through the dongle are reused for local reads (None disables
+            passive mode)
+        input_refresh_intervals: Optional minimum seconds between reads per
+            input register group (see ``validate_input_refresh_intervals``).
+        gap_map: Optional shared map of register gaps that are safe to
+            bridge when coalescing input reads (see ``GapSafetyMap``).
 
     Returns:
         DongleTransport instance ready for use
@@ -522,6 +560,9 @@ def create_dongle_transport(
         inverter_family=inverter_family,
         max_input_block_size=max_input_block_size,
         register_observer=register_observer,
+        passive_cache_max_age=passive_cache_max_age,
+        input_refresh_intervals=input_refresh_intervals,
+        gap_map=gap_map,
     )
 
 
@@ -537,6 +578,9 @@ def create_serial_transport(
     inverter_family: InverterFamily | None = None,
     max_input_block_size: int = DEFAULT_INPUT_BLOCK_SIZE,
     register_observer: RegisterObserver | None = None,
+    bus: RS485BusArbiter | None = None,
+    input_refresh_intervals: Mapping[str, float] | None = None,
+    gap_map: GapSafetyMap | None = None,
 ) -> ModbusSerialTransport:
     """Create a Modbus RTU serial transport for local communication.
 
@@ -563,6 +607,12 @@ def create_serial_transport(
             If None, defaults to PV_SERIES (EG4-18KPV) for backward
             compatibility.
         register_observer: Optional callback for terminal raw-register segments.
+        bus: Optional arbiter for an RS485 bus shared with other transports
+            (e.g. a ``BatteryModbusTransport`` on the same adapter).
+        input_refresh_intervals: Optional minimum seconds between reads per
+            input register group (see ``validate_input_refresh_intervals``).
+        gap_map: Optional shared map of register gaps that are safe to
+            bridge when coalescing input reads (see ``GapSafetyMap``).
 
     Returns:
         ModbusSerialTransport instance ready for use
@@ -595,6 +645,9 @@ def create_serial_transport(
         inverter_family=inverter_family,
         max_input_block_size=max_input_block_size,
         register_observer=register_observer,
+        bus=bus,
+        input_refresh_intervals=input_refresh_intervals,
+        gap_map=gap_map,
     )
 
 
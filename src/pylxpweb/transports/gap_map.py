@@ -0,0 +1,141 @@
+"""Learned gap-bridging map for coalesced input-register reads.
+
+``coalesce_register_groups()`` only merges contiguous or overlapping groups:
+some models misbehave when a read covers addresses between the groups, so
+e.g. regs 113-153, 170-173 and 193-204 cost three transactions even though
+one 92-register read would cover them.
+
+A ``GapSafetyMap`` records, per inverter model (device type code and
+firmware version), which of those gaps have been read safely and which
+have failed.  Transports given a map bridge the known-safe gaps, probe at
+most one unknown gap per plan once large reads are proven, and mark a gap
+unsafe when the device rejects a read bridging it (an exception response or
+short read).  Timeouts and socket errors are not blamed on a gap until they
+repeat, and a gap known safe is never flipped by a single failure.  When
+merging maps, unsafe wins.
+
+The map is plain data: :meth:`GapSafetyMap.to_dict` /
+:meth:`GapSafetyMap.from_dict` round-trip through JSON, so a fleet can share
+what its units have learned.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+
+_SAFE = "safe"
+_UNSAFE = "unsafe"
+
+# (first gap address, first address after the gap)
+type Gap = tuple[int, int]
+
+
+def gap_model_key(device_type_code: int, firmware_version: str) -> str:
+    """Key a model by device type code and firmware version.
+
+    Example:
+        >>> gap_model_key(2092, "FAAB-2525")
+        '2092:FAAB-2525'
+    """
+    return f"{device_type_code}:{firmware_version}"
+
+
+class GapSafetyMap:
+    """Per-model record of register gaps that are safe to bridge.
+
+    Example:
+        >>> gaps = GapSafetyMap()
+        >>> gaps.mark_safe("2092:FAAB-2525", [(154, 170)])
+        >>> gaps.status("2092:FAAB-2525", 154, 170)
+        True
+        >>> gaps.status("2092:FAAB-2525", 174, 193) is None
+        True
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty map."""
+        self._models: dict[str, dict[Gap, bool]] = {}
+
+    def status(self, model: str, start: int, end: int) -> bool | None:
+        """Return True (safe), False (unsafe) or None (never tried).
+
+        Args:
+            model: Key from :func:`gap_model_key`.
+            start: First address of the gap.
+            end: First address after the gap.
+        """
+        return self._models.get(model, {}).get((start, end))
+
+    def mark_safe(self, model: str, gaps: Iterable[Gap]) -> None:
+        """Record a successful read bridging ``gaps`` (never clears unsafe)."""
+        known = self._models.setdefault(model, {})
+        for gap in gaps:
+            known.setdefault(gap, True)
+
+    def mark_unsafe(self, model: str, gaps: Iterable[Gap], *, overwrite_safe: bool = False) -> None:
+        """Record a failed read bridging ``gaps``.
+
+        Gaps already known safe keep that status unless ``overwrite_safe``
+        is set, so one failed read cannot undo a proven gap.
+        """
+        known = self._models.setdefault(model, {})
+        for gap in gaps:
+            if overwrite_safe or not known.get(gap, False):
+                known[gap] = False
+
+    def merge(self, other: GapSafetyMap) -> None:
+        """Fold ``other`` into this map; a gap unsafe in either stays unsafe."""
+        for model, gaps in other._models.items():
+            self.mark_unsafe(
+                model, [gap for gap, safe in gaps.items() if not safe], overwrite_safe=True
+            )
+            self.mark_safe(model, [gap for gap, safe in gaps.items() if safe])
+
+    @property
+    def models(self) -> list[str]:
+        """Model keys with at least one recorded gap."""
+        return sorted(self._models)
+
+    def to_dict(self) -> dict[str, dict[str, str]]:
+        """Export as ``{model: {"start-end": "safe" | "unsafe"}}`` (JSON-ready).
+
+        ``end`` is inclusive in the exported form, matching how register
+        ranges are written elsewhere (e.g. ``"154-169"``).
+        """
+        return {
+            model: {
+                f"{start}-{end - 1}": _SAFE if safe else _UNSAFE
+                for (start, end), safe in sorted(gaps.items())
+            }
+            for model, gaps in sorted(self._models.items())
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Mapping[str, str]]) -> GapSafetyMap:
+        """Rebuild a map exported by :meth:`to_dict`.
+
+        Raises:
+            ValueError: If a range or status is malformed.
+        """
+        gap_map = cls()
+        for model, gaps in data.items():
+            for span, state in gaps.items():
+                first, sep, last = span.partition("-")
+                if not sep or not first.isdigit() or not last.isdigit() or int(last) < int(first):
+                    raise ValueError(f"Invalid gap range {span!r} for model {model!r}")
+                if state not in (_SAFE, _UNSAFE):
+                    raise ValueError(f"Invalid gap status {state!r} for model {model!r}")
+                gap = (int(first), int(last) + 1)
+                if state == _SAFE:
+                    gap_map.mark_safe(model, [gap])
+                else:
+                    gap_map.mark_unsafe(model, [gap])
+        return gap_map
+
+    def __repr__(self) -> str:
+        """Return the number of models and gaps recorded."""
+        gaps = sum(len(known) for known in self._models.values())
+        return f"{type(self).__name__}(models={len(self._models)}, gaps={gaps})"
+
+
+__all__ = ["GapSafetyMap", "gap_model_key"]
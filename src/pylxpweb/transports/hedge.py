@@ -0,0 +1,160 @@
+"""Latency budget and win accounting for hedged hybrid reads.
+
+``HybridTransport`` normally waits for the local read to fail before asking
+the cloud, so a slow-but-alive dongle (retries, cloud contention on the
+dongle's uplink) holds a poll for the full local timeout.  Given a
+``HedgePolicy``, the hybrid transport starts the HTTP read once the local
+read has run longer than :meth:`HedgePolicy.budget` and returns whichever
+valid result arrives first.
+
+The budget follows the local read latency the way TCP sizes its
+retransmission timeout: a smoothed mean plus a multiple of the smoothed
+mean deviation, which tracks a high percentile without keeping samples.
+Only successful local reads are sampled, including ones that finish after
+losing a race, so a recovering dongle pulls the budget back down.
+
+Only runtime, energy and battery reads are hedged.  Parameter reads stay
+local-first with a sequential fallback: their cloud path is a remote read
+relayed through the same dongle, so racing it only adds load to the slow
+link.  Writes are never hedged: issuing the same write through both paths
+could apply it twice.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+_LOCAL = "local"
+_HTTP = "http"
+
+
+class HedgePolicy:
+    """Adaptive hedging budget for ``HybridTransport`` reads.
+
+    Example:
+        >>> policy = HedgePolicy(min_samples=2, min_budget=0.1)
+        >>> policy.budget() is None
+        True
+        >>> policy.record_local(0.4)
+        >>> policy.record_local(0.4)
+        >>> round(policy.budget(), 2)
+        1.1
+    """
+
+    def __init__(
+        self,
+        *,
+        smoothing: float = 0.125,
+        deviation_factor: float = 4.0,
+        min_budget: float = 0.5,
+        max_budget: float | None = None,
+        min_samples: int = 5,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            smoothing: Weight of each new sample in the latency averages
+                (0 < smoothing <= 1).
+            deviation_factor: Multiple of the mean deviation added to the
+                mean latency to form the budget.
+            min_budget: Never hedge a local read sooner than this (seconds).
+            max_budget: Always hedge once a local read runs this long
+                (seconds), however slow the local path has been.
+            min_samples: Successful local reads to observe before hedging.
+
+        Raises:
+            ValueError: If an argument is out of range.
+        """
+        if not 0 < smoothing <= 1:
+            raise ValueError(f"smoothing must be in (0, 1], got {smoothing}")
+        if deviation_factor < 0:
+            raise ValueError(f"deviation_factor must be >= 0, got {deviation_factor}")
+        if min_budget < 0:
+            raise ValueError(f"min_budget must be >= 0, got {min_budget}")
+        if max_budget is not None and max_budget < min_budget:
+            raise ValueError(f"max_budget must be >= min_budget, got {max_budget}")
+        if min_samples < 1:
+            raise ValueError(f"min_samples must be >= 1, got {min_samples}")
+        self.smoothing = smoothing
+        self.deviation_factor = deviation_factor
+        self.min_budget = min_budget
+        self.max_budget = max_budget
+        self.min_samples = min_samples
+
+        self._mean: float | None = None
+        self._deviation = 0.0
+        self._samples = 0
+        self.reads = 0
+        self.hedged = 0
+        self.local_wins = 0
+        self.http_wins = 0
+
+    def budget(self) -> float | None:
+        """Return seconds to wait on the local read before hedging.
+
+        Returns:
+            The hedge delay, or None while fewer than ``min_samples`` local
+            latencies have been observed (never hedge).
+        """
+        if self._mean is None or self._samples < self.min_samples:
+            return None
+        budget = max(self.min_budget, self._mean + self.deviation_factor * self._deviation)
+        if self.max_budget is not None:
+            budget = min(budget, self.max_budget)
+        return budget
+
+    def record_local(self, latency: float) -> None:
+        """Fold one successful local read latency (seconds) into the budget."""
+        self._samples += 1
+        if self._mean is None:
+            self._mean = latency
+            self._deviation = latency / 2
+            return
+        alpha = self.smoothing
+        self._deviation += alpha * (abs(latency - self._mean) - self._deviation)
+        self._mean += alpha * (latency - self._mean)
+
+    def record_read(self) -> None:
+        """Count a read eligible for hedging."""
+        self.reads += 1
+
+    def record_hedge(self) -> None:
+        """Count a read that outlived its budget and started the HTTP read."""
+        self.hedged += 1
+
+    def record_win(self, side: str) -> None:
+        """Count the path (``"local"`` or ``"http"``) that won a hedged read."""
+        if side == _LOCAL:
+            self.local_wins += 1
+        elif side == _HTTP:
+            self.http_wins += 1
+        else:
+            raise ValueError(f"Unknown hedge side {side!r}")
+
+    def stats(self) -> dict[str, Any]:
+        """Return counters, win rates and the current budget (JSON-ready).
+
+        ``local_win_rate`` and ``http_win_rate`` are fractions of hedged
+        reads that produced a result; both are 0.0 before any race.
+        """
+        races = self.local_wins + self.http_wins
+        return {
+            "reads": self.reads,
+            "hedged": self.hedged,
+            "local_wins": self.local_wins,
+            "http_wins": self.http_wins,
+            "local_win_rate": self.local_wins / races if races else 0.0,
+            "http_win_rate": self.http_wins / races if races else 0.0,
+            "budget": self.budget(),
+        }
+
+    def __repr__(self) -> str:
+        """Return the budget and hedge counters."""
+        return (
+            f"{type(self).__name__}(budget={self.budget()!r}, reads={self.reads}, "
+            f"hedged={self.hedged}, local_wins={self.local_wins}, "
+            f"http_wins={self.http_wins})"
+        )
+
+
+__all__ = ["HedgePolicy"]
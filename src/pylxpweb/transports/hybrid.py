@@ -6,6 +6,7 @@ This module provides the HybridTransport class that combines a local transport
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from collections.abc import Awaitable, Callable
@@ -24,6 +25,7 @@ from .protocol import BaseTransport
 
 if TYPE_CHECKING:
     from .dongle import DongleTransport
+    from .hedge import HedgePolicy
     from .http import HTTPTransport
     from .modbus import ModbusTransport
 
@@ -31,6 +33,14 @@ _LOGGER = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Local failures that switch the hybrid transport to HTTP
+_LOCAL_ERRORS = (
+    TransportReadError,
+    TransportWriteError,
+    TransportTimeoutError,
+    TransportConnectionError,
+)
+
 
 def _monotonic() -> float:
     """Return monotonic time through a transport-local test seam."""
@@ -48,6 +58,8 @@ class HybridTransport(BaseTransport):
         - Fast local polling when inverter is reachable
         - Reliable fallback when local connection fails
         - Automatic recovery when local becomes available after retry interval
+        - Optional hedged reads (``hedge_policy``): when a local read runs
+          past its learned latency budget, HTTP is raced against it
 
     Session Management:
         The HTTPTransport wraps a LuxpowerClient which may be shared across
@@ -81,6 +93,7 @@ class HybridTransport(BaseTransport):
         *,
         prefer_local: bool = True,
         local_retry_interval: float = 60.0,
+        hedge_policy: HedgePolicy | None = None,
     ) -> None:
         """Initialize hybrid transport.
 
@@ -90,6 +103,13 @@ class HybridTransport(BaseTransport):
             prefer_local: If True, always try local first (default: True)
             local_retry_interval: Seconds before retrying local after failure
                 (default: 60.0)
+            hedge_policy: Optional policy for hedged reads. When set, a local
+                read that outlives ``hedge_policy.budget()`` is raced against
+                the HTTP read and the first valid result wins. Only runtime,
+                energy and battery reads are hedged: parameter reads fall back
+                to the cloud's remote read, which relays through the same
+                dongle, and writes could apply twice. Default None keeps
+                strict local-first reads.
         """
         super().__init__(local_transport.serial)
         self._local = local_transport
@@ -98,6 +118,9 @@ class HybridTransport(BaseTransport):
         self._local_retry_interval = local_retry_interval
         self._local_failed_at: float | None = None
         self._using_local: bool = True
+        self._hedge_policy = hedge_policy
+        # Local reads that lost a hedge race and are finishing in the background
+        self._hedge_losers: set[asyncio.Future[Any]] = set()
 
     @property
     def capabilities(self) -> TransportCapabilities:
@@ -125,6 +148,11 @@ class HybridTransport(BaseTransport):
         """Get the underlying HTTP transport."""
         return self._http
 
+    @property
+    def hedge_policy(self) -> HedgePolicy | None:
+        """Get the hedged-read policy (None when reads are not hedged)."""
+        return self._hedge_policy
+
     @property
     def register_observation_error_count(self) -> int:
         """Return the local transport's redacted observer-error count."""
@@ -159,6 +187,8 @@ class HybridTransport(BaseTransport):
         local_op: Callable[[], Awaitable[T]],
         http_op: Callable[[], Awaitable[T]],
         operation_name: str,
+        *,
+        hedge: bool = False,
     ) -> T:
         """Execute operation with local-first, HTTP-fallback pattern.
 
@@ -166,6 +196,8 @@ class HybridTransport(BaseTransport):
             local_op: Async callable for local transport operation
             http_op: Async callable for HTTP transport operation
             operation_name: Name of operation for logging
+            hedge: Whether the operation is a read that may be hedged
+                (only applies when a ``hedge_policy`` is configured)
 
         Returns:
             Result from whichever transport succeeds
@@ -174,19 +206,115 @@ class HybridTransport(BaseTransport):
         self._check_local_recovery()
 
         if self._using_local:
+            if hedge and self._hedge_policy is not None:
+                return await self._with_hedge(local_op, http_op, operation_name, self._hedge_policy)
             try:
                 return await local_op()
-            except (
-                TransportReadError,
-                TransportWriteError,
-                TransportTimeoutError,
-                TransportConnectionError,
-            ) as err:
+            except _LOCAL_ERRORS as err:
                 self._mark_local_failed()
                 _LOGGER.debug("Local %s failed: %s", operation_name, err)
 
         return await http_op()
 
+    async def _with_hedge(
+        self,
+        local_op: Callable[[], Awaitable[T]],
+        http_op: Callable[[], Awaitable[T]],
+        operation_name: str,
+        policy: HedgePolicy,
+    ) -> T:
+        """Run a local read, racing HTTP against it once it outlives the budget.
+
+        A local read that loses is left to finish rather than cancelled, so
+        a Modbus/dongle transaction is never torn mid-frame; its result is
+        discarded and only its latency is kept.  A losing HTTP read is
+        cancelled.  Local transport errors still switch to HTTP fallback.
+        """
+        policy.record_read()
+        started = _monotonic()
+        local: asyncio.Future[T] = asyncio.ensure_future(local_op())
+        try:
+            done, _ = await asyncio.wait({local}, timeout=policy.budget())
+        except asyncio.CancelledError:
+            local.cancel()
+            raise
+
+        if done:
+            try:
+                result = local.result()
+            except _LOCAL_ERRORS as err:
+                self._mark_local_failed()
+                _LOGGER.debug("Local %s failed: %s", operation_name, err)
+                return await http_op()
+            policy.record_local(_monotonic() - started)
+            return result
+
+        policy.record_hedge()
+        _LOGGER.debug(
+            "Local %s for %s exceeded %.2fs budget, hedging with HTTP",
+            operation_name,
+            self._serial,
+            policy.budget() or 0.0,
+        )
+        http: asyncio.Future[T] = asyncio.ensure_future(http_op())
+        pending: set[asyncio.Future[T]] = {local, http}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if local in done:
+                    local_err = local.exception()
+                    if local_err is None:
+                        policy.record_local(_monotonic() - started)
+                        policy.record_win("local")
+                        return local.result()
+                    if not isinstance(local_err, _LOCAL_ERRORS):
+                        raise local_err
+                    self._mark_local_failed()
+                    _LOGGER.debug("Local %s failed: %s", operation_name, local_err)
+                if http in done and http.exception() is None:
+                    policy.record_win("http")
+                    if not local.done():
+                        self._detach_local_loser(local, started, operation_name, policy)
+                    return http.result()
+            # Both sides failed: surface the HTTP error, as the fallback does
+            return http.result()
+        finally:
+            if not http.done():
+                http.cancel()
+            if not local.done() and local not in self._hedge_losers:
+                local.cancel()
+
+    def _detach_local_loser(
+        self,
+        local: asyncio.Future[Any],
+        started: float,
+        operation_name: str,
+        policy: HedgePolicy,
+    ) -> None:
+        """Let a local read that lost a hedge race finish in the background."""
+        self._hedge_losers.add(local)
+
+        def _done(task: asyncio.Future[Any]) -> None:
+            self._hedge_losers.discard(task)
+            if task.cancelled():
+                return
+            err = task.exception()
+            if err is None:
+                policy.record_local(_monotonic() - started)
+            elif isinstance(err, _LOCAL_ERRORS):
+                self._mark_local_failed()
+                _LOGGER.debug("Late local %s failed: %s", operation_name, err)
+            else:
+                _LOGGER.debug("Late local %s raised: %s", operation_name, err)
+
+        local.add_done_callback(_done)
+
+    def _cancel_hedge_losers(self) -> None:
+        """Cancel local reads still finishing after losing a hedge race."""
+        for task in list(self._hedge_losers):
+            task.cancel()
+        self._hedge_losers.clear()
+
     async def connect(self) -> None:
         """Connect both transports.
 
@@ -219,6 +347,7 @@ class HybridTransport(BaseTransport):
 
     async def disconnect(self) -> None:
         """Disconnect both transports."""
+        self._cancel_hedge_losers()
         try:
             await self._local.disconnect()
         except Exception as err:  # noqa: BLE001
@@ -243,6 +372,7 @@ class HybridTransport(BaseTransport):
         ordinary ``disconnect()``. Like the dongle's, this is terminal —
         discard the transport afterwards.
         """
+        self._cancel_hedge_losers()
         for side in (self._local, self._http):
             shutdown = getattr(type(side), "async_shutdown", None)
             try:
@@ -270,6 +400,7 @@ class HybridTransport(BaseTransport):
             self._local.read_runtime,
             self._http.read_runtime,
             "read_runtime",
+            hedge=True,
         )
 
     async def read_energy(self) -> InverterEnergyData:
@@ -286,6 +417,7 @@ class HybridTransport(BaseTransport):
             self._local.read_energy,
             self._http.read_energy,
             "read_energy",
+            hedge=True,
         )
 
     async def read_battery(self) -> BatteryBankData | None:
@@ -301,6 +433,7 @@ class HybridTransport(BaseTransport):
             self._local.read_battery,
             self._http.read_battery,
             "read_battery",
+            hedge=True,
         )
 
     async def read_parameters(
@@ -19,15 +19,24 @@ Disable other Modbus integrations before using this transport.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import hashlib
 import logging
 import time
-from typing import TYPE_CHECKING, Protocol, cast
+from collections.abc import AsyncIterator, Mapping
+from typing import TYPE_CHECKING, Any, Protocol, cast
 
 from ._modbus_base import INPUT_REGISTER_GROUPS, BaseModbusTransport
-from ._register_data import DEFAULT_INPUT_BLOCK_SIZE
+from ._modbus_pipeline import (
+    DEFAULT_PIPELINE_WINDOW,
+    ModbusTcpPipeline,
+    PipelineMisbehaviorError,
+    validate_pipeline_window,
+)
+from ._register_data import DEFAULT_INPUT_BLOCK_SIZE, _ReadBlock
 from .capabilities import MODBUS_CAPABILITIES, TransportCapabilities
-from .exceptions import TransportConnectionError
+from .exceptions import TransportConnectionError, TransportTimeoutError
+from .modbus_gateway import patch_tid_validation
 from .observation import RegisterObserver
 
 if TYPE_CHECKING:
@@ -35,6 +44,9 @@ if TYPE_CHECKING:
 
     from pylxpweb.devices.inverters._features import InverterFamily
 
+    from .gap_map import GapSafetyMap
+    from .modbus_gateway import ModbusGateway
+
 _LOGGER = logging.getLogger(__name__)
 
 _DEFAULT_SESSION_MAX_AGE = 3600.0
@@ -102,6 +114,10 @@ class ModbusTransport(BaseModbusTransport):
     Ensure only ONE integration/script connects to each inverter at a time.
     Disable other Modbus integrations before using this transport.
 
+    Several inverters behind one gateway (distinct unit IDs) should share a
+    :class:`~pylxpweb.transports.modbus_gateway.ModbusGateway` so they use a
+    single connection and take fair turns on the bus.
+
     Example:
         transport = ModbusTransport(
             host="192.168.1.100",
@@ -135,6 +151,10 @@ class ModbusTransport(BaseModbusTransport):
         max_input_block_size: int = DEFAULT_INPUT_BLOCK_SIZE,
         register_observer: RegisterObserver | None = None,
         session_max_age: float | None = _DEFAULT_SESSION_MAX_AGE,
+        pipeline_window: int = DEFAULT_PIPELINE_WINDOW,
+        gateway: ModbusGateway | None = None,
+        input_refresh_intervals: Mapping[str, float] | None = None,
+        gap_map: GapSafetyMap | None = None,
     ) -> None:
         """Initialize Modbus transport.
 
@@ -165,7 +185,28 @@ class ModbusTransport(BaseModbusTransport):
                 proactive reconnect (default 3600), with deterministic per-
                 transport jitter of plus or minus ten percent. None disables
                 proactive recycling.
+            pipeline_window: Maximum input-register reads in flight at once,
+                1..16 (default 1 = serial reads).  Above 1, each cycle's
+                input blocks are sent back to back and matched to their
+                responses by MBAP transaction ID, for gateways that buffer
+                requests.  A gateway that does not echo transaction IDs, or
+                drops buffered requests, latches the transport back to
+                serial reads.
+            gateway: Optional shared connection to ``host:port`` (see
+                :class:`~pylxpweb.transports.modbus_gateway.ModbusGatewayPool`).
+                When set, the transport attaches to the gateway's connection
+                instead of opening its own, and each request waits its turn
+                behind the other unit IDs on it.
+            input_refresh_intervals: Optional minimum seconds between reads
+                per input register group (see
+                :func:`~pylxpweb.transports._register_data.validate_input_refresh_intervals`).
+            gap_map: Optional learned map of register gaps that are safe to
+                bridge, shared across transports (see
+                :class:`~pylxpweb.transports.gap_map.GapSafetyMap`).  With
+                coalescing enabled, input reads then bridge known-safe gaps
+                and probe unknown ones to use fewer transactions.
         """
+        validate_pipeline_window(pipeline_window)
         super().__init__(
             serial,
             unit_id=unit_id,
@@ -184,6 +225,8 @@ class ModbusTransport(BaseModbusTransport):
                 unit_id=unit_id,
                 serial=serial,
             ),
+            input_refresh_intervals=input_refresh_intervals,
+            gap_map=gap_map,
         )
         self._host = host
         self._port = port
@@ -192,6 +235,12 @@ class ModbusTransport(BaseModbusTransport):
         self._session_started_at: float | None = None
         self._reconnect_retry_after: float | None = None
         self._session_reconnect_count = 0
+        self._pipeline_window = pipeline_window
+        self._pipelining_latched_off = False
+        self._prefetched_input: dict[tuple[int, int], list[int]] = {}
+        self._gateway = gateway
+        # Generation of the shared gateway socket this transport is using
+        self._gateway_generation: int | None = None
 
     @property
     def capabilities(self) -> TransportCapabilities:
@@ -208,6 +257,16 @@ class ModbusTransport(BaseModbusTransport):
         """Get the Modbus gateway port."""
         return self._port
 
+    @property
+    def gateway(self) -> ModbusGateway | None:
+        """Get the shared gateway connection, if any."""
+        return self._gateway
+
+    @property
+    def pipeline_window(self) -> int:
+        """Input reads kept in flight at once (1 once pipelining latched off)."""
+        return 1 if self._pipelining_latched_off else self._pipeline_window
+
     async def connect(self) -> None:
         """Establish a Modbus TCP connection under the operation lock.
 
@@ -227,6 +286,9 @@ class ModbusTransport(BaseModbusTransport):
         if self._connected:
             return
         self._drop_session()
+        if self._gateway is not None:
+            await self._attach_gateway(self._gateway)
+            return
 
         try:
             # Import pymodbus here to make it optional
@@ -307,57 +369,169 @@ class ModbusTransport(BaseModbusTransport):
             ) from err
 
     def _patch_tid_validation(self) -> None:
-        """Disable MBAP transaction ID validation in pymodbus.
-
-        Waveshare RS485-to-Ethernet gateways use MBAP framing on the TCP
-        side but don't echo the request's transaction ID in responses --
-        they use their own incrementing counter. This causes pymodbus to
-        reject every response at two validation points:
-
-        1. ``framer.handleFrame``: ``if exp_tid and tid != exp_tid``
-        2. ``execute``: ``if response.transaction_id != request.transaction_id``
+        """Disable MBAP transaction ID validation on this transport's client.
 
-        We patch ``handleFrame`` to pass ``exp_tid=0`` (disabling check 1)
-        and set the decoded PDU's TID to the expected value (fixing check 2).
-        Stale responses arriving after a future is resolved are also
-        silently dropped to prevent log spam.
+        See :func:`~pylxpweb.transports.modbus_gateway.patch_tid_validation`.
         """
         if self._client is None:
             return
+        patch_tid_validation(self._client, f"{self._host}:{self._port} ({self._serial})")
 
-        ctx = getattr(self._client, "ctx", None)
-        if ctx is None or not hasattr(ctx, "framer"):
-            return
+    async def _attach_gateway(self, gateway: ModbusGateway, *, recycle: bool = False) -> None:
+        """Join the shared gateway connection (the gateway branch of connect).
+
+        Args:
+            gateway: The shared gateway.
+            recycle: Replace the shared socket (for every attached unit)
+                unless another unit already replaced the one in use.
+
+        Raises:
+            TransportConnectionError: If the gateway cannot be reached
+        """
+        try:
+            if recycle:
+                self._client = await gateway.recycle(self, self._gateway_generation)
+            else:
+                self._client = await gateway.attach(self)
+        except TransportConnectionError:
+            self._reconnect_retry_after = _monotonic() + _FAILED_RECONNECT_COOLDOWN
+            raise
+        except asyncio.CancelledError:
+            self._reconnect_retry_after = _monotonic()
+            raise
+        if self._shutdown_requested:
+            self._drop_session()
+        self._raise_if_shutdown()
 
-        framer = ctx.framer
-        original_handle_frame = framer.handleFrame
-
-        def _patched_handle_frame(
-            data: bytes,
-            exp_devid: int,
-            exp_tid: int,
-        ) -> tuple[int, object | None]:
-            used_len, pdu = original_handle_frame(data, exp_devid, 0)
-            if pdu is not None:
-                # Drop stale responses whose future is already resolved.
-                future = getattr(ctx, "response_future", None)
-                if future is not None and future.done():
-                    return used_len, None
-                if exp_tid:
-                    pdu.transaction_id = exp_tid
-            return used_len, pdu
-
-        framer.handleFrame = _patched_handle_frame
-        _LOGGER.debug(
-            "Patched TID validation for Modbus gateway %s:%s (%s)",
-            self._host,
-            self._port,
+        self._connected = True
+        self._gateway_generation = gateway.generation
+        self._consecutive_errors = 0
+        self._session_started_at = _monotonic()
+        self._reconnect_retry_after = None
+        _LOGGER.info(
+            "Modbus transport attached to shared gateway %s (unit %s) for %s",
+            gateway.label,
+            self._unit_id,
             self._serial,
         )
 
+    def _require_active_client(self) -> Any:
+        """Return the active client, following a gateway that reopened."""
+        gateway = self._gateway
+        if (
+            gateway is not None
+            and self._client is not None
+            and gateway.client is not None
+            and gateway.generation != self._gateway_generation
+        ):
+            # Another unit recycled the shared socket: this is a new session
+            self._client = gateway.client
+            self._gateway_generation = gateway.generation
+            self._session_started_at = _monotonic()
+        return super()._require_active_client()
+
+    def _gateway_replaced(self) -> bool:
+        """Whether the shared socket this transport uses was reset or replaced."""
+        gateway = self._gateway
+        return (
+            gateway is not None
+            and self._connected
+            and (gateway.client is None or gateway.generation != self._gateway_generation)
+        )
+
+    @contextlib.asynccontextmanager
+    async def _bus_slot(self) -> AsyncIterator[None]:
+        """Wait for this unit's turn on a shared gateway connection."""
+        if self._gateway is None:
+            yield
+            return
+        async with self._gateway.transaction(self._unit_id):
+            yield
+
+    @contextlib.asynccontextmanager
+    async def _input_prefetch(self, plan: list[_ReadBlock]) -> AsyncIterator[bool]:
+        """Pipeline ``plan``'s input reads when a window above 1 is set."""
+        if self.pipeline_window <= 1 or len(plan) < 2:
+            yield False
+            return
+        try:
+            yield await self._pipeline_input_reads(plan)
+        finally:
+            self._prefetched_input.clear()
+
+    async def _pipeline_input_reads(self, plan: list[_ReadBlock]) -> bool:
+        """Send every block of ``plan`` through one pipelined batch.
+
+        Successful reads are stashed for :meth:`_read_input_registers`;
+        failed ones are left for the sequential loop to read (and retry)
+        serially.  A response with a foreign transaction ID or a timed-out
+        request latches pipelining off and replaces the session, so no late
+        pipelined reply can be taken for a serial request's answer.
+
+        Returns:
+            True if every block was fetched.
+        """
+        self._ensure_connected()
+        async with self._lock, self._bus_slot():
+            client = self._require_active_client()
+            ctx = getattr(client, "ctx", None)
+            if ctx is None or getattr(ctx, "transport", None) is None:
+                return False
+            pipeline = ModbusTcpPipeline(
+                ctx,
+                window=self._pipeline_window,
+                unit_id=self._unit_id,
+                timeout=self._timeout,
+            )
+            results = await pipeline.read_many([(4, block.start, block.count) for block in plan])
+
+            failures = [r for r in results if isinstance(r, Exception)]
+            if pipeline.misbehaved or any(isinstance(r, TransportTimeoutError) for r in failures):
+                reason = next(
+                    (r for r in failures if isinstance(r, PipelineMisbehaviorError)), failures[0]
+                )
+                self._pipelining_latched_off = True
+                _LOGGER.warning(
+                    "[%s] Pipelined Modbus reads failed on %s:%s (%s) — falling back "
+                    "to serial reads for this transport. The gateway does not echo "
+                    "transaction IDs or does not buffer requests; set "
+                    "pipeline_window=1 to disable this probe.",
+                    self._serial,
+                    self._host,
+                    self._port,
+                    reason,
+                )
+                if self._gateway is not None:
+                    # Late replies would reach the other units' requests
+                    self._gateway.reset()
+                self._drop_session()
+                await self._connect_locked()
+
+            for block, result in zip(plan, results, strict=True):
+                if not isinstance(result, Exception):
+                    self._prefetched_input[(block.start, block.count)] = result
+            if not failures:
+                self._consecutive_errors = 0
+            return not failures
+
+    async def _read_input_registers(self, address: int, count: int) -> list[int]:
+        """Read input registers, answered from a pipelined batch if fetched."""
+        prefetched = self._prefetched_input.pop((address, count), None)
+        if prefetched is not None:
+            self._last_read_retried = False
+            return prefetched
+        return await super()._read_input_registers(address, count)
+
     def _drop_session(self) -> None:
-        """Close and forget the client, marking the session as dead."""
-        if self._client is not None:
+        """Close and forget the client, marking the session as dead.
+
+        A transport on a shared gateway only detaches: the socket stays open
+        for the other unit IDs and closes with the last one.
+        """
+        if self._gateway is not None:
+            self._gateway.detach(self)
+            self._client = None
+        elif self._client is not None:
             self._client.close()
             self._client = None
         self._connected = False
@@ -408,6 +582,8 @@ class ModbusTransport(BaseModbusTransport):
                 and now - self._session_started_at >= self._session_max_age
             ):
                 reason = "age-recycle"
+            elif self._gateway_replaced():
+                reason = "gateway-reopened"
 
             if reason is None:
                 return
@@ -422,9 +598,17 @@ class ModbusTransport(BaseModbusTransport):
                 self._session_reconnect_count,
             )
 
-            await self.disconnect()
             try:
-                await self.connect()
+                if self._gateway is not None and self._connected:
+                    # Shared socket: replace it once for every attached unit
+                    try:
+                        await self._attach_gateway(self._gateway, recycle=True)
+                    except TransportConnectionError:
+                        self._drop_session()
+                        raise
+                else:
+                    await self.disconnect()
+                    await self.connect()
             except TransportConnectionError:
                 _LOGGER.warning(
                     "Modbus reconnect failed for %s: reason=%s count=%d",
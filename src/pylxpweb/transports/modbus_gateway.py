@@ -0,0 +1,394 @@
+"""Shared Modbus TCP connections for devices behind one gateway.
+
+A parallel group usually hangs several inverters (and the GridBOSS) off
+one RS485-to-Ethernet adapter, each with its own unit ID.  The RS485 side
+is half duplex, so one socket per ``ModbusTransport`` buys nothing: the
+transports only collide on the bus and churn the gateway's few TCP slots.
+
+:class:`ModbusGateway` owns one pymodbus client for a (host, port) and
+multiplexes every unit ID over it.  Transactions are granted one at a
+time, round-robin across units, so a device with a long read backlog
+cannot starve the others; per-unit wait and latency figures are kept for
+diagnostics.  :class:`ModbusGatewayPool` hands out one gateway per
+(host, port).
+
+Example:
+    pool = ModbusGatewayPool()
+    transports = [
+        ModbusTransport(
+            host="192.168.1.100",
+            unit_id=unit_id,
+            serial=serial,
+            gateway=pool.get("192.168.1.100", 502),
+        )
+        for unit_id, serial in ((1, "CE12345678"), (2, "CE87654321"))
+    ]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, replace
+from typing import Any
+
+from .exceptions import TransportConnectionError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def patch_tid_validation(client: Any, label: str) -> None:
+    """Disable MBAP transaction ID validation in pymodbus.
+
+    Waveshare RS485-to-Ethernet gateways use MBAP framing on the TCP
+    side but don't echo the request's transaction ID in responses --
+    they use their own incrementing counter. This causes pymodbus to
+    reject every response at two validation points:
+
+    1. ``framer.handleFrame``: ``if exp_tid and tid != exp_tid``
+    2. ``execute``: ``if response.transaction_id != request.transaction_id``
+
+    We patch ``handleFrame`` to pass ``exp_tid=0`` (disabling check 1)
+    and set the decoded PDU's TID to the expected value (fixing check 2).
+    Stale responses arriving after a future is resolved are also
+    silently dropped to prevent log spam.
+
+    Args:
+        client: Connected pymodbus TCP client.
+        label: Connection description for the debug log.
+    """
+    ctx = getattr(client, "ctx", None)
+    if ctx is None or not hasattr(ctx, "framer"):
+        return
+
+    framer = ctx.framer
+    original_handle_frame = framer.handleFrame
+
+    def _patched_handle_frame(
+        data: bytes,
+        exp_devid: int,
+        exp_tid: int,
+    ) -> tuple[int, object | None]:
+        used_len, pdu = original_handle_frame(data, exp_devid, 0)
+        if pdu is not None:
+            # Drop stale responses whose future is already resolved.
+            future = getattr(ctx, "response_future", None)
+            if future is not None and future.done():
+                return used_len, None
+            if exp_tid:
+                pdu.transaction_id = exp_tid
+        return used_len, pdu
+
+    framer.handleFrame = _patched_handle_frame
+    _LOGGER.debug("Patched TID validation for Modbus gateway %s", label)
+
+
+@dataclass(slots=True)
+class GatewayUnitStats:
+    """Transaction timing for one unit ID on a shared gateway.
+
+    Attributes:
+        transactions: Completed transactions (successful or not).
+        total_wait: Seconds spent queued for the bus, summed.
+        total_latency: Seconds holding the bus, summed.
+        max_latency: Longest single transaction in seconds.
+        last_latency: Most recent transaction in seconds.
+    """
+
+    transactions: int = 0
+    total_wait: float = 0.0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    last_latency: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        """Mean seconds queued for the bus per transaction."""
+        return self.total_wait / self.transactions if self.transactions else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean seconds per transaction."""
+        return self.total_latency / self.transactions if self.transactions else 0.0
+
+
+class ModbusGateway:
+    """One pymodbus TCP connection shared by every unit ID behind a gateway.
+
+    Transports attach on connect and detach on disconnect; the socket is
+    opened by the first attach (or the first after it dropped) and closed
+    when the last transport detaches.
+
+    Recycling is gateway-wide: a transport that needs a fresh session
+    (consecutive errors, session age, stray replies) calls :meth:`recycle`,
+    which replaces the shared socket once.  Every socket gets a new
+    :attr:`generation`; the other attached transports see the bump and move
+    to the new client instead of recycling it again.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 502,
+        *,
+        timeout: float = 10.0,
+        pymodbus_retries: int = 3,
+    ) -> None:
+        """Initialize an unconnected gateway.
+
+        Args:
+            host: IP address or hostname of the Modbus TCP gateway
+            port: TCP port (default 502)
+            timeout: Connection and operation timeout in seconds
+            pymodbus_retries: Number of retries passed to the pymodbus client
+        """
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._pymodbus_retries = pymodbus_retries
+        self._client: Any = None
+        self._generation = 0
+        self._owners: set[int] = set()
+        self._connect_lock = asyncio.Lock()
+        self._busy = False
+        # Per-unit FIFO of waiting transactions, and the units with waiters
+        # in service order; a served unit with more waiters rejoins the back.
+        self._queues: dict[int, deque[asyncio.Future[None]]] = {}
+        self._rotation: deque[int] = deque()
+        self._stats: dict[int, GatewayUnitStats] = {}
+
+    @property
+    def host(self) -> str:
+        """Get the gateway host."""
+        return self._host
+
+    @property
+    def port(self) -> int:
+        """Get the gateway port."""
+        return self._port
+
+    @property
+    def attached(self) -> int:
+        """Number of transports currently attached."""
+        return len(self._owners)
+
+    @property
+    def client(self) -> Any:
+        """The shared pymodbus client, or None while the gateway is closed."""
+        return self._client
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped each time a new shared socket is opened."""
+        return self._generation
+
+    @property
+    def label(self) -> str:
+        """``host:port`` description for log messages."""
+        return f"{self._host}:{self._port}"
+
+    async def attach(self, owner: object) -> Any:
+        """Attach ``owner`` and return the shared client, connecting if needed.
+
+        Args:
+            owner: The attaching transport (detach with the same object).
+
+        Returns:
+            The connected pymodbus ``AsyncModbusTcpClient``.
+
+        Raises:
+            TransportConnectionError: If the gateway cannot be reached.
+        """
+        async with self._connect_lock:
+            if self._client is None or not self._client.connected:
+                await self._open()
+            self._owners.add(id(owner))
+            return self._client
+
+    async def recycle(self, owner: object, generation: int | None) -> Any:
+        """Replace the shared socket for every attached unit, once.
+
+        The socket is reopened only if ``generation`` is still the current
+        one (or the socket is gone); a transport whose view is older just
+        picks up the socket another unit already replaced.
+
+        Args:
+            owner: The recycling transport (attached if it was not).
+            generation: :attr:`generation` of the socket the caller last used.
+
+        Returns:
+            The connected pymodbus client.
+
+        Raises:
+            TransportConnectionError: If the gateway cannot be reached.
+        """
+        async with self._connect_lock:
+            if generation == self._generation or self._client is None or not self._client.connected:
+                await self._open()
+            self._owners.add(id(owner))
+            return self._client
+
+    def detach(self, owner: object) -> None:
+        """Detach ``owner``; the last one out closes the socket."""
+        self._owners.discard(id(owner))
+        if not self._owners and self._client is not None:
+            self._client.close()
+            self._client = None
+            _LOGGER.debug("Closed shared Modbus gateway connection %s", self.label)
+
+    def reset(self) -> None:
+        """Close the socket so the next :meth:`attach` opens a fresh one.
+
+        For a unit whose traffic left the connection in an unknown state
+        (such as replies still in flight); attached transports see the
+        socket is gone at their next operation and :meth:`recycle`.
+        """
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+            _LOGGER.debug("Reset shared Modbus gateway connection %s", self.label)
+
+    async def _open(self) -> None:
+        """(Re)open the shared socket."""
+        self.reset()
+        try:
+            # Import pymodbus here to make it optional
+            from pymodbus.client import AsyncModbusTcpClient
+        except ImportError as err:
+            raise TransportConnectionError(
+                "pymodbus package not installed. Install with: uv add pymodbus"
+            ) from err
+
+        client = AsyncModbusTcpClient(
+            host=self._host,
+            port=self._port,
+            timeout=self._timeout,
+            retries=self._pymodbus_retries,
+        )
+        try:
+            connected = await client.connect()
+        except (TimeoutError, OSError) as err:
+            client.close()
+            raise TransportConnectionError(
+                f"Failed to connect to Modbus gateway at {self.label}: {err}"
+            ) from err
+        except asyncio.CancelledError:
+            client.close()
+            raise
+        if not connected:
+            client.close()
+            raise TransportConnectionError(f"Failed to connect to Modbus gateway at {self.label}")
+        patch_tid_validation(client, self.label)
+        self._client = client
+        self._generation += 1
+        _LOGGER.info("Shared Modbus gateway connection opened to %s", self.label)
+
+    @contextlib.asynccontextmanager
+    async def transaction(self, unit_id: int) -> AsyncIterator[None]:
+        """Hold the bus for one transaction of ``unit_id``.
+
+        Waiting units are served round-robin, each unit's own transactions
+        in arrival order.
+
+        Args:
+            unit_id: Modbus unit ID the transaction addresses.
+        """
+        queued_at = time.monotonic()
+        if self._busy or self._rotation:
+            turn: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            queue = self._queues.setdefault(unit_id, deque())
+            if not queue:
+                self._rotation.append(unit_id)
+            queue.append(turn)
+            try:
+                await turn
+            except asyncio.CancelledError:
+                if turn.done() and not turn.cancelled():
+                    # Granted just as we were cancelled: pass the bus on
+                    self._grant_next()
+                else:
+                    queue.remove(turn)
+                    if not queue:
+                        self._rotation.remove(unit_id)
+                raise
+        else:
+            self._busy = True
+
+        started_at = time.monotonic()
+        try:
+            yield
+        finally:
+            finished_at = time.monotonic()
+            stats = self._stats.setdefault(unit_id, GatewayUnitStats())
+            latency = finished_at - started_at
+            stats.transactions += 1
+            stats.total_wait += started_at - queued_at
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+            stats.last_latency = latency
+            self._grant_next()
+
+    def _grant_next(self) -> None:
+        """Hand the bus to the next waiting unit, or mark it idle."""
+        while self._rotation:
+            unit_id = self._rotation.popleft()
+            queue = self._queues[unit_id]
+            turn = queue.popleft()
+            if queue:
+                self._rotation.append(unit_id)
+            if not turn.done():
+                turn.set_result(None)
+                return
+        self._busy = False
+
+    def unit_stats(self) -> dict[int, GatewayUnitStats]:
+        """Return a snapshot of per-unit transaction timing.
+
+        Returns:
+            Dict mapping unit ID to a copy of its :class:`GatewayUnitStats`.
+        """
+        return {unit_id: replace(stats) for unit_id, stats in self._stats.items()}
+
+
+class ModbusGatewayPool:
+    """One :class:`ModbusGateway` per (host, port)."""
+
+    def __init__(self, *, timeout: float = 10.0, pymodbus_retries: int = 3) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            timeout: Timeout for gateways the pool creates
+            pymodbus_retries: pymodbus retries for gateways the pool creates
+        """
+        self._timeout = timeout
+        self._pymodbus_retries = pymodbus_retries
+        self._gateways: dict[tuple[str, int], ModbusGateway] = {}
+
+    def get(self, host: str, port: int = 502, *, timeout: float | None = None) -> ModbusGateway:
+        """Return the gateway for ``host:port``, creating it on first use.
+
+        Args:
+            host: IP address or hostname of the Modbus TCP gateway
+            port: TCP port (default 502)
+            timeout: Timeout for a newly created gateway (default: the
+                pool's); ignored when the gateway already exists
+        """
+        key = (host, port)
+        gateway = self._gateways.get(key)
+        if gateway is None:
+            gateway = ModbusGateway(
+                host,
+                port,
+                timeout=self._timeout if timeout is None else timeout,
+                pymodbus_retries=self._pymodbus_retries,
+            )
+            self._gateways[key] = gateway
+        return gateway
+
+    def gateways(self) -> list[ModbusGateway]:
+        """Return every gateway created so far."""
+        return list(self._gateways.values())
@@ -25,11 +25,14 @@ Example:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+from collections.abc import AsyncIterator, Mapping
 from typing import TYPE_CHECKING
 
 from ._modbus_base import BaseModbusTransport
 from ._register_data import DEFAULT_INPUT_BLOCK_SIZE
+from .bus_arbiter import BUS_PRIORITY_INVERTER
 from .capabilities import MODBUS_CAPABILITIES, TransportCapabilities
 from .exceptions import TransportConnectionError
 from .observation import RegisterObserver
@@ -39,6 +42,9 @@ if TYPE_CHECKING:
 
     from pylxpweb.devices.inverters._features import InverterFamily
 
+    from .bus_arbiter import RS485BusArbiter
+    from .gap_map import GapSafetyMap
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -67,6 +73,9 @@ class ModbusSerialTransport(BaseModbusTransport):
     Running multiple clients causes communication errors and data corruption.
 
     Ensure only ONE integration/script connects to each serial port at a time.
+    Transports of this library sharing one bus (e.g. the inverter and the
+    battery chain on one adapter) must share an
+    :class:`~pylxpweb.transports.bus_arbiter.RS485BusArbiter`.
 
     Example:
         transport = ModbusSerialTransport(
@@ -103,6 +112,10 @@ class ModbusSerialTransport(BaseModbusTransport):
         pymodbus_retries: int = 3,
         max_input_block_size: int = DEFAULT_INPUT_BLOCK_SIZE,
         register_observer: RegisterObserver | None = None,
+        bus: RS485BusArbiter | None = None,
+        bus_priority: int = BUS_PRIORITY_INVERTER,
+        input_refresh_intervals: Mapping[str, float] | None = None,
+        gap_map: GapSafetyMap | None = None,
     ) -> None:
         """Initialize Modbus serial transport.
 
@@ -137,6 +150,18 @@ class ModbusSerialTransport(BaseModbusTransport):
                 reads; hardware that rejects large reads automatically falls
                 back to the plain grouped reads (eg4_web_monitor#254).
             register_observer: Optional callback for terminal raw-register segments.
+            bus: Optional arbiter for an RS485 bus shared with other
+                transports; each request then waits its turn on the bus.
+            bus_priority: Queue priority on ``bus``, lower first (default
+                ``BUS_PRIORITY_INVERTER``).
+            input_refresh_intervals: Optional minimum seconds between reads
+                per input register group (see
+                :func:`~pylxpweb.transports._register_data.validate_input_refresh_intervals`).
+            gap_map: Optional learned map of register gaps that are safe to
+                bridge, shared across transports (see
+                :class:`~pylxpweb.transports.gap_map.GapSafetyMap`).  With
+                coalescing enabled, input reads then bridge known-safe gaps
+                and probe unknown ones to use fewer transactions.
         """
         super().__init__(
             serial,
@@ -149,6 +174,8 @@ class ModbusSerialTransport(BaseModbusTransport):
             pymodbus_retries=pymodbus_retries,
             max_input_block_size=max_input_block_size,
             register_observer=register_observer,
+            input_refresh_intervals=input_refresh_intervals,
+            gap_map=gap_map,
         )
         self._port = port
         self._baudrate = baudrate
@@ -157,6 +184,8 @@ class ModbusSerialTransport(BaseModbusTransport):
         self._stopbits = stopbits
         # Narrow type for serial client
         self._client: AsyncModbusSerialClient | None = None
+        self._bus = bus
+        self._bus_priority = bus_priority
 
     @property
     def capabilities(self) -> TransportCapabilities:
@@ -173,6 +202,20 @@ class ModbusSerialTransport(BaseModbusTransport):
         """Get the serial baud rate."""
         return self._baudrate
 
+    @property
+    def bus(self) -> RS485BusArbiter | None:
+        """Get the shared RS485 bus arbiter, if any."""
+        return self._bus
+
+    @contextlib.asynccontextmanager
+    async def _bus_slot(self) -> AsyncIterator[None]:
+        """Wait for this transport's turn on a shared RS485 bus."""
+        if self._bus is None:
+            yield
+            return
+        async with self._bus.transaction(self._serial or self._port, self._bus_priority):
+            yield
+
     async def connect(self) -> None:
         """Establish Modbus RTU serial connection.
 
@@ -0,0 +1,123 @@
+"""Passive register cache fed by frames another client requested.
+
+The WiFi dongle serves the cloud and local TCP clients together, and every
+connected client sees every inverter reply - including the register blocks
+the cloud polls on its own schedule.  ``DongleTransport`` normally drops those
+frames as unsolicited.  In passive mode it decodes them into a
+``PassiveRegisterCache`` instead, so a later local read of the same block can
+be answered without another transaction on the shared link.
+
+Entries are kept per inverter serial and per register, each stamped with the
+monotonic time it was seen, so a lookup succeeds only when every requested
+register was seen within the cache's freshness window.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+# register address -> (value, monotonic time it was seen)
+_RegisterTable = dict[int, tuple[int, float]]
+
+
+class PassiveRegisterCache:
+    """Per-serial, timestamped register values harvested from the wire.
+
+    Example:
+        >>> cache = PassiveRegisterCache(max_age=10.0)
+        >>> cache.store("CE12345678", 0x04, 0, [230, 231])
+        >>> cache.lookup("CE12345678", 0x04, 0, 2)
+        [230, 231]
+    """
+
+    def __init__(
+        self,
+        max_age: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_age: Seconds a harvested register stays fresh
+            clock: Monotonic time source (injectable for tests)
+
+        Raises:
+            ValueError: If ``max_age`` is not positive
+        """
+        if max_age <= 0:
+            raise ValueError(f"max_age must be positive, got {max_age}")
+        self.max_age = max_age
+        self._clock = clock
+        self._tables: dict[tuple[str, int], _RegisterTable] = {}
+        self._blocks_stored = 0
+        self._hits = 0
+        self._misses = 0
+
+    def store(self, serial: str, function: int, start: int, values: list[int]) -> None:
+        """Record a contiguous register block seen for ``serial``.
+
+        Args:
+            serial: Inverter serial the block belongs to
+            function: Modbus read function (0x03 holding, 0x04 input)
+            start: First register address of the block
+            values: Register values in address order
+        """
+        now = self._clock()
+        table = self._tables.setdefault((serial, function), {})
+        for offset, value in enumerate(values):
+            table[start + offset] = (value, now)
+        self._blocks_stored += 1
+
+    def lookup(self, serial: str, function: int, start: int, count: int) -> list[int] | None:
+        """Return the block if every register in it is still fresh.
+
+        Args:
+            serial: Inverter serial
+            function: Modbus read function (0x03 holding, 0x04 input)
+            start: First register address
+            count: Number of registers
+
+        Returns:
+            Register values in address order, or None on any missing or
+            stale register
+        """
+        table = self._tables.get((serial, function))
+        if table is not None:
+            cutoff = self._clock() - self.max_age
+            values: list[int] = []
+            for address in range(start, start + count):
+                entry = table.get(address)
+                if entry is None or entry[1] < cutoff:
+                    break
+                values.append(entry[0])
+            else:
+                self._hits += 1
+                return values
+        self._misses += 1
+        return None
+
+    def clear(self, serial: str | None = None) -> None:
+        """Forget harvested registers for ``serial`` (all serials if None)."""
+        if serial is None:
+            self._tables.clear()
+            return
+        for key in [key for key in self._tables if key[0] == serial]:
+            del self._tables[key]
+
+    def stats(self) -> dict[str, int]:
+        """Return harvest and lookup counters.
+
+        Returns:
+            dict with:
+                - blocks_stored: Register blocks harvested
+                - registers: Registers currently held (fresh or stale)
+                - hits / misses: Lookups answered / not answered
+        """
+        return {
+            "blocks_stored": self._blocks_stored,
+            "registers": sum(len(table) for table in self._tables.values()),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
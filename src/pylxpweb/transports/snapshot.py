@@ -0,0 +1,306 @@
+"""Array-backed register snapshots for the local read path.
+
+A poll cycle reads a handful of contiguous register blocks.  Keeping them
+as ``dict[int, int]`` costs one dict slot plus one int object per register,
+built one insertion at a time, and comparing or storing two polls means
+walking every key.
+
+:class:`RegisterSnapshot` keeps the same data as a single ``array('H')``
+spanning the read window, plus a one-byte-per-address presence map
+recording which addresses were actually read.  It is a read-only
+``Mapping[int, int]``, so ``read_raw()``, the decode plans and every
+``.get()``/``in`` caller work unchanged, while:
+
+- lookups are an offset computation and two buffer indexes;
+- :meth:`RegisterSnapshot.view` slices a block without copying;
+- :meth:`RegisterSnapshot.diff` short-circuits unchanged polls with two
+  buffer comparisons;
+- :meth:`RegisterSnapshot.to_bytes` serializes the present segments as-is.
+
+A snapshot covers one register window (a poll's input registers, the
+battery block), so the gaps it spans are small.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from functools import cache
+from itertools import compress
+from typing import Any
+
+from .observation import RegisterSegment
+
+_SEGMENT_HEADER = struct.Struct("<HH")
+_SWAP_BYTES = sys.byteorder != "little"
+
+
+class RegisterSnapshot(Mapping[int, int]):
+    """Immutable register map backed by a word array and a presence map.
+
+    Build one from ``(start, words)`` blocks in read order (a later block
+    overwrites the addresses it overlaps, like successive dict updates),
+    or from existing :class:`RegisterSegment` objects with
+    :meth:`from_segments`.
+
+    Example:
+        snapshot = RegisterSnapshot([(0, block_a), (40, block_b)])
+        soc = snapshot.get(5)
+        window = snapshot.view(0, 40)  # memoryview, no copy
+    """
+
+    __slots__ = ("_base", "_words", "_present", "_count")
+
+    def __init__(self, blocks: Iterable[tuple[int, Sequence[int]]] = ()) -> None:
+        """Initialize the snapshot.
+
+        Args:
+            blocks: ``(start_address, words)`` pairs of raw 16-bit values.
+
+        Raises:
+            ValueError: If a word does not fit in 16 bits.
+        """
+        pending = [(start, words) for start, words in blocks if len(words)]
+        if not pending:
+            self._base = 0
+            self._words = array("H")
+            self._present = bytearray()
+            self._count = 0
+            return
+
+        base = min(start for start, _ in pending)
+        span = max(start + len(words) for start, words in pending) - base
+        words_array = array("H", bytes(2 * span))
+        present = bytearray(span)
+        for start, words in pending:
+            offset = start - base
+            count = len(words)
+            if isinstance(words, (array, memoryview)):
+                memoryview(words_array)[offset : offset + count] = words
+            else:
+                try:
+                    _words_struct(count).pack_into(words_array, 2 * offset, *words)
+                except struct.error as err:
+                    raise ValueError(f"Register block at {start} is not 16-bit: {err}") from err
+            present[offset : offset + count] = b"\x01" * count
+
+        self._base = base
+        self._words = words_array
+        self._present = present
+        self._count = span if len(pending) == 1 else span - present.count(0)
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[RegisterSegment]) -> RegisterSnapshot:
+        """Build a snapshot from observed register segments."""
+        return cls((segment.start_address, segment.words) for segment in segments)
+
+    @classmethod
+    def from_registers(cls, registers: Mapping[int, int]) -> RegisterSnapshot:
+        """Build a snapshot from an address-to-value mapping."""
+        if isinstance(registers, RegisterSnapshot):
+            return registers
+        return cls(_runs(sorted(registers.items())))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> RegisterSnapshot:
+        """Rebuild a snapshot serialized by :meth:`to_bytes`.
+
+        Raises:
+            ValueError: If ``data`` is truncated or malformed.
+        """
+        blocks: list[tuple[int, Sequence[int]]] = []
+        position = 0
+        try:
+            while position < len(data):
+                start, count = _SEGMENT_HEADER.unpack_from(data, position)
+                position += _SEGMENT_HEADER.size
+                words = array("H")
+                words.frombytes(data[position : position + 2 * count])
+                if len(words) != count:
+                    raise ValueError("Malformed register snapshot: truncated segment")
+                position += 2 * count
+                if _SWAP_BYTES:
+                    words.byteswap()
+                blocks.append((start, words))
+        except struct.error as err:
+            raise ValueError(f"Malformed register snapshot: {err}") from err
+        return cls(blocks)
+
+    # ------------------------------------------------------------------
+    # Mapping interface
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, address: int) -> int:
+        index = address - self._base
+        if 0 <= index < len(self._present) and self._present[index]:
+            return self._words[index]
+        raise KeyError(address)
+
+    def get(self, address: int, default: Any = None) -> Any:
+        """Return the value at ``address``, or ``default`` if it was not read."""
+        index = address - self._base
+        if 0 <= index < len(self._present) and self._present[index]:
+            return self._words[index]
+        return default
+
+    def __contains__(self, address: object) -> bool:
+        if not isinstance(address, int):
+            return False
+        index = address - self._base
+        return 0 <= index < len(self._present) and bool(self._present[index])
+
+    def __iter__(self) -> Iterator[int]:
+        return compress(range(self._base, self._base + len(self._present)), self._present)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RegisterSnapshot):
+            return (
+                self._base == other._base
+                and self._present == other._present
+                and self._words == other._words
+            )
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __or__(self, other: Mapping[int, int]) -> RegisterSnapshot:
+        """Merge ``other`` over this snapshot, like ``dict | dict``."""
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        if not other:
+            return self
+        return RegisterSnapshot([*self.blocks(), *RegisterSnapshot.from_registers(other).blocks()])
+
+    def __ror__(self, other: Mapping[int, int]) -> RegisterSnapshot:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return RegisterSnapshot([*RegisterSnapshot.from_registers(other).blocks(), *self.blocks()])
+
+    def __repr__(self) -> str:
+        """Return the layout without exposing raw register words."""
+        return (
+            f"{type(self).__name__}(registers={self._count}, "
+            f"segments={sum(1 for _ in self._runs())}, words=<redacted>)"
+        )
+
+    # ------------------------------------------------------------------
+    # Segments, slicing and comparison
+    # ------------------------------------------------------------------
+
+    @property
+    def base_address(self) -> int:
+        """Lowest register address in the snapshot (0 when empty)."""
+        return self._base
+
+    def layout(self) -> tuple[int, memoryview, memoryview]:
+        """Return ``(base_address, words, presence)`` for bulk decoders.
+
+        Both are read-only views of the snapshot's buffers, so nothing is
+        copied: ``words[i]`` holds register ``base_address + i``, valid only
+        where ``presence[i]`` is non-zero.  Lets decoders index the buffers
+        directly instead of calling :meth:`get` per register.
+        """
+        return (
+            self._base,
+            memoryview(self._words).toreadonly(),
+            memoryview(self._present).toreadonly(),
+        )
+
+    def view(self, start: int, count: int) -> memoryview:
+        """Return registers ``start``..``start + count - 1`` without copying.
+
+        Raises:
+            KeyError: If any address in the range was not read.
+        """
+        index = start - self._base
+        end = index + count
+        if (
+            count < 0
+            or index < 0
+            or end > len(self._present)
+            or self._present.find(0, index, end) != -1
+        ):
+            raise KeyError(f"registers {start}-{start + count - 1} not fully present")
+        return memoryview(self._words)[index:end].toreadonly()
+
+    def blocks(self) -> Iterator[tuple[int, memoryview]]:
+        """Yield ``(start_address, words)`` per contiguous run, without copying."""
+        words = memoryview(self._words).toreadonly()
+        for index, end in self._runs():
+            yield self._base + index, words[index:end]
+
+    def segments(self) -> tuple[RegisterSegment, ...]:
+        """Return the contiguous runs as observation segments."""
+        return tuple(
+            RegisterSegment(self._base + index, tuple(self._words[index:end]))
+            for index, end in self._runs()
+        )
+
+    def diff(self, previous: Mapping[int, int]) -> dict[int, int | None]:
+        """Return the registers that differ from ``previous``.
+
+        Args:
+            previous: Earlier snapshot (or mapping) of the same registers.
+
+        Returns:
+            Dict mapping each changed address to its value in this snapshot,
+            or ``None`` for addresses present only in ``previous``.  Empty
+            when nothing changed.
+        """
+        if self == previous:
+            return {}
+        changes: dict[int, int | None] = {
+            address: value for address, value in self.items() if previous.get(address) != value
+        }
+        for address in previous:
+            if address not in self:
+                changes[address] = None
+        return changes
+
+    def to_bytes(self) -> bytes:
+        """Serialize the present segments (little-endian, headers per run)."""
+        parts: list[bytes] = []
+        for index, end in self._runs():
+            parts.append(_SEGMENT_HEADER.pack(self._base + index, end - index))
+            words = self._words[index:end]
+            if _SWAP_BYTES:
+                words.byteswap()
+            parts.append(words.tobytes())
+        return b"".join(parts)
+
+    def _runs(self) -> Iterator[tuple[int, int]]:
+        """Yield ``(index, end)`` buffer bounds of each contiguous run."""
+        present = self._present
+        index = present.find(1)
+        while index != -1:
+            end = present.find(0, index)
+            if end == -1:
+                end = len(present)
+            yield index, end
+            index = present.find(1, end)
+
+
+@cache
+def _words_struct(count: int) -> struct.Struct:
+    """Native-order struct packing ``count`` 16-bit words."""
+    return struct.Struct(f"={count}H")
+
+
+def _runs(items: Sequence[tuple[int, int]]) -> list[tuple[int, list[int]]]:
+    """Group sorted ``(address, value)`` pairs into contiguous blocks."""
+    blocks: list[tuple[int, list[int]]] = []
+    expected = -1
+    for address, value in items:
+        if address != expected:
+            blocks.append((address, []))
+        blocks[-1][1].append(value)
+        expected = address + 1
+    return blocks
+
+
+__all__ = ["RegisterSnapshot"]
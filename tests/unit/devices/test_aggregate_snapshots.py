@@ -0,0 +1,183 @@
+"""Aggregate snapshots memoized per member refresh generation.
+
+``ParallelGroup`` and ``BatteryBank`` build their aggregate properties in one
+pass and reuse the result until a member device refreshes.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from pylxpweb import LuxpowerClient
+from pylxpweb.devices.battery import Battery
+from pylxpweb.devices.battery_bank import BatteryBank
+from pylxpweb.devices.inverters.generic import GenericInverter
+from pylxpweb.devices.parallel_group import ParallelGroup
+from pylxpweb.models import BatteryInfo, BatteryModule
+from pylxpweb.transports.data import InverterRuntimeData
+
+
+@pytest.fixture
+def mock_client() -> LuxpowerClient:
+    """Create a mock client for testing."""
+    client = Mock(spec=LuxpowerClient)
+    client.api = Mock()
+    return client
+
+
+def _inverter(pv: int, charge: int = 0, current: float = 100.0) -> Mock:
+    inverter = Mock()
+    inverter.refresh_generation = 0
+    inverter.pv_total_power = pv
+    inverter.inverter_power = pv
+    inverter.eps_power = 0
+    inverter.power_to_user = 200
+    inverter.power_to_grid = 0
+    bank = inverter.battery_bank
+    bank.charge_power = charge
+    bank.discharge_power = 0
+    bank.battery_power = -charge
+    bank.max_capacity = 280
+    bank.current_capacity = current
+    bank.voltage = 53.0
+    bank.battery_count = 2
+    return inverter
+
+
+def _group(mock_client: LuxpowerClient, inverters: list[Mock]) -> ParallelGroup:
+    group = ParallelGroup(
+        client=mock_client, station=Mock(), name="A", first_device_serial="1234567890"
+    )
+    group.inverters = inverters
+    return group
+
+
+def _battery(mock_client: LuxpowerClient, soc: int, key: str = "bat") -> Battery:
+    module = BatteryModule.model_construct(
+        batteryKey=key,
+        batterySn=key,
+        batIndex=0,
+        lost=False,
+        totalVoltage=5394,
+        current=100,
+        soc=soc,
+        soh=100,
+        currentRemainCapacity=100,
+        currentFullCapacity=200,
+        batMaxCellTemp=350,
+        batMinCellTemp=340,
+        batMaxCellVoltage=3400,
+        batMinCellVoltage=3350,
+        cycleCnt=50,
+        fwVersionText="1.0",
+    )
+    return Battery(client=mock_client, battery_data=module)
+
+
+class TestRefreshGeneration:
+    def test_setting_last_refresh_bumps_generation(self, mock_client: LuxpowerClient) -> None:
+        battery = _battery(mock_client, 80)
+
+        assert battery.refresh_generation == 0
+        assert battery._last_refresh is None
+
+        now = datetime.now()
+        battery._last_refresh = now
+
+        assert battery.refresh_generation == 1
+        assert battery._last_refresh == now
+
+    def test_battery_data_update_bumps_generation(self, mock_client: LuxpowerClient) -> None:
+        battery = _battery(mock_client, 80)
+
+        battery.data = _battery(mock_client, 70).data
+
+        assert battery.refresh_generation == 1
+
+
+class TestParallelGroupSnapshot:
+    def test_reused_until_member_refreshes(self, mock_client: LuxpowerClient) -> None:
+        first, second = _inverter(1000, charge=300), _inverter(2000)
+        group = _group(mock_client, [first, second])
+
+        assert group.pv_total_power == 3000
+        assert group.load_power == 3000 - 300 + 400
+        assert group.battery_soc == pytest.approx(35.7)
+
+        # Stale member data is not re-read until the member refreshes
+        first.pv_total_power = 5000
+        first.battery_bank.current_capacity = 280.0
+        assert group.pv_total_power == 3000
+        assert group.battery_soc == pytest.approx(35.7)
+
+        first.refresh_generation += 1
+        assert group.pv_total_power == 7000
+        assert group.battery_soc == pytest.approx(67.9)
+
+    def test_membership_change_invalidates(self, mock_client: LuxpowerClient) -> None:
+        group = _group(mock_client, [_inverter(1000)])
+
+        assert group.battery_count == 2
+
+        group.inverters.append(_inverter(500))
+
+        assert group.battery_count == 4
+        assert group.pv_total_power == 1500
+
+    def test_transport_detach_invalidates(self, mock_client: LuxpowerClient) -> None:
+        inverter = GenericInverter(client=mock_client, serial_number="1234567890", model="18KPV")
+        inverter._transport_runtime = InverterRuntimeData(pv_total_power=1500.0)
+        group = _group(mock_client, [inverter])
+
+        assert group.pv_total_power == 1500
+
+        inverter._on_local_transport_detached()
+
+        assert inverter.pv_total_power is None
+        assert group.pv_total_power == 0
+
+    def test_link_down_invalidates(self, mock_client: LuxpowerClient) -> None:
+        inverter = GenericInverter(client=mock_client, serial_number="1234567890", model="18KPV")
+        inverter._transport_runtime = InverterRuntimeData(pv_total_power=1500.0)
+        group = _group(mock_client, [inverter])
+
+        assert group.pv_total_power == 1500
+
+        inverter._on_transport_link_down()
+
+        assert group.pv_total_power == 0
+
+    def test_snapshot_is_immutable(self, mock_client: LuxpowerClient) -> None:
+        group = _group(mock_client, [_inverter(1000)])
+
+        snapshot = group._power()
+
+        assert group._power() is snapshot
+        with pytest.raises(AttributeError):
+            snapshot.pv_total_power = 0  # type: ignore[misc]
+
+
+class TestBatteryBankSnapshot:
+    def test_recomputed_after_battery_data_update(self, mock_client: LuxpowerClient) -> None:
+        bank = BatteryBank(
+            client=mock_client,
+            inverter_serial="1234567890",
+            battery_info=BatteryInfo.model_construct(batteryArray=[]),
+        )
+        low, high = _battery(mock_client, 80, "a"), _battery(mock_client, 90, "b")
+        bank.batteries = [low, high]
+
+        assert bank.soc_delta == 10
+        assert bank._aggregates() is bank._aggregates()
+
+        low.data = _battery(mock_client, 60, "a").data
+
+        assert bank.soc_delta == 30
+
+        bank.batteries = [high]
+
+        assert bank.soc_delta is None
+        assert bank.min_soh == 100
@@ -0,0 +1,105 @@
+"""One-pass sensor snapshots (``snapshot()``) on inverters and MID devices."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from pylxpweb.devices.inverters._runtime_properties import (
+    _NON_SENSOR_PROPERTIES,
+    InverterRuntimePropertiesMixin,
+)
+from pylxpweb.devices.inverters.generic import GenericInverter
+from pylxpweb.devices.mid_device import MIDDevice
+from pylxpweb.transports.data import InverterRuntimeData, MidboxRuntimeData
+
+
+@pytest.fixture
+def inverter() -> GenericInverter:
+    inverter = GenericInverter(client=MagicMock(), serial_number="1234567890", model="18KPV")
+    inverter._transport_runtime = InverterRuntimeData(
+        pv1_voltage=510.0, pv1_power=1500, pv2_power=1200, battery_voltage=53.9
+    )
+    return inverter
+
+
+@pytest.fixture
+def mid_device() -> MIDDevice:
+    mid = MIDDevice(client=MagicMock(), serial_number="4524850115", model="GridBOSS")
+    mid._transport_runtime = MidboxRuntimeData(grid_l1_power=100.0, grid_l2_power=50.0)
+    return mid
+
+
+class TestInverterSnapshot:
+    def test_matches_properties(self, inverter: GenericInverter) -> None:
+        snapshot = inverter.snapshot()
+
+        assert snapshot["pv1_voltage"] == 510.0
+        assert snapshot["pv_total_power"] == inverter.pv_total_power
+        assert all(snapshot[name] == getattr(inverter, name) for name in snapshot)
+        assert not any(name.startswith("_") for name in snapshot)
+        assert "snapshot" not in snapshot
+
+    def test_excludes_non_sensor_properties(self, inverter: GenericInverter) -> None:
+        snapshot = inverter.snapshot()
+
+        for name in ("firmware_version", "power_rating_text", "is_lost", "has_runtime_data"):
+            assert name not in snapshot
+        assert "status" in snapshot
+
+    def test_read_only(self, inverter: GenericInverter) -> None:
+        with pytest.raises(TypeError):
+            inverter.snapshot()["pv1_power"] = 0  # type: ignore[index]
+
+    def test_cached_until_refresh(self, inverter: GenericInverter) -> None:
+        first = inverter.snapshot()
+
+        assert inverter.snapshot() is first
+
+        inverter._last_refresh = datetime.now()
+
+        assert inverter.snapshot() is not first
+
+    def test_new_runtime_object_invalidates(self, inverter: GenericInverter) -> None:
+        inverter.snapshot()
+
+        inverter._transport_runtime = InverterRuntimeData(pv1_power=300)
+
+        assert inverter.snapshot()["pv1_power"] == 300
+
+    def test_subclass_override_wins(self) -> None:
+        class _Capped(GenericInverter):
+            @property
+            def pv1_power(self) -> int | None:
+                return 42
+
+        capped = _Capped(client=MagicMock(), serial_number="1234567890", model="18KPV")
+
+        assert capped.snapshot()["pv1_power"] == 42
+        assert list(capped.snapshot()) == [
+            name
+            for name, attr in vars(InverterRuntimePropertiesMixin).items()
+            if isinstance(attr, property)
+            and not name.startswith("_")
+            and name not in _NON_SENSOR_PROPERTIES
+        ]
+
+
+class TestMIDSnapshot:
+    def test_matches_properties(self, mid_device: MIDDevice) -> None:
+        snapshot = mid_device.snapshot()
+
+        assert snapshot["grid_power"] == 150.0
+        assert all(snapshot[name] == getattr(mid_device, name) for name in snapshot)
+        assert "firmware_version" not in snapshot and "has_data" not in snapshot
+
+    def test_cached_until_refresh(self, mid_device: MIDDevice) -> None:
+        first = mid_device.snapshot()
+
+        assert mid_device.snapshot() is first
+
+        mid_device._last_refresh = datetime.now()
+
+        assert mid_device.snapshot() is not first
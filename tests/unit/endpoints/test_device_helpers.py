@@ -7,7 +7,9 @@ from unittest.mock import AsyncMock, Mock
 import pytest
 
 from pylxpweb import LuxpowerClient
-from pylxpweb.models import BatteryInfo, InverterOverviewResponse, InverterRuntime
+from pylxpweb.endpoints.devices import DeviceEndpoints
+from pylxpweb.exceptions import LuxpowerConnectionError
+from pylxpweb.models import BatteryInfo, EnergyInfo, InverterOverviewResponse, InverterRuntime
 
 
 class TestBulkDeviceData:
@@ -233,8 +235,106 @@ class TestBulkDeviceData:
         # Call get_all_device_data
         await devices_endpoint.get_all_device_data(12345)
 
-        # Both sequential gather groups must fan out over both devices.
+        # Both request groups must fan out over both devices.
         assert peak_in_flight == {"runtime": 2, "battery": 2}
 
         # Verify all 4 calls were made (2 runtime + 2 battery)
         assert len(calls) == 4
+
+
+class TestRuntimeBatch:
+    """Test batched multi-inverter runtime fetches."""
+
+    @staticmethod
+    def _endpoint() -> DeviceEndpoints:
+        return DeviceEndpoints(Mock(spec=LuxpowerClient))
+
+    @pytest.mark.asyncio
+    async def test_runtime_and_battery_run_together(self) -> None:
+        """All requests of the batch overlap instead of running group by group."""
+        import asyncio
+
+        devices_endpoint = self._endpoint()
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def fetch(serial: str) -> Mock:
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Mock(serialNum=serial)
+
+        devices_endpoint.get_inverter_runtime = AsyncMock(side_effect=fetch)
+        devices_endpoint.get_battery_info = AsyncMock(side_effect=fetch)
+
+        result = await devices_endpoint.get_runtime_batch(["1111111111", "2222222222"])
+
+        assert peak_in_flight == 4
+        assert list(result) == ["1111111111", "2222222222"]
+        assert all(r.ok and r.runtime and r.battery for r in result.values())
+        assert result["1111111111"].energy is None
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        """No more than max_concurrency requests are in flight at once."""
+        import asyncio
+
+        devices_endpoint = self._endpoint()
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def fetch(serial: str) -> Mock:
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Mock(spec=InverterRuntime)
+
+        devices_endpoint.get_inverter_runtime = AsyncMock(side_effect=fetch)
+        serials = [f"{n:010d}" for n in range(20)]
+
+        result = await devices_endpoint.get_runtime_batch(
+            serials, include=("runtime",), max_concurrency=3
+        )
+
+        assert peak_in_flight == 3
+        assert len(result) == 20
+
+    @pytest.mark.asyncio
+    async def test_partial_failures_are_reported(self) -> None:
+        """A failing part is recorded per serial without failing the batch."""
+        devices_endpoint = self._endpoint()
+        offline = LuxpowerConnectionError("Device offline")
+
+        async def runtime(serial: str) -> Mock:
+            if serial == "2222222222":
+                raise offline
+            return Mock(spec=InverterRuntime)
+
+        devices_endpoint.get_inverter_runtime = AsyncMock(side_effect=runtime)
+        devices_endpoint.get_inverter_energy = AsyncMock(return_value=Mock(spec=EnergyInfo))
+
+        result = await devices_endpoint.get_runtime_batch(
+            ["1111111111", "2222222222", "1111111111"], include=("runtime", "energy")
+        )
+
+        assert len(result) == 2
+        assert result["1111111111"].ok
+        failed = result["2222222222"]
+        assert not failed.ok
+        assert failed.runtime is None
+        assert failed.energy is not None
+        assert failed.errors == {"runtime": offline}
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments(self) -> None:
+        """Unknown parts and a non-positive concurrency are rejected."""
+        devices_endpoint = self._endpoint()
+
+        with pytest.raises(ValueError, match="Unknown runtime batch parts"):
+            await devices_endpoint.get_runtime_batch(["1111111111"], include=("midbox",))  # type: ignore[list-item]
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await devices_endpoint.get_runtime_batch(["1111111111"], max_concurrency=0)
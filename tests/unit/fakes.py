@@ -0,0 +1,13 @@
+"""Shared fakes for unit tests."""
+
+from __future__ import annotations
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
@@ -0,0 +1,202 @@
+"""Tests for boundary-driven cache invalidation.
+
+Daily energy totals reset at local midnight, so day-scoped cache classes are
+dropped on the first request after the local date changes. Every other cache
+class (discovery, parameters, runtime) expires only by its own TTL; hour
+changes no longer wipe the cache.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, tzinfo
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pylxpweb.client import LuxpowerClient
+
+
+@pytest.fixture
+def mock_session():
+    """Create a mock aiohttp session."""
+    session = MagicMock()
+    session.closed = False
+    return session
+
+
+@pytest.fixture
+def client(mock_session):
+    """Create a client with mocked session."""
+    return LuxpowerClient(
+        username="test_user",
+        password="test_pass",
+        session=mock_session,
+    )
+
+
+@pytest.fixture
+def mocked_request(client):
+    """Patch the HTTP layer so _request returns a successful JSON payload."""
+    with patch.object(client, "_get_session", new_callable=AsyncMock) as mock_get_session:
+        mock_get_session.return_value = MagicMock()
+        with patch.object(mock_get_session.return_value, "request") as mock_request:
+            mock_response = AsyncMock()
+            mock_response.raise_for_status = MagicMock()
+            mock_response.json = AsyncMock(return_value={"success": True, "todayYielding": 0})
+            mock_response.status = 200
+            mock_request.return_value.__aenter__.return_value = mock_response
+            yield mock_request
+
+
+def _populate(client: LuxpowerClient) -> None:
+    """Cache one entry per class with TTLs long enough to outlive the test."""
+    client._response_cache.put(
+        "devices:plantId=1", {"rows": []}, ttl=3600.0, cache_class="device_discovery"
+    )
+    client._response_cache.put(
+        "params:count=127&sn=1234567890&start=0",
+        {"valueFrame": ""},
+        ttl=3600.0,
+        cache_class="parameter_read",
+    )
+    client._response_cache.put(
+        "runtime:serialNum=1234567890", {"ppv": 1}, ttl=3600.0, cache_class="inverter_runtime"
+    )
+    client._response_cache.put(
+        "energy:serialNum=1234567890",
+        {"todayYielding": 155},
+        ttl=3600.0,
+        cache_class="inverter_energy",
+    )
+    client._response_cache.put(
+        "parallel_energy:serialNum=1234567890",
+        {"todayYielding": 310},
+        ttl=3600.0,
+        cache_class="inverter_energy",
+    )
+
+
+async def _request_at(client: LuxpowerClient, when: datetime) -> None:
+    with patch("pylxpweb.client.datetime") as mock_dt:
+        mock_dt.now.return_value = when
+        await client._request("POST", "/test", data={})
+
+
+@pytest.mark.asyncio
+async def test_hour_change_keeps_all_entries(client, mocked_request):
+    """Crossing an hour boundary no longer clears the cache."""
+    _populate(client)
+
+    await _request_at(client, datetime(2025, 1, 1, 13, 59, 0))
+    await _request_at(client, datetime(2025, 1, 1, 14, 0, 1))
+
+    assert len(client._response_cache) == 5
+    assert client._last_request_date == date(2025, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_day_change_drops_only_energy_entries(client, mocked_request):
+    """Midnight drops day-scoped energy entries and leaves other classes alone."""
+    _populate(client)
+
+    await _request_at(client, datetime(2025, 1, 1, 23, 58, 0))
+    await _request_at(client, datetime(2025, 1, 2, 0, 1, 0))
+
+    assert client._last_request_date == date(2025, 1, 2)
+    assert sorted(client._response_cache) == [
+        "devices:plantId=1",
+        "params:count=127&sn=1234567890&start=0",
+        "runtime:serialNum=1234567890",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_first_request_sets_date_without_clearing(client, mocked_request):
+    """The first request records the date but has nothing to compare against."""
+    _populate(client)
+    assert client._last_request_date is None
+
+    await _request_at(client, datetime(2025, 1, 1, 0, 0, 5))
+
+    assert client._last_request_date == date(2025, 1, 1)
+    assert len(client._response_cache) == 5
+
+
+@pytest.mark.asyncio
+async def test_long_gap_across_days(client, mocked_request):
+    """A gap spanning several days still drops energy entries once."""
+    _populate(client)
+
+    await _request_at(client, datetime(2025, 1, 1, 22, 30, 0))
+    await _request_at(client, datetime(2025, 1, 4, 2, 15, 0))
+
+    assert "energy:serialNum=1234567890" not in client._response_cache
+    assert "devices:plantId=1" in client._response_cache
+
+
+@pytest.mark.asyncio
+async def test_fresh_energy_fetched_after_midnight(client, mocked_request):
+    """The first energy read after midnight goes to the API, not the cache."""
+    client._response_cache.put(
+        "energy:serialNum=1234567890",
+        {"success": True, "todayYielding": 155},
+        ttl=3600.0,
+        cache_class="inverter_energy",
+    )
+
+    with patch("pylxpweb.client.datetime") as mock_dt:
+        mock_dt.now.return_value = datetime(2025, 1, 1, 23, 58, 0)
+        first = await client._request(
+            "POST",
+            "/WManage/api/inverter/getInverterEnergyInfo",
+            data={},
+            cache_key="energy:serialNum=1234567890",
+            cache_endpoint="inverter_energy",
+        )
+    assert first["todayYielding"] == 155
+
+    with patch("pylxpweb.client.datetime") as mock_dt:
+        mock_dt.now.return_value = datetime(2025, 1, 2, 0, 1, 0)
+        second = await client._request(
+            "POST",
+            "/WManage/api/inverter/getInverterEnergyInfo",
+            data={},
+            cache_key="energy:serialNum=1234567890",
+            cache_endpoint="inverter_energy",
+        )
+    assert second["todayYielding"] == 0
+    assert mocked_request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_manual_clear_keeps_date_tracking(client, mocked_request):
+    """clear_cache() does not reset the tracked local date."""
+    await _request_at(client, datetime(2025, 1, 1, 10, 30, 0))
+    client.clear_cache()
+
+    assert client._last_request_date == date(2025, 1, 1)
+
+
+class TestLocalDate:
+    """The local day follows iana_timezone when configured."""
+
+    def test_uses_configured_timezone(self, mock_session):
+        client = LuxpowerClient(
+            "user", "pass", session=mock_session, iana_timezone="America/Los_Angeles"
+        )
+        utc_now = datetime(2025, 1, 2, 5, 0, 0, tzinfo=UTC)  # 21:00 on Jan 1 in LA
+
+        def fake_now(tz: tzinfo | None = None) -> datetime:
+            return utc_now.astimezone(tz) if tz is not None else utc_now
+
+        with patch("pylxpweb.client.datetime") as mock_dt:
+            mock_dt.now.side_effect = fake_now
+            assert client._local_date() == date(2025, 1, 1)
+
+    def test_invalid_timezone_falls_back_to_system_time(self, mock_session):
+        client = LuxpowerClient("user", "pass", session=mock_session, iana_timezone="Not/AZone")
+
+        with patch("pylxpweb.client.datetime") as mock_dt:
+            mock_dt.now.return_value = datetime(2025, 6, 1, 12, 0, 0)
+            assert client._local_date() == date(2025, 6, 1)
+            mock_dt.now.assert_called_with()
@@ -0,0 +1,239 @@
+"""Tests for per-endpoint, per-device circuit breakers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from pylxpweb.circuit_breaker import CircuitBreakerTable, CircuitState, breaker_key
+from pylxpweb.client import LuxpowerClient
+from pylxpweb.exceptions import (
+    LuxpowerAPIError,
+    LuxpowerCircuitOpenError,
+    LuxpowerConnectionError,
+)
+from tests.unit.fakes import FakeClock
+
+BATTERY = "/WManage/api/battery/getBatteryInfo"
+RUNTIME = "/WManage/api/inverter/getInverterRuntime"
+
+
+def _table(clock: FakeClock, threshold: int = 3) -> CircuitBreakerTable:
+    return CircuitBreakerTable(
+        backoff_config={
+            "base_delay": 1.0,
+            "max_delay": 60.0,
+            "exponential_factor": 2.0,
+            "jitter": 0.0,
+        },
+        failure_threshold=threshold,
+        reset_timeout=30.0,
+        clock=clock,
+    )
+
+
+class _Response:
+    status = 200
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self._payload = payload
+
+    async def __aenter__(self) -> _Response:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        return None
+
+    async def json(self) -> dict[str, Any]:
+        return self._payload
+
+
+class _FleetSession:
+    """Injected session where one serial's battery endpoint always fails."""
+
+    def __init__(self, dead_serial: str) -> None:
+        self.closed = False
+        self.dead_serial = dead_serial
+        self.requests: list[tuple[str, str | None]] = []
+
+    def request(self, method: str, url: str, *, data: Any = None, **kwargs: Any) -> _Response:
+        serial = data.get("serialNum") if data else None
+        self.requests.append((url, serial))
+        if url.endswith(BATTERY) and serial == self.dead_serial:
+            return _Response({"success": False, "msg": "DATAFRAME_TIMEOUT"})
+        return _Response({"success": True, "serialNum": serial})
+
+
+class TestBreakerKey:
+    def test_key_includes_serial_param(self) -> None:
+        assert breaker_key(BATTERY, {"serialNum": "123"}) == (BATTERY, "123")
+        assert breaker_key(BATTERY, {"inverterSn": "456"}) == (BATTERY, "456")
+
+    def test_key_without_serial(self) -> None:
+        assert breaker_key("/WManage/api/login", {"account": "user"}) == (
+            "/WManage/api/login",
+            None,
+        )
+        assert breaker_key(RUNTIME, None) == (RUNTIME, None)
+
+
+class TestCircuitBreakerTable:
+    def test_failures_back_off_per_key(self) -> None:
+        table = _table(FakeClock())
+        failing = (BATTERY, "1")
+
+        table.record_failure(failing)
+        table.record_failure(failing)
+
+        assert table.acquire(failing) == 2.0
+        assert table.acquire((BATTERY, "2")) == 0.0
+        assert table.acquire((RUNTIME, "1")) == 0.0
+
+    def test_opens_at_threshold_and_fails_fast(self) -> None:
+        table = _table(FakeClock())
+        key = (BATTERY, "1")
+        for _ in range(3):
+            table.record_failure(key)
+
+        assert table.state(key) is CircuitState.OPEN
+        with pytest.raises(LuxpowerCircuitOpenError):
+            table.acquire(key)
+        assert table.snapshot()[0]["rejections"] == 1
+
+    def test_half_open_allows_single_probe(self) -> None:
+        clock = FakeClock()
+        table = _table(clock)
+        key = (BATTERY, "1")
+        for _ in range(3):
+            table.record_failure(key)
+
+        clock.now += 30.0
+        assert table.acquire(key) == 0.0
+        assert table.state(key) is CircuitState.HALF_OPEN
+        with pytest.raises(LuxpowerCircuitOpenError):
+            table.acquire(key)
+
+    def test_successful_probe_closes(self) -> None:
+        clock = FakeClock()
+        table = _table(clock)
+        key = (BATTERY, "1")
+        for _ in range(3):
+            table.record_failure(key)
+        clock.now += 30.0
+        table.acquire(key)
+
+        table.record_success(key)
+
+        assert table.state(key) is CircuitState.CLOSED
+        assert table.snapshot() == []
+
+    def test_failed_probe_reopens(self) -> None:
+        clock = FakeClock()
+        table = _table(clock)
+        key = (BATTERY, "1")
+        for _ in range(3):
+            table.record_failure(key)
+        clock.now += 30.0
+        table.acquire(key)
+
+        table.record_failure(key)
+
+        assert table.state(key) is CircuitState.OPEN
+        (row,) = table.snapshot()
+        assert row["retry_in"] == 30.0
+        assert row["consecutive_errors"] == 4
+
+    def test_abandoned_probe_is_replaced_after_timeout(self) -> None:
+        clock = FakeClock()
+        table = _table(clock)
+        key = (BATTERY, "1")
+        for _ in range(3):
+            table.record_failure(key)
+        clock.now += 30.0
+        table.acquire(key)
+
+        clock.now += 30.0
+        assert table.acquire(key) == 0.0
+
+    def test_released_probe_frees_slot(self) -> None:
+        clock = FakeClock()
+        table = _table(clock)
+        key = (BATTERY, "1")
+        for _ in range(3):
+            table.record_failure(key)
+        clock.now += 30.0
+        table.acquire(key)
+        probe = table.current_probe(key)
+        assert probe is not None
+
+        table.release_probe(key, probe)
+
+        assert table.acquire(key) == 0.0
+        assert table.state(key) is CircuitState.HALF_OPEN
+
+    def test_rejects_invalid_threshold(self) -> None:
+        with pytest.raises(ValueError):
+            _table(FakeClock(), threshold=0)
+
+
+class TestClientCircuitBreakers:
+    async def test_dead_device_does_not_slow_healthy_devices(self) -> None:
+        session = _FleetSession(dead_serial="DEAD")
+        client = LuxpowerClient(
+            "user",
+            "pass",
+            session=session,  # type: ignore[arg-type]
+            circuit_failure_threshold=2,
+        )
+        client._backoff_config.update({"base_delay": 0.0, "max_delay": 0.0, "jitter": 0.0})
+
+        # Transient retries stop as soon as the circuit opens
+        with pytest.raises(LuxpowerCircuitOpenError):
+            await client._request("POST", BATTERY, data={"serialNum": "DEAD"})
+        assert len(session.requests) == 2
+
+        with pytest.raises(LuxpowerConnectionError):
+            await client._request("POST", BATTERY, data={"serialNum": "DEAD"})
+        assert len(session.requests) == 2
+
+        healthy = await client._request("POST", RUNTIME, data={"serialNum": "DEAD"})
+        other = await client._request("POST", BATTERY, data={"serialNum": "OK"})
+        assert healthy["success"] is True
+        assert other["success"] is True
+
+        (row,) = client.circuit_breaker_states
+        assert row["endpoint"] == BATTERY
+        assert row["serial"] == "DEAD"
+        assert row["state"] == "open"
+
+        client.reset_circuit_breakers()
+        assert client.circuit_breaker_states == []
+
+    async def test_probe_answered_with_api_error_closes_circuit(self) -> None:
+        session = _FleetSession(dead_serial="DEAD")
+        client = LuxpowerClient(
+            "user",
+            "pass",
+            session=session,  # type: ignore[arg-type]
+            circuit_failure_threshold=1,
+        )
+        clock = FakeClock()
+        client._circuit_breakers._clock = clock
+        key = (BATTERY, "DEAD")
+        client._circuit_breakers.record_failure(key)
+        clock.now += client._circuit_breakers.reset_timeout
+
+        def reject(method: str, url: str, **kwargs: Any) -> _Response:
+            return _Response({"success": False, "msg": "Parameter error"})
+
+        session.request = reject  # type: ignore[method-assign]
+
+        with pytest.raises(LuxpowerAPIError, match="Parameter error"):
+            await client._request("POST", BATTERY, data={"serialNum": "DEAD"})
+
+        assert client._circuit_breakers.state(key) is CircuitState.CLOSED
+        assert client.circuit_breaker_states == []
@@ -0,0 +1,112 @@
+"""Tests for the multi-account client pool."""
+
+from __future__ import annotations
+
+import pytest
+from aiohttp.test_utils import TestServer
+
+from pylxpweb import LuxpowerClientPool
+from pylxpweb.exceptions import LuxpowerConnectionError
+
+
+class TestClientPoolAccounts:
+    async def test_accounts_share_connector_but_not_cookies(self) -> None:
+        async with LuxpowerClientPool(max_connections=25) as pool:
+            alice = pool.add_account("alice", "pw")
+            bob = pool.add_account("bob", "pw", iana_timezone="Europe/Berlin")
+
+            alice_session = await alice._get_session()
+            bob_session = await bob._get_session()
+
+            assert alice_session is not bob_session
+            assert alice_session.connector is bob_session.connector
+            assert alice_session.cookie_jar is not bob_session.cookie_jar
+            assert alice_session.connector is not None
+            assert alice_session.connector.limit == 25
+            assert bob.iana_timezone == "Europe/Berlin"
+            assert list(pool) == ["alice", "bob"]
+
+    async def test_rate_budget_is_per_account(self) -> None:
+        async with LuxpowerClientPool(request_rate=2.0, request_burst=4) as pool:
+            default = pool.add_account("alice", "pw")
+            custom = pool.add_account("bob", "pw", request_rate=5.0)
+
+            assert default._request_scheduler is not None
+            assert custom._request_scheduler is not None
+            assert default._request_scheduler is not custom._request_scheduler
+            assert default._request_scheduler.rate == 2.0
+            assert custom._request_scheduler.rate == 5.0
+            assert custom._request_scheduler.burst == 4
+
+    async def test_duplicate_and_injected_session_are_rejected(self) -> None:
+        async with LuxpowerClientPool() as pool:
+            pool.add_account("alice", "pw")
+
+            with pytest.raises(ValueError, match="already in the pool"):
+                pool.add_account("alice", "other")
+            with pytest.raises(ValueError, match="shared connector"):
+                pool.add_account("bob", "pw", session=None)
+
+            pool.add_account("alice", "pw", account="alice-2")
+            assert len(pool) == 2
+
+    async def test_close_closes_sessions_then_connector(self) -> None:
+        pool = LuxpowerClientPool()
+        client = pool.add_account("alice", "pw")
+        session = await client._get_session()
+        connector = session.connector
+        assert connector is not None
+
+        await pool.close()
+
+        assert session.closed
+        assert connector.closed
+        assert len(pool) == 0
+
+    async def test_client_used_after_pool_close_raises_clear_error(self) -> None:
+        pool = LuxpowerClientPool()
+        client = pool.add_account("alice", "pw")
+        await client._get_session()
+
+        await pool.close()
+
+        with pytest.raises(LuxpowerConnectionError, match="LuxpowerClientPool was closed"):
+            await client._get_session()
+        with pytest.raises(LuxpowerConnectionError, match="LuxpowerClientPool was closed"):
+            await client.login()
+
+    async def test_remove_account_keeps_shared_connector_open(self) -> None:
+        async with LuxpowerClientPool() as pool:
+            alice = pool.add_account("alice", "pw")
+            bob = pool.add_account("bob", "pw")
+            alice_session = await alice._get_session()
+            bob_session = await bob._get_session()
+
+            await pool.remove_account("alice")
+
+            assert alice_session.closed
+            assert not bob_session.closed
+            assert bob_session.connector is not None
+            assert not bob_session.connector.closed
+            assert "alice" not in pool
+
+
+class TestClientPoolStats:
+    async def test_per_account_request_stats(self, mock_api_server: TestServer) -> None:
+        base_url = str(mock_api_server.make_url("/")).rstrip("/")
+        async with LuxpowerClientPool(base_url=base_url) as pool:
+            busy = pool.add_account("testuser", "testpass", account="busy")
+            pool.add_account("testuser", "testpass", account="idle")
+
+            await busy.login()
+            await busy.api.devices.get_inverter_runtime("1234567890")
+            await busy.api.devices.get_inverter_runtime("1234567890")
+
+            stats = pool.stats()
+
+        assert set(stats) == {"busy", "idle"}
+        assert stats["busy"]["requests_today"] > 0
+        assert stats["busy"]["cache_hits"] >= 1
+        assert stats["busy"]["open_circuits"] == 0
+        assert stats["idle"]["requests_today"] == 0
+        assert stats["idle"]["cache_entries"] == 0
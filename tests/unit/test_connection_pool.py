@@ -0,0 +1,89 @@
+"""Tests for owned-session connector tuning and connection reuse statistics."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import aiohttp
+from aiohttp.test_utils import TestServer
+
+from pylxpweb.client import LuxpowerClient
+from pylxpweb.constants import (
+    HTTP_DNS_CACHE_TTL_SECONDS,
+    HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+    HTTP_POOL_LIMIT,
+    HTTP_POOL_LIMIT_PER_HOST,
+)
+
+
+class TestConnectorConfiguration:
+    async def test_default_connector_settings(self) -> None:
+        client = LuxpowerClient("user", "pass")
+        try:
+            session = await client._get_session()
+            connector = session.connector
+            assert isinstance(connector, aiohttp.TCPConnector)
+            assert connector.limit == HTTP_POOL_LIMIT
+            assert connector.limit_per_host == HTTP_POOL_LIMIT_PER_HOST
+        finally:
+            await client.close()
+
+    async def test_custom_connector_settings_are_passed_through(self) -> None:
+        client = LuxpowerClient(
+            "user",
+            "pass",
+            pool_limit=20,
+            pool_limit_per_host=4,
+            ttl_dns_cache=60,
+            keepalive_timeout=45.0,
+        )
+        with (
+            patch("pylxpweb.client.aiohttp.TCPConnector") as connector_cls,
+            patch("pylxpweb.client.aiohttp.ClientSession"),
+        ):
+            await client._get_session()
+
+        connector_cls.assert_called_once_with(
+            ssl=True,
+            limit=20,
+            limit_per_host=4,
+            ttl_dns_cache=60,
+            keepalive_timeout=45.0,
+        )
+
+    async def test_defaults_match_constants(self) -> None:
+        client = LuxpowerClient("user", "pass")
+        assert client._connector_config == {
+            "limit": HTTP_POOL_LIMIT,
+            "limit_per_host": HTTP_POOL_LIMIT_PER_HOST,
+            "ttl_dns_cache": HTTP_DNS_CACHE_TTL_SECONDS,
+            "keepalive_timeout": HTTP_KEEPALIVE_TIMEOUT_SECONDS,
+        }
+
+    async def test_injected_session_is_untouched(self) -> None:
+        async with aiohttp.ClientSession() as injected:
+            client = LuxpowerClient("user", "pass", session=injected, pool_limit=1)
+            assert await client._get_session() is injected
+            assert client.api_connections_created == 0
+
+
+class TestConnectionReuseStatistics:
+    async def test_sequential_polls_reuse_one_connection(self, mock_api_server: TestServer) -> None:
+        base_url = str(mock_api_server.make_url("/")).rstrip("/")
+        client = LuxpowerClient("testuser", "testpass", base_url=base_url)
+        try:
+            await client.login()
+            for _ in range(3):
+                client.clear_cache()
+                await client.api.devices.get_inverter_runtime("1234567890")
+
+            assert client.api_connections_created == 1
+            assert client.api_connections_reused >= 3
+            assert client.api_connection_reuse_ratio > 0.5
+            assert client.api_connection_queue_waits == 0
+        finally:
+            await client.close()
+
+    def test_ratio_without_connections(self) -> None:
+        client = LuxpowerClient("user", "pass")
+        assert client.api_connection_reuse_ratio == 0.0
@@ -0,0 +1,235 @@
+"""Tests for single-flight coalescing of concurrent identical API requests."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import aiohttp
+import pytest
+
+from pylxpweb.client import LuxpowerClient
+from pylxpweb.exceptions import LuxpowerConnectionError
+
+
+class _GatedResponse:
+    """Response context that blocks until the owning session releases it."""
+
+    status = 200
+
+    def __init__(self, session: _GatedSession, url: str) -> None:
+        self._session = session
+        self._url = url
+
+    async def __aenter__(self) -> _GatedResponse:
+        await self._session.release.wait()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        return None
+
+    async def json(self) -> dict[str, Any]:
+        return self._session.payload_for(self._url)
+
+
+class _GatedSession:
+    """Injected session that counts requests and holds responses until released."""
+
+    def __init__(self, payload: dict[str, Any] | None = None) -> None:
+        self.closed = False
+        self.release = asyncio.Event()
+        self.requests: list[str] = []
+        self._payload = payload or {"success": True, "value": 1}
+
+    def payload_for(self, url: str) -> dict[str, Any]:
+        return {**self._payload, "url": url}
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: dict[str, Any] | None,
+        headers: dict[str, str],
+    ) -> _GatedResponse:
+        self.requests.append(url)
+        return _GatedResponse(self, url)
+
+
+async def _settle() -> None:
+    """Let scheduled request tasks reach the gated response."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestRequestCoalescing:
+    """Concurrent identical cacheable requests share one HTTP call."""
+
+    async def test_concurrent_identical_requests_share_one_call(self) -> None:
+        session = _GatedSession()
+        client = LuxpowerClient("user", "pass", session=session)  # type: ignore[arg-type]
+
+        calls = [
+            asyncio.create_task(
+                client._request(
+                    "POST",
+                    "/WManage/api/inverter/getInverterRuntime",
+                    data={"serialNum": "1234567890"},
+                    cache_key="runtime:serialNum=1234567890",
+                    cache_endpoint="inverter_runtime",
+                )
+            )
+            for _ in range(5)
+        ]
+        await _settle()
+        assert client.api_requests_in_flight == 1
+
+        session.release.set()
+        results = await asyncio.gather(*calls)
+
+        assert len(session.requests) == 1
+        assert all(result is results[0] for result in results)
+        assert client.api_requests_coalesced == 4
+        assert client.api_requests_in_flight == 0
+
+    async def test_distinct_keys_are_not_coalesced(self) -> None:
+        session = _GatedSession()
+        client = LuxpowerClient("user", "pass", session=session)  # type: ignore[arg-type]
+
+        calls = [
+            asyncio.create_task(
+                client._request(
+                    "POST",
+                    "/WManage/api/inverter/getInverterRuntime",
+                    data={"serialNum": serial},
+                    cache_key=f"runtime:serialNum={serial}",
+                    cache_endpoint="inverter_runtime",
+                )
+            )
+            for serial in ("1111111111", "2222222222")
+        ]
+        await _settle()
+        session.release.set()
+        await asyncio.gather(*calls)
+
+        assert len(session.requests) == 2
+        assert client.api_requests_coalesced == 0
+
+    async def test_uncached_requests_are_not_coalesced(self) -> None:
+        session = _GatedSession()
+        client = LuxpowerClient("user", "pass", session=session)  # type: ignore[arg-type]
+
+        calls = [
+            asyncio.create_task(
+                client._request("POST", "/WManage/web/maintain/remoteSet/write", data={})
+            )
+            for _ in range(3)
+        ]
+        await _settle()
+        session.release.set()
+        await asyncio.gather(*calls)
+
+        assert len(session.requests) == 3
+        assert client.api_requests_coalesced == 0
+
+    async def test_failure_is_shared_by_all_waiters(self) -> None:
+        session = _GatedSession()
+        client = LuxpowerClient("user", "pass", session=session)  # type: ignore[arg-type]
+
+        def fail(method: str, url: str, **kwargs: Any) -> _GatedResponse:
+            session.requests.append(url)
+            raise aiohttp.ClientPayloadError("boom")
+
+        session.request = fail  # type: ignore[method-assign]
+
+        results = await asyncio.gather(
+            *(
+                client._request(
+                    "POST",
+                    "/WManage/api/battery/getBatteryInfo",
+                    data={},
+                    cache_key="battery:serialNum=1234567890",
+                    cache_endpoint="battery_info",
+                )
+                for _ in range(3)
+            ),
+            return_exceptions=True,
+        )
+
+        assert len(session.requests) == 1
+        assert all(isinstance(result, LuxpowerConnectionError) for result in results)
+        assert client.api_requests_in_flight == 0
+
+    async def test_cancelled_caller_does_not_cancel_shared_request(self) -> None:
+        session = _GatedSession()
+        client = LuxpowerClient("user", "pass", session=session)  # type: ignore[arg-type]
+
+        def call() -> asyncio.Task[dict[str, Any]]:
+            return asyncio.create_task(
+                client._request(
+                    "POST",
+                    "/WManage/api/midbox/getMidboxRuntime",
+                    data={},
+                    cache_key="midbox:serialNum=4524850115",
+                    cache_endpoint="midbox_runtime",
+                )
+            )
+
+        first = call()
+        await _settle()
+        second = call()
+        await _settle()
+
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        session.release.set()
+
+        result = await second
+        assert result["success"] is True
+        assert len(session.requests) == 1
+
+    async def test_result_is_cached_after_coalesced_call(self) -> None:
+        session = _GatedSession()
+        session.release.set()
+        client = LuxpowerClient("user", "pass", session=session)  # type: ignore[arg-type]
+
+        for _ in range(2):
+            await client._request(
+                "POST",
+                "/WManage/api/inverter/getInverterRuntime",
+                data={},
+                cache_key="runtime:serialNum=1234567890",
+                cache_endpoint="inverter_runtime",
+            )
+
+        assert len(session.requests) == 1
+        assert client.api_requests_coalesced == 0
+
+
+@pytest.mark.parametrize("count", [2, 12])
+async def test_fleet_poll_issues_one_call_per_device(
+    count: int, runtime_response: dict[str, Any]
+) -> None:
+    """Three consumers polling the same fleet cost one call per device."""
+    session = _GatedSession(runtime_response)
+    client = LuxpowerClient("user", "pass", session=session)  # type: ignore[arg-type]
+    client._ensure_authenticated = _noop  # type: ignore[method-assign]
+    serials = [f"{index:010d}" for index in range(count)]
+
+    async def poll() -> None:
+        await asyncio.gather(*(client.api.devices.get_inverter_runtime(sn) for sn in serials))
+
+    pollers = [asyncio.create_task(poll()) for _ in range(3)]
+    await _settle()
+    session.release.set()
+    await asyncio.gather(*pollers)
+
+    assert len(session.requests) == count
+    assert client.api_requests_coalesced == 2 * count
+
+
+async def _noop() -> None:
+    return None
@@ -0,0 +1,179 @@
+"""Tests for the token-bucket request scheduler and its client integration."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from pylxpweb.client import LuxpowerClient
+from pylxpweb.request_scheduler import RequestPriority, RequestScheduler, request_priority
+
+
+class _Response:
+    status = 200
+
+    async def __aenter__(self) -> _Response:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        return None
+
+    async def json(self) -> dict[str, Any]:
+        return {"success": True}
+
+
+class _RecordingSession:
+    """Injected session that records the order of request URLs."""
+
+    def __init__(self) -> None:
+        self.closed = False
+        self.urls: list[str] = []
+
+    def request(self, method: str, url: str, **kwargs: Any) -> _Response:
+        self.urls.append(url)
+        return _Response()
+
+
+class TestRequestPriority:
+    @pytest.mark.parametrize(
+        ("endpoint", "expected"),
+        [
+            ("/WManage/api/login", RequestPriority.CONTROL),
+            ("/WManage/web/maintain/remoteSet/write", RequestPriority.CONTROL),
+            ("/WManage/web/config/quickCharge/start", RequestPriority.CONTROL),
+            ("/WManage/api/inverter/getInverterRuntime", RequestPriority.RUNTIME),
+            ("/WManage/api/battery/getBatteryInfo", RequestPriority.RUNTIME),
+            ("/WManage/api/midbox/getMidboxRuntime", RequestPriority.RUNTIME),
+            ("/WManage/web/config/quickCharge/getStatusInfo", RequestPriority.NORMAL),
+            ("/WManage/api/inverterOverview/list", RequestPriority.NORMAL),
+            ("/WManage/api/analyze/chart/dayLine", RequestPriority.BACKGROUND),
+            ("/WManage/web/maintain/standardUpdate/checkUpdates", RequestPriority.BACKGROUND),
+            ("/WManage/web/maintain/remoteUpdate/info", RequestPriority.BACKGROUND),
+            ("/WManage/web/maintain/standardUpdate/run", RequestPriority.CONTROL),
+        ],
+    )
+    def test_endpoint_lanes(self, endpoint: str, expected: RequestPriority) -> None:
+        assert request_priority(endpoint) is expected
+
+
+class TestRequestScheduler:
+    @pytest.mark.parametrize(("rate", "burst"), [(0.0, 1), (-1.0, 1), (1.0, 0)])
+    def test_rejects_invalid_settings(self, rate: float, burst: int) -> None:
+        with pytest.raises(ValueError):
+            RequestScheduler(rate=rate, burst=burst)
+
+    async def test_burst_is_granted_without_waiting(self) -> None:
+        scheduler = RequestScheduler(rate=1.0, burst=3)
+
+        waits = [await scheduler.acquire() for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.0]
+        assert scheduler.granted == 3
+        assert scheduler.queued == 0
+
+    async def test_empty_bucket_paces_requests(self) -> None:
+        scheduler = RequestScheduler(rate=50.0, burst=1)
+        await scheduler.acquire()
+
+        waited = await scheduler.acquire()
+
+        assert waited > 0.0
+        assert scheduler.queued == 1
+        assert scheduler.max_wait == waited
+
+    async def test_higher_priority_lanes_are_served_first(self) -> None:
+        scheduler = RequestScheduler(rate=50.0, burst=1)
+        await scheduler.acquire()
+        order: list[RequestPriority] = []
+
+        async def request(priority: RequestPriority) -> None:
+            await scheduler.acquire(priority)
+            order.append(priority)
+
+        tasks = [
+            asyncio.create_task(request(priority))
+            for priority in (
+                RequestPriority.BACKGROUND,
+                RequestPriority.NORMAL,
+                RequestPriority.RUNTIME,
+                RequestPriority.CONTROL,
+            )
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth == 4
+        assert scheduler.queue_depth_by_priority() == {
+            "control": 1,
+            "runtime": 1,
+            "normal": 1,
+            "background": 1,
+        }
+
+        await asyncio.gather(*tasks)
+
+        assert order == [
+            RequestPriority.CONTROL,
+            RequestPriority.RUNTIME,
+            RequestPriority.NORMAL,
+            RequestPriority.BACKGROUND,
+        ]
+        assert scheduler.queue_depth == 0
+
+    async def test_cancelled_waiter_leaves_the_queue(self) -> None:
+        scheduler = RequestScheduler(rate=50.0, burst=1)
+        await scheduler.acquire()
+        cancelled = asyncio.create_task(scheduler.acquire(RequestPriority.CONTROL))
+        waiting = asyncio.create_task(scheduler.acquire(RequestPriority.BACKGROUND))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        await asyncio.gather(cancelled, return_exceptions=True)
+
+        assert scheduler.queue_depth == 1
+        await waiting
+        assert scheduler.granted == 2
+
+
+class TestClientRequestScheduling:
+    async def test_disabled_by_default(self) -> None:
+        client = LuxpowerClient("user", "pass", session=_RecordingSession())  # type: ignore[arg-type]
+
+        await client._request("POST", "/WManage/api/analyze/chart/dayLine")
+
+        assert client.request_scheduler_stats is None
+        assert client.api_request_queue_depth == 0
+
+    async def test_control_write_overtakes_queued_analytics(self) -> None:
+        session = _RecordingSession()
+        client = LuxpowerClient(
+            "user",
+            "pass",
+            session=session,  # type: ignore[arg-type]
+            request_rate=50.0,
+            request_burst=1,
+        )
+        await client._request("POST", "/WManage/api/analyze/chart/dayLine")
+
+        charts = [
+            asyncio.create_task(client._request("POST", "/WManage/api/analyze/energy/dayColumn"))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        write = asyncio.create_task(
+            client._request("POST", "/WManage/web/maintain/remoteSet/write")
+        )
+        await asyncio.sleep(0)
+        assert client.api_request_queue_depth == 3
+
+        await asyncio.gather(*charts, write)
+
+        assert session.urls[1].endswith("/WManage/web/maintain/remoteSet/write")
+        stats = client.request_scheduler_stats
+        assert stats is not None
+        assert stats["granted"] == 4
+        assert stats["queued"] == 3
+        assert stats["total_wait_seconds"] > 0.0
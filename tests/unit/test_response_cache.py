@@ -0,0 +1,179 @@
+"""Unit tests for the bounded LRU API response cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from pylxpweb.client import LuxpowerClient
+from pylxpweb.response_cache import ResponseCache
+from tests.unit.fakes import FakeClock
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+class TestResponseCacheTTL:
+    """Per-entry TTL on a monotonic clock."""
+
+    def test_fresh_entry_is_returned(self, clock: FakeClock) -> None:
+        cache = ResponseCache(clock=clock)
+        cache.put("runtime:serialNum=1", {"soc": 80}, ttl=20.0)
+
+        clock.now += 19.9
+        assert cache.get("runtime:serialNum=1") == {"soc": 80}
+        assert cache.hits == 1
+
+    def test_expired_entry_is_dropped_and_counted(self, clock: FakeClock) -> None:
+        cache = ResponseCache(clock=clock)
+        cache.put("runtime:serialNum=1", {"soc": 80}, ttl=20.0)
+
+        clock.now += 20.0
+        assert cache.get("runtime:serialNum=1") is None
+        assert "runtime:serialNum=1" not in cache
+        assert cache.misses == 1
+        assert cache.expirations == 1
+
+    def test_ttl_is_per_entry(self, clock: FakeClock) -> None:
+        cache = ResponseCache(clock=clock)
+        cache.put("runtime:serialNum=1", {"a": 1}, ttl=20.0)
+        cache.put("devices:plantId=7", {"b": 2}, ttl=900.0)
+
+        clock.now += 60.0
+        assert cache.get("runtime:serialNum=1") is None
+        assert cache.get("devices:plantId=7") == {"b": 2}
+
+    def test_peek_ignores_freshness(self, clock: FakeClock) -> None:
+        cache = ResponseCache(clock=clock)
+        cache.put("midbox:serialNum=9", {"x": 1}, ttl=1.0, cache_class="midbox_runtime")
+
+        clock.now += 5.0
+        entry = cache.peek("midbox:serialNum=9")
+        assert entry is not None
+        assert entry.cache_class == "midbox_runtime"
+        assert entry.age(clock.now) == pytest.approx(5.0)
+        assert not entry.is_fresh(clock.now)
+
+
+class TestResponseCacheBounds:
+    """LRU eviction by entry count and byte size."""
+
+    def test_evicts_least_recently_used_entry(self, clock: FakeClock) -> None:
+        cache = ResponseCache(max_entries=2, clock=clock)
+        cache.put("a:serialNum=1", {"v": 1}, ttl=60.0)
+        cache.put("b:serialNum=2", {"v": 2}, ttl=60.0)
+        cache.get("a:serialNum=1")  # a becomes most recently used
+        cache.put("c:serialNum=3", {"v": 3}, ttl=60.0)
+
+        assert list(cache) == ["a:serialNum=1", "c:serialNum=3"]
+        assert cache.evictions == 1
+        assert cache.invalidate_serial("2") == 0
+
+    def test_byte_bound_evicts_oldest(self, clock: FakeClock) -> None:
+        cache = ResponseCache(max_bytes=40, clock=clock)
+        cache.put("a", {"payload": "x" * 10}, ttl=60.0)
+        cache.put("b", {"payload": "y" * 10}, ttl=60.0)
+
+        assert list(cache) == ["b"]
+        assert cache.total_bytes <= 40
+
+    def test_oversized_single_entry_is_kept(self, clock: FakeClock) -> None:
+        cache = ResponseCache(max_bytes=1, clock=clock)
+        cache.put("big", {"payload": "x" * 100}, ttl=60.0)
+
+        assert cache.get("big") is not None
+
+    def test_replacing_key_updates_size(self, clock: FakeClock) -> None:
+        cache = ResponseCache(clock=clock)
+        cache.put("a", {"payload": "x" * 100}, ttl=60.0)
+        cache.put("a", {}, ttl=60.0)
+
+        assert len(cache) == 1
+        assert cache.total_bytes == 2
+
+    @pytest.mark.parametrize("kwargs", [{"max_entries": 0}, {"max_bytes": 0}])
+    def test_rejects_non_positive_bounds(self, kwargs: dict[str, int]) -> None:
+        with pytest.raises(ValueError):
+            ResponseCache(**kwargs)
+
+
+class TestResponseCacheSerialIndex:
+    """Per-device invalidation through the serial index."""
+
+    def test_invalidate_serial_removes_only_that_device(self) -> None:
+        cache = ResponseCache()
+        cache.put("runtime:serialNum=1234567890", {}, ttl=60.0)
+        cache.put("battery:serialNum=1234567890", {}, ttl=60.0)
+        cache.put("params:count=127&sn=1234567890&start=0", {}, ttl=60.0)
+        cache.put("runtime:serialNum=0987654321", {}, ttl=60.0)
+        cache.put("devices:plantId=12345", {}, ttl=60.0)
+
+        assert cache.invalidate_serial("1234567890") == 3
+        assert list(cache) == ["runtime:serialNum=0987654321", "devices:plantId=12345"]
+
+    def test_serial_prefix_does_not_match(self) -> None:
+        cache = ResponseCache()
+        cache.put("runtime:serialNum=12345678901", {}, ttl=60.0)
+
+        assert cache.invalidate_serial("1234567890") == 0
+        assert len(cache) == 1
+
+    def test_invalidate_class(self) -> None:
+        cache = ResponseCache()
+        cache.put("energy:serialNum=1", {}, ttl=60.0, cache_class="inverter_energy")
+        cache.put("runtime:serialNum=1", {}, ttl=60.0, cache_class="inverter_runtime")
+
+        assert cache.invalidate_class("inverter_energy") == 1
+        assert list(cache) == ["runtime:serialNum=1"]
+        assert cache.invalidate_serial("1") == 1
+
+    def test_clear_resets_index(self) -> None:
+        cache = ResponseCache()
+        cache.put("runtime:serialNum=1", {}, ttl=60.0)
+
+        assert cache.clear() == 1
+        assert cache.invalidate_serial("1") == 0
+        assert cache.total_bytes == 0
+
+
+class TestClientCacheIntegration:
+    """LuxpowerClient cache management uses the bounded cache."""
+
+    def test_client_bounds_are_configurable(self) -> None:
+        client = LuxpowerClient("user", "pass", cache_max_entries=8, cache_max_bytes=4096)
+
+        stats = client.cache_stats
+        assert stats["max_entries"] == 8
+        assert stats["max_bytes"] == 4096
+
+    def test_cache_stats_reports_counters(self) -> None:
+        client = LuxpowerClient("user", "pass")
+        client._cache_response("runtime:serialNum=1", "inverter_runtime", {"soc": 1})
+        client._response_cache.get("runtime:serialNum=1")
+        client._response_cache.get("runtime:serialNum=2")
+
+        stats = client.cache_stats
+        assert stats["total_entries"] == 1
+        assert stats["endpoints"] == {"runtime": 1}
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["evictions"] == 0
+
+    def test_cache_response_uses_endpoint_ttl(self) -> None:
+        client = LuxpowerClient("user", "pass")
+        client._cache_response("devices:plantId=1", "device_discovery", {})
+
+        entry = client._response_cache.peek("devices:plantId=1")
+        assert entry is not None
+        assert entry.ttl == 900.0
+        assert entry.cache_class == "device_discovery"
+
+    def test_invalidate_cache_for_device(self) -> None:
+        client = LuxpowerClient("user", "pass")
+        client._cache_response("runtime:serialNum=1234567890", "inverter_runtime", {})
+        client._cache_response("runtime:serialNum=0987654321", "inverter_runtime", {})
+
+        client.invalidate_cache_for_device("1234567890")
+
+        assert list(client._response_cache) == ["runtime:serialNum=0987654321"]
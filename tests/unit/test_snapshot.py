@@ -0,0 +1,183 @@
+"""Tests for on-disk client snapshots."""
+
+from __future__ import annotations
+
+import json
+import os
+import stat
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from aiohttp.test_utils import TestServer
+from yarl import URL
+
+from pylxpweb import LuxpowerClient
+from pylxpweb.constants import SNAPSHOT_FORMAT_VERSION
+from pylxpweb.snapshot import ClientSnapshot, read_snapshot, write_snapshot
+
+PORTAL = "https://portal.example.com"
+
+
+def _snapshot(**overrides: object) -> ClientSnapshot:
+    fields: dict[str, object] = {
+        "base_url": PORTAL,
+        "username": "user",
+        "saved_at": time.time(),
+        "cookies": {"JSESSIONID": "abc123"},
+        "session_expires": time.time() + 3600,
+        "user_id": 42,
+        "user_role": "VIEWER",
+        "account_level": "owner",
+        "cache": [("devices:plantId=1", "device_discovery", {"success": True})],
+    }
+    fields.update(overrides)
+    return ClientSnapshot(**fields)  # type: ignore[arg-type]
+
+
+class TestSnapshotFormat:
+    def test_round_trip(self) -> None:
+        snapshot = _snapshot()
+        assert ClientSnapshot.from_bytes(snapshot.to_bytes()) == snapshot
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            b"not json",
+            b"[]",
+            json.dumps({"version": SNAPSHOT_FORMAT_VERSION + 1}).encode(),
+            json.dumps({"version": SNAPSHOT_FORMAT_VERSION, "session": {}}).encode(),
+        ],
+    )
+    def test_invalid_payload_is_rejected(self, payload: bytes) -> None:
+        with pytest.raises(ValueError):
+            ClientSnapshot.from_bytes(payload)
+
+    def test_malformed_cache_entry_is_rejected(self) -> None:
+        payload = json.loads(_snapshot().to_bytes())
+        payload["cache"] = [["key", "device_discovery"]]
+        with pytest.raises(ValueError, match="cache entries"):
+            ClientSnapshot.from_bytes(json.dumps(payload).encode())
+
+    def test_write_is_owner_only_and_leaves_no_temp_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "snapshot.json"
+        write_snapshot(path, _snapshot())
+
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        assert [p.name for p in tmp_path.iterdir()] == ["snapshot.json"]
+        assert read_snapshot(path).user_id == 42
+
+
+class TestClientSnapshot:
+    async def test_session_round_trip_without_password(self, tmp_path: Path) -> None:
+        path = tmp_path / "snapshot.json"
+        source = LuxpowerClient("user", "secret-password", base_url=PORTAL)
+        session = await source._get_session()
+        session.cookie_jar.update_cookies({"JSESSIONID": "abc123"}, response_url=URL(PORTAL))
+        source._session_expires = datetime.now() + timedelta(hours=1)
+        source._user_id = 42
+        source._user_role = "INSTALLER"
+        source._account_level = "installer"
+        try:
+            await source.save_snapshot(path)
+        finally:
+            await source.close()
+
+        assert b"secret-password" not in path.read_bytes()
+
+        restored = LuxpowerClient("user", "secret-password", base_url=PORTAL)
+        try:
+            assert await restored.load_snapshot(path) is True
+            cookies = (await restored._get_session()).cookie_jar.filter_cookies(URL(PORTAL))
+            assert cookies["JSESSIONID"].value == "abc123"
+            assert restored._user_id == 42
+            assert restored.is_installer_role
+            assert restored.account_level == "installer"
+            assert restored._session_expires is not None
+        finally:
+            await restored.close()
+
+    async def test_expired_session_is_not_restored(self, tmp_path: Path) -> None:
+        path = tmp_path / "snapshot.json"
+        write_snapshot(path, _snapshot(session_expires=time.time() - 60))
+
+        client = LuxpowerClient("user", "pw", base_url=PORTAL)
+        try:
+            assert await client.load_snapshot(path) is True
+            assert client._session_expires is None
+            assert client._user_id is None
+            assert len(client._response_cache) == 1
+        finally:
+            await client.close()
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"username": "someone-else"},
+            {"base_url": "https://other.example.com"},
+            {"saved_at": time.time() - 2 * 24 * 3600},
+        ],
+    )
+    async def test_foreign_or_old_snapshot_is_ignored(
+        self, tmp_path: Path, overrides: dict[str, object]
+    ) -> None:
+        path = tmp_path / "snapshot.json"
+        write_snapshot(path, _snapshot(**overrides))
+
+        client = LuxpowerClient("user", "pw", base_url=PORTAL)
+        assert await client.load_snapshot(path) is False
+        assert client._session_expires is None
+        assert len(client._response_cache) == 0
+
+    async def test_missing_or_corrupt_file_starts_cold(self, tmp_path: Path) -> None:
+        client = LuxpowerClient("user", "pw", base_url=PORTAL)
+        assert await client.load_snapshot(tmp_path / "missing.json") is False
+
+        corrupt = tmp_path / "corrupt.json"
+        corrupt.write_bytes(b"{truncated")
+        assert await client.load_snapshot(corrupt) is False
+
+    async def test_discovery_served_from_restored_cache(
+        self, mock_api_server: TestServer, tmp_path: Path
+    ) -> None:
+        base_url = str(mock_api_server.make_url("/")).rstrip("/")
+        path = tmp_path / "snapshot.json"
+
+        async with LuxpowerClient(
+            "testuser", "testpass", base_url=base_url, cache_plant_discovery=True
+        ) as cold:
+            plants = await cold.api.plants.get_plants()
+            await cold.api.devices.get_inverter_runtime("1234567890")
+            await cold.save_snapshot(path)
+
+        saved = read_snapshot(path)
+        classes = {cache_class for _, cache_class, _ in saved.cache}
+        assert "plant_discovery" in classes
+        assert "inverter_runtime" not in classes
+
+        warm = LuxpowerClient("testuser", "testpass", base_url=base_url, cache_plant_discovery=True)
+        try:
+            assert await warm.load_snapshot(path) is True
+            warm._session_expires = datetime.now() + timedelta(hours=1)
+
+            assert await warm.api.plants.get_plants() == plants
+            assert warm.api_requests_today == 0
+        finally:
+            await warm.close()
+
+    async def test_plants_uncached_by_default(
+        self, mock_api_server: TestServer, tmp_path: Path
+    ) -> None:
+        base_url = str(mock_api_server.make_url("/")).rstrip("/")
+        path = tmp_path / "snapshot.json"
+
+        async with LuxpowerClient("testuser", "testpass", base_url=base_url) as client:
+            await client.api.plants.get_plants()
+            requests = client.api_requests_today
+            await client.api.plants.get_plants()
+            assert client.api_requests_today == requests + 1
+            await client.save_snapshot(path)
+
+        classes = {cache_class for _, cache_class, _ in read_snapshot(path).cache}
+        assert "plant_discovery" not in classes
@@ -0,0 +1,188 @@
+"""Tests for stale-while-revalidate serving of cached runtime responses."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from pylxpweb.client import LuxpowerClient
+from pylxpweb.response_cache import ResponseCache
+from tests.unit.fakes import FakeClock
+
+RUNTIME_KEY = "runtime:serialNum=1234567890"
+
+
+class _Response:
+    status = 200
+
+    def __init__(self, session: _CountingSession) -> None:
+        self._session = session
+
+    async def __aenter__(self) -> _Response:
+        await self._session.release.wait()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        return None
+
+    async def json(self) -> dict[str, Any]:
+        return {"success": True, "ppv": 2000}
+
+
+class _CountingSession:
+    """Injected session that counts requests and gates their responses."""
+
+    def __init__(self) -> None:
+        self.closed = False
+        self.requests = 0
+        self.release = asyncio.Event()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> _Response:
+        self.requests += 1
+        return _Response(self)
+
+
+def _client(session: _CountingSession, clock: FakeClock, **kwargs: Any) -> LuxpowerClient:
+    client = LuxpowerClient("user", "pass", session=session, **kwargs)  # type: ignore[arg-type]
+    client._response_cache = ResponseCache(clock=clock)
+    client._cache_response(RUNTIME_KEY, "inverter_runtime", {"success": True, "ppv": 1000})
+    clock.now += 25.0  # past the 20 s inverter_runtime TTL
+    return client
+
+
+async def _runtime(client: LuxpowerClient, cache_endpoint: str = "inverter_runtime") -> Any:
+    return await client._request(
+        "POST",
+        "/WManage/api/inverter/getInverterRuntime",
+        data={"serialNum": "1234567890"},
+        cache_key=RUNTIME_KEY,
+        cache_endpoint=cache_endpoint,
+    )
+
+
+async def _drain(client: LuxpowerClient) -> None:
+    await asyncio.gather(*client._inflight_requests.values(), return_exceptions=True)
+
+
+class TestStaleWhileRevalidate:
+    async def test_disabled_by_default_waits_for_fresh_data(self) -> None:
+        session = _CountingSession()
+        session.release.set()
+        client = _client(session, FakeClock())
+
+        result = await _runtime(client)
+
+        assert result["ppv"] == 2000
+        assert session.requests == 1
+
+    async def test_stale_entry_returned_and_refreshed_once(self) -> None:
+        session = _CountingSession()
+        refreshed: list[tuple[str, dict[str, Any]]] = []
+        client = _client(
+            session,
+            FakeClock(),
+            stale_while_revalidate=True,
+            on_cache_refresh=lambda key, data: refreshed.append((key, data)),
+        )
+
+        first = await _runtime(client)
+        second = await _runtime(client)
+
+        assert first["ppv"] == 1000
+        assert second["ppv"] == 1000
+        assert client.api_requests_in_flight == 1
+
+        session.release.set()
+        await _drain(client)
+
+        assert session.requests == 1
+        assert refreshed == [(RUNTIME_KEY, {"success": True, "ppv": 2000})]
+        assert (await _runtime(client))["ppv"] == 2000
+        assert client.cache_stats["stale_hits"] == 2
+
+    async def test_entry_beyond_max_staleness_blocks(self) -> None:
+        session = _CountingSession()
+        session.release.set()
+        clock = FakeClock()
+        client = _client(session, clock, stale_while_revalidate=True, max_staleness=10.0)
+        clock.now += 10.0  # 15 s past TTL
+
+        result = await _runtime(client)
+
+        assert result["ppv"] == 2000
+        assert client.cache_stats["stale_hits"] == 0
+
+    async def test_only_runtime_classes_are_served_stale(self) -> None:
+        session = _CountingSession()
+        session.release.set()
+        clock = FakeClock()
+        client = _client(session, clock, stale_while_revalidate=True)
+        client._cache_response("battery:serialNum=1234567890", "battery_info", {"soc": 1})
+        clock.now += 120.0
+
+        result = await client._request(
+            "POST",
+            "/WManage/api/battery/getBatteryInfo",
+            data={},
+            cache_key="battery:serialNum=1234567890",
+            cache_endpoint="battery_info",
+        )
+
+        assert result["ppv"] == 2000
+
+    async def test_failed_revalidation_keeps_serving_stale(self) -> None:
+        session = _CountingSession()
+        client = _client(session, FakeClock(), stale_while_revalidate=True)
+        callback_calls: list[str] = []
+        client.on_cache_refresh = lambda key, data: callback_calls.append(key)
+
+        def fail(method: str, url: str, **kwargs: Any) -> _Response:
+            session.requests += 1
+            raise OSError("network down")
+
+        session.request = fail  # type: ignore[method-assign]
+
+        assert (await _runtime(client))["ppv"] == 1000
+        await _drain(client)
+
+        assert callback_calls == []
+        assert (await _runtime(client))["ppv"] == 1000
+        await _drain(client)
+        assert session.requests == 2
+
+    async def test_callback_errors_are_contained(self) -> None:
+        session = _CountingSession()
+        session.release.set()
+
+        def broken(key: str, data: dict[str, Any]) -> None:
+            raise RuntimeError("consumer bug")
+
+        client = _client(session, FakeClock(), stale_while_revalidate=True, on_cache_refresh=broken)
+
+        await _runtime(client)
+        await _drain(client)
+
+        assert client._response_cache.get(RUNTIME_KEY) == {"success": True, "ppv": 2000}
+
+    async def test_close_cancels_pending_revalidation(self) -> None:
+        session = _CountingSession()
+        refreshed: list[str] = []
+        client = _client(
+            session,
+            FakeClock(),
+            stale_while_revalidate=True,
+            on_cache_refresh=lambda key, data: refreshed.append(key),
+        )
+
+        await _runtime(client)
+        (task,) = client._inflight_requests.values()
+
+        await client.close()
+
+        assert task.cancelled()
+        assert client.api_requests_in_flight == 0
+        assert refreshed == []
+        assert not session.closed  # injected session stays open
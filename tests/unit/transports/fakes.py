@@ -0,0 +1,57 @@
+"""Shared fakes for Modbus input-register polling tests."""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+from typing import Any
+
+from pylxpweb.transports.exceptions import TransportReadError
+from pylxpweb.transports.modbus import ModbusTransport
+
+
+def make_fake_read(
+    fail: Collection[int | tuple[int, int]] = frozenset(),
+    error: type[Exception] = TransportReadError,
+):
+    """Fake ``_read_input_registers`` returning ``poll * 1000 + address`` words.
+
+    Args:
+        fail: Start addresses or ``(start, count)`` reads that raise ``error``
+        error: Exception raised for failing reads
+
+    The fake records its reads in ``calls``; ``poll[0]`` is bumped by
+    ``poll_input_data()`` so values show which poll read them.
+    """
+    calls: list[tuple[int, int]] = []
+    poll = [0]
+
+    async def fake_read(start: int, count: int) -> list[int]:
+        calls.append((start, count))
+        if start in fail or (start, count) in fail:
+            raise error("simulated failed Modbus read")
+        values = [poll[0] * 1000 + start + i for i in range(count)]
+        for reg, value in ((4, 534), (5, (100 << 8) | 82)):
+            if start <= reg < start + count:
+                values[reg - start] = value
+        return values
+
+    fake_read.calls = calls  # type: ignore[attr-defined]
+    fake_read.poll = poll  # type: ignore[attr-defined]
+    return fake_read
+
+
+def make_transport(**kwargs: Any) -> ModbusTransport:
+    """Modbus transport for a 3-string inverter with no inter-read delay."""
+    t = ModbusTransport(host="192.168.1.100", serial="CE12345678", **kwargs)
+    t.pv_string_count = 3
+    t._inter_register_delay = 0.0
+    return t
+
+
+async def poll_input_data(transport: ModbusTransport, fake_read) -> list[tuple[int, int]]:
+    """Run one ``read_all_input_data()`` poll and return its input-group reads."""
+    fake_read.calls.clear()
+    fake_read.poll[0] += 1
+    await transport.read_all_input_data()
+    # Battery module reads (5000+) are outside the input group table
+    return [call for call in fake_read.calls if call[0] < 5000]
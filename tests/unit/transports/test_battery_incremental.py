@@ -0,0 +1,157 @@
+"""Static battery block refresh and the master re-decode that follows it."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pylxpweb.battery_protocols.eg4_master import EG4MasterProtocol
+from pylxpweb.transports.battery_modbus import BatteryModbusTransport
+
+_MONOTONIC = "pylxpweb.transports.battery_modbus.time.monotonic"
+_SLEEP = "pylxpweb.transports.battery_modbus.asyncio.sleep"
+
+
+def _master_regs() -> list[int]:
+    regs = [0] * 42
+    regs[21] = 79
+    regs[22] = 5294
+    regs[24] = 19
+    regs[26] = 43700
+    regs[27] = 56000
+    regs[33] = 5600
+    regs[41] = 16
+    return regs
+
+
+def _slave_regs(remaining: int = 224) -> list[int]:
+    regs = [0] * 42
+    regs[0] = 5294
+    regs[1] = 100
+    regs[2] = 3310
+    regs[18] = 18
+    regs[21] = remaining
+    regs[24] = 80
+    regs[36] = 16
+    regs[37] = 2800
+    return regs
+
+
+class _Bank:
+    """Fake bridge with a master at unit 1 and slaves at 2 and 3."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[int, int]] = []
+        self.remaining = {2: 112, 3: 112}
+        self.fail: set[tuple[int, int]] = set()
+
+    async def read(self, start: int, count: int, device_id: int) -> MagicMock:
+        self.calls.append((device_id, start))
+        result = MagicMock()
+        result.isError.return_value = (device_id, start) in self.fail
+        if start == 0:
+            regs = _master_regs() if device_id == 1 else _slave_regs(self.remaining[device_id])
+            result.registers = regs[:count]
+        elif start == 113:
+            result.registers = [3310] * count
+        else:
+            result.registers = [0x5A30] * count
+        return result
+
+
+def _transport(bank: _Bank, **kwargs: object) -> BatteryModbusTransport:
+    transport = BatteryModbusTransport(host="10.100.3.27", unit_ids=[1, 2, 3], **kwargs)
+    client = AsyncMock()
+    client.connected = True
+    client.close = MagicMock()
+    client.read_holding_registers = AsyncMock(side_effect=bank.read)
+    transport._client = client
+    transport._connected = True
+    return transport
+
+
+async def _poll(
+    transport: BatteryModbusTransport, bank: _Bank, now: float
+) -> list[tuple[int, int]]:
+    bank.calls.clear()
+    with patch(_SLEEP, new_callable=AsyncMock), patch(_MONOTONIC, return_value=now):
+        await transport.read_all()
+    return list(bank.calls)
+
+
+class TestStaticBlocks:
+    def test_negative_interval_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            BatteryModbusTransport(host="10.100.3.27", static_block_interval=-1)
+
+    @pytest.mark.asyncio
+    async def test_default_reads_info_block_every_poll(self) -> None:
+        bank = _Bank()
+        transport = _transport(bank)
+
+        await _poll(transport, bank, 1.0)
+        second = await _poll(transport, bank, 2.0)
+
+        assert (2, 105) in second and (3, 105) in second
+
+    @pytest.mark.asyncio
+    async def test_info_block_read_once_per_interval(self) -> None:
+        bank = _Bank()
+        transport = _transport(bank, static_block_interval=3600.0)
+
+        first = await _poll(transport, bank, 1.0)
+        second = await _poll(transport, bank, 60.0)
+        third = await _poll(transport, bank, 3601.0)
+
+        assert first == [(1, 0), (1, 113), (2, 0), (2, 105), (3, 0), (3, 105)]
+        # Live blocks (runtime, master cells) are still read every poll
+        assert second == [(1, 0), (1, 113), (2, 0), (3, 0)]
+        assert third == first
+
+    @pytest.mark.asyncio
+    async def test_cached_info_block_still_decoded(self) -> None:
+        bank = _Bank()
+        transport = _transport(bank, static_block_interval=3600.0)
+
+        with patch(_SLEEP, new_callable=AsyncMock), patch(_MONOTONIC, return_value=1.0):
+            first = await transport.read_all()
+        with patch(_SLEEP, new_callable=AsyncMock), patch(_MONOTONIC, return_value=2.0):
+            second = await transport.read_all()
+
+        assert [b.firmware_version for b in second] == [b.firmware_version for b in first]
+        assert [b.model for b in second] == [b.model for b in first]
+
+    @pytest.mark.asyncio
+    async def test_failed_info_block_stays_due(self) -> None:
+        bank = _Bank()
+        bank.fail = {(2, 105)}
+        transport = _transport(bank, static_block_interval=3600.0)
+
+        await _poll(transport, bank, 1.0)
+        bank.fail = set()
+
+        assert (2, 105) in await _poll(transport, bank, 2.0)
+        assert (2, 105) not in await _poll(transport, bank, 3.0)
+
+
+class TestMasterRedecode:
+    @pytest.mark.asyncio
+    async def test_master_redecoded_every_poll(self) -> None:
+        bank = _Bank()
+        transport = _transport(bank, static_block_interval=3600.0)
+        redecode = patch.object(
+            EG4MasterProtocol,
+            "decode_with_slaves",
+            autospec=True,
+            side_effect=EG4MasterProtocol.decode_with_slaves,
+        )
+
+        with redecode as spy, patch(_SLEEP, new_callable=AsyncMock):
+            first = await transport.read_all()
+            bank.remaining[3] = 100
+            second = await transport.read_all()
+
+        assert spy.call_count == 2
+        assert first[0].current_capacity == pytest.approx(213.0)
+        assert second[0].current_capacity != first[0].current_capacity
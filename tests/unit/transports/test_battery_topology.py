@@ -0,0 +1,201 @@
+"""Battery topology cache and turnaround-tuned scanning."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pylxpweb.transports.battery_modbus import (
+    _INTER_UNIT_DELAY,
+    _MIN_INTER_UNIT_DELAY,
+    _MIN_PROBE_TIMEOUT,
+    BatteryModbusTransport,
+    BatteryTopologyCache,
+)
+
+_BRIDGE = "10.100.3.27:502"
+
+
+def _result(regs: list[int] | None) -> MagicMock:
+    m = MagicMock()
+    m.isError.return_value = regs is None
+    m.registers = regs or []
+    return m
+
+
+def _slave_regs() -> list[int]:
+    regs = [0] * 42
+    regs[0] = 5294
+    regs[1] = 100
+    regs[2] = 3310
+    regs[18] = 18
+    regs[24] = 80
+    regs[36] = 16
+    return regs
+
+
+def _bus(present: set[int]) -> tuple[AsyncMock, list[tuple[int, int, int]]]:
+    """Fake RS485 bridge where only ``present`` unit IDs answer."""
+    calls: list[tuple[int, int, int]] = []
+
+    async def read(start: int, count: int, device_id: int) -> MagicMock:
+        calls.append((device_id, start, count))
+        if device_id not in present:
+            return _result(None)
+        return _result(_slave_regs()[start : start + count] if start < 42 else [0] * count)
+
+    client = AsyncMock()
+    client.connected = True
+    client.close = MagicMock()
+    client.read_holding_registers = AsyncMock(side_effect=read)
+    return client, calls
+
+
+def _transport(cache: BatteryTopologyCache | None, client: AsyncMock) -> BatteryModbusTransport:
+    transport = BatteryModbusTransport(host="10.100.3.27", max_units=4, topology_cache=cache)
+    transport._client = client
+    transport._connected = True
+    return transport
+
+
+def _probed(calls: list[tuple[int, int, int]]) -> list[int]:
+    return [uid for uid, start, count in calls if (start, count) == (0, 1)]
+
+
+class TestCache:
+    def test_round_trip(self) -> None:
+        cache = BatteryTopologyCache()
+        cache.record(_BRIDGE, [3, 1, 2], 0.04)
+        cache.record("10.0.0.9:502", [1])
+
+        restored = BatteryTopologyCache.from_dict(json.loads(json.dumps(cache.to_dict())))
+
+        assert restored.to_dict() == cache.to_dict()
+        assert restored.units(_BRIDGE) == [1, 2, 3]
+        assert restored.turnaround(_BRIDGE) == pytest.approx(0.04)
+        assert restored.turnaround("10.0.0.9:502") is None
+        assert restored.units("unknown:502") == []
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {_BRIDGE: {"units": [0]}},
+            {_BRIDGE: {"units": ["1"]}},
+            {_BRIDGE: {"units": [1], "turnaround": -1}},
+        ],
+    )
+    def test_from_dict_rejects_malformed(self, data: dict[str, dict[str, object]]) -> None:
+        with pytest.raises(ValueError):
+            BatteryTopologyCache.from_dict(data)
+
+
+class TestTopologyReuse:
+    @pytest.mark.asyncio
+    async def test_cold_start_scans_and_fills_cache(self) -> None:
+        cache = BatteryTopologyCache()
+        client, calls = _bus({1, 2})
+        transport = _transport(cache, client)
+
+        with patch("pylxpweb.transports.battery_modbus.asyncio.sleep", new_callable=AsyncMock):
+            results = await transport.read_all()
+
+        assert len(results) == 2
+        assert _probed(calls) == [1, 2, 3, 4]
+        assert cache.units(_BRIDGE) == [1, 2]
+        assert cache.turnaround(_BRIDGE) is not None
+
+    @pytest.mark.asyncio
+    async def test_warm_start_skips_scan_and_sweeps_one_unknown_id(self) -> None:
+        cache = BatteryTopologyCache()
+        cache.record(_BRIDGE, [1, 2], 0.02)
+        client, calls = _bus({1, 2})
+        transport = _transport(cache, client)
+
+        with patch("pylxpweb.transports.battery_modbus.asyncio.sleep", new_callable=AsyncMock):
+            first = await transport.read_all()
+            second = await transport.read_all()
+
+        assert len(first) == len(second) == 2
+        # No startup scan: one sweep probe per poll, round-robin over 3..4
+        assert _probed(calls) == [3, 4]
+        assert set(transport._unit_last_seen) == {1, 2}
+
+    @pytest.mark.asyncio
+    async def test_sweep_adds_new_unit_for_next_poll(self) -> None:
+        cache = BatteryTopologyCache()
+        cache.record(_BRIDGE, [1], 0.02)
+        client, calls = _bus({1, 3})
+        transport = _transport(cache, client)
+        transport._sweep_next = 3
+
+        with patch("pylxpweb.transports.battery_modbus.asyncio.sleep", new_callable=AsyncMock):
+            assert len(await transport.read_all()) == 1
+            assert cache.units(_BRIDGE) == [1, 3]
+            assert len(await transport.read_all()) == 2
+
+    @pytest.mark.asyncio
+    async def test_without_cache_every_poll_scans(self) -> None:
+        client, calls = _bus({1})
+        transport = _transport(None, client)
+
+        with patch("pylxpweb.transports.battery_modbus.asyncio.sleep", new_callable=AsyncMock):
+            await transport.read_all()
+            await transport.read_all()
+
+        assert _probed(calls) == [1, 2, 3, 4, 1, 2, 3, 4]
+
+
+class TestTurnaroundTuning:
+    def test_fixed_timing_unless_enabled(self) -> None:
+        transport = BatteryModbusTransport(host="10.100.3.27")
+
+        transport._record_turnaround(0.001)
+
+        assert transport._inter_unit_delay() == _INTER_UNIT_DELAY
+        assert transport._probe_timeout() == transport.timeout
+
+    def test_defaults_until_a_unit_answers(self) -> None:
+        transport = BatteryModbusTransport(host="10.100.3.27", tune_to_turnaround=True)
+
+        assert transport._inter_unit_delay() == _INTER_UNIT_DELAY
+        assert transport._probe_timeout() == transport.timeout
+
+    def test_tracks_measured_turnaround_within_bounds(self) -> None:
+        transport = BatteryModbusTransport(host="10.100.3.27", tune_to_turnaround=True)
+
+        transport._record_turnaround(0.001)
+        assert transport._inter_unit_delay() == _MIN_INTER_UNIT_DELAY
+        assert transport._probe_timeout() == _MIN_PROBE_TIMEOUT
+
+        transport._turnaround = 0.1
+        assert transport._inter_unit_delay() == pytest.approx(0.1)
+        assert transport._probe_timeout() == pytest.approx(0.4)
+
+        transport._turnaround = 5.0
+        assert transport._inter_unit_delay() == _INTER_UNIT_DELAY
+        assert transport._probe_timeout() == transport.timeout
+
+    @pytest.mark.asyncio
+    async def test_silent_probe_gives_up_after_short_timeout(self) -> None:
+        transport = BatteryModbusTransport(
+            host="10.100.3.27", timeout=30.0, tune_to_turnaround=True
+        )
+        transport._turnaround = 0.01
+
+        async def hang(*_args: object, **_kwargs: object) -> MagicMock:
+            await asyncio.sleep(60)
+            raise AssertionError("unreachable")
+
+        transport._client = AsyncMock()
+        transport._client.read_holding_registers = hang
+
+        regs = await asyncio.wait_for(
+            transport._read_registers(0, 1, 5, probe=True, timeout=transport._probe_timeout()),
+            timeout=5,
+        )
+
+        assert regs is None
+        assert transport._consecutive_errors == 0
@@ -0,0 +1,201 @@
+"""Tests for RS485 bus arbitration."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from pylxpweb.transports.battery_modbus import BatteryModbusTransport
+from pylxpweb.transports.bus_arbiter import (
+    BUS_PRIORITY_BATTERY,
+    BUS_PRIORITY_INVERTER,
+    RS485BusArbiter,
+    rtu_inter_frame_gap,
+)
+from pylxpweb.transports.modbus_serial import ModbusSerialTransport
+
+
+class SharedWire:
+    """Fake half-duplex bus: records any overlap between transactions."""
+
+    def __init__(self, delay: float = 0.005) -> None:
+        self._delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.order: list[str] = []
+
+    def client(self, name: str) -> MagicMock:
+        client = MagicMock()
+        client.connected = True
+
+        async def read(address: int, count: int = 1, device_id: int = 1) -> MagicMock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.order.append(name)
+            await asyncio.sleep(self._delay)
+            self.in_flight -= 1
+            result = MagicMock()
+            result.isError.return_value = False
+            result.registers = [device_id] * count
+            return result
+
+        client.read_input_registers = read
+        client.read_holding_registers = read
+        return client
+
+
+class TestInterFrameGap:
+    def test_gap_scales_with_baudrate(self) -> None:
+        assert rtu_inter_frame_gap(9600) == pytest.approx(3.5 * 11 / 9600)
+        assert rtu_inter_frame_gap(19200) == pytest.approx(3.5 * 11 / 19200)
+
+    def test_gap_fixed_above_19200(self) -> None:
+        assert rtu_inter_frame_gap(115200) == pytest.approx(0.00175)
+
+    @pytest.mark.parametrize("kwargs", [{"inter_frame_gap": -1.0}, {"transaction_timeout": 0}])
+    def test_invalid_arguments_rejected(self, kwargs: dict[str, float]) -> None:
+        with pytest.raises(ValueError):
+            RS485BusArbiter(**kwargs)
+
+    @pytest.mark.asyncio
+    async def test_gap_enforced_between_transactions(self) -> None:
+        bus = RS485BusArbiter(inter_frame_gap=0.03)
+        async with bus.transaction("a"):
+            pass
+        released = time.monotonic()
+        async with bus.transaction("b"):
+            granted = time.monotonic()
+
+        assert granted - released >= 0.025
+
+
+class TestScheduling:
+    @pytest.mark.asyncio
+    async def test_priority_then_arrival_order(self) -> None:
+        bus = RS485BusArbiter(inter_frame_gap=0)
+        release = asyncio.Event()
+        order: list[str] = []
+
+        async def hold() -> None:
+            async with bus.transaction("holder"):
+                await release.wait()
+
+        async def request(name: str, priority: int) -> None:
+            async with bus.transaction(name, priority):
+                order.append(name)
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        tasks = [
+            asyncio.create_task(request("battery-1", BUS_PRIORITY_BATTERY)),
+            asyncio.create_task(request("inverter-1", BUS_PRIORITY_INVERTER)),
+            asyncio.create_task(request("battery-2", BUS_PRIORITY_BATTERY)),
+            asyncio.create_task(request("inverter-2", BUS_PRIORITY_INVERTER)),
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(holder, *tasks)
+
+        assert order == ["inverter-1", "inverter-2", "battery-1", "battery-2"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self) -> None:
+        bus = RS485BusArbiter(inter_frame_gap=0)
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with bus.transaction("holder"):
+                await release.wait()
+
+        async def request() -> None:
+            async with bus.transaction("waiter"):
+                pass
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(request())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        await holder
+
+        assert waiter.cancelled()
+        async with asyncio.timeout(0.1), bus.transaction("next"):
+            pass
+
+
+class TestTimeouts:
+    @pytest.mark.asyncio
+    async def test_timeout_measured_from_grant(self) -> None:
+        """Queueing behind a slow transaction does not eat into the timeout."""
+        bus = RS485BusArbiter(inter_frame_gap=0, transaction_timeout=0.1)
+
+        async def slow(name: str) -> None:
+            async with bus.transaction(name):
+                await asyncio.sleep(0.06)
+
+        await asyncio.gather(slow("a"), slow("b"), slow("c"))
+
+        stats = bus.client_stats()
+        assert sum(s.timeouts for s in stats.values()) == 0
+        assert stats["c"].total_wait >= 0.1
+
+    @pytest.mark.asyncio
+    async def test_overrun_times_out_and_frees_bus(self) -> None:
+        bus = RS485BusArbiter(inter_frame_gap=0, transaction_timeout=0.02)
+
+        with pytest.raises(TimeoutError):
+            async with bus.transaction("stuck"):
+                await asyncio.sleep(1)
+
+        async with asyncio.timeout(0.1), bus.transaction("next"):
+            pass
+        assert bus.client_stats()["stuck"].timeouts == 1
+
+
+class TestSharedTransports:
+    @pytest.mark.asyncio
+    async def test_inverter_and_battery_never_overlap(self) -> None:
+        wire = SharedWire()
+        bus = RS485BusArbiter(baudrate=19200)
+        inverter = ModbusSerialTransport(
+            port="socket://10.0.0.5:502",
+            serial="CE12345678",
+            retries=0,
+            inter_register_delay=0.0,
+            bus=bus,
+        )
+        inverter._client = wire.client("inverter")
+        inverter._connected = True
+        battery = BatteryModbusTransport(host="10.0.0.5", unit_ids=[1, 2], bus=bus)
+        battery._client = wire.client("battery")
+        battery._connected = True
+
+        async def poll_inverter() -> None:
+            for address in range(0, 200, 40):
+                assert await inverter._read_input_registers(address, 40) == [1] * 40
+
+        async def poll_battery() -> None:
+            for unit_id in (1, 2, 1, 2):
+                assert await battery._read_registers(0, 4, unit_id) == [unit_id] * 4
+
+        await asyncio.gather(poll_inverter(), poll_battery())
+
+        assert wire.max_in_flight == 1
+        assert wire.order.count("inverter") == 5
+        assert wire.order.count("battery") == 4
+        stats = bus.client_stats()
+        assert stats["CE12345678"].transactions == 5
+        assert stats["battery@10.0.0.5:502"].transactions == 4
+
+    @pytest.mark.asyncio
+    async def test_battery_skips_congestion_delays_on_arbitrated_bus(self) -> None:
+        battery = BatteryModbusTransport(host="10.0.0.5", bus=RS485BusArbiter())
+        started = time.monotonic()
+        await battery._pause(0.2)
+
+        assert time.monotonic() - started < 0.1
@@ -0,0 +1,86 @@
+"""Tests for precompiled register decode plans."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from pylxpweb.registers.battery import BATTERY_BASE_ADDRESS, BATTERY_REGISTERS
+from pylxpweb.registers.gridboss import GRIDBOSS_REGISTERS
+from pylxpweb.registers.inverter_input import INVERTER_INPUT_REGISTERS
+from pylxpweb.transports._canonical_reader import read_raw, read_scaled
+from pylxpweb.transports._decode_plan import (
+    battery_module_plan,
+    compile_op,
+    decode_into,
+    energy_plan,
+    gridboss_plan,
+    runtime_plan,
+)
+
+ALL_DEFINITIONS = INVERTER_INPUT_REGISTERS + GRIDBOSS_REGISTERS
+
+
+def _random_registers(addresses: range, seed: int) -> dict[int, int]:
+    rng = random.Random(seed)
+    # Favour values with the sign bit set so signed decoding is exercised
+    return {
+        a: rng.choice((rng.randrange(0x10000), rng.randrange(0x8000, 0x10000))) for a in addresses
+    }
+
+
+class TestDecodeMatchesCanonicalReader:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_every_definition(self, seed: int) -> None:
+        registers = _random_registers(range(400), seed)
+        for reg in ALL_DEFINITIONS:
+            for raw in (True, False):
+                out = decode_into((compile_op(reg, "value", raw=raw),), registers, {})
+                expected = read_raw(registers, reg) if raw else read_scaled(registers, reg)
+                assert out["value"] == expected, reg.canonical_name
+
+    def test_battery_definitions_with_base(self) -> None:
+        base = BATTERY_BASE_ADDRESS + 2 * 30
+        registers = _random_registers(range(base, base + 30), 7)
+        for reg in BATTERY_REGISTERS:
+            if getattr(reg, "packed", None) not in (None, "low_byte", "high_byte"):
+                continue
+            op = compile_op(reg, "value", raw=True, offset=True)
+            out = decode_into((op,), registers, {}, base=base)
+            assert out["value"] == read_raw(registers, reg, base_address=base)
+
+    def test_missing_registers(self) -> None:
+        wide = next(r for r in INVERTER_INPUT_REGISTERS if r.bit_width == 32)
+        ops = (compile_op(wide, "wide", raw=False),)
+
+        assert decode_into(ops, {}, {}) == {"wide": None}
+        # 32-bit values need both words
+        assert decode_into(ops, {wide.address: 5}, {}, missing=0) == {"wide": 0}
+
+
+class TestPlans:
+    def test_plans_are_memoized(self) -> None:
+        assert runtime_plan("EG4_HYBRID", 3) is runtime_plan("EG4_HYBRID", 3)
+        assert energy_plan("LXP", 3) is energy_plan("LXP", 3)
+        assert gridboss_plan() is gridboss_plan()
+
+    def test_pv_string_count_gates_extended_strings(self) -> None:
+        three = {op[5] for op in runtime_plan("EG4_HYBRID", 3).ops}
+        six = {op[5] for op in runtime_plan("EG4_HYBRID", 6).ops}
+
+        assert "pv4_power" not in three
+        assert {"pv4_power", "pv6_voltage"} <= six
+        assert "pv4_energy_today" not in {op[5] for op in energy_plan("EG4_HYBRID", 3).ops}
+
+    def test_runtime_specials_are_raw_and_named(self) -> None:
+        specials = {op[5]: op for op in runtime_plan("EG4_HYBRID", 3).specials}
+
+        assert {"soc_soh_packed", "fault_code", "bms_fault_code"} <= set(specials)
+        assert specials["fault_code"][3] == 0  # raw, no scaling
+
+    def test_battery_module_plan_is_offset_relative(self) -> None:
+        ops = battery_module_plan().ops
+
+        assert all(op[0] < 30 for op in ops)
+        assert {"soc", "soh", "voltage"} <= {op[5] for op in ops}
@@ -262,7 +262,6 @@ class TestDongleConnection:
         transport._reader = reader
         transport._writer = writer
         transport._connected = True
-        transport._drain_buffer = AsyncMock()  # type: ignore[method-assign]
         transport._receive_frame = blocked_receive  # type: ignore[method-assign]
 
         request = asyncio.create_task(transport._send_receive(b"\x00" * 10, max_retries=0))
@@ -367,7 +366,6 @@ class TestDongleConnection:
         transport._reader = reader
         transport._writer = writer
         transport._connected = True
-        transport._drain_buffer = AsyncMock()  # type: ignore[method-assign]
 
         async def shutdown_then_fail() -> bytes:
             await transport.async_shutdown()
@@ -750,14 +748,13 @@ class TestDongleFrameAssembly:
         )
         transport, _writer = self._connected_transport(reader)
 
-        with patch.object(transport, "_drain_buffer", new=AsyncMock()):
-            registers = await transport._send_receive(
-                self._read_packet(transport),
-                max_retries=0,
-                expected_func=MODBUS_READ_INPUT,
-                expected_register=0,
-                expected_count=2,
-            )
+        registers = await transport._send_receive(
+            self._read_packet(transport),
+            max_retries=0,
+            expected_func=MODBUS_READ_INPUT,
+            expected_register=0,
+            expected_count=2,
+        )
 
         assert registers == [111, 222]
         assert reader.read.await_count == 5
@@ -771,7 +768,6 @@ class TestDongleFrameAssembly:
         transport, writer = self._connected_transport(reader)
 
         with (
-            patch.object(transport, "_drain_buffer", new=AsyncMock()),
             pytest.raises(TransportReadError, match="closed before complete frame"),
         ):
             await transport._send_receive(self._read_packet(transport), max_retries=0)
@@ -790,7 +786,6 @@ class TestDongleFrameAssembly:
         transport, writer = self._connected_transport(reader)
 
         with (
-            patch.object(transport, "_drain_buffer", new=AsyncMock()),
             pytest.raises(TransportReadError, match="Invalid advertised frame length"),
         ):
             await transport._send_receive(self._read_packet(transport), max_retries=0)
@@ -808,7 +803,6 @@ class TestDongleFrameAssembly:
         transport, writer = self._connected_transport(reader)
 
         with (
-            patch.object(transport, "_drain_buffer", new=AsyncMock()),
             pytest.raises(TransportReadError, match="exceeds maximum"),
         ):
             await transport._send_receive(self._read_packet(transport), max_retries=0)
@@ -838,7 +832,6 @@ class TestDongleFrameAssembly:
         started = asyncio.get_running_loop().time()
 
         with (
-            patch.object(transport, "_drain_buffer", new=AsyncMock()),
             pytest.raises(TransportTimeoutError, match="Timeout waiting"),
         ):
             await transport._send_receive(self._read_packet(transport), max_retries=0)
@@ -857,7 +850,6 @@ class TestDongleFrameAssembly:
         transport, writer = self._connected_transport(reader)
 
         with (
-            patch.object(transport, "_drain_buffer", new=AsyncMock()),
             pytest.raises(TransportReadError, match="prefix scan exceeded"),
         ):
             await transport._send_receive(self._read_packet(transport), max_retries=0)
@@ -1106,15 +1098,20 @@ class TestDongleResponseValidation:
 
     @pytest.mark.asyncio
     async def test_send_receive_preserves_mismatch_type_after_retries(self) -> None:
-        """Exhausted retries on a misrouted frame re-raise the mismatch type (#320).
+        """A request that only ever sees misrouted frames raises the mismatch (#320).
 
-        The coalescing probe relies on the exception type surviving the
-        ``_send_receive`` retry loop; a bare ``raise`` on the final attempt
-        must preserve ``TransportResponseMismatchError`` rather than wrapping
-        it in a generic ``TransportReadError``.
+        The coalescing probe relies on the exception type: the frame reader
+        drops misrouted frames while the request keeps waiting, and when the
+        wait times out the last dropped frame is reported as
+        ``TransportResponseMismatchError`` rather than a bare timeout.
         """
-        transport = self._make_transport()
-        # Valid CRC, wrong inverter serial: a misrouted frame on every attempt.
+        transport = DongleTransport(
+            host="192.168.1.100",
+            dongle_serial="BA12345678",
+            inverter_serial="CE12345678",
+            timeout=0.05,
+        )
+        # Valid CRC, wrong inverter serial: a misrouted frame on every read.
         misrouted = _build_mock_response(inverter_serial="XX99999999")
         transport._reader = AsyncMock()
         transport._reader.read = AsyncMock(return_value=misrouted)
@@ -1123,12 +1120,11 @@ class TestDongleResponseValidation:
         transport._connected = True
 
         with (
-            patch.object(transport, "_drain_buffer", new=AsyncMock()),
             patch.object(transport, "connect", new=AsyncMock()),
-            patch("asyncio.sleep", new=AsyncMock()),
             pytest.raises(TransportResponseMismatchError, match="serial mismatch"),
         ):
             await transport._read_input_registers(0, 2)
+        assert transport._writer is None  # torn down like any response timeout
 
     def test_heartbeat_tcp_function_rejected_as_mismatch(self) -> None:
         """An unsolicited heartbeat (0xC1) is rejected as a mismatch (#320).
@@ -1160,7 +1156,7 @@ class TestDongleResponseValidation:
 
     @pytest.mark.asyncio
     async def test_send_receive_recovers_after_heartbeat_then_valid(self) -> None:
-        """A heartbeat then a valid reply recovers via retry, registers intact (#320)."""
+        """A heartbeat before the reply is dropped by the frame reader (#320)."""
         transport = self._make_transport()
         heartbeat = _build_mock_response(tcp_func=TCP_FUNC_HEARTBEAT)
         valid = _build_mock_response(
@@ -1175,13 +1171,154 @@ class TestDongleResponseValidation:
         transport._connected = True
 
         with (
-            patch.object(transport, "_drain_buffer", new=AsyncMock()),
             patch.object(transport, "connect", new=AsyncMock()),
             patch("asyncio.sleep", new=AsyncMock()),
         ):
             registers = await transport._read_input_registers(0, 2)
 
         assert registers == [111, 222]
+        transport._writer.write.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_frame_reader_routes_reply_past_unsolicited_frames(self) -> None:
+        """Heartbeats and cloud-bound frames never cost a resend."""
+        transport = self._make_transport()
+        coalesced = b"".join(
+            [
+                _build_mock_response(tcp_func=TCP_FUNC_HEARTBEAT),
+                _build_mock_response(inverter_serial="XX99999999", register_values=[1, 2]),
+                _build_mock_response(start_register=40, register_values=[7, 7]),
+                _build_mock_response(register_values=[111, 222]),
+            ]
+        )
+        transport._reader = AsyncMock()
+        transport._reader.read = AsyncMock(side_effect=[coalesced])
+        transport._writer = MagicMock()
+        transport._writer.drain = AsyncMock()
+        transport._connected = True
+
+        registers = await transport._read_input_registers(0, 2)
+
+        assert registers == [111, 222]
+        transport._writer.write.assert_called_once()
+        transport._reader.read.assert_awaited_once()
+        assert transport._frame_waiters == {}
+        assert not transport._frame_demand.is_set()
+
+    @pytest.mark.asyncio
+    async def test_closing_connection_fails_waiting_request(self) -> None:
+        """A request waiting on the frame reader fails as soon as the socket closes."""
+        transport = self._make_transport()
+        never_respond = asyncio.Event()
+
+        async def blocked_read(_size: int) -> bytes:
+            await never_respond.wait()
+            return b""
+
+        transport._reader = AsyncMock()
+        transport._reader.read = blocked_read
+        transport._writer = MagicMock()
+        transport._writer.drain = AsyncMock()
+        transport._writer.wait_closed = AsyncMock()
+        transport._connected = True
+
+        packet = transport._build_packet(
+            tcp_func=TCP_FUNC_TRANSLATED,
+            modbus_func=MODBUS_READ_INPUT,
+            start_register=0,
+            register_count=2,
+        )
+        request = asyncio.create_task(transport._send_receive(packet, max_retries=0))
+        while not transport._frame_waiters:
+            await asyncio.sleep(0)
+        await transport._teardown_connection()
+
+        with pytest.raises(TransportReadError, match="Socket error"):
+            await asyncio.wait_for(request, timeout=1.0)
+        assert transport._frame_reader_task is None
+
+
+class TestDonglePassiveCache:
+    """Tests for harvesting cloud-polled frames in passive mode."""
+
+    def _make_transport(self) -> DongleTransport:
+        transport = DongleTransport(
+            host="192.168.1.100",
+            dongle_serial="BA12345678",
+            inverter_serial="CE12345678",
+            passive_cache_max_age=30.0,
+        )
+        transport._reader = asyncio.StreamReader()
+        transport._writer = MagicMock()
+        transport._writer.drain = AsyncMock()
+        transport._writer.wait_closed = AsyncMock()
+        transport._connected = True
+        return transport
+
+    async def _harvest(self, transport: DongleTransport, *frames: bytes) -> None:
+        """Feed ``frames`` to an idle passive reader and let it consume them."""
+        assert transport._reader is not None
+        transport._start_frame_reader()
+        for frame in frames:
+            transport._reader.feed_data(frame)
+        for _ in range(50):
+            await asyncio.sleep(0)
+
+    def test_disabled_by_default(self) -> None:
+        transport = DongleTransport(
+            host="192.168.1.100",
+            dongle_serial="BA12345678",
+            inverter_serial="CE12345678",
+        )
+        assert transport.passive_cache is None
+
+    @pytest.mark.asyncio
+    async def test_cloud_polled_block_answers_local_read(self) -> None:
+        """An input block the cloud polled is served without a transaction."""
+        transport = self._make_transport()
+        await self._harvest(transport, _build_mock_response(register_values=list(range(40))))
+
+        registers = await transport._read_input_registers(0, 40)
+
+        assert registers == list(range(40))
+        transport._writer.write.assert_not_called()
+        await transport._teardown_connection()
+
+    @pytest.mark.asyncio
+    async def test_foreign_and_invalid_frames_not_harvested(self) -> None:
+        """Other serials, exceptions and corrupt frames never enter the cache."""
+        transport = self._make_transport()
+        corrupt = bytearray(_build_mock_response(start_register=80))
+        corrupt[-1] ^= 0xFF
+        await self._harvest(
+            transport,
+            _build_mock_response(inverter_serial="XX99999999"),
+            _build_mock_response(modbus_func=0x84, exception_code=2, start_register=40),
+            bytes(corrupt),
+        )
+
+        assert transport.passive_cache is not None
+        assert transport.passive_cache.stats()["registers"] == 0
+        await transport._teardown_connection()
+
+    @pytest.mark.asyncio
+    async def test_uncovered_read_goes_to_the_wire(self) -> None:
+        """A read the harvested block does not cover is sent as usual."""
+        transport = self._make_transport()
+        await self._harvest(transport, _build_mock_response(register_values=[1, 2]))
+        assert transport._reader is not None
+
+        async def reply() -> list[int]:
+            return await transport._read_input_registers(40, 2)
+
+        request = asyncio.create_task(reply())
+        while not transport._frame_waiters:
+            await asyncio.sleep(0)
+        transport._reader.feed_data(_build_mock_response(start_register=40, register_values=[5, 6]))
+
+        assert await asyncio.wait_for(request, timeout=1.0) == [5, 6]
+        transport._writer.write.assert_called_once()
+        await transport._teardown_connection()
 
 
 class TestDongleShortReadGuard:
@@ -1274,10 +1411,10 @@ class TestDongleShortReadGuard:
             register_values=[42],  # only 1 of 3 requested
         )
         reader = AsyncMock()
-        # Each attempt: drain read (b"") then the (short) response.  A
+        # Each attempt reads one (short) response.  A
         # TransportReadError does not tear the socket down, so the same
         # reader serves all three attempts (max_retries defaults to 2).
-        reader.read = AsyncMock(side_effect=[b"", short, b"", short, b"", short])
+        reader.read = AsyncMock(side_effect=[short, short, short])
         writer = AsyncMock()
         writer.write = MagicMock()
         writer.close = MagicMock()
@@ -1308,7 +1445,7 @@ class TestDongleShortReadGuard:
         )
         reader = AsyncMock()
         # Attempt 0: short (raises, retries). Attempt 1: full (succeeds).
-        reader.read = AsyncMock(side_effect=[b"", short, b"", full])
+        reader.read = AsyncMock(side_effect=[short, full])
         writer = AsyncMock()
         writer.write = MagicMock()
         writer.close = MagicMock()
@@ -1428,8 +1565,7 @@ class TestDongleRegisterOperations:
 
         # After reconnect: fresh reader returns valid response
         second_reader = AsyncMock()
-        # First read is _drain_buffer (empty), second is the actual response
-        second_reader.read = AsyncMock(side_effect=[b"", valid_response])
+        second_reader.read = AsyncMock(side_effect=[valid_response])
         second_writer = AsyncMock()
         second_writer.write = MagicMock()
         second_writer.close = MagicMock()
@@ -1558,9 +1694,8 @@ class TestDongleRegisterOperations:
         mock_reader = AsyncMock()
         # First call times out (connect's _discard_initial_data: no initial
         # data; b'' would mean EOF and fail the connect attempt)
-        # Second call is for _drain_buffer (returns empty to stop draining)
-        # Third call returns the actual response
-        mock_reader.read = AsyncMock(side_effect=[TimeoutError(), b"", response])
+        # Second call returns the actual response
+        mock_reader.read = AsyncMock(side_effect=[TimeoutError(), response])
 
         mock_writer = MagicMock()
         mock_writer.write = MagicMock()
@@ -2149,7 +2284,7 @@ class TestDongleSendReceiveTimeoutRetry:
         )
 
         second_reader = AsyncMock()
-        second_reader.read = AsyncMock(side_effect=[b"", write_echo])
+        second_reader.read = AsyncMock(side_effect=[write_echo])
         second_writer = AsyncMock()
         second_writer.write = MagicMock()
         second_writer.close = MagicMock()
@@ -2268,8 +2403,7 @@ class TestWriteAckEchoValidation:
             start_register=110,
             register_values=[0x0100],
         )
-        # First read = drain (empty), second read = the actual ACK frame.
-        transport._reader.read = AsyncMock(side_effect=[b"", echo])
+        transport._reader.read = AsyncMock(side_effect=[echo])
 
         with patch("asyncio.sleep", AsyncMock()):
             assert await transport._write_holding_registers(110, [0x0100]) is True
@@ -2283,8 +2417,7 @@ class TestWriteAckEchoValidation:
             start_register=110,
             register_values=[0x0BAD],
         )
-        # First read = drain (empty), second read = the actual ACK frame.
-        transport._reader.read = AsyncMock(side_effect=[b"", echo])
+        transport._reader.read = AsyncMock(side_effect=[echo])
 
         with (
             patch("asyncio.sleep", AsyncMock()),
@@ -2301,8 +2434,7 @@ class TestWriteAckEchoValidation:
             start_register=110,
             register_values=[5],
         )
-        # First read = drain (empty), second read = the actual ACK frame.
-        transport._reader.read = AsyncMock(side_effect=[b"", echo])
+        transport._reader.read = AsyncMock(side_effect=[echo])
 
         with (
             patch("asyncio.sleep", AsyncMock()),
@@ -2319,7 +2451,7 @@ class TestWriteAckEchoValidation:
             start_register=110,
             register_values=[2],
         )
-        transport._reader.read = AsyncMock(side_effect=[b"", echo])
+        transport._reader.read = AsyncMock(side_effect=[echo])
 
         with patch("asyncio.sleep", AsyncMock()):
             assert await transport._write_holding_registers(110, [1, 2]) is True
@@ -2339,7 +2471,7 @@ class TestWriteAckEchoValidation:
         """Real-layout FC06 ACK (no byte_count header) echoing our value passes."""
         transport = self._connected_transport()
         ack = _build_write_ack_frame(MODBUS_WRITE_SINGLE, 110, 0x0100)
-        transport._reader.read = AsyncMock(side_effect=[b"", ack])
+        transport._reader.read = AsyncMock(side_effect=[ack])
 
         with patch("asyncio.sleep", AsyncMock()):
             assert await transport._write_holding_registers(110, [0x0100]) is True
@@ -2349,7 +2481,7 @@ class TestWriteAckEchoValidation:
         """Real-layout FC06 ACK with a different echoed value is rejected."""
         transport = self._connected_transport()
         ack = _build_write_ack_frame(MODBUS_WRITE_SINGLE, 110, 0x0BAD)
-        transport._reader.read = AsyncMock(side_effect=[b"", ack])
+        transport._reader.read = AsyncMock(side_effect=[ack])
 
         with (
             patch("asyncio.sleep", AsyncMock()),
@@ -2362,7 +2494,7 @@ class TestWriteAckEchoValidation:
         """Real-layout FC16 ACK echoing the written register count passes."""
         transport = self._connected_transport()
         ack = _build_write_ack_frame(MODBUS_WRITE_MULTI, 110, 2)
-        transport._reader.read = AsyncMock(side_effect=[b"", ack])
+        transport._reader.read = AsyncMock(side_effect=[ack])
 
         with patch("asyncio.sleep", AsyncMock()):
             assert await transport._write_holding_registers(110, [1, 2]) is True
@@ -2372,7 +2504,7 @@ class TestWriteAckEchoValidation:
         """Real-layout FC16 ACK echoing a wrong register count is rejected."""
         transport = self._connected_transport()
         ack = _build_write_ack_frame(MODBUS_WRITE_MULTI, 110, 5)
-        transport._reader.read = AsyncMock(side_effect=[b"", ack])
+        transport._reader.read = AsyncMock(side_effect=[ack])
 
         with (
             patch("asyncio.sleep", AsyncMock()),
@@ -0,0 +1,138 @@
+"""Tests for the dongle frame codec."""
+
+from __future__ import annotations
+
+import struct
+
+import pytest
+
+from pylxpweb.transports.frame_codec import (
+    MODBUS_READ_HOLDING,
+    MODBUS_READ_INPUT,
+    MODBUS_WRITE_MULTI,
+    MODBUS_WRITE_SINGLE,
+    PACKET_PREFIX,
+    PROTOCOL_VERSION,
+    DongleFrameCodec,
+    compute_crc16,
+    frame_crc,
+)
+
+TCP_FUNC_TRANSLATED = 0xC2
+DONGLE = "BA12345678"
+INVERTER = "CE12345678"
+
+
+def _bitwise_crc16(data: bytes) -> int:
+    """Reference CRC-16/Modbus, bit by bit."""
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+    return crc
+
+
+def _reference_packet(tcp_func: int, data_frame: bytes) -> bytes:
+    """Reference packet assembly by concatenation."""
+    data_length = len(data_frame) + 2
+    return (
+        PACKET_PREFIX
+        + struct.pack("<HH", PROTOCOL_VERSION, 14 + data_length)
+        + bytes([0x01, tcp_func])
+        + DONGLE.encode("ascii")
+        + struct.pack("<H", data_length)
+        + data_frame
+        + struct.pack("<H", _bitwise_crc16(data_frame))
+    )
+
+
+def _data_prefix(func: int, register: int) -> bytes:
+    return bytes([0x00, func]) + INVERTER.encode("ascii") + struct.pack("<H", register)
+
+
+class TestComputeCRC16:
+    @pytest.mark.parametrize(
+        "data",
+        [b"", b"\x00", b"123456789", bytes(range(256)), b"\xff" * 300],
+    )
+    def test_matches_bitwise_reference(self, data: bytes) -> None:
+        assert compute_crc16(data) == _bitwise_crc16(data)
+
+    def test_known_check_value(self) -> None:
+        # CRC-16/MODBUS catalogue check value for "123456789"
+        assert compute_crc16(b"123456789") == 0x4B37
+
+    def test_accepts_memoryview(self) -> None:
+        data = bytearray(b"xx123456789")
+        assert compute_crc16(memoryview(data)[2:]) == 0x4B37
+
+
+class TestDongleFrameCodec:
+    @pytest.mark.parametrize(
+        ("func", "register", "count"),
+        [
+            (MODBUS_READ_INPUT, 0, 40),
+            (MODBUS_READ_HOLDING, 200, 127),
+            (MODBUS_READ_INPUT, 0xFFFF, 1),
+        ],
+    )
+    def test_encode_read_matches_reference(self, func: int, register: int, count: int) -> None:
+        codec = DongleFrameCodec(DONGLE, INVERTER)
+        expected = _reference_packet(
+            TCP_FUNC_TRANSLATED, _data_prefix(func, register) + struct.pack("<H", count)
+        )
+        assert codec.encode_read(TCP_FUNC_TRANSLATED, func, register, count) == expected
+
+    def test_reused_buffer_does_not_leak_between_packets(self) -> None:
+        codec = DongleFrameCodec(DONGLE, INVERTER)
+        first = codec.encode_read(TCP_FUNC_TRANSLATED, MODBUS_READ_INPUT, 0, 40)
+        second = codec.encode_read(TCP_FUNC_TRANSLATED, MODBUS_READ_HOLDING, 80, 2)
+
+        assert first == codec.encode_read(TCP_FUNC_TRANSLATED, MODBUS_READ_INPUT, 0, 40)
+        assert first != second
+
+    def test_encode_write_single_matches_reference(self) -> None:
+        codec = DongleFrameCodec(DONGLE, INVERTER)
+        expected = _reference_packet(
+            TCP_FUNC_TRANSLATED,
+            _data_prefix(MODBUS_WRITE_SINGLE, 21) + struct.pack("<H", 0xBEEF),
+        )
+        assert codec.encode_write_single(TCP_FUNC_TRANSLATED, 21, 0xBEEF) == expected
+
+    def test_encode_write_multi_matches_reference(self) -> None:
+        codec = DongleFrameCodec(DONGLE, INVERTER)
+        values = [1, 2, 0xFFFF]
+        expected = _reference_packet(
+            TCP_FUNC_TRANSLATED,
+            _data_prefix(MODBUS_WRITE_MULTI, 66)
+            + struct.pack("<HB", len(values), 2 * len(values))
+            + struct.pack("<3H", *values),
+        )
+        assert codec.encode_write_multi(TCP_FUNC_TRANSLATED, 66, values) == expected
+
+    def test_short_serials_are_nul_padded(self) -> None:
+        codec = DongleFrameCodec("BA1", "CE1")
+        packet = codec.encode_read(TCP_FUNC_TRANSLATED, MODBUS_READ_INPUT, 0, 1)
+
+        assert packet[8:18] == b"BA1" + b"\x00" * 7
+        assert packet[22:32] == b"CE1" + b"\x00" * 7
+
+
+class TestFrameCrc:
+    def test_valid_frame(self) -> None:
+        codec = DongleFrameCodec(DONGLE, INVERTER)
+        packet = codec.encode_write_multi(TCP_FUNC_TRANSLATED, 0, [5, 6])
+
+        computed, received = frame_crc(packet)
+
+        assert computed == received
+
+    def test_corrupt_payload_detected(self) -> None:
+        codec = DongleFrameCodec(DONGLE, INVERTER)
+        packet = bytearray(codec.encode_read(TCP_FUNC_TRANSLATED, MODBUS_READ_INPUT, 0, 40))
+        packet[33] ^= 0x01
+
+        computed, received = frame_crc(packet)
+
+        assert computed != received
@@ -0,0 +1,213 @@
+"""Learned gap bridging for coalesced input reads (``GapSafetyMap``)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from pylxpweb.transports._register_data import (
+    GAP_UNSAFE_STRIKES,
+    INPUT_REGISTER_GROUPS,
+    _ReadBlock,
+    coalesce_register_groups,
+)
+from pylxpweb.transports.exceptions import TransportTimeoutError
+from pylxpweb.transports.gap_map import GapSafetyMap, gap_model_key
+from pylxpweb.transports.modbus import ModbusTransport
+from tests.unit.transports.fakes import make_fake_read, make_transport, poll_input_data
+
+_MODEL = gap_model_key(2092, "FAAB-2525")
+
+
+def _transport(gap_map: GapSafetyMap, *, proven: bool = True) -> ModbusTransport:
+    t = make_transport(max_input_block_size=125, gap_map=gap_map)
+    t._input_coalescing_proven = proven
+    t._last_device_type_code = 2092
+    t._last_firmware_version = "FAAB-2525"
+    return t
+
+
+class TestPlanner:
+    def test_bridging_minimizes_reads(self) -> None:
+        plan = coalesce_register_groups(
+            list(INPUT_REGISTER_GROUPS.items()), 125, lambda start, end: True
+        )
+
+        assert [(b.start, b.count) for b in plan] == [(0, 113), (113, 92)]
+        assert plan[1].gaps == ((154, 170), (174, 193))
+
+    def test_unbridgeable_gap_splits(self) -> None:
+        plan = coalesce_register_groups(
+            list(INPUT_REGISTER_GROUPS.items()), 125, lambda start, end: start == 154
+        )
+
+        assert [(b.start, b.count) for b in plan] == [(0, 113), (113, 61), (193, 12)]
+
+    def test_spans_drop_bridged_registers(self) -> None:
+        block = _ReadBlock(("a", "b"), 10, 10, ((12, 15),))
+
+        assert block.spans(list(range(10, 20))) == [(10, [10, 11]), (15, [15, 16, 17, 18, 19])]
+        assert _ReadBlock(("a",), 10, 2).spans([1, 2]) == [(10, [1, 2])]
+
+
+class TestGapSafetyMap:
+    def test_unsafe_wins(self) -> None:
+        gaps = GapSafetyMap()
+        gaps.mark_unsafe(_MODEL, [(154, 170)])
+        gaps.mark_safe(_MODEL, [(154, 170), (174, 193)])
+
+        assert gaps.status(_MODEL, 154, 170) is False
+        assert gaps.status(_MODEL, 174, 193) is True
+        assert gaps.status("other", 174, 193) is None
+
+    def test_unsafe_does_not_flip_known_safe_gap(self) -> None:
+        gaps = GapSafetyMap()
+        gaps.mark_safe(_MODEL, [(154, 170)])
+        gaps.mark_unsafe(_MODEL, [(154, 170)])
+
+        assert gaps.status(_MODEL, 154, 170) is True
+
+        gaps.mark_unsafe(_MODEL, [(154, 170)], overwrite_safe=True)
+
+        assert gaps.status(_MODEL, 154, 170) is False
+
+    def test_export_round_trip_and_merge(self) -> None:
+        local = GapSafetyMap()
+        local.mark_safe(_MODEL, [(154, 170)])
+        fleet = GapSafetyMap.from_dict(json.loads(json.dumps(local.to_dict())))
+
+        assert local.to_dict() == {_MODEL: {"154-169": "safe"}}
+        assert fleet.to_dict() == local.to_dict()
+
+        other = GapSafetyMap()
+        other.mark_unsafe(_MODEL, [(154, 170)])
+        fleet.merge(other)
+        assert fleet.status(_MODEL, 154, 170) is False
+
+    @pytest.mark.parametrize(
+        "data", [{_MODEL: {"154": "safe"}}, {_MODEL: {"170-154": "safe"}}, {_MODEL: {"1-2": "ok"}}]
+    )
+    def test_from_dict_rejects_malformed(self, data: dict[str, dict[str, str]]) -> None:
+        with pytest.raises(ValueError):
+            GapSafetyMap.from_dict(data)
+
+
+class TestLearning:
+    @pytest.mark.asyncio
+    async def test_probes_one_gap_per_plan_then_bridges(self) -> None:
+        gaps = GapSafetyMap()
+        transport = _transport(gaps)
+        fake_read = make_fake_read()
+        transport._read_input_registers = fake_read
+
+        assert await poll_input_data(transport, fake_read) == [(0, 113), (113, 61), (193, 12)]
+        assert gaps.status(_MODEL, 154, 170) is True
+        assert await poll_input_data(transport, fake_read) == [(0, 113), (113, 92)]
+        assert await poll_input_data(transport, fake_read) == [(0, 113), (113, 92)]
+        assert gaps.to_dict() == {_MODEL: {"154-169": "safe", "174-192": "safe"}}
+
+    @pytest.mark.asyncio
+    async def test_bridged_registers_stay_out_of_snapshot(self) -> None:
+        gaps = GapSafetyMap()
+        gaps.mark_safe(_MODEL, [(154, 170), (174, 193)])
+        transport = _transport(gaps)
+        transport._read_input_registers = make_fake_read()
+
+        registers = await transport._read_register_groups()
+
+        assert 160 not in registers and 180 not in registers
+        assert registers[153] == 153 and registers[170] == 170
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_marks_gap_unsafe_without_latching(self) -> None:
+        gaps = GapSafetyMap()
+        transport = _transport(gaps)
+        fake_read = make_fake_read({(113, 61)})
+        transport._read_input_registers = fake_read
+
+        calls = await poll_input_data(transport, fake_read)
+
+        assert (113, 61) in calls
+        assert calls[-1] == (193, 12)  # the cycle completed with plain reads
+        assert gaps.status(_MODEL, 154, 170) is False
+        assert not transport._input_coalescing_latched_off
+        # Next plan stops bridging the bad gap and probes the other one
+        assert await poll_input_data(transport, fake_read) == [(0, 113), (113, 41), (170, 35)]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error", [TransportTimeoutError, OSError])
+    async def test_transient_failure_does_not_poison_map(self, error: type[Exception]) -> None:
+        gaps = GapSafetyMap()
+        transport = _transport(gaps)
+        fake_read = make_fake_read({(113, 61)}, error=error)
+        transport._read_input_registers = fake_read
+
+        calls = await poll_input_data(transport, fake_read)
+
+        assert calls[-1] == (193, 12)
+        assert gaps.status(_MODEL, 154, 170) is None
+        assert not transport._input_coalescing_latched_off
+        assert transport._input_coalescing_retry_after > 0
+        # Plain group reads during the cooldown
+        assert (0, 113) not in await poll_input_data(transport, fake_read)
+
+    @pytest.mark.asyncio
+    async def test_known_safe_gap_needs_repeated_failures(self) -> None:
+        gaps = GapSafetyMap()
+        gaps.mark_safe(_MODEL, [(154, 170), (174, 193)])
+        transport = _transport(gaps)
+        fake_read = make_fake_read({(113, 92)})
+        transport._read_input_registers = fake_read
+
+        for _ in range(GAP_UNSAFE_STRIKES - 1):
+            await poll_input_data(transport, fake_read)
+            assert gaps.status(_MODEL, 154, 170) is True
+
+        await poll_input_data(transport, fake_read)
+
+        assert gaps.status(_MODEL, 154, 170) is False
+        assert gaps.status(_MODEL, 174, 193) is False
+
+    @pytest.mark.asyncio
+    async def test_success_clears_strikes(self) -> None:
+        gaps = GapSafetyMap()
+        gaps.mark_safe(_MODEL, [(154, 170), (174, 193)])
+        transport = _transport(gaps)
+        failing = make_fake_read({(113, 92)})
+        transport._read_input_registers = failing
+
+        for _ in range(GAP_UNSAFE_STRIKES - 1):
+            await poll_input_data(transport, failing)
+        working = make_fake_read()
+        transport._read_input_registers = working
+        await poll_input_data(transport, working)
+        transport._read_input_registers = failing
+        await poll_input_data(transport, failing)
+
+        assert gaps.status(_MODEL, 154, 170) is True
+
+    @pytest.mark.asyncio
+    async def test_no_bridging_until_model_known_or_proven(self) -> None:
+        gaps = GapSafetyMap()
+        fake_read = make_fake_read()
+
+        unproven = _transport(gaps, proven=False)
+        unproven._read_input_registers = fake_read
+        assert await poll_input_data(unproven, fake_read) == [
+            (0, 113),
+            (113, 41),
+            (170, 4),
+            (193, 12),
+        ]
+
+        unknown = _transport(gaps)
+        unknown._last_firmware_version = None
+        unknown._read_input_registers = fake_read
+        assert await poll_input_data(unknown, fake_read) == [
+            (0, 113),
+            (113, 41),
+            (170, 4),
+            (193, 12),
+        ]
+        assert gaps.models == []
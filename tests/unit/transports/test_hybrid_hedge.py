@@ -0,0 +1,197 @@
+"""Hedged local/cloud reads in HybridTransport (``hedge_policy``)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pylxpweb.transports.data import InverterRuntimeData
+from pylxpweb.transports.exceptions import TransportReadError
+from pylxpweb.transports.hedge import HedgePolicy
+from pylxpweb.transports.hybrid import HybridTransport
+
+_LOCAL = InverterRuntimeData(pv_total_power=1000.0)
+_HTTP = InverterRuntimeData(pv_total_power=950.0)
+
+
+def _after(delay: float, result: object = None, error: Exception | None = None) -> AsyncMock:
+    """AsyncMock that completes after ``delay`` seconds."""
+
+    async def op(*_args: object) -> object:
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return result
+
+    return AsyncMock(side_effect=op)
+
+
+def _warm_policy() -> HedgePolicy:
+    """Policy whose budget is already 0.05 s."""
+    policy = HedgePolicy(min_samples=1, min_budget=0.05)
+    policy.record_local(0.01)
+    return policy
+
+
+def _hybrid(local_op: AsyncMock, http_op: AsyncMock, policy: HedgePolicy) -> HybridTransport:
+    local = MagicMock()
+    local.serial = "CE12345678"
+    local.read_runtime = local_op
+    local.write_parameters = local_op
+    local.read_parameters = local_op
+    local.disconnect = AsyncMock()
+    http = MagicMock()
+    http.read_runtime = http_op
+    http.write_parameters = http_op
+    http.read_parameters = http_op
+    http.disconnect = AsyncMock()
+    transport = HybridTransport(local, http, hedge_policy=policy)
+    transport._connected = True
+    return transport
+
+
+class TestHedgePolicy:
+    def test_budget_tracks_latency_within_bounds(self) -> None:
+        policy = HedgePolicy(min_samples=3, min_budget=0.5, max_budget=2.0)
+
+        for _ in range(2):
+            policy.record_local(0.05)
+        assert policy.budget() is None
+
+        policy.record_local(0.05)
+        assert policy.budget() == 0.5
+
+        for _ in range(20):
+            policy.record_local(5.0)
+        assert policy.budget() == 2.0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"smoothing": 0},
+            {"min_budget": -1},
+            {"min_budget": 2, "max_budget": 1},
+            {"min_samples": 0},
+        ],
+    )
+    def test_invalid_arguments_rejected(self, kwargs: dict[str, float]) -> None:
+        with pytest.raises(ValueError):
+            HedgePolicy(**kwargs)
+
+    def test_win_rates(self) -> None:
+        policy = HedgePolicy()
+        assert policy.stats()["http_win_rate"] == 0.0
+
+        policy.record_win("local")
+        policy.record_win("http")
+        policy.record_win("http")
+
+        assert policy.stats()["http_win_rate"] == pytest.approx(2 / 3)
+        with pytest.raises(ValueError):
+            policy.record_win("carrier pigeon")
+
+
+class TestHedgedReads:
+    @pytest.mark.asyncio
+    async def test_no_hedge_before_warm_up(self) -> None:
+        policy = HedgePolicy()
+        http = _after(0, _HTTP)
+        transport = _hybrid(_after(0.1, _LOCAL), http, policy)
+
+        assert await transport.read_runtime() is _LOCAL
+        http.assert_not_called()
+        assert policy.stats()["reads"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fast_local_is_not_hedged(self) -> None:
+        policy = _warm_policy()
+        http = _after(0, _HTTP)
+        transport = _hybrid(_after(0, _LOCAL), http, policy)
+
+        assert await transport.read_runtime() is _LOCAL
+        http.assert_not_called()
+        assert policy.hedged == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_local_loses_to_http_and_finishes_in_background(self) -> None:
+        policy = _warm_policy()
+        local = _after(0.3, _LOCAL)
+        transport = _hybrid(local, _after(0, _HTTP), policy)
+
+        assert await asyncio.wait_for(transport.read_runtime(), timeout=0.2) is _HTTP
+        assert policy.stats()["http_wins"] == 1
+        (loser,) = transport._hedge_losers
+
+        await loser
+        await asyncio.sleep(0)
+
+        assert not transport._hedge_losers
+        assert policy._samples == 2  # the late local latency still counts
+        assert transport.is_using_local
+
+    @pytest.mark.asyncio
+    async def test_local_wins_when_http_fails(self) -> None:
+        policy = _warm_policy()
+        transport = _hybrid(
+            _after(0.1, _LOCAL), _after(0, error=TransportReadError("cloud down")), policy
+        )
+
+        assert await transport.read_runtime() is _LOCAL
+        assert policy.stats()["local_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_local_error_during_race_falls_back(self) -> None:
+        policy = _warm_policy()
+        transport = _hybrid(
+            _after(0.1, error=TransportReadError("dongle gone")), _after(0.2, _HTTP), policy
+        )
+
+        assert await transport.read_runtime() is _HTTP
+        assert not transport.is_using_local
+
+    @pytest.mark.asyncio
+    async def test_both_failing_raises_http_error(self) -> None:
+        policy = _warm_policy()
+        transport = _hybrid(
+            _after(0.1, error=TransportReadError("dongle gone")),
+            _after(0.2, error=TransportReadError("cloud down")),
+            policy,
+        )
+
+        with pytest.raises(TransportReadError, match="cloud down"):
+            await transport.read_runtime()
+
+    @pytest.mark.asyncio
+    async def test_writes_are_never_hedged(self) -> None:
+        policy = _warm_policy()
+        http = _after(0, False)
+        transport = _hybrid(_after(0.1, True), http, policy)
+
+        assert await transport.write_parameters({21: 1}) is True
+        http.assert_not_called()
+        assert policy.reads == 0
+
+    @pytest.mark.asyncio
+    async def test_parameter_reads_are_never_hedged(self) -> None:
+        policy = _warm_policy()
+        http = _after(0, {21: 0})
+        transport = _hybrid(_after(0.1, {21: 1}), http, policy)
+
+        assert await transport.read_parameters(21, 1) == {21: 1}
+        http.assert_not_called()
+        assert policy.reads == 0
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_background_loser(self) -> None:
+        policy = _warm_policy()
+        transport = _hybrid(_after(5, _LOCAL), _after(0, _HTTP), policy)
+
+        await transport.read_runtime()
+        (loser,) = transport._hedge_losers
+        await transport.disconnect()
+        await asyncio.sleep(0)
+
+        assert loser.cancelled()
+        assert not transport._hedge_losers
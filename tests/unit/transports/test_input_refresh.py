@@ -0,0 +1,114 @@
+"""Multi-rate input refresh (``input_refresh_intervals``).
+
+Slow-changing input groups (lifetime energy, BMS limits, temperatures) are
+read at most once per configured interval; ``read_all_input_data()`` reads
+the due groups and serves the others from their last successful read.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from pylxpweb.transports._register_data import (
+    INPUT_REGISTER_GROUPS,
+    _ReadBlock,
+    coalesce_register_groups,
+    select_due_blocks,
+    validate_input_refresh_intervals,
+)
+from pylxpweb.transports.modbus import ModbusTransport
+from pylxpweb.transports.snapshot import RegisterSnapshot
+from tests.unit.transports.fakes import make_fake_read, make_transport, poll_input_data
+
+_GROUPED_READS = list(INPUT_REGISTER_GROUPS.values())
+_POLICY = {"extended_data": 60.0, "temperatures": 60.0, "bms_data": 30.0}
+
+
+def _age(transport: ModbusTransport, seconds: float) -> None:
+    """Pretend every cached group was read ``seconds`` earlier."""
+    cache = transport._input_group_cache
+    for name, (read_at, start, words) in cache.items():
+        cache[name] = (read_at - seconds, start, words)
+
+
+class TestPolicyValidation:
+    def test_none_and_zero_mean_every_poll(self) -> None:
+        assert validate_input_refresh_intervals(None) == {}
+        assert validate_input_refresh_intervals({"bms_data": 0}) == {}
+
+    @pytest.mark.parametrize(
+        "policy",
+        [{"no_such_group": 10}, {"bms_data": -1}, {"status_energy": 60}, {"power_energy": 5}],
+    )
+    def test_invalid_policy_rejected(self, policy: dict[str, float]) -> None:
+        with pytest.raises(ValueError):
+            make_transport(input_refresh_intervals=policy)
+
+
+class TestSelectDueBlocks:
+    def test_coalesced_block_read_whole_when_any_member_due(self) -> None:
+        plan = coalesce_register_groups(list(INPUT_REGISTER_GROUPS.items()), 120)
+
+        due = select_due_blocks(plan, {"power_energy", "output_power"})
+
+        assert [(b.start, b.count) for b in due] == [(0, 113), (170, 4)]
+
+    def test_nothing_due(self) -> None:
+        assert select_due_blocks([_ReadBlock(("bms_data",), 80, 33)], set()) == []
+
+
+class TestReadAllInputData:
+    @pytest.mark.asyncio
+    async def test_default_reads_every_group_every_poll(self) -> None:
+        transport = make_transport()
+        fake_read = make_fake_read()
+        transport._read_input_registers = fake_read
+
+        assert await poll_input_data(transport, fake_read) == _GROUPED_READS
+        assert await poll_input_data(transport, fake_read) == _GROUPED_READS
+
+    @pytest.mark.asyncio
+    async def test_fresh_groups_served_from_cache(self) -> None:
+        transport = make_transport(input_refresh_intervals=_POLICY)
+        fake_read = make_fake_read()
+        transport._read_input_registers = fake_read
+
+        assert await poll_input_data(transport, fake_read) == _GROUPED_READS
+        second = await poll_input_data(transport, fake_read)
+
+        skipped = {INPUT_REGISTER_GROUPS[name] for name in _POLICY}
+        assert second == [read for read in _GROUPED_READS if read not in skipped]
+
+        _age(transport, 30)
+        third = await poll_input_data(transport, fake_read)
+        assert (80, 33) in third and (113, 41) not in third
+        _age(transport, 30)
+        assert await poll_input_data(transport, fake_read) == _GROUPED_READS
+
+    @pytest.mark.asyncio
+    async def test_merged_snapshot_mixes_fresh_and_cached(self) -> None:
+        transport = make_transport(input_refresh_intervals=_POLICY)
+        fake_read = make_fake_read()
+        transport._read_input_registers = fake_read
+
+        await poll_input_data(transport, fake_read)
+        await poll_input_data(transport, fake_read)
+        # An empty plan leaves the cache as is and returns the merged view
+        merged = transport._merge_input_group_cache(RegisterSnapshot(), [], 0.0)
+
+        assert merged[0] == 2000  # power_energy re-read on poll 2
+        assert merged[40] == 2040  # status_energy is always read
+        assert merged[113] == 1113  # extended_data from poll 1
+        assert merged[80] == 1080  # bms_data from poll 1
+
+    @pytest.mark.asyncio
+    async def test_failed_group_stays_due_and_absent(self) -> None:
+        transport = make_transport(input_refresh_intervals={"bms_data": 30.0})
+        fake_read = make_fake_read({80}, OSError)
+        transport._read_input_registers = fake_read
+
+        _, _, battery = await transport.read_all_input_data()
+
+        assert battery is None
+        assert "bms_data" not in transport._input_group_cache
+        assert (80, 33) in await poll_input_data(transport, fake_read)
@@ -0,0 +1,310 @@
+"""Tests for shared Modbus TCP gateway connections."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import struct
+from collections.abc import AsyncIterator
+
+import pytest
+
+from pylxpweb.transports.config import TransportConfig, TransportType
+from pylxpweb.transports.exceptions import TransportError
+from pylxpweb.transports.modbus import ModbusTransport
+from pylxpweb.transports.modbus_gateway import ModbusGateway, ModbusGatewayPool
+
+
+class MultiUnitGateway:
+    """Fake RS485 gateway answering FC 03/04 reads for any unit ID.
+
+    Register ``n`` of unit ``u`` reads back as ``1000 * u + n`` so a reply
+    routed to the wrong unit is visible in the decoded values.
+    """
+
+    def __init__(self) -> None:
+        self._server: asyncio.AbstractServer | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self.port = 0
+        self.connections = 0
+        self.units: list[int] = []
+        # Unit IDs whose requests are swallowed (the inverter never answers)
+        self.silent: set[int] = set()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        for writer in list(self._writers):
+            writer.close()
+            with contextlib.suppress(Exception):
+                await writer.wait_closed()
+        if self._server is not None:
+            with contextlib.suppress(Exception):
+                await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self._writers.add(writer)
+        try:
+            while True:
+                tid, _pid, length, uid = struct.unpack(">HHHB", await reader.readexactly(7))
+                pdu = await reader.readexactly(length - 1)
+                self.units.append(uid)
+                if uid in self.silent:
+                    continue
+                fc = pdu[0]
+                address, count = struct.unpack(">HH", pdu[1:5])
+                data = struct.pack(
+                    f">{count}H", *((1000 * uid + address + i) & 0xFFFF for i in range(count))
+                )
+                resp_pdu = bytes([fc, len(data)]) + data
+                writer.write(struct.pack(">HHHB", tid, 0, len(resp_pdu) + 1, uid) + resp_pdu)
+        except (asyncio.IncompleteReadError, ConnectionResetError, OSError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            with contextlib.suppress(Exception):
+                writer.close()
+
+
+def _transport(gateway: ModbusGateway, unit_id: int) -> ModbusTransport:
+    return ModbusTransport(
+        host=gateway.host,
+        port=gateway.port,
+        unit_id=unit_id,
+        serial=f"CE0000000{unit_id}",
+        timeout=1.0,
+        retries=0,
+        inter_register_delay=0.0,
+        pymodbus_retries=0,
+        gateway=gateway,
+    )
+
+
+@pytest.fixture
+async def server() -> AsyncIterator[MultiUnitGateway]:
+    fake = MultiUnitGateway()
+    await fake.start()
+    yield fake
+    await fake.stop()
+
+
+class TestSharedConnection:
+    @pytest.mark.asyncio
+    async def test_units_share_one_connection(self, server: MultiUnitGateway) -> None:
+        gateway = ModbusGateway("127.0.0.1", server.port, timeout=1.0, pymodbus_retries=0)
+        first = _transport(gateway, 1)
+        second = _transport(gateway, 2)
+        try:
+            await first.connect()
+            await second.connect()
+
+            one, two = await asyncio.gather(
+                first._read_input_registers(0, 4),
+                second._read_input_registers(0, 4),
+            )
+
+            assert one == [1000, 1001, 1002, 1003]
+            assert two == [2000, 2001, 2002, 2003]
+            assert server.connections == 1
+            assert sorted(server.units) == [1, 2]
+            assert gateway.attached == 2
+        finally:
+            await first.disconnect()
+            await second.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_last_detach_closes_socket(self, server: MultiUnitGateway) -> None:
+        gateway = ModbusGateway("127.0.0.1", server.port, timeout=1.0, pymodbus_retries=0)
+        first = _transport(gateway, 1)
+        second = _transport(gateway, 2)
+        await first.connect()
+        await second.connect()
+
+        await first.disconnect()
+        assert gateway.client is not None
+        assert await second._read_input_registers(10, 1) == [2010]
+
+        await second.disconnect()
+        assert gateway.client is None
+        assert gateway.attached == 0
+
+    @pytest.mark.asyncio
+    async def test_reattach_reopens_socket(self, server: MultiUnitGateway) -> None:
+        gateway = ModbusGateway("127.0.0.1", server.port, timeout=1.0, pymodbus_retries=0)
+        transport = _transport(gateway, 3)
+        await transport.connect()
+        await transport.disconnect()
+        await transport.connect()
+        try:
+            assert await transport._read_holding_registers(5, 2) == [3005, 3006]
+            assert server.connections == 2
+        finally:
+            await transport.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_unit_stats_recorded(self, server: MultiUnitGateway) -> None:
+        gateway = ModbusGateway("127.0.0.1", server.port, timeout=1.0, pymodbus_retries=0)
+        transport = _transport(gateway, 1)
+        await transport.connect()
+        try:
+            for _ in range(3):
+                await transport._read_input_registers(0, 2)
+        finally:
+            await transport.disconnect()
+
+        stats = gateway.unit_stats()
+        assert list(stats) == [1]
+        assert stats[1].transactions == 3
+        assert stats[1].max_latency >= stats[1].mean_latency > 0
+
+
+class TestFairScheduling:
+    @pytest.mark.asyncio
+    async def test_units_served_round_robin(self) -> None:
+        gateway = ModbusGateway("127.0.0.1", 502)
+        order: list[int] = []
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with gateway.transaction(9):
+                await release.wait()
+
+        async def request(unit_id: int) -> None:
+            async with gateway.transaction(unit_id):
+                order.append(unit_id)
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        # Unit 1 queues a backlog before units 2 and 3 arrive
+        tasks = [asyncio.create_task(request(1)) for _ in range(3)]
+        tasks += [asyncio.create_task(request(2)), asyncio.create_task(request(3))]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(holder, *tasks)
+
+        assert order == [1, 2, 3, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self) -> None:
+        gateway = ModbusGateway("127.0.0.1", 502)
+        release = asyncio.Event()
+        served: list[int] = []
+
+        async def hold() -> None:
+            async with gateway.transaction(1):
+                await release.wait()
+
+        async def request(unit_id: int) -> None:
+            async with gateway.transaction(unit_id):
+                served.append(unit_id)
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        cancelled = asyncio.create_task(request(2))
+        waiting = asyncio.create_task(request(3))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(holder, waiting)
+
+        assert served == [3]
+        assert cancelled.cancelled()
+        # The bus is idle again: a new transaction is granted immediately
+        async with asyncio.timeout(0.1), gateway.transaction(4):
+            pass
+
+
+class TestGatewayWideRecycle:
+    @pytest.mark.asyncio
+    async def test_timeout_on_one_unit_recycles_shared_socket_once(
+        self, server: MultiUnitGateway
+    ) -> None:
+        gateway = ModbusGateway("127.0.0.1", server.port, timeout=0.3, pymodbus_retries=0)
+        first = _transport(gateway, 1)
+        second = _transport(gateway, 2)
+        second._max_consecutive_errors = 1
+        try:
+            await first.connect()
+            await second.connect()
+            stale = gateway.client
+            server.silent = {2}
+
+            with pytest.raises(TransportError):
+                await second._read_input_registers(0, 4)
+            server.silent = set()
+
+            # The timed-out unit replaces the shared socket for everyone
+            await second._reconnect()
+            assert server.connections == 2
+            assert gateway.generation == 2
+            assert gateway.client is not stale
+            assert not stale.connected
+
+            # Its neighbour follows the new socket instead of reopening it
+            await first._reconnect()
+            assert server.connections == 2
+            assert await first._read_input_registers(0, 2) == [1000, 1001]
+            assert await second._read_input_registers(0, 2) == [2000, 2001]
+            assert first._client is second._client is gateway.client
+        finally:
+            await first.disconnect()
+            await second.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_reset_gateway_is_reacquired_by_attached_units(
+        self, server: MultiUnitGateway
+    ) -> None:
+        gateway = ModbusGateway("127.0.0.1", server.port, timeout=1.0, pymodbus_retries=0)
+        first = _transport(gateway, 1)
+        second = _transport(gateway, 2)
+        try:
+            await first.connect()
+            await second.connect()
+
+            gateway.reset()
+            await first._reconnect()
+            await second._reconnect()
+
+            assert server.connections == 2
+            assert await second._read_input_registers(0, 1) == [2000]
+            assert gateway.attached == 2
+        finally:
+            await first.disconnect()
+            await second.disconnect()
+
+
+class TestPool:
+    def test_one_gateway_per_endpoint(self) -> None:
+        pool = ModbusGatewayPool()
+
+        assert pool.get("10.0.0.5", 502) is pool.get("10.0.0.5", 502)
+        assert pool.get("10.0.0.5", 502) is not pool.get("10.0.0.5", 503)
+        assert len(pool.gateways()) == 2
+
+    def test_station_shares_gateway_for_same_endpoint(self) -> None:
+        from pylxpweb.devices.station import Station
+
+        pool = ModbusGatewayPool()
+        transports = [
+            Station._create_transport_from_config(
+                TransportConfig(
+                    host="10.0.0.5",
+                    port=502,
+                    serial=serial,
+                    transport_type=TransportType.MODBUS_TCP,
+                    unit_id=unit_id,
+                ),
+                gateways=pool,
+            )
+            for unit_id, serial in ((1, "CE00000001"), (2, "CE00000002"))
+        ]
+
+        assert transports[0].gateway is transports[1].gateway
+        assert transports[0].unit_id == 1
+        assert transports[1].unit_id == 2
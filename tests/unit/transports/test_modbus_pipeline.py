@@ -0,0 +1,165 @@
+"""Tests for pipelined Modbus TCP reads against a fake buffering gateway."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import struct
+
+import pytest
+
+from pylxpweb.transports._modbus_pipeline import validate_pipeline_window
+from pylxpweb.transports.modbus import ModbusTransport
+
+
+class BufferingGateway:
+    """Fake gateway answering FC 03/04 reads concurrently after a delay.
+
+    Each register reads back as its own address, so a response routed to
+    the wrong request is visible in the decoded values.  With
+    ``echo_tid=False`` the gateway substitutes its own transaction counter,
+    like the Waveshare gateways ``_patch_tid_validation`` works around.
+    """
+
+    def __init__(self, *, delay: float = 0.02, echo_tid: bool = True) -> None:
+        self._delay = delay
+        self._echo_tid = echo_tid
+        self._server: asyncio.AbstractServer | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._own_tid = 1000
+        self.port = 0
+        self.requests = 0
+        self.outstanding = 0
+        self.max_outstanding = 0
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        for writer in list(self._writers):
+            writer.close()
+            with contextlib.suppress(Exception):
+                await writer.wait_closed()
+        if self._server is not None:
+            with contextlib.suppress(Exception):
+                await self._server.wait_closed()
+
+    async def _answer(self, writer: asyncio.StreamWriter, tid: int, uid: int, pdu: bytes) -> None:
+        await asyncio.sleep(self._delay)
+        fc = pdu[0]
+        address, count = struct.unpack(">HH", pdu[1:5])
+        data = struct.pack(f">{count}H", *(address + i for i in range(count)))
+        resp_pdu = bytes([fc, len(data)]) + data
+        if not self._echo_tid:
+            self._own_tid += 1
+            tid = self._own_tid
+        writer.write(struct.pack(">HHHB", tid, 0, len(resp_pdu) + 1, uid) + resp_pdu)
+        self.outstanding -= 1
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.add(writer)
+        tasks: set[asyncio.Task[None]] = set()
+        try:
+            while True:
+                tid, _pid, length, uid = struct.unpack(">HHHB", await reader.readexactly(7))
+                pdu = await reader.readexactly(length - 1)
+                self.requests += 1
+                self.outstanding += 1
+                self.max_outstanding = max(self.max_outstanding, self.outstanding)
+                task = asyncio.create_task(self._answer(writer, tid, uid, pdu))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except (asyncio.IncompleteReadError, ConnectionResetError, OSError):
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._writers.discard(writer)
+            with contextlib.suppress(Exception):
+                writer.close()
+
+
+def _transport(port: int, pipeline_window: int) -> ModbusTransport:
+    return ModbusTransport(
+        host="127.0.0.1",
+        serial="1234567890",
+        port=port,
+        timeout=1.0,
+        retries=0,
+        inter_register_delay=0.0,
+        pymodbus_retries=0,
+        pipeline_window=pipeline_window,
+    )
+
+
+@pytest.mark.parametrize("window", [0, 17, True])
+def test_invalid_window_rejected(window: int) -> None:
+    with pytest.raises(ValueError):
+        validate_pipeline_window(window)
+
+
+@pytest.mark.asyncio
+async def test_pipelined_cycle_matches_serial_reads() -> None:
+    """A pipelined input cycle keeps reads in flight and decodes the same values."""
+    gateway = BufferingGateway()
+    await gateway.start()
+    serial = _transport(gateway.port, 1)
+    pipelined = _transport(gateway.port, 8)
+    try:
+        await serial.connect()
+        expected = await serial._read_register_groups()
+        assert gateway.max_outstanding == 1
+        await serial.disconnect()
+
+        await pipelined.connect()
+        registers = await pipelined._read_register_groups()
+
+        assert registers == expected
+        assert all(value == address for address, value in registers.items())
+        assert gateway.max_outstanding > 1
+        assert pipelined.pipeline_window == 8
+        assert pipelined._prefetched_input == {}
+    finally:
+        await serial.disconnect()
+        await pipelined.disconnect()
+        await gateway.stop()
+
+
+@pytest.mark.asyncio
+async def test_window_bounds_outstanding_requests() -> None:
+    gateway = BufferingGateway()
+    await gateway.start()
+    transport = _transport(gateway.port, 2)
+    try:
+        await transport.connect()
+        await transport._read_register_groups()
+
+        assert gateway.max_outstanding == 2
+    finally:
+        await transport.disconnect()
+        await gateway.stop()
+
+
+@pytest.mark.asyncio
+async def test_gateway_without_tid_echo_falls_back_to_serial() -> None:
+    """Foreign TIDs latch pipelining off; the cycle still completes serially."""
+    gateway = BufferingGateway(echo_tid=False)
+    await gateway.start()
+    transport = _transport(gateway.port, 8)
+    try:
+        await transport.connect()
+        registers = await transport._read_register_groups()
+
+        assert transport.pipeline_window == 1
+        assert registers
+        assert all(value == address for address, value in registers.items())
+
+        gateway.max_outstanding = 0
+        await transport._read_register_groups()
+        assert gateway.max_outstanding == 1
+    finally:
+        await transport.disconnect()
+        await gateway.stop()
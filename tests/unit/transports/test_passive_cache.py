@@ -0,0 +1,69 @@
+"""Tests for the passive register cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from pylxpweb.transports.passive_cache import PassiveRegisterCache
+from tests.unit.fakes import FakeClock
+
+SERIAL = "CE12345678"
+INPUT = 0x04
+HOLDING = 0x03
+
+
+class TestPassiveRegisterCache:
+    def test_lookup_within_stored_block(self) -> None:
+        cache = PassiveRegisterCache(max_age=10.0, clock=FakeClock())
+        cache.store(SERIAL, INPUT, 0, list(range(40)))
+
+        assert cache.lookup(SERIAL, INPUT, 5, 3) == [5, 6, 7]
+        assert cache.stats()["hits"] == 1
+
+    def test_lookup_spanning_adjacent_blocks(self) -> None:
+        cache = PassiveRegisterCache(max_age=10.0, clock=FakeClock())
+        cache.store(SERIAL, INPUT, 0, [1] * 40)
+        cache.store(SERIAL, INPUT, 40, [2] * 40)
+
+        assert cache.lookup(SERIAL, INPUT, 38, 4) == [1, 1, 2, 2]
+
+    def test_partial_coverage_misses(self) -> None:
+        cache = PassiveRegisterCache(max_age=10.0, clock=FakeClock())
+        cache.store(SERIAL, INPUT, 0, [1] * 40)
+
+        assert cache.lookup(SERIAL, INPUT, 30, 20) is None
+        assert cache.stats()["misses"] == 1
+
+    def test_stale_registers_miss(self) -> None:
+        clock = FakeClock()
+        cache = PassiveRegisterCache(max_age=10.0, clock=clock)
+        cache.store(SERIAL, INPUT, 0, [1, 2])
+        clock.now += 5.0
+        cache.store(SERIAL, INPUT, 1, [3])
+        clock.now += 6.0
+
+        # Register 0 is 11 s old, register 1 only 6 s
+        assert cache.lookup(SERIAL, INPUT, 1, 1) == [3]
+        assert cache.lookup(SERIAL, INPUT, 0, 2) is None
+
+    def test_keyed_by_serial_and_function(self) -> None:
+        cache = PassiveRegisterCache(max_age=10.0, clock=FakeClock())
+        cache.store(SERIAL, INPUT, 0, [1])
+
+        assert cache.lookup(SERIAL, HOLDING, 0, 1) is None
+        assert cache.lookup("OTHER00000", INPUT, 0, 1) is None
+
+    def test_clear_one_serial(self) -> None:
+        cache = PassiveRegisterCache(max_age=10.0, clock=FakeClock())
+        cache.store(SERIAL, INPUT, 0, [1])
+        cache.store("OTHER00000", INPUT, 0, [2])
+
+        cache.clear(SERIAL)
+
+        assert cache.lookup(SERIAL, INPUT, 0, 1) is None
+        assert cache.lookup("OTHER00000", INPUT, 0, 1) == [2]
+        assert cache.stats()["registers"] == 1
+
+    def test_rejects_non_positive_max_age(self) -> None:
+        with pytest.raises(ValueError):
+            PassiveRegisterCache(max_age=0)
@@ -0,0 +1,131 @@
+"""Tests for array-backed register snapshots."""
+
+from __future__ import annotations
+
+import pytest
+
+from pylxpweb.registers.inverter_input import INVERTER_INPUT_REGISTERS
+from pylxpweb.transports._canonical_reader import read_raw
+from pylxpweb.transports._decode_plan import DecodePlan, decode_into, energy_plan, runtime_plan
+from pylxpweb.transports.observation import RegisterSegment
+from pylxpweb.transports.snapshot import RegisterSnapshot
+
+
+def _blocks() -> list[tuple[int, list[int]]]:
+    return [(0, [10, 11, 12]), (10, [0xFFFF, 0x8000]), (2, [99, 13])]
+
+
+class TestMapping:
+    def test_later_block_wins_like_dict_updates(self) -> None:
+        expected: dict[int, int] = {}
+        for start, words in _blocks():
+            expected.update({start + i: value for i, value in enumerate(words)})
+
+        snapshot = RegisterSnapshot(_blocks())
+
+        assert snapshot == expected
+        assert dict(snapshot) == expected
+        assert list(snapshot) == sorted(expected)
+        assert len(snapshot) == len(expected)
+
+    def test_gaps_are_absent(self) -> None:
+        snapshot = RegisterSnapshot(_blocks())
+
+        assert 5 not in snapshot
+        assert snapshot.get(5) is None
+        assert snapshot.get(-1, 7) == 7
+        with pytest.raises(KeyError):
+            snapshot[5]
+
+    def test_empty(self) -> None:
+        snapshot = RegisterSnapshot([(40, [])])
+
+        assert len(snapshot) == 0
+        assert snapshot == {}
+        assert snapshot.to_bytes() == b""
+
+    def test_rejects_wide_values(self) -> None:
+        with pytest.raises(ValueError):
+            RegisterSnapshot([(0, [0x10000])])
+
+    def test_merge_operators(self) -> None:
+        snapshot = RegisterSnapshot([(0, [1, 2])])
+
+        assert snapshot | {1: 5, 3: 6} == {0: 1, 1: 5, 3: 6}
+        assert {1: 5, 3: 6} | snapshot == {0: 1, 1: 2, 3: 6}
+        merged = snapshot
+        merged |= RegisterSnapshot([(2, [3])])
+        assert merged == {0: 1, 1: 2, 2: 3}
+        assert snapshot == {0: 1, 1: 2}
+
+    def test_repr_redacts_words(self) -> None:
+        assert "12" not in repr(RegisterSnapshot([(0, [12345])]))
+
+
+class TestSegments:
+    def test_round_trips_observed_segments(self) -> None:
+        segments = (RegisterSegment(0, (1, 2, 3)), RegisterSegment(40, (4, 5)))
+
+        snapshot = RegisterSnapshot.from_segments(segments)
+
+        assert snapshot.segments() == segments
+        assert [(start, list(words)) for start, words in snapshot.blocks()] == [
+            (0, [1, 2, 3]),
+            (40, [4, 5]),
+        ]
+
+    def test_view_is_zero_copy_and_checked(self) -> None:
+        snapshot = RegisterSnapshot([(100, list(range(40)))])
+
+        view = snapshot.view(110, 5)
+        assert view.readonly
+        assert view.tolist() == [10, 11, 12, 13, 14]
+        with pytest.raises(KeyError):
+            snapshot.view(130, 20)
+
+    def test_layout_shares_buffers(self) -> None:
+        snapshot = RegisterSnapshot([(100, [1, 2]), (103, [4])])
+
+        base, words, present = snapshot.layout()
+
+        assert base == 100
+        assert words.readonly and present.readonly
+        assert present.obj is snapshot._present
+        assert present.tolist() == [1, 1, 0, 1]
+        assert words[3] == 4
+
+    def test_bytes_round_trip(self) -> None:
+        snapshot = RegisterSnapshot(_blocks())
+
+        assert RegisterSnapshot.from_bytes(snapshot.to_bytes()) == snapshot
+        with pytest.raises(ValueError):
+            RegisterSnapshot.from_bytes(snapshot.to_bytes()[:-1])
+
+    def test_diff(self) -> None:
+        previous = RegisterSnapshot([(0, [1, 2, 3])])
+
+        assert RegisterSnapshot([(0, [1, 2, 3])]).diff(previous) == {}
+        assert RegisterSnapshot([(0, [1, 9]), (5, [4])]).diff(previous) == {
+            1: 9,
+            2: None,
+            5: 4,
+        }
+
+
+class TestDecoding:
+    def test_read_raw_matches_dict(self) -> None:
+        registers = {address: (address * 977) & 0xFFFF for address in range(0, 300) if address % 7}
+        snapshot = RegisterSnapshot.from_registers(registers)
+
+        for reg in INVERTER_INPUT_REGISTERS:
+            assert read_raw(snapshot, reg) == read_raw(registers, reg), reg.canonical_name
+
+    @pytest.mark.parametrize("plan", [runtime_plan("EG4_HYBRID", 6), energy_plan("LXP", 3)])
+    def test_decode_plan_matches_dict(self, plan: DecodePlan) -> None:
+        registers = {
+            address: (address * 4099) & 0xFFFF for address in range(1, 260) if address % 11
+        }
+        snapshot = RegisterSnapshot.from_registers(registers)
+        ops = plan.ops + plan.specials
+
+        assert decode_into(ops, snapshot, {}) == decode_into(ops, registers, {})